@@ -346,12 +346,19 @@ def list_datasources(directory):
 )
 @click.option('--batch_kwargs', default=None,
               help='Additional keyword arguments to be provided to get_batch when loading the data asset. Must be a valid JSON dictionary')
+@click.option('--sample_fraction', type=float, default=None,
+              help='Profile a random sample of about this fraction (between 0 and 1) of the rows of each data asset.')
+@click.option('--sample_seed', type=int, default=None,
+              help='The seed of the random samples taken with --sample_fraction, to repeat a previous sample.')
+@click.option('--max_workers', type=click.IntRange(min=1), default=1,
+              help='The number of data assets to profile concurrently.')
 @click.option(
     "--view/--no-view",
     help="By default open in browser unless you specify the --no-view flag",
     default=True
 )
-def profile(datasource_name, data_assets, profile_all_data_assets, directory, view, batch_kwargs):
+def profile(datasource_name, data_assets, profile_all_data_assets, directory, view, batch_kwargs,
+            sample_fraction, sample_seed, max_workers):
     """
     Profile datasources from the specified context.
 
@@ -366,6 +373,9 @@ def profile(datasource_name, data_assets, profile_all_data_assets, directory, vi
     :param directory:
     :param view: Open the docs in a browser
     :param batch_kwargs: Additional keyword arguments to be provided to get_batch when loading the data asset.
+    :param sample_fraction: if provided, a random sample of about this fraction of the rows of each data asset is profiled
+    :param sample_seed: the seed of the random samples
+    :param max_workers: the number of data assets to profile concurrently
     :return:
     """
 
@@ -399,7 +409,10 @@ def profile(datasource_name, data_assets, profile_all_data_assets, directory, vi
                 data_assets=data_assets,
                 profile_all_data_assets=profile_all_data_assets,
                 open_docs=view,
-                additional_batch_kwargs=batch_kwargs
+                additional_batch_kwargs=batch_kwargs,
+                sample_fraction=sample_fraction,
+                sample_seed=sample_seed,
+                max_workers=max_workers
             )
     else:
         profile_datasource(
@@ -408,7 +421,10 @@ def profile(datasource_name, data_assets, profile_all_data_assets, directory, vi
             data_assets=data_assets,
             profile_all_data_assets=profile_all_data_assets,
             open_docs=view,
-            additional_batch_kwargs=batch_kwargs
+            additional_batch_kwargs=batch_kwargs,
+            sample_fraction=sample_fraction,
+            sample_seed=sample_seed,
+            max_workers=max_workers
         )
 
 
@@ -407,6 +407,9 @@ def profile_datasource(
     max_data_assets=20,
     additional_batch_kwargs=None,
     open_docs=False,
+    sample_fraction=None,
+    sample_seed=None,
+    max_workers=1,
 ):
     """"Profile a named datasource using the specified context"""
     msg_intro = """
@@ -452,7 +455,10 @@ Great Expectations is building Data Docs from the data you just profiled!"""
         profile_all_data_assets=profile_all_data_assets,
         max_data_assets=max_data_assets,
         dry_run=True,
-        additional_batch_kwargs=additional_batch_kwargs
+        additional_batch_kwargs=additional_batch_kwargs,
+        sample_fraction=sample_fraction,
+        sample_seed=sample_seed,
+        max_workers=max_workers
     )
 
     if profiling_results['success']: # data context is ready to profile - run profiling
@@ -463,7 +469,10 @@ Great Expectations is building Data Docs from the data you just profiled!"""
             profile_all_data_assets=profile_all_data_assets,
             max_data_assets=max_data_assets,
             dry_run=False,
-            additional_batch_kwargs=additional_batch_kwargs
+            additional_batch_kwargs=additional_batch_kwargs,
+            sample_fraction=sample_fraction,
+            sample_seed=sample_seed,
+            max_workers=max_workers
         )
         else:
             cli_message(msg_skipping)
@@ -508,7 +517,10 @@ Great Expectations is building Data Docs from the data you just profiled!"""
                 profile_all_data_assets=profile_all_data_assets,
                 max_data_assets=max_data_assets,
                 dry_run=False,
-                additional_batch_kwargs=additional_batch_kwargs
+                additional_batch_kwargs=additional_batch_kwargs,
+                sample_fraction=sample_fraction,
+                sample_seed=sample_seed,
+                max_workers=max_workers
             )
 
             if profiling_results['success']: # data context is ready to profile
@@ -1207,6 +1207,7 @@ class DataAsset(object):
         unexpected_count,
         unexpected_list,
         unexpected_index_list,
+        unexpected_counts=None,
     ):
         """Helper function to construct expectation result objects for map_expectations (such as column_map_expectation
         and file_lines_map_expectation).
@@ -1215,7 +1216,9 @@ class DataAsset(object):
         In each case, the object returned has a different set of populated fields.
         See :ref:`result_format` for more information.
 
-        This function handles the logic for mapping those fields for column_map_expectations.
+        This function handles the logic for mapping those fields for column_map_expectations. The
+        partial_unexpected_counts are counted from unexpected_list, unless implementing classes that count them
+        elsewhere pass them as unexpected_counts, a list of (value, count) tuples ordered by decreasing count.
         """
         # NB: unexpected_count parameter is explicit some implementing classes may limit the length of unexpected_list
 
@@ -1262,11 +1265,14 @@ class DataAsset(object):
         # Try to return the most common values, if possible.
         if 0 < result_format.get('partial_unexpected_count'):
             try:
+                if unexpected_counts is None:
+                    unexpected_counts = Counter(unexpected_list).most_common(
+                        result_format['partial_unexpected_count'])
                 partial_unexpected_counts = [
                     {'value': key, 'count': value}
                     for key, value
                     in sorted(
-                        Counter(unexpected_list).most_common(result_format['partial_unexpected_count']),
+                        unexpected_counts[:result_format['partial_unexpected_count']],
                         key=lambda x: (-x[1], x[0]))
                 ]
             except TypeError:
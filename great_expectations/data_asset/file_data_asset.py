@@ -2,16 +2,256 @@ from __future__ import division
 import re
 import inspect
 import hashlib
+import io
+import logging
 import os
 import json
 import jsonschema
+from collections import Counter
 from functools import wraps
 import numpy as np
-from six import PY3
-from itertools import compress
+from six import PY3, string_types
 from great_expectations.data_asset.data_asset import DataAsset
 from great_expectations.data_asset.util import parse_result_format
 
+logger = logging.getLogger(__name__)
+
+# The approximate number of bytes read from a file at a time by file expectations
+FILE_LINES_BLOCK_SIZE = 1 << 20
+# The size of the largest file whose text a FileScan keeps for expect_file_to_be_valid_json; larger files are read
+# again by the expectation itself, so that validate holds at most this much text in memory
+FILE_SCAN_MAX_TEXT_SIZE = 64 << 20
+
+
+class FileLinesMap(object):
+    """Accumulates the result of one file_lines_map_expectation over the lines of a file, block by block.
+
+    Only counts and a bounded sample of the unexpected lines are kept, so the memory used does not grow with the
+    size of the file, except with the COMPLETE result_format, which keeps every unexpected line. The values counted
+    for partial_unexpected_counts are capped at max_unexpected_value_counts distinct lines; lines first seen after
+    that are counted as unexpected but left out of partial_unexpected_counts.
+    """
+
+    max_unexpected_value_counts = 10000
+
+    def __init__(self, data_asset, func, args, kwargs, skip, null_lines_regex, result_format):
+        if skip is not None:
+            try:
+                assert float(skip).is_integer()
+                assert float(skip) >= 0
+            except:
+                raise ValueError("skip must be a positive integer")
+        self.skip = 0 if skip is None else int(skip)
+
+        self.data_asset = data_asset
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs
+        self.null_lines = None if null_lines_regex is None else re.compile(null_lines_regex)
+
+        self.keep_all_unexpected = result_format["result_format"] == "COMPLETE"
+        self.partial_unexpected_count = result_format["partial_unexpected_count"]
+
+        self.element_count = 0
+        self.nonnull_count = 0
+        self.unexpected_count = 0
+        self.unexpected_list = []
+        self.unexpected_index_list = []
+        self.unexpected_value_counts = Counter()
+
+    def update(self, lines):
+        """Evaluate the expectation on the next block of lines of the file."""
+        self.element_count += len(lines)
+        if self.null_lines is not None:
+            # Ignore lines that are empty or have only white space ("null values" in the line-map context)
+            lines = [line for line in lines if not self.null_lines.match(line)]
+        if not lines:
+            return
+
+        boolean_mapped_success_lines = np.array(self.func(self.data_asset, _lines=lines, *self.args, **self.kwargs),
+                                                dtype=bool)
+        for offset in np.flatnonzero(~boolean_mapped_success_lines):
+            line = lines[offset]
+            if self.keep_all_unexpected or self.unexpected_count < self.partial_unexpected_count:
+                self.unexpected_list.append(line)
+                self.unexpected_index_list.append(self.nonnull_count + int(offset))
+            if not self.keep_all_unexpected and (line in self.unexpected_value_counts or
+                                                 len(self.unexpected_value_counts) < self.max_unexpected_value_counts):
+                self.unexpected_value_counts[line] += 1
+            self.unexpected_count += 1
+
+        self.nonnull_count += len(lines)
+
+    def can_format(self, result_format):
+        """Whether the lines kept are enough to build the output for result_format."""
+        if self.keep_all_unexpected:
+            return True
+        return result_format["result_format"] != "COMPLETE" and \
+            result_format["partial_unexpected_count"] <= self.partial_unexpected_count
+
+    def format_output(self, result_format, mostly):
+        if self.nonnull_count == 0:
+            return self.data_asset._format_map_output(
+                result_format=result_format, success=None,
+                element_count=self.element_count, nonnull_count=0,
+                unexpected_count=0,
+                unexpected_list=[], unexpected_index_list=[]
+            )
+
+        success, percent_success = self.data_asset._calc_map_expectation_success(
+            self.nonnull_count - self.unexpected_count, self.nonnull_count, mostly)
+        return_obj = self.data_asset._format_map_output(
+            result_format, success,
+            self.element_count, self.nonnull_count,
+            self.unexpected_count,
+            self.unexpected_list, self.unexpected_index_list
+        )
+
+        # Only a sample of the unexpected lines was kept, so count them from the running counts instead
+        if not self.keep_all_unexpected and "partial_unexpected_counts" in return_obj.get("result", {}):
+            return_obj["result"]["partial_unexpected_counts"] = [
+                {'value': key, 'count': value}
+                for key, value
+                in sorted(
+                    self.unexpected_value_counts.most_common(result_format['partial_unexpected_count']),
+                    key=lambda x: (-x[1], x[0]))
+            ]
+
+        return return_obj
+
+    @staticmethod
+    def get_key(func, skip, null_lines_regex, args, kwargs):
+        """Identifies the evaluations of a file_lines_map_expectation that can share a FileLinesMap."""
+        return func.__name__, skip, null_lines_regex, json.dumps([args, kwargs], sort_keys=True, default=str)
+
+
+class _HashingFile(io.RawIOBase):
+    """A readable binary file that updates a set of hashes with the bytes read from it."""
+
+    def __init__(self, f, hashes):
+        self._file = f
+        self._hashes = hashes
+
+    def readable(self):
+        return True
+
+    def readinto(self, b):
+        n = self._file.readinto(b)
+        if n:
+            data = memoryview(b)[:n].tobytes()
+            for hash in self._hashes:
+                hash.update(data)
+        return n
+
+
+class FileScan(object):
+    """Reads a file once, computing everything that a set of file expectations needs from its contents.
+
+    Hashes are computed from the bytes as they are read. The same bytes are split into lines as they would be by
+    open(path, "r"), decoded on py3 and left as str on py2, and the lines are passed to each of the file lines maps,
+    kept for the first first_line_count lines, and joined into text if keep_text is set. Reading stops early when
+    only the first lines are needed.
+
+    JSON cannot be parsed as it is read, so keep_text holds the whole text of the file in memory; it is ignored for
+    files larger than FILE_SCAN_MAX_TEXT_SIZE, and text is then None.
+
+    Args:
+        path (str): the path of the file
+        hash_algs (list): the names of hashlib algorithms to compute the hex digest of the file with
+        first_line_count (int): the number of lines to keep from the start of the file
+        keep_text (boolean): whether to keep the whole text of the file, as is needed to parse it as JSON
+        file_lines_maps (dict): FileLinesMap objects to evaluate, each of which receives the lines after its own skip
+    """
+
+    def __init__(self, path, hash_algs=None, first_line_count=0, keep_text=False, file_lines_maps=None):
+        self.path = path
+        self._hashes = dict([(hash_alg, hashlib.new(hash_alg)) for hash_alg in (hash_algs or [])])
+        self.first_line_count = first_line_count
+        self.keep_text = keep_text
+        self.file_lines_maps = dict(file_lines_maps or {})
+
+        self.hexdigests = {}
+        self.first_lines = []
+        self.line_count = None
+        self.text = None
+
+    def run(self, catch_exceptions=False):
+        """Read the file.
+
+        Args:
+            catch_exceptions (boolean): if True, a file lines map that raises an exception stops receiving lines \
+                and is removed from file_lines_maps, instead of the exception being raised
+
+        Returns:
+            the FileScan itself
+        """
+        if self.keep_text and os.path.getsize(self.path) > FILE_SCAN_MAX_TEXT_SIZE:
+            self.keep_text = False
+        with open(self.path, "rb") as f:
+            if self.file_lines_maps or self.first_line_count or self.keep_text:
+                lines_file = io.BufferedReader(_HashingFile(f, self._hashes.values()))
+                # open(path, "r") reads str lines on py2, which the expectations have always received
+                if PY3:
+                    lines_file = io.TextIOWrapper(lines_file)
+                self._read_lines(lines_file, catch_exceptions)
+            else:
+                for block in iter(lambda: f.read(FILE_LINES_BLOCK_SIZE), b""):
+                    for hash in self._hashes.values():
+                        hash.update(block)
+
+        self.hexdigests = dict([(hash_alg, hash.hexdigest()) for hash_alg, hash in self._hashes.items()])
+        return self
+
+    def _read_lines(self, f, catch_exceptions):
+        file_lines_maps = list(self.file_lines_maps.values())
+        max_skip = max([file_lines_map.skip for file_lines_map in file_lines_maps] + [0])
+        # The first max_skip lines, kept in case the file turns out to be shorter than a skip
+        skipped_lines = []
+        text_lines = [] if self.keep_text else None
+        line_count = 0
+
+        def update(file_lines_map, lines):
+            try:
+                file_lines_map.update(lines)
+            except Exception:
+                if not catch_exceptions:
+                    raise
+                logger.debug("Error evaluating {} on {}".format(file_lines_map.func.__name__, self.path),
+                             exc_info=True)
+                file_lines_maps.remove(file_lines_map)
+
+        while True:
+            if not (file_lines_maps or self._hashes or self.keep_text or line_count < self.first_line_count):
+                break
+            lines = f.readlines(FILE_LINES_BLOCK_SIZE)
+            if not lines:
+                self.line_count = line_count
+                break
+            if line_count < max_skip:
+                skipped_lines.extend(lines[:max_skip - line_count])
+            if line_count < self.first_line_count:
+                self.first_lines.extend(lines[:self.first_line_count - line_count])
+            if text_lines is not None:
+                text_lines.extend(lines)
+            for file_lines_map in list(file_lines_maps):
+                start = file_lines_map.skip - line_count
+                if start <= 0:
+                    update(file_lines_map, lines)
+                elif start < len(lines):
+                    update(file_lines_map, lines[start:])
+            line_count += len(lines)
+
+        # A skip greater than the number of lines in the file does not skip any line
+        for file_lines_map in list(file_lines_maps):
+            if file_lines_map.skip > line_count:
+                update(file_lines_map, skipped_lines)
+
+        if text_lines is not None:
+            self.text = "".join(text_lines)
+
+        self.file_lines_maps = dict([(key, file_lines_map) for key, file_lines_map in self.file_lines_maps.items()
+                                     if file_lines_map in file_lines_maps])
+
 
 class MetaFileDataAsset(DataAsset):
     """MetaFileDataset is a thin layer above FileDataset.
@@ -23,6 +263,8 @@ class MetaFileDataAsset(DataAsset):
 
     def __init__(self, *args, **kwargs):
         super(MetaFileDataAsset, self).__init__(*args, **kwargs)
+        # The FileScan made by FileDataAsset.validate for the expectations of the suite being validated
+        self._file_scan = None
 
     @classmethod
     def file_lines_map_expectation(cls, func):
@@ -42,7 +284,8 @@ class MetaFileDataAsset(DataAsset):
             function to disregard the first k lines of the file.
 
             file_lines_map_expectation will add a kwarg _lines to the called function with the nonnull lines \
-            to process.
+            to process. The file is read in blocks, and the function is called once per block with the nonnull \
+            lines of that block, so it must evaluate each line independently of the others.
 
             null_lines_regex defines a regex used to skip lines, but can be overridden
 
@@ -59,75 +302,23 @@ class MetaFileDataAsset(DataAsset):
         @cls.expectation(argspec)
         @wraps(func)
         def inner_wrapper(self, skip=None, mostly=None, null_lines_regex=r"^\s*$", result_format=None, *args, **kwargs):
-            try:
-                f = open(self._path, "r")
-            except:
-                raise
-
             if result_format is None:
                 result_format = self.default_expectation_args["result_format"]
 
             result_format = parse_result_format(result_format)
-            lines = f.readlines() #Read in file lines
 
-            #Skip k initial lines designated by the user
-            if skip is not None and skip <= len(lines):
-                try:
-                    assert float(skip).is_integer()
-                    assert float(skip) >= 0
-                except:
-                    raise ValueError("skip must be a positive integer")
-
-                for i in range(1, skip+1):
-                    lines.pop(0)
-
-            if lines:
-                if null_lines_regex is not None:
-                    null_lines = re.compile(null_lines_regex) #Ignore lines that are empty or have only white space ("null values" in the line-map context)
-                    boolean_mapped_null_lines = np.array(
-                        [bool(null_lines.match(line)) for line in lines])
-                else:
-                    boolean_mapped_null_lines = np.zeros(len(lines), dtype=bool)
-                element_count = int(len(lines))
-                if element_count > sum(boolean_mapped_null_lines):
-                    nonnull_lines = list(compress(lines, np.invert(boolean_mapped_null_lines)))
-                    nonnull_count = int((boolean_mapped_null_lines == False).sum())
-                    boolean_mapped_success_lines = np.array(
-                        func(self, _lines=nonnull_lines, *args, **kwargs))
-                    success_count = np.count_nonzero(boolean_mapped_success_lines)
-                    unexpected_list = list(compress(nonnull_lines, \
-                        np.invert(boolean_mapped_success_lines)))
-                    nonnull_lines_index = range(0, len(nonnull_lines)+1)
-                    unexpected_index_list = list(compress(nonnull_lines_index,
-                                                          np.invert(boolean_mapped_success_lines)))
-                    success, percent_success = self._calc_map_expectation_success(
-                        success_count, nonnull_count, mostly)
-                    return_obj = self._format_map_output(
-                        result_format, success,
-                        element_count, nonnull_count,
-                        len(unexpected_list),
-                        unexpected_list, unexpected_index_list
-                    )
-                else:
-                    return_obj = self._format_map_output(
-                        result_format=result_format, success=None,
-                        element_count=element_count, nonnull_count=0,
-                        unexpected_count=0,
-                        unexpected_list=[], unexpected_index_list=[]
-                    )
-            else:
-                return_obj = self._format_map_output(result_format=result_format,
-                                                     success=None,
-                                                     element_count=0,
-                                                     nonnull_count=0,
-                                                     unexpected_count=0,
-                                                     unexpected_list=[],
-                                                     unexpected_index_list=[])
-            f.close()
-            return return_obj
+            # FileDataAsset.validate evaluates all the file lines map expectations of a suite in a single pass
+            key = FileLinesMap.get_key(func, skip, null_lines_regex, args, kwargs)
+            file_lines_map = None if self._file_scan is None else self._file_scan.file_lines_maps.get(key)
+            if file_lines_map is None or not file_lines_map.can_format(result_format):
+                file_lines_map = FileLinesMap(self, func, args, kwargs, skip, null_lines_regex, result_format)
+                FileScan(self._path, file_lines_maps={key: file_lines_map}).run()
+
+            return file_lines_map.format_output(result_format, mostly)
 
         inner_wrapper.__name__ = func.__name__
         inner_wrapper.__doc__ = func.__doc__
+        inner_wrapper._file_lines_map_function = func
 
         return inner_wrapper
 
@@ -145,6 +336,129 @@ class FileDataAsset(MetaFileDataAsset):
         super(FileDataAsset, self).__init__(*args, **kwargs)
         self._path = file_path
 
+    def validate(self,
+                 expectation_suite=None,
+                 run_id=None,
+                 data_context=None,
+                 evaluation_parameters=None,
+                 catch_exceptions=True,
+                 result_format=None,
+                 only_return_failures=False):
+        """Validates the file as DataAsset.validate does, but reads the file only once for all of the expectations \
+        in the suite that read its contents: file lines map expectations such as \
+        expect_file_line_regex_match_count_to_be_between, expect_file_hash_to_equal, \
+        expect_file_to_have_valid_table_header and expect_file_to_be_valid_json.
+
+        Expectations with $PARAMETER arguments are evaluated separately, as are expectations that raise an \
+        exception, so that the exception is reported with the expectation as usual.
+
+        See :func:`DataAsset.validate <great_expectations.data_asset.data_asset.DataAsset.validate>` for the \
+        arguments and the result.
+        """
+        if expectation_suite is None:
+            expectation_suite = self.get_expectation_suite(
+                discard_failed_expectations=False,
+                discard_result_format_kwargs=False,
+                discard_include_config_kwargs=False,
+                discard_catch_exceptions_kwargs=False,
+            )
+        elif isinstance(expectation_suite, string_types):
+            with open(expectation_suite, 'r') as infile:
+                expectation_suite = json.load(infile)
+
+        self._file_scan = self._scan_file(expectation_suite["expectations"], result_format)
+        try:
+            return super(FileDataAsset, self).validate(
+                expectation_suite=expectation_suite,
+                run_id=run_id,
+                data_context=data_context,
+                evaluation_parameters=evaluation_parameters,
+                catch_exceptions=catch_exceptions,
+                result_format=result_format,
+                only_return_failures=only_return_failures
+            )
+        finally:
+            self._file_scan = None
+
+    def _scan_file(self, expectations, result_format=None):
+        """Plan a FileScan that computes what expectations need from the file, and run it.
+
+        Returns:
+            the FileScan, or None if no expectation needs to read the file or the file could not be read
+        """
+        if self._path is None or not os.path.isfile(self._path):
+            return None
+
+        hash_algs = set()
+        first_line_count = 0
+        keep_text = False
+        file_lines_maps = {}
+        for expectation in expectations:
+            kwargs = dict(expectation["kwargs"])
+            if any([isinstance(value, dict) and "$PARAMETER" in value for value in kwargs.values()]):
+                continue
+
+            expectation_type = expectation["expectation_type"]
+            if expectation_type == "expect_file_hash_to_equal":
+                hash_alg = kwargs.get("hash_alg", "md5")
+                try:
+                    hashlib.new(hash_alg)
+                except (TypeError, ValueError):
+                    continue
+                hash_algs.add(hash_alg)
+
+            elif expectation_type == "expect_file_to_have_valid_table_header":
+                skip = kwargs.get("skip")
+                try:
+                    first_line_count = max(first_line_count, int(skip or 0) + 1)
+                except (TypeError, ValueError):
+                    continue
+
+            elif expectation_type == "expect_file_to_be_valid_json":
+                keep_text = True
+
+            else:
+                func = getattr(getattr(self, expectation_type, None), "_file_lines_map_function", None)
+                if func is None:
+                    continue
+
+                for key in ["mostly", "include_config", "catch_exceptions", "meta"]:
+                    kwargs.pop(key, None)
+                skip = kwargs.pop("skip", None)
+                null_lines_regex = kwargs.pop("null_lines_regex", r"^\s*$")
+                expectation_result_format = kwargs.pop("result_format", None)
+                if result_format is not None:
+                    expectation_result_format = result_format
+                if expectation_result_format is None:
+                    expectation_result_format = self.default_expectation_args["result_format"]
+
+                key = FileLinesMap.get_key(func, skip, null_lines_regex, (), kwargs)
+                try:
+                    expectation_result_format = parse_result_format(expectation_result_format)
+                    file_lines_map = FileLinesMap(self, func, (), kwargs, skip, null_lines_regex,
+                                                  expectation_result_format)
+                except ValueError:
+                    continue
+                # Expectations that differ only in result_format share the map that keeps the most unexpected lines
+                if key not in file_lines_maps or not file_lines_maps[key].can_format(expectation_result_format):
+                    file_lines_maps[key] = file_lines_map
+
+        if not (hash_algs or first_line_count or keep_text or file_lines_maps):
+            return None
+
+        try:
+            return FileScan(
+                self._path,
+                hash_algs=sorted(hash_algs),
+                first_line_count=first_line_count,
+                keep_text=keep_text,
+                file_lines_maps=file_lines_maps
+            ).run(catch_exceptions=True)
+        except Exception:
+            # The expectations will read the file themselves, and report the error
+            logger.debug("Unable to scan {}".format(self._path), exc_info=True)
+            return None
+
     @MetaFileDataAsset.file_lines_map_expectation
     def expect_file_line_regex_match_count_to_be_between(self,
                                                          regex,
@@ -240,18 +554,22 @@ class FileDataAsset(MetaFileDataAsset):
                 raise ValueError("expected_max_count must be greater than or \
                                  equal to expected_min_count")
 
-        if expected_max_count != None and expected_min_count != None:
-            truth_list = [True if(len(comp_regex.findall(line)) >= expected_min_count and \
-                                len(comp_regex.findall(line)) <= expected_max_count) else False \
-                                for line in _lines]
+        if expected_max_count == 0:
+            # No match is allowed, so one search per line is enough
+            truth_list = [comp_regex.search(line) is None for line in _lines]
+
+        elif expected_max_count != None and expected_min_count != None:
+            truth_list = [expected_min_count <= len(comp_regex.findall(line)) <= expected_max_count
+                          for line in _lines]
 
         elif expected_max_count != None:
-            truth_list = [True if(len(comp_regex.findall(line)) <= expected_max_count) else False \
-                                for line in _lines]
+            truth_list = [len(comp_regex.findall(line)) <= expected_max_count for line in _lines]
+
+        elif expected_min_count == 1:
+            truth_list = [comp_regex.search(line) is not None for line in _lines]
 
-        elif expected_min_count != None:
-              truth_list = [True if(len(comp_regex.findall(line)) >= expected_min_count) else False \
-                                for line in _lines]
+        elif expected_min_count != None and expected_min_count > 0:
+            truth_list = [len(comp_regex.findall(line)) >= expected_min_count for line in _lines]
         else:
             truth_list = [True for line in _lines]
 
@@ -331,8 +649,10 @@ class FileDataAsset(MetaFileDataAsset):
         except:
             raise ValueError("expected_count must be a non-negative integer")
 
-        return [True if(len(comp_regex.findall(line)) == expected_count) else False \
-                                for line in _lines]
+        if expected_count == 0:
+            return [comp_regex.search(line) is None for line in _lines]
+
+        return [len(comp_regex.findall(line)) == expected_count for line in _lines]
 
     @DataAsset.expectation(["value"])
     def expect_file_hash_to_equal(self, value, hash_alg='md5', result_format=None,
@@ -369,23 +689,11 @@ class FileDataAsset(MetaFileDataAsset):
         <result_format>` and :ref:`include_config`, :ref:`catch_exceptions`,
         and :ref:`meta`.
         """
-        success = False
-        try:
-            hash = hashlib.new(hash_alg)
-
-        # Limit file reads to 64 KB chunks at a time
-            BLOCKSIZE = 65536
-            try:
-                with open(self._path, 'rb') as file:
-                    file_buffer = file.read(BLOCKSIZE)
-                    while file_buffer:
-                        hash.update(file_buffer)
-                        file_buffer = file.read(BLOCKSIZE)
-                    success = hash.hexdigest() == value
-            except IOError:
-                raise
-        except ValueError:
-            raise
+        if self._file_scan is not None and hash_alg in self._file_scan.hexdigests:
+            hexdigest = self._file_scan.hexdigests[hash_alg]
+        else:
+            hexdigest = FileScan(self._path, hash_algs=[hash_alg]).run().hexdigests[hash_alg]
+        success = hexdigest == value
         return {"success":success}
 
     @DataAsset.expectation(["minsize", "maxsize"])
@@ -561,12 +869,12 @@ class FileDataAsset(MetaFileDataAsset):
 
         success = False
 
-        try:
-            with open(self._path, 'r') as f:
-                lines = f.readlines() #Read in file lines
-
-        except IOError:
-            raise
+        # Only the lines up to the header are needed
+        first_line_count = (0 if skip is None else int(skip)) + 1
+        if self._file_scan is not None and self._file_scan.first_line_count >= first_line_count:
+            lines = self._file_scan.first_lines[:first_line_count]
+        else:
+            lines = FileScan(self._path, first_line_count=first_line_count).run().first_lines
 
             #Skip k initial lines designated by the user
         if skip is not None and skip <= len(lines):
@@ -621,10 +929,15 @@ class FileDataAsset(MetaFileDataAsset):
 
         """
         success = False
+        if self._file_scan is not None and self._file_scan.text is not None:
+            json_data = self._file_scan.text
+        else:
+            with open(self._path, 'r') as f:
+                json_data = f.read()
+
         if schema is None:
             try:
-                with open(self._path, 'r') as f:
-                    json.load(f)
+                json.loads(json_data)
                 success = True
             except ValueError:
                 success = False
@@ -633,8 +946,6 @@ class FileDataAsset(MetaFileDataAsset):
                 with open(schema, 'r') as s:
                     schema_data = s.read()
                 sdata = json.loads(schema_data)
-                with open(self._path, 'r') as f:
-                    json_data = f.read()
                 jdata = json.loads(json_data)
                 jsonschema.validate(jdata, sdata)
                 success = True
@@ -3,6 +3,7 @@
 from __future__ import division
 
 import decimal
+import re
 import sys
 import datetime
 
@@ -64,6 +65,78 @@ Usage::
 """
 
 
+class MultiRegexMatcher(object):
+    """Matches strings against a list of regular expressions, scanning each string once to find whether any of them
+    matches.
+
+    The regular expressions are combined into a single alternation, so that testing whether any of them matches a
+    string takes one regular expression call instead of one per regular expression. Checking that all of them match
+    narrows the strings down one regular expression at a time, so that each one only looks at the strings that every
+    earlier one matched.
+
+    Regular expressions whose meaning could change once combined, namely those with inline flags or numbered
+    backreferences, and lists that fail to compile as one regular expression, are matched one at a time instead,
+    with the same results.
+    """
+
+    _base_flags = re.compile("").flags
+
+    def __init__(self, regex_list):
+        self.regex_list = list(regex_list)
+        if len(self.regex_list) == 0:
+            raise ValueError("regex_list must contain at least one regular expression")
+        self.compiled_regex_list = [re.compile(regex) for regex in self.regex_list]
+
+        self._any_regex = None
+        if all([self._can_combine(regex, compiled_regex)
+                for regex, compiled_regex in zip(self.regex_list, self.compiled_regex_list)]):
+            try:
+                self._any_regex = re.compile("|".join(["(?:%s)" % regex for regex in self.regex_list]))
+            except Exception:
+                # For example, two regular expressions with a group of the same name
+                self._any_regex = None
+
+    @property
+    def is_combined(self):
+        """Whether the regular expressions are matched together, rather than one at a time."""
+        return self._any_regex is not None
+
+    def _can_combine(self, regex, compiled_regex):
+        if compiled_regex.flags != self._base_flags:
+            return False
+        # Group numbers change once regular expressions are combined
+        if compiled_regex.groups > 0 and re.search(r"\\[1-9]|\(\?\(\d", regex):
+            return False
+        return True
+
+    def search_any(self, value):
+        """Return whether re.search finds any of the regular expressions in value."""
+        if self._any_regex is None:
+            return any([compiled_regex.search(value) is not None for compiled_regex in self.compiled_regex_list])
+
+        return self._any_regex.search(value) is not None
+
+    def search_any_values(self, values):
+        """Return a boolean numpy array with, for each value, whether re.search finds any of the regular expressions
+        in it."""
+        return np.fromiter((self.search_any(value) for value in values), dtype=bool, count=len(values))
+
+    def search_all_values(self, values):
+        """Return a boolean numpy array with, for each value, whether re.search finds every one of the regular
+        expressions in it."""
+        values = list(values)
+        remaining = list(range(len(values)))
+        for compiled_regex in self.compiled_regex_list:
+            search = compiled_regex.search
+            remaining = [i for i in remaining if search(values[i]) is not None]
+            if len(remaining) == 0:
+                break
+
+        matches = np.zeros(len(values), dtype=bool)
+        matches[remaining] = True
+        return matches
+
+
 class DocInherit(object):
 
     def __init__(self, mthd):
@@ -199,3 +272,39 @@ def get_empty_expectation_suite(data_asset_name=None, expectation_suite_name="de
         },
         'expectations': []
     })
+
+
+def get_expectation_suite_columns(expectation_suite):
+    """Find the columns that the expectations of a suite reference through their column, column_A, column_B and
+    column_list kwargs.
+
+    Returns:
+        set: the names of the columns, or None if the suite has no column expectations or has expectations about \
+        the columns of the whole table (such as expect_table_columns_to_match_ordered_list) or about the position \
+        of a column (such as expect_column_to_exist with a column_index), which need every column in its place
+    """
+    if expectation_suite is None:
+        return None
+
+    columns = set()
+    for expectation in expectation_suite.get("expectations", []):
+        if expectation.get("expectation_type", "").startswith("expect_table_column"):
+            return None
+        kwargs = expectation.get("kwargs", {})
+        if kwargs.get("column_index") is not None:
+            return None
+        expectation_columns = [kwargs[column_kwarg] for column_kwarg in ["column", "column_A", "column_B"]
+                               if column_kwarg in kwargs]
+        column_list = kwargs.get("column_list", [])
+        if isinstance(column_list, dict):
+            return None
+        expectation_columns.extend(column_list)
+        for column in expectation_columns:
+            if isinstance(column, dict):
+                # An evaluation parameter, which could stand for any column
+                return None
+            columns.add(column)
+
+    if len(columns) == 0:
+        return None
+    return columns
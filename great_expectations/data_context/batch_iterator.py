@@ -0,0 +1,187 @@
+import logging
+import threading
+import time
+from collections import deque
+from multiprocessing.pool import ThreadPool
+
+logger = logging.getLogger(__name__)
+
+
+def get_batch_memory_usage(batch):
+    """Returns: the number of bytes of memory used by a batch, or None if that cannot be told cheaply"""
+    if hasattr(batch, "memory_usage"):
+        try:
+            return int(batch.memory_usage(index=True).sum())
+        except (TypeError, ValueError):
+            return None
+    return None
+
+
+class PrefetchingBatchIterator(object):
+    """Iterates over the batches of a sequence of batch kwargs, loading the next batches in background threads while
+    the caller validates the current one, so that loading and validating overlap.
+
+    Batches are returned in the order of their batch kwargs. At most prefetch batches are loaded ahead of the one
+    being validated, and, with max_bytes, no more batches are loaded ahead once the batches loaded or being loaded
+    would use more than max_bytes of memory; the size of batches still loading is estimated from those already
+    loaded, so only one batch is loaded ahead until one has loaded. A batch that fails to load raises its error when it
+    is reached.
+
+    Closing the iterator closes the batches loaded ahead that were not returned, including those that finish loading
+    afterwards.
+
+    Statistics are available from get_statistics, including the stall time, the time the caller spent waiting for a
+    batch that was not loaded yet.
+
+    Args:
+        load_batch: a function loading the batch of some batch kwargs
+        batch_kwargs: an iterable of the batch kwargs of the batches, read as batches are scheduled to be loaded
+        prefetch (int): the number of batches to load ahead of the current one
+        max_workers (int): the number of threads loading batches; defaults to prefetch
+        max_bytes (int): if given, the memory budget of the batches loaded ahead, as told by get_batch_memory_usage
+    """
+
+    def __init__(self, load_batch, batch_kwargs, prefetch=2, max_workers=None, max_bytes=None):
+        if prefetch < 1:
+            raise ValueError("prefetch must be at least 1")
+        self._load_batch = load_batch
+        self._batch_kwargs = iter(batch_kwargs)
+        self.prefetch = prefetch
+        self.max_bytes = max_bytes
+        self._pool = ThreadPool(max_workers or prefetch)
+        # The results of the batches scheduled to be loaded, in order
+        self._pending = deque()
+        self._exhausted = False
+        self._closed = False
+        # The batches loaded but not returned yet, by id, which close closes
+        self._loaded_ahead = {}
+        self._lock = threading.Lock()
+        self._statistics = {
+            "batches": 0,
+            "prefetched_batches": 0,
+            "stall_time": 0.0,
+            "load_time": 0.0,
+            "loaded_bytes": 0,
+            "loaded_batches": 0,
+            "sized_batches": 0,
+        }
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        if self._closed:
+            raise StopIteration
+        self._schedule()
+        if len(self._pending) == 0:
+            self.close()
+            raise StopIteration
+
+        result = self._pending.popleft()
+        ready = result.ready()
+        wait_start = time.time()
+        try:
+            batch = result.get()[0]
+        finally:
+            with self._lock:
+                self._statistics["stall_time"] += time.time() - wait_start
+        with self._lock:
+            self._loaded_ahead.pop(id(batch), None)
+            self._statistics["batches"] += 1
+            self._statistics["prefetched_batches"] += int(ready)
+
+        # The next batches load while the caller validates this one
+        self._schedule()
+        return batch
+
+    # Python 2
+    next = __next__
+
+    def _load(self, batch_kwargs):
+        start = time.time()
+        batch = self._load_batch(batch_kwargs)
+        load_time = time.time() - start
+        memory_usage = get_batch_memory_usage(batch)
+        with self._lock:
+            closed = self._closed
+            if not closed:
+                self._loaded_ahead[id(batch)] = batch
+            self._statistics["load_time"] += load_time
+            self._statistics["loaded_batches"] += 1
+            if memory_usage is not None:
+                self._statistics["loaded_bytes"] += memory_usage
+                self._statistics["sized_batches"] += 1
+        if closed:
+            # The iterator was closed while this batch loaded, so nothing will return it
+            self._close_batch(batch)
+        return batch, memory_usage, load_time
+
+    @staticmethod
+    def _close_batch(batch):
+        if hasattr(batch, "close"):
+            try:
+                batch.close()
+            except Exception:
+                logger.exception("Error closing a batch that was loaded ahead.")
+
+    def _get_pending_bytes(self):
+        """Estimate the memory used by the batches loaded or being loaded ahead, which is unbounded until a batch has
+        loaded, and counts batches whose size cannot be told as empty."""
+        with self._lock:
+            loaded_batches = self._statistics["loaded_batches"]
+            sized_batches = self._statistics["sized_batches"]
+            loaded_bytes = self._statistics["loaded_bytes"]
+        if loaded_batches == 0:
+            return float("inf")
+        average_bytes = loaded_bytes / float(sized_batches) if sized_batches else 0
+        pending_bytes = 0
+        for result in self._pending:
+            memory_usage = result.get()[1] if result.ready() and result.successful() else average_bytes
+            pending_bytes += memory_usage if memory_usage is not None else 0
+        return pending_bytes
+
+    def _schedule(self):
+        while not self._exhausted and len(self._pending) < self.prefetch:
+            # At least one batch is always loaded, however large
+            if self.max_bytes is not None and len(self._pending) > 0 and \
+                    self._get_pending_bytes() >= self.max_bytes:
+                break
+            try:
+                batch_kwargs = next(self._batch_kwargs)
+            except StopIteration:
+                self._exhausted = True
+                break
+            self._pending.append(self._pool.apply_async(self._load, (batch_kwargs,)))
+
+    def close(self):
+        """Stop loading batches, closing those loaded ahead."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            loaded_ahead = list(self._loaded_ahead.values())
+            self._loaded_ahead.clear()
+        self._pending.clear()
+        for batch in loaded_ahead:
+            self._close_batch(batch)
+        # Batches still loading are closed by _load once they have loaded
+        self._pool.terminate()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def get_statistics(self):
+        """Returns: dict with the number of batches returned, how many of them were loaded before they were reached,
+        the time spent waiting for batches to load (stall_time) and loading them (load_time) in seconds, and the
+        total memory used by the batches whose size is known"""
+        with self._lock:
+            return {
+                "batches": self._statistics["batches"],
+                "prefetched_batches": self._statistics["prefetched_batches"],
+                "stall_time": self._statistics["stall_time"],
+                "load_time": self._statistics["load_time"],
+                "loaded_bytes": self._statistics["loaded_bytes"],
+            }
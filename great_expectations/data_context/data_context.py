@@ -12,7 +12,9 @@ import copy
 import errno
 from six import string_types
 import datetime
+import random
 import warnings
+from multiprocessing.pool import ThreadPool
 
 from great_expectations.util import file_relative_path
 from .util import safe_mmkdir, substitute_all_config_variables, substitute_config_variable
@@ -36,6 +38,7 @@ from great_expectations.datasource import (
     SparkDFDatasource,
     DBTDatasource
 )
+from great_expectations.datasource.util import get_sampling_options
 from great_expectations.profile.basic_dataset_profiler import BasicDatasetProfiler
 
 from .types import (
@@ -54,6 +57,7 @@ from .util import (
     load_class,
     instantiate_class_from_config
 )
+from .batch_iterator import PrefetchingBatchIterator
 
 try:
     from sqlalchemy.exc import SQLAlchemyError
@@ -745,6 +749,51 @@ class ConfigOnlyDataContext(object):
                                           **kwargs)
         return data_asset
 
+    def iterate_batches(self, data_asset_name, expectation_suite_name, batch_kwargs_list=None, partition_ids=None,
+                        prefetch=2, max_workers=None, max_bytes=None, **kwargs):
+        """
+        Iterate over batches of a data asset, loading the next batches in background threads while the current one
+        is validated.
+
+        The batches are those of batch_kwargs_list, or of the partitions in partition_ids, or else all the batches
+        that the generator of the data asset yields, read with an iterator of their own that does not affect
+        yield_batch_kwargs.
+
+        Args:
+            data_asset_name: name of the data asset. The name will be normalized. \
+                (See :py:meth:`normalize_data_asset_name` )
+            expectation_suite_name: name of the expectation suite to attach to the batches
+            batch_kwargs_list: the batch_kwargs of the batches
+            partition_ids: the partition_ids of the batches
+            prefetch (int): the number of batches to load ahead of the current one
+            max_workers (int): the number of threads loading batches; defaults to prefetch
+            max_bytes (int): if given, stop loading batches ahead while those loaded ahead would use more than \
+                max_bytes of memory
+            **kwargs: additional kwargs to supplement the batch_kwargs built by the generator
+
+        Returns:
+            PrefetchingBatchIterator: an iterator of the batches, which reports how long the caller waited for them \
+            in get_statistics
+        """
+        normalized_data_asset_name = self.normalize_data_asset_name(data_asset_name)
+        if batch_kwargs_list is not None:
+            batch_kwargs = batch_kwargs_list
+        elif partition_ids is not None:
+            batch_kwargs = (
+                self.build_batch_kwargs(normalized_data_asset_name, partition_id=partition_id, **kwargs)
+                for partition_id in partition_ids
+            )
+        else:
+            datasource = self.get_datasource(normalized_data_asset_name.datasource)
+            generator = datasource.get_generator(normalized_data_asset_name.generator)
+            batch_kwargs = generator.iterate_batch_kwargs(normalized_data_asset_name.generator_asset, **kwargs)
+
+        def load_batch(batch_kwargs):
+            return self.get_batch(normalized_data_asset_name, expectation_suite_name, batch_kwargs=batch_kwargs)
+
+        return PrefetchingBatchIterator(load_batch, batch_kwargs, prefetch=prefetch, max_workers=max_workers,
+                                        max_bytes=max_bytes)
+
     def run_validation_operator(
             self,
             validation_operator_name,
@@ -1664,7 +1713,10 @@ class ConfigOnlyDataContext(object):
                            profile_all_data_assets=True,
                            profiler=BasicDatasetProfiler,
                            dry_run=False,
-                           additional_batch_kwargs=None):
+                           additional_batch_kwargs=None,
+                           sample_fraction=None,
+                           sample_seed=None,
+                           max_workers=1):
         """Profile the named datasource using the named profiler.
 
         Args:
@@ -1677,6 +1729,11 @@ class ConfigOnlyDataContext(object):
             profiler: the profiler class to use
             dry_run: when true, the method checks arguments and reports if can profile or specifies the arguments that are missing
             additional_batch_kwargs: Additional keyword arguments to be provided to get_batch when loading the data asset.
+            sample_fraction: when set, profile a random sample of about this fraction of the rows of each data asset
+                instead of all of them, using the "sampling" batch_kwargs of the datasource
+            sample_seed: the seed of the random samples; when sampling without a seed, one is chosen at random. The
+                fraction and seed are recorded in the meta of the profiled expectation suites.
+            max_workers: the number of data assets to profile concurrently
         Returns:
             A dictionary::
 
@@ -1687,6 +1744,16 @@ class ConfigOnlyDataContext(object):
 
             When success = False, the error details are under "error" key
         """
+        if not isinstance(max_workers, int) or max_workers < 1:
+            raise ValueError("max_workers must be a positive integer, not {!r}".format(max_workers))
+
+        if sample_fraction is not None:
+            if sample_seed is None:
+                sample_seed = random.randint(0, 2 ** 31 - 1)
+            additional_batch_kwargs = dict(additional_batch_kwargs or {})
+            additional_batch_kwargs["sampling"] = {"fraction": sample_fraction, "seed": sample_seed}
+            # Check the sampling options before loading any batch
+            get_sampling_options(additional_batch_kwargs)
 
         if not dry_run:
             logger.info("Profiling '%s' with '%s'" % (datasource_name, profiler.__name__))
@@ -1747,86 +1814,51 @@ class ConfigOnlyDataContext(object):
 
         if not dry_run:
             profiling_results['results'] = []
-            total_columns, total_expectations, total_rows, skipped_data_assets = 0, 0, 0, 0
+            total_columns, total_expectations, total_rows = 0, 0, 0
             total_start_time = datetime.datetime.now()
             # run_id = total_start_time.isoformat().replace(":", "") + "Z"
             run_id = "profiling"
 
-            for name in data_asset_name_list:
+            if additional_batch_kwargs is None:
+                additional_batch_kwargs = {}
+            skipped_data_asset_names = []
+
+            def profile_data_asset(name):
+                """Returns the profiling results and statistics of the data asset, or None if it could not be profiled."""
                 logger.info("\tProfiling '%s'..." % name)
                 try:
-                    start_time = datetime.datetime.now()
-
-                    # FIXME: There needs to be an affordance here to limit to 100 rows, or downsample, etc.
-                    if additional_batch_kwargs is None:
-                        additional_batch_kwargs = {}
-
-                    normalized_data_asset_name = self.normalize_data_asset_name(name)
-                    expectation_suite_name = profiler.__name__
-                    self.create_expectation_suite(
-                        data_asset_name=normalized_data_asset_name,
-                        expectation_suite_name=expectation_suite_name,
-                        overwrite_existing=True
-                    )
-                    batch_kwargs = self.yield_batch_kwargs(
-                        data_asset_name=normalized_data_asset_name,
-                        **additional_batch_kwargs
-                    )
-
-                    batch = self.get_batch(
-                        data_asset_name=normalized_data_asset_name,
-                        expectation_suite_name=expectation_suite_name,
-                        batch_kwargs=batch_kwargs
-                    )
-
-                    if not profiler.validate(batch):
-                        raise ge_exceptions.ProfilerError(
-                            "batch '%s' is not a valid batch for the '%s' profiler" % (name, profiler.__name__)
-                        )
-
-                    # Note: This logic is specific to DatasetProfilers, which profile a single batch. Multi-batch profilers
-                    # will have more to unpack.
-                    expectation_suite, validation_results = profiler.profile(batch, run_id=run_id)
-                    profiling_results['results'].append((expectation_suite, validation_results))
-
-                    self.validations_store.set(
-                        key=ValidationResultIdentifier(
-                            expectation_suite_identifier=ExpectationSuiteIdentifier(
-                                data_asset_name=DataAssetIdentifier(
-                                    *normalized_data_asset_name
-                                ),
-                                expectation_suite_name=expectation_suite_name
-                            ),
-                            run_id=run_id
-                        ),
-                        value=validation_results
-                    )
-
-                    if isinstance(batch, Dataset):
-                        # For datasets, we can produce some more detailed statistics
-                        row_count = batch.get_row_count()
-                        total_rows += row_count
-                        new_column_count = len(set([exp["kwargs"]["column"] for exp in expectation_suite["expectations"] if "column" in exp["kwargs"]]))
-                        total_columns += new_column_count
-
-                    new_expectation_count = len(expectation_suite["expectations"])
-                    total_expectations += new_expectation_count
-
-                    self.save_expectation_suite(expectation_suite)
-                    duration = (datetime.datetime.now() - start_time).total_seconds()
-                    logger.info("\tProfiled %d columns using %d rows from %s (%.3f sec)" %
-                                (new_column_count, row_count, name, duration))
-
+                    return self._profile_data_asset(name, profiler, run_id, additional_batch_kwargs)
                 except ge_exceptions.ProfilerError as err:
                     logger.warning(err.message)
                 except IOError as err:
                     logger.warning("IOError while profiling %s. (Perhaps a loading error?) Skipping." % name)
                     logger.debug(str(err))
-                    skipped_data_assets += 1
+                    skipped_data_asset_names.append(name)
                 except SQLAlchemyError as e:
                     logger.warning("SqlAlchemyError while profiling %s. Skipping." % name)
                     logger.debug(str(e))
-                    skipped_data_assets += 1
+                    skipped_data_asset_names.append(name)
+
+            if max_workers == 1:
+                data_asset_results = [profile_data_asset(name) for name in data_asset_name_list]
+            else:
+                pool = ThreadPool(max_workers)
+                try:
+                    # Results come back in the order of data_asset_name_list
+                    data_asset_results = pool.map(profile_data_asset, data_asset_name_list)
+                finally:
+                    pool.close()
+                    pool.join()
+
+            skipped_data_assets = len(skipped_data_asset_names)
+            for data_asset_result in data_asset_results:
+                if data_asset_result is None:
+                    continue
+                expectation_suite, validation_results, row_count, column_count = data_asset_result
+                profiling_results['results'].append((expectation_suite, validation_results))
+                total_rows += row_count
+                total_columns += column_count
+                total_expectations += len(expectation_suite["expectations"])
 
             total_duration = (datetime.datetime.now() - total_start_time).total_seconds()
             logger.info("""
@@ -1845,6 +1877,77 @@ class ConfigOnlyDataContext(object):
         profiling_results['success'] = True
         return profiling_results
 
+    def _profile_data_asset(self, name, profiler, run_id, additional_batch_kwargs):
+        """Profile one data asset for profile_datasource, storing its expectation suite and validation results.
+
+        Returns:
+            an (expectation_suite, validation_results, row_count, column_count) tuple
+        """
+        start_time = datetime.datetime.now()
+
+        normalized_data_asset_name = self.normalize_data_asset_name(name)
+        expectation_suite_name = profiler.__name__
+        self.create_expectation_suite(
+            data_asset_name=normalized_data_asset_name,
+            expectation_suite_name=expectation_suite_name,
+            overwrite_existing=True
+        )
+        # Not every generator accepts sampling options, so they are added to the generated batch_kwargs instead
+        additional_batch_kwargs = dict(additional_batch_kwargs)
+        sampling = additional_batch_kwargs.pop("sampling", None)
+        batch_kwargs = self.yield_batch_kwargs(
+            data_asset_name=normalized_data_asset_name,
+            **additional_batch_kwargs
+        )
+        if sampling is not None:
+            batch_kwargs["sampling"] = sampling
+
+        batch = self.get_batch(
+            data_asset_name=normalized_data_asset_name,
+            expectation_suite_name=expectation_suite_name,
+            batch_kwargs=batch_kwargs
+        )
+
+        try:
+            if not profiler.validate(batch):
+                raise ge_exceptions.ProfilerError(
+                    "batch '%s' is not a valid batch for the '%s' profiler" % (name, profiler.__name__)
+                )
+
+            # Note: This logic is specific to DatasetProfilers, which profile a single batch. Multi-batch profilers
+            # will have more to unpack.
+            expectation_suite, validation_results = profiler.profile(batch, run_id=run_id)
+
+            self.validations_store.set(
+                key=ValidationResultIdentifier(
+                    expectation_suite_identifier=ExpectationSuiteIdentifier(
+                        data_asset_name=DataAssetIdentifier(
+                            *normalized_data_asset_name
+                        ),
+                        expectation_suite_name=expectation_suite_name
+                    ),
+                    run_id=run_id
+                ),
+                value=validation_results
+            )
+
+            row_count, column_count = 0, 0
+            if isinstance(batch, Dataset):
+                # For datasets, we can produce some more detailed statistics
+                row_count = batch.get_row_count()
+                column_count = len(set([exp["kwargs"]["column"] for exp in expectation_suite["expectations"] if "column" in exp["kwargs"]]))
+        finally:
+            if hasattr(batch, "close"):
+                # Release the database connection that the batch may hold
+                batch.close()
+
+        self.save_expectation_suite(expectation_suite)
+        duration = (datetime.datetime.now() - start_time).total_seconds()
+        logger.info("\tProfiled %d columns using %d rows from %s (%.3f sec)" %
+                    (column_count, row_count, name, duration))
+
+        return expectation_suite, validation_results, row_count, column_count
+
 
 class DataContext(ConfigOnlyDataContext):
     """A DataContext represents a Great Expectations project. It organizes storage and access for
@@ -22,4 +22,8 @@ from .namespaced_read_write_store import (
 
 from .evaluation_parameter_store import (
     InMemoryEvaluationParameterStore,
+)
+
+from .validation_metrics_store import (
+    ParquetValidationMetricsStore,
 )
\ No newline at end of file
@@ -1,8 +1,11 @@
 import logging
 
+from collections import OrderedDict
 import copy
+import hashlib
 from mimetypes import guess_type
 import os
+import threading
 
 from ..types.base_resource_identifiers import (
     DataContextKey,
@@ -14,6 +17,7 @@ from great_expectations.data_context.types.resource_identifiers import (
 )
 from .store import (
     ReadWriteStore,
+    SERIALIZATION_CONTENT_METADATA,
 )
 from .store_backend import (
     FixedLengthTupleStoreBackend
@@ -72,11 +76,21 @@ class NamespacedReadWriteStore(ReadWriteStore):
         key_tuple = self._convert_resource_identifier_to_tuple(key)
         return self.store_backend.get(key_tuple)
 
-    def _set(self, key, serialized_value):
+    def _set(self, key, serialized_value, serialization_type=None):
         self._validate_key(key)
 
         key_tuple = self._convert_resource_identifier_to_tuple(key)
-        return self.store_backend.set(key_tuple, serialized_value)
+        content_metadata = SERIALIZATION_CONTENT_METADATA.get(serialization_type or self.serialization_type)
+        if content_metadata is None:
+            return self.store_backend.set(key_tuple, serialized_value)
+
+        content_encoding, content_type = content_metadata
+        return self.store_backend.set(
+            key_tuple,
+            serialized_value,
+            content_encoding=content_encoding,
+            content_type=content_type
+        )
 
     def list_keys(self):
         return [self._convert_tuple_to_resource_identifier(key) for key in self.store_backend.list_keys()]
@@ -120,9 +134,96 @@ class NamespacedReadWriteStore(ReadWriteStore):
             ))
 
 
+def copy_expectation_suite(expectation_suite):
+    """Copy a deserialized expectation suite, which only holds dicts, lists and immutable values; this is much
+    cheaper than copy.deepcopy."""
+    if isinstance(expectation_suite, dict):
+        return {key: copy_expectation_suite(value) for key, value in expectation_suite.items()}
+    if isinstance(expectation_suite, list):
+        return [copy_expectation_suite(value) for value in expectation_suite]
+    return expectation_suite
+
+
 class ExpectationsStore(NamespacedReadWriteStore):
-    # Note : As of 2019/09/06, this method is untested.
-    # It shares virtually all of its business logic with ValidationStore, which is under test.
+    """Stores expectation suites, keeping an LRU cache of deserialized suites.
+
+    A cached suite is reused only while the backend reports the same change token for its key (mtime and size for
+    the filesystem backend, ETag for S3 and GCS), so edits made outside this process are always picked up. Backends
+    that cannot report a change token are never cached.
+
+    Every call to `get` returns a new copy of the cached suite, so callers may modify the suites they get without
+    affecting the cache or each other. Writing a suite with `set` evicts it from the cache. The cache may be used
+    from several threads at once, as it is when a validation operator validates batches concurrently.
+    """
+
+    def __init__(self,
+        store_backend,
+        root_directory,
+        serialization_type="json",
+        cache_size=128
+    ):
+        super(ExpectationsStore, self).__init__(
+            store_backend=store_backend,
+            root_directory=root_directory,
+            serialization_type=serialization_type,
+        )
+        self.cache_size = cache_size
+        self._suite_cache = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    def get(self, key, serialization_type=None):
+        if not self.cache_size or (serialization_type and serialization_type != self.serialization_type):
+            return super(ExpectationsStore, self).get(key, serialization_type=serialization_type)
+
+        self._validate_key(key)
+        change_token = self.store_backend.get_change_token(self._convert_resource_identifier_to_tuple(key))
+
+        with self._cache_lock:
+            cached = self._suite_cache.pop(key, None)
+            if cached is not None and change_token is not None and cached[0] == change_token:
+                self.cache_hits += 1
+                self._suite_cache[key] = cached
+                # The cached suite is never handed out, since callers may modify the suite they are given
+                return copy_expectation_suite(cached[1])
+            self.cache_misses += 1
+
+        expectation_suite = super(ExpectationsStore, self).get(key)
+        if change_token is not None:
+            self._cache_suite(key, change_token, copy_expectation_suite(expectation_suite))
+        return expectation_suite
+
+    def set(self, key, value, serialization_type=None):
+        # Drop any cached copy rather than caching the caller's object, which the caller may go on to modify
+        with self._cache_lock:
+            self._suite_cache.pop(key, None)
+        return super(ExpectationsStore, self).set(key, value, serialization_type=serialization_type)
+
+    def has_key(self, key):
+        self._validate_key(key)
+        # A change token is only available for keys that exist, and is much cheaper than listing every key
+        if self.store_backend.get_change_token(self._convert_resource_identifier_to_tuple(key)) is not None:
+            return True
+        return super(ExpectationsStore, self).has_key(key)
+
+    def clear_cache(self):
+        with self._cache_lock:
+            self._suite_cache.clear()
+
+    def get_cache_statistics(self):
+        return {
+            "hits": self.cache_hits,
+            "misses": self.cache_misses,
+            "size": len(self._suite_cache),
+            "max_size": self.cache_size,
+        }
+
+    def _cache_suite(self, key, change_token, expectation_suite):
+        with self._cache_lock:
+            self._suite_cache[key] = (change_token, expectation_suite)
+            while len(self._suite_cache) > self.cache_size:
+                self._suite_cache.popitem(last=False)
 
     def _init_store_backend(self, store_backend_config, runtime_config):
         self.key_class = ExpectationSuiteIdentifier
@@ -182,6 +283,9 @@ class ValidationsStore(NamespacedReadWriteStore):
 
 class HtmlSiteStore(NamespacedReadWriteStore):
 
+    # The key of the file that records the digest of the static assets copied into the site
+    STATIC_ASSETS_DIGEST_KEY = ("static", "static_assets_digest.txt")
+
     def __init__(self,
                  root_directory,
                  serialization_type=None,
@@ -292,7 +396,7 @@ class HtmlSiteStore(NamespacedReadWriteStore):
             type(key.resource_identifier)
         ].get(key_tuple)
 
-    def _set(self, key, serialized_value):
+    def _set(self, key, serialized_value, serialization_type=None):
         self._validate_key(key)
 
         self.keys.add(key)
@@ -333,39 +437,69 @@ class HtmlSiteStore(NamespacedReadWriteStore):
         return self.store_backends["index_page"].set((), page, content_encoding='utf-8', content_type='text/html; '
                                                                                                       'charset=utf-8')
     
-    def copy_static_assets(self, static_assets_source_dir=None):
+    def copy_static_assets(self, static_assets_source_dir=None, force=False):
         """
         Copies static assets, using a special "static_assets" backend store that accepts variable-length tuples as
         keys, with no filepath_template.
+
+        A digest of the copied files is stored alongside them, and the copy is skipped when the site already holds
+        assets with the same digest. Pass force=True to copy the assets regardless.
+
+        Returns:
+            True if the assets were copied, False if they were already up to date
         """
-        file_exclusions = [".DS_Store"]
-        dir_exclusions = []
-        
         if not static_assets_source_dir:
             static_assets_source_dir = file_relative_path(__file__, "../../render/view/static")
 
-        for item in os.listdir(static_assets_source_dir):
-            # Directory
-            if os.path.isdir(os.path.join(static_assets_source_dir, item)):
-                if item in dir_exclusions:
-                    continue
-                # Recurse
-                new_source_dir = os.path.join(static_assets_source_dir, item)
-                self.copy_static_assets(new_source_dir)
-            # File
-            else:
-                # Copy file over using static assets store backend
-                if item in file_exclusions:
+        static_assets = self._list_static_assets(static_assets_source_dir)
+
+        digest = hashlib.md5()
+        for store_key, source_name in static_assets:
+            digest.update("/".join(store_key).encode("utf-8"))
+            with open(source_name, 'rb') as f:
+                digest.update(f.read())
+        digest = digest.hexdigest()
+
+        static_assets_backend = self.store_backends["static_assets"]
+        if not force and static_assets_backend.get_change_token(self.STATIC_ASSETS_DIGEST_KEY) is not None and \
+                static_assets_backend.get(self.STATIC_ASSETS_DIGEST_KEY) == digest:
+            logger.debug("Static assets are up to date; skipping copy")
+            return False
+
+        for store_key, source_name in static_assets:
+            with open(source_name, 'rb') as f:
+                content_type, content_encoding = guess_type(source_name, strict=False)
+                static_assets_backend.set(
+                    store_key,
+                    f.read(),
+                    content_encoding=content_encoding,
+                    content_type=content_type
+                )
+        # Written last, so that an interrupted copy is repeated on the next build
+        static_assets_backend.set(
+            self.STATIC_ASSETS_DIGEST_KEY,
+            digest,
+            content_encoding='utf-8',
+            content_type='text/plain; charset=utf-8'
+        )
+        return True
+
+    @staticmethod
+    def _list_static_assets(static_assets_source_dir):
+        """Returns a sorted list of (store key, source file path) tuples for the files under static_assets_source_dir."""
+        file_exclusions = [".DS_Store"]
+        dir_exclusions = []
+
+        static_assets = []
+        for dirpath, dirnames, filenames in os.walk(static_assets_source_dir):
+            dirnames[:] = [dirname for dirname in dirnames if dirname not in dir_exclusions]
+            for filename in filenames:
+                if filename in file_exclusions:
                     continue
-                source_name = os.path.join(static_assets_source_dir, item)
-                with open(source_name, 'rb') as f:
-                    # Only use path elements starting from static/ for key
-                    store_key = tuple(os.path.normpath(source_name).split(os.sep))
-                    store_key = store_key[store_key.index('static'):]
-                    content_type, content_encoding = guess_type(item, strict=False)
-                    self.store_backends["static_assets"].set(
-                        store_key,
-                        f.read(),
-                        content_encoding=content_encoding,
-                        content_type=content_type
-                    )
+                source_name = os.path.join(dirpath, filename)
+                # Only use path elements starting from static/ for key
+                store_key = tuple(os.path.normpath(source_name).split(os.sep))
+                store_key = store_key[store_key.index('static'):]
+                static_assets.append((store_key, source_name))
+
+        return sorted(static_assets)
@@ -2,6 +2,8 @@ import logging
 logger = logging.getLogger(__name__)
 
 from six import string_types
+import gzip
+import io
 import json
 
 import pandas as pd
@@ -10,6 +12,30 @@ from great_expectations.data_context.util import (
     instantiate_class_from_config
 )
 
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+    logger.debug("Unable to import msgpack.")
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+    logger.debug("Unable to import zstandard.")
+
+GZIP_MAGIC_NUMBER = b"\x1f\x8b"
+ZSTD_MAGIC_NUMBER = b"\x28\xb5\x2f\xfd"
+
+# serialization_type -> (content_encoding, content_type) to record alongside the serialized value,
+# for backends such as S3 that keep object metadata
+SERIALIZATION_CONTENT_METADATA = {
+    "json": ("utf-8", "application/json"),
+    "gzip_json": ("gzip", "application/json"),
+    "zstd_json": ("zstd", "application/json"),
+    "msgpack": (None, "application/msgpack"),
+}
+
 # TODO : Add a ConfigReadWriteStore.
 
 class WriteOnlyStore(object):
@@ -25,15 +51,12 @@ class WriteOnlyStore(object):
     def set(self, key, value, serialization_type=None):
         self._validate_key(key)
         
-        if serialization_type:
-            serialization_method = self._get_serialization_method(
-                serialization_type)
-        else:
-            serialization_method = self._get_serialization_method(
-                self.serialization_type)
+        if not serialization_type:
+            serialization_type = self.serialization_type
+        serialization_method = self._get_serialization_method(serialization_type)
 
         serialized_value = serialization_method(value)
-        return self._set(key, serialized_value)
+        return self._set(key, serialized_value, serialization_type=serialization_type)
 
 
     # NOTE : Abe 2019/09/06 : It's unclear whether this serialization logic belongs here,
@@ -46,6 +69,19 @@ class WriteOnlyStore(object):
         elif serialization_type == "json":
             return json.dumps
 
+        elif serialization_type == "gzip_json":
+            return lambda x: gzip_compress(json.dumps(x).encode("utf-8"))
+
+        elif serialization_type == "zstd_json":
+            if zstandard is None:
+                raise ImportError("zstd_json serialization requires the zstandard package.")
+            return lambda x: zstandard.ZstdCompressor().compress(json.dumps(x).encode("utf-8"))
+
+        elif serialization_type == "msgpack":
+            if msgpack is None:
+                raise ImportError("msgpack serialization requires the msgpack package.")
+            return lambda x: msgpack.packb(x, use_bin_type=True)
+
         elif serialization_type == "pandas_csv":
 
             def convert_to_csv(df):
@@ -70,7 +106,7 @@ class WriteOnlyStore(object):
     def _setup(self):
         pass
 
-    def _set(self, key, value):
+    def _set(self, key, value, serialization_type=None):
         raise NotImplementedError
 
 
@@ -108,8 +144,10 @@ class ReadWriteStore(WriteOnlyStore):
         if serialization_type == None:
             return lambda x: x
 
-        elif serialization_type == "json":
-            return json.loads
+        elif serialization_type in ["json", "gzip_json", "zstd_json", "msgpack"]:
+            # Every json-compatible serialization type reads all of the others, so changing a store's
+            # serialization_type does not strand values that were written before the change.
+            return deserialize_json_compatible
 
         elif serialization_type == "pandas_csv":
             # TODO:
@@ -148,7 +186,7 @@ class BasicInMemoryStore(ReadWriteStore):
     def _get(self, key):
         return self.store_backend.get((key,))
     
-    def _set(self, key, value):
+    def _set(self, key, value, serialization_type=None):
         self.store_backend.set((key,), value)
 
     def has_key(self, key):
@@ -156,3 +194,42 @@ class BasicInMemoryStore(ReadWriteStore):
 
     def list_keys(self):
         return [key for key, in self.store_backend.list_keys()]
+
+
+def gzip_compress(value):
+    # mtime=0 keeps the output identical for identical input
+    buffer = io.BytesIO()
+    with gzip.GzipFile(fileobj=buffer, mode="wb", mtime=0) as gzip_file:
+        gzip_file.write(value)
+    return buffer.getvalue()
+
+
+def gzip_decompress(value):
+    with gzip.GzipFile(fileobj=io.BytesIO(value), mode="rb") as gzip_file:
+        return gzip_file.read()
+
+
+def deserialize_json_compatible(value):
+    """Deserialize a value written with any of the json, gzip_json, zstd_json or msgpack serialization types.
+
+    The format is recognized from the value itself: gzip and zstd frames start with their magic numbers, and
+    a msgpack map or array starts with a byte of 0x80 or above, which can never start a JSON document.
+    """
+    if isinstance(value, string_types) and not isinstance(value, bytes):
+        return json.loads(value)
+
+    value = bytes(value)
+    if value[:2] == GZIP_MAGIC_NUMBER:
+        return json.loads(gzip_decompress(value).decode("utf-8"))
+
+    if value[:4] == ZSTD_MAGIC_NUMBER:
+        if zstandard is None:
+            raise ImportError("Reading zstd-compressed values requires the zstandard package.")
+        return json.loads(zstandard.ZstdDecompressor().decompress(value).decode("utf-8"))
+
+    if len(value) > 0 and bytearray(value[:1])[0] >= 0x80:
+        if msgpack is None:
+            raise ImportError("Reading msgpack values requires the msgpack package.")
+        return msgpack.unpackb(value, raw=False)
+
+    return json.loads(value.decode("utf-8"))
@@ -58,6 +58,15 @@ class StoreBackend(object):
         self._validate_key(key)
         return self._has_key(key)
 
+    def get_change_token(self, key):
+        """Return an opaque token that changes whenever the value stored at key changes.
+
+        Stores use the token to decide whether a previously deserialized value is still current. Backends that
+        cannot detect changes cheaply return None, which tells callers not to cache the value.
+        """
+        self._validate_key(key)
+        return self._get_change_token(key)
+
     def _validate_key(self, key):
         if not isinstance(key, tuple):
             raise TypeError("Keys in {0} must be instances of {1}, not {2}".format(
@@ -83,6 +92,9 @@ class StoreBackend(object):
     def _set(self, key, value, **kwargs):
         raise NotImplementedError
 
+    def _get_change_token(self, key):
+        return None
+
     def list_keys(self):
         raise NotImplementedError
 
@@ -299,8 +311,26 @@ class FixedLengthTupleFilesystemStoreBackend(FixedLengthTupleStoreBackend):
             self.full_base_directory,
             self._convert_key_to_filepath(key)
         )
-        with open(filepath, 'r') as infile:
-            return infile.read()
+        with open(filepath, 'rb') as infile:
+            contents = infile.read()
+        # Text is returned as str, while binary values such as compressed or msgpack-serialized objects
+        # are returned as bytes
+        try:
+            return contents.decode("utf-8")
+        except UnicodeDecodeError:
+            return contents
+
+    def _get_change_token(self, key):
+        filepath = os.path.join(
+            self.full_base_directory,
+            self._convert_key_to_filepath(key)
+        )
+        try:
+            file_stat = os.stat(filepath)
+        except OSError:
+            return None
+        # st_mtime_ns is not available in python 2
+        return getattr(file_stat, "st_mtime_ns", file_stat.st_mtime), file_stat.st_size
 
     def _set(self, key, value, **kwargs):
         filepath = os.path.join(
@@ -389,7 +419,27 @@ class FixedLengthTupleS3StoreBackend(FixedLengthTupleStoreBackend):
         import boto3
         s3 = boto3.client('s3', **self._boto3_options)
         s3_response_object = s3.get_object(Bucket=self.bucket, Key=s3_object_key)
-        return s3_response_object['Body'].read().decode(s3_response_object.get("ContentEncoding", 'utf-8'))
+        contents = s3_response_object['Body'].read()
+        # A ContentEncoding such as gzip marks a binary value, which is returned as bytes
+        try:
+            return contents.decode(s3_response_object.get("ContentEncoding", 'utf-8'))
+        except (LookupError, UnicodeDecodeError):
+            return contents
+
+    def _get_change_token(self, key):
+        s3_object_key = os.path.join(
+            self.prefix,
+            self._convert_key_to_filepath(key)
+        )
+
+        import boto3
+        from botocore.exceptions import ClientError
+        s3 = boto3.client('s3', **self._boto3_options)
+        try:
+            s3_response_object = s3.head_object(Bucket=self.bucket, Key=s3_object_key)
+        except ClientError:
+            return None
+        return s3_response_object.get("ETag")
 
     def _set(self, key, value, content_encoding='utf-8', content_type='application/json', **kwargs):
         s3_object_key = os.path.join(
@@ -400,11 +450,15 @@ class FixedLengthTupleS3StoreBackend(FixedLengthTupleStoreBackend):
         import boto3
         s3 = boto3.resource('s3', **self._boto3_options)
         result_s3 = s3.Object(self.bucket, s3_object_key)
-        if isinstance(value, string_types):
+        # Serialized values are bytes, which also pass the string check on py2, so they are sent unchanged
+        if isinstance(value, six.binary_type):
+            if content_encoding is not None:
+                result_s3.put(Body=value, ContentEncoding=content_encoding, ContentType=content_type)
+            else:
+                result_s3.put(Body=value, ContentType=content_type)
+        else:
             result_s3.put(Body=value.encode(content_encoding), ContentEncoding=content_encoding,
                           ContentType=content_type)
-        else:
-            result_s3.put(Body=value, ContentType=content_type)
         return s3_object_key
 
     def list_keys(self):
@@ -475,7 +529,25 @@ class FixedLengthTupleGCSStoreBackend(FixedLengthTupleStoreBackend):
         gcs = storage.Client(project=self.project)
         bucket = gcs.get_bucket(self.bucket)
         gcs_response_object = bucket.get_blob(gcs_object_key)
-        return gcs_response_object.download_as_string().decode("utf-8")
+        contents = gcs_response_object.download_as_string()
+        try:
+            return contents.decode("utf-8")
+        except UnicodeDecodeError:
+            return contents
+
+    def _get_change_token(self, key):
+        gcs_object_key = os.path.join(
+            self.prefix,
+            self._convert_key_to_filepath(key)
+        )
+
+        from google.cloud import storage
+        gcs = storage.Client(project=self.project)
+        bucket = gcs.get_bucket(self.bucket)
+        gcs_response_object = bucket.get_blob(gcs_object_key)
+        if gcs_response_object is None:
+            return None
+        return gcs_response_object.etag
 
     def _set(self, key, value, content_encoding='utf-8', content_type='application/json', **kwargs):
         gcs_object_key = os.path.join(
@@ -487,15 +559,15 @@ class FixedLengthTupleGCSStoreBackend(FixedLengthTupleStoreBackend):
         gcs = storage.Client(project=self.project)
         bucket = gcs.get_bucket(self.bucket)
         blob = bucket.blob(gcs_object_key)
-        if isinstance(value, string_types):
-            # Following try/except is to support py2, since both str and bytes objects pass above condition
-            try:
-                blob.upload_from_string(value.encode(content_encoding), content_encoding=content_encoding,
-                                        content_type=content_type)
-            except TypeError:
+        # Serialized values are bytes, which also pass the string check on py2, so they are sent unchanged
+        if isinstance(value, six.binary_type):
+            if content_encoding is not None:
+                blob.upload_from_string(value, content_encoding=content_encoding, content_type=content_type)
+            else:
                 blob.upload_from_string(value, content_type=content_type)
         else:
-            blob.upload_from_string(value, content_type=content_type)
+            blob.upload_from_string(value.encode(content_encoding), content_encoding=content_encoding,
+                                    content_type=content_type)
         return gcs_object_key
 
     def list_keys(self):
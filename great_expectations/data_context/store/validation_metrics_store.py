@@ -0,0 +1,231 @@
+import logging
+import operator
+import os
+import uuid
+
+import numpy as np
+import pandas as pd
+from six.moves.urllib.parse import quote, unquote
+
+from ..types.resource_identifiers import (
+    ValidationResultIdentifier,
+)
+from ..util import safe_mmkdir
+from great_expectations.datasource.types import BatchKwargs
+from great_expectations.profile.metrics_utils import acts_as_a_number
+
+logger = logging.getLogger(__name__)
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
+    logger.debug("Unable to import pyarrow.")
+
+
+class ParquetValidationMetricsStore(object):
+    """Appends flattened per-expectation metrics from validation results to partitioned Parquet files.
+
+    Each validation result is written as one new Parquet file under a directory per data asset and expectation suite,
+    named after its run_id:
+    {base_directory}/{datasource}/{generator}/{generator_asset}/{expectation_suite_name}/{run_id}.{uuid}.parquet
+
+    That layout lets `query` skip every partition that a filter on the data asset or suite rules out, and every file
+    that a filter on the run_id rules out, such as ("run_id", ">=", "20190701") to read the runs of a time window when
+    run ids are timestamps. Only the requested columns are read from the files that remain, instead of listing and
+    parsing every validation result JSON file.
+
+    Only scalar metrics are captured: observed values that are not numbers (such as quantile lists) are stored as NaN.
+    """
+
+    PARTITION_COLUMNS = ["datasource", "generator", "generator_asset", "expectation_suite_name"]
+    METRIC_COLUMNS = [
+        "run_id",
+        "batch_partition_id",
+        "batch_fingerprint",
+        "expectation_type",
+        "column",
+        "observed_value",
+        "unexpected_percent",
+        "success",
+    ]
+
+    _filter_operators = {
+        "==": operator.eq,
+        "=": operator.eq,
+        "!=": operator.ne,
+        "<": operator.lt,
+        "<=": operator.le,
+        ">": operator.gt,
+        ">=": operator.ge,
+        "in": lambda series, value: series.isin(value),
+        "not in": lambda series, value: ~series.isin(value),
+    }
+
+    def __init__(self, base_directory, root_directory=None):
+        if pyarrow is None:
+            raise ImportError("ParquetValidationMetricsStore requires pyarrow; please install it to use this store.")
+
+        if os.path.isabs(base_directory) or root_directory is None:
+            self.full_base_directory = base_directory
+        else:
+            self.full_base_directory = os.path.join(root_directory, base_directory)
+        self.root_directory = root_directory
+        self.base_directory = base_directory
+
+    def set(self, key, value):
+        """Flatten the validation result `value` and append it to the partition for `key`.
+
+        Args:
+            key (ValidationResultIdentifier): the identifier of the validation result
+            value (dict): the validation result suite
+
+        Returns:
+            the path of the written Parquet file, or None if the validation result had no results to write
+        """
+        if not isinstance(key, ValidationResultIdentifier):
+            raise TypeError("key: {!r} must be a ValidationResultIdentifier, not {!r}".format(key, type(key)))
+
+        df = self.flatten_validation_result(value, key)
+        if len(df) == 0:
+            return None
+
+        partition_directory = os.path.join(
+            self.full_base_directory,
+            *[str(df[partition_column].iloc[0]) for partition_column in self.PARTITION_COLUMNS]
+        )
+        safe_mmkdir(partition_directory)
+        # The run_id is quoted so that any run_id makes a valid file name
+        filepath = os.path.join(partition_directory, "{}.{}.parquet".format(
+            quote(str(key.run_id), safe=""), uuid.uuid4().hex))
+
+        table = pyarrow.Table.from_pandas(df[self.METRIC_COLUMNS], preserve_index=False)
+        pyarrow.parquet.write_table(table, filepath)
+        return filepath
+
+    @classmethod
+    def flatten_validation_result(cls, validation_result_suite, validation_result_suite_identifier):
+        """Build one row per expectation validation result, with the columns in PARTITION_COLUMNS + METRIC_COLUMNS."""
+        expectation_suite_identifier = validation_result_suite_identifier.expectation_suite_identifier
+        data_asset_name = expectation_suite_identifier.data_asset_name
+
+        batch_fingerprint = None
+        batch_kwargs = validation_result_suite.get("meta", {}).get("batch_kwargs")
+        if batch_kwargs:
+            batch_fingerprint = BatchKwargs.build_batch_fingerprint(batch_kwargs)
+
+        rows = []
+        for result in validation_result_suite.get("results", []):
+            expectation_config = result["expectation_config"]
+            result_dict = result.get("result") or {}
+            observed_value = result_dict.get("observed_value")
+            unexpected_percent = result_dict.get("unexpected_percent")
+            rows.append({
+                "datasource": data_asset_name.datasource,
+                "generator": data_asset_name.generator,
+                "generator_asset": data_asset_name.generator_asset,
+                "expectation_suite_name": expectation_suite_identifier.expectation_suite_name,
+                "run_id": validation_result_suite_identifier.run_id,
+                "batch_partition_id": None if batch_fingerprint is None else batch_fingerprint.partition_id,
+                "batch_fingerprint": None if batch_fingerprint is None else batch_fingerprint.fingerprint,
+                "expectation_type": expectation_config["expectation_type"],
+                "column": expectation_config["kwargs"].get("column"),
+                "observed_value": cls._to_float(observed_value),
+                "unexpected_percent": cls._to_float(unexpected_percent),
+                "success": bool(result.get("success")),
+            })
+
+        df = pd.DataFrame(rows, columns=cls.PARTITION_COLUMNS + cls.METRIC_COLUMNS)
+        df["observed_value"] = df["observed_value"].astype(np.float64)
+        df["unexpected_percent"] = df["unexpected_percent"].astype(np.float64)
+        df["success"] = df["success"].astype(bool)
+        return df
+
+    @staticmethod
+    def _to_float(value):
+        if value is None or isinstance(value, bool) or not acts_as_a_number(value):
+            return np.nan
+        return float(value)
+
+    def query(self, filters=None, columns=None):
+        """Load flattened validation metrics as a pandas DataFrame.
+
+        Filters use the same convention as pyarrow: a list of (column, operator, value) tuples that must all hold,
+        with operators ==, !=, <, <=, >, >=, in and not in. Filters on PARTITION_COLUMNS prune directories, and
+        filters on run_id prune files, before any file is opened; the remaining filters are applied to the rows that
+        are read.
+
+        Args:
+            filters (list): (column, operator, value) tuples
+            columns (list): the columns to return; defaults to PARTITION_COLUMNS + METRIC_COLUMNS
+
+        Returns:
+            pandas.DataFrame
+        """
+        if filters is None:
+            filters = []
+        if columns is None:
+            columns = self.PARTITION_COLUMNS + self.METRIC_COLUMNS
+
+        for column, op, value in filters:
+            if column not in self.PARTITION_COLUMNS + self.METRIC_COLUMNS:
+                raise ValueError("Unrecognized filter column: {}".format(column))
+            if op not in self._filter_operators:
+                raise ValueError("Unrecognized filter operator: {}".format(op))
+
+        row_filter_columns = set([column for column, op, value in filters if column in self.METRIC_COLUMNS])
+        read_columns = [column for column in self.METRIC_COLUMNS
+                        if column in columns or column in row_filter_columns]
+
+        frames = []
+        for partition_values, filepath in self._iter_partition_files(filters):
+            df = pyarrow.parquet.read_table(filepath, columns=read_columns).to_pandas()
+            for partition_column, partition_value in zip(self.PARTITION_COLUMNS, partition_values):
+                df[partition_column] = partition_value
+            frames.append(df)
+
+        if len(frames) == 0:
+            return pd.DataFrame([], columns=columns)
+
+        df = pd.concat(frames, ignore_index=True)
+        for column, op, value in filters:
+            df = df[self._filter_operators[op](df[column], value)]
+
+        return df[columns].reset_index(drop=True)
+
+    def _iter_partition_files(self, filters):
+        if not os.path.isdir(self.full_base_directory):
+            return
+
+        def walk(directory, partition_values):
+            depth = len(partition_values)
+            if depth == len(self.PARTITION_COLUMNS):
+                for file_name in sorted(os.listdir(directory)):
+                    if file_name.endswith(".parquet") and self._file_run_id_matches(file_name, filters):
+                        yield partition_values, os.path.join(directory, file_name)
+                return
+
+            for name in sorted(os.listdir(directory)):
+                path = os.path.join(directory, name)
+                if os.path.isdir(path) and self._partition_value_matches(
+                        self.PARTITION_COLUMNS[depth], name, filters):
+                    for item in walk(path, partition_values + (name,)):
+                        yield item
+
+        for item in walk(self.full_base_directory, ()):
+            yield item
+
+    def _file_run_id_matches(self, file_name, filters):
+        name = file_name[:-len(".parquet")]
+        if "." not in name:
+            # Files written before they were named after their run_id cannot be pruned
+            return True
+        return self._partition_value_matches("run_id", unquote(name.rsplit(".", 1)[0]), filters)
+
+    def _partition_value_matches(self, partition_column, partition_value, filters):
+        series = pd.Series([partition_value])
+        for column, op, value in filters:
+            if column == partition_column and not self._filter_operators[op](series, value).iloc[0]:
+                return False
+        return True
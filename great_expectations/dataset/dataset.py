@@ -2,6 +2,8 @@ from __future__ import division
 
 import inspect
 import sys
+import time
+import weakref
 from six import PY3, string_types
 from functools import wraps
 from numbers import Number
@@ -10,10 +12,8 @@ from datetime import datetime, timedelta
 
 if sys.version_info.major == 2:  # If python 2
     from itertools import izip_longest as zip_longest
-    from backports.functools_lru_cache import lru_cache
 elif sys.version_info.major == 3:  # If python 3
     from itertools import zip_longest
-    from functools import lru_cache
 
 from great_expectations.data_asset.data_asset import DataAsset
 from great_expectations.data_asset.util import DocInherit, parse_result_format
@@ -23,6 +23,7 @@ from great_expectations.dataset.util import (
     is_valid_partition_object,
     is_valid_categorical_partition_object
 )
+from great_expectations.dataset.metric_cache import InMemoryMetricCache
 
 import pandas as pd
 import numpy as np
@@ -170,17 +171,213 @@ class Dataset(MetaDataset):
         'get_column_count_in_range',
     ]
 
+    # column statistics that prefetch_column_statistics can gather, and the getters they stand in for
+    # ("quantiles" stands in for get_column_quantiles, and "approximate_unique_count" for get_column_unique_count
+    # called with approximate=True)
+    column_statistic_getters = {
+        'nonnull_count': 'get_column_nonnull_count',
+        'unique_count': 'get_column_unique_count',
+        'approximate_unique_count': 'get_column_unique_count',
+        'min': 'get_column_min',
+        'max': 'get_column_max',
+        'mean': 'get_column_mean',
+        'stdev': 'get_column_stdev',
+    }
+
+    # the default for the most bytes of memory that the values cached by the getters may use
+    cache_max_memory = 256 * 1024 * 1024
+
     def __init__(self, *args, **kwargs):
         # NOTE: using caching makes the strong assumption that the user will not modify the core data store
         # (e.g. self.spark_df) over the lifetime of the dataset instance
         self.caching = kwargs.pop("caching", True)
+        cache_max_memory = kwargs.pop("cache_max_memory", self.cache_max_memory)
+        # A persistent cache of getter values, such as a SqliteMetricCache, shared with other datasets and processes
+        metric_cache = kwargs.pop("metric_cache", None)
 
         super(Dataset, self).__init__(*args, **kwargs)
 
+        self._metric_cache = metric_cache
+        self._prefetched_column_statistics = {}
+        self._in_memory_metric_cache = None
         if self.caching:
+            self._in_memory_metric_cache = InMemoryMetricCache(max_memory=cache_max_memory)
+        if self.caching or self._metric_cache is not None:
             for func in self.hashable_getters:
-                caching_func = lru_cache(maxsize=None)(getattr(self, func))
-                setattr(self, func, caching_func)
+                setattr(self, func, self._wrap_getter(func))
+
+    def _wrap_getter(self, func):
+        """Wrap the getter func so that its values come from prefetched statistics and the metric caches when
+        possible (see _get_metric)."""
+        getter = getattr(type(self), func)
+        # The wrapper is stored on the dataset, so it holds a weak reference to it, and the unbound getter, to avoid a
+        # reference cycle that would keep the dataset alive until the garbage collector runs
+        dataset_ref = weakref.ref(self)
+
+        @wraps(getter)
+        def get_metric(*args, **kwargs):
+            return dataset_ref()._get_metric(func, getter, args, kwargs)
+
+        if self._in_memory_metric_cache is not None:
+            in_memory_metric_cache = self._in_memory_metric_cache
+            get_metric.cache_info = lambda: in_memory_metric_cache.cache_info(func)
+
+        return get_metric
+
+    def _get_metric(self, func, getter, args, kwargs):
+        """Get the value of the getter func for the given arguments, in order from: the statistics gathered by
+        prefetch_column_statistics, the in-memory cache, the persistent metric cache (when the batch_id of the dataset
+        includes a fingerprint of its content), and finally the getter itself."""
+        try:
+            value = self._get_prefetched_metric(func, args, kwargs)
+            self._in_memory_metric_cache.record_hit(func)
+            return value
+        except KeyError:
+            pass
+
+        key = None
+        if self._in_memory_metric_cache is not None:
+            key = InMemoryMetricCache.build_key(func, args, kwargs)
+            try:
+                return self._in_memory_metric_cache.get(key)
+            except KeyError:
+                pass
+
+        start_time = time.time()
+        fingerprint = None
+        if self._metric_cache is not None and isinstance(self._batch_id, dict):
+            fingerprint = self._batch_id.get("fingerprint")
+        if fingerprint is not None:
+            # Different backends can return different types for the same metric
+            metric_key = type(self).__name__ + "." + func + repr((args, sorted(kwargs.items())))
+            try:
+                value = self._metric_cache.get(fingerprint, metric_key)
+            except KeyError:
+                value = getter(self, *args, **kwargs)
+                self._metric_cache.set(fingerprint, metric_key, value)
+        else:
+            value = getter(self, *args, **kwargs)
+        compute_time = time.time() - start_time
+
+        if self._in_memory_metric_cache is not None:
+            if key is None:
+                # Arguments that cannot be hashed, such as a list of quantiles, cannot be cached
+                self._in_memory_metric_cache.record_miss(func, compute_time)
+            else:
+                self._in_memory_metric_cache.set(key, value, compute_time)
+        return value
+
+    def _get_prefetched_metric(self, func, args, kwargs):
+        """Get the statistic gathered by prefetch_column_statistics that answers a call of the getter func, which for
+        most getters must be called with its default arguments.
+
+        Raises:
+            KeyError: if no prefetched statistic answers the call
+        """
+        if not self._prefetched_column_statistics:
+            raise KeyError(func)
+        call_args = inspect.getcallargs(getattr(type(self), func), self, *args, **kwargs)
+        column_statistics = self._prefetched_column_statistics.get(call_args.get('column'), {})
+
+        if func == 'get_column_quantiles':
+            prefetched_quantiles = column_statistics.get('quantiles', {})
+            quantiles = call_args['quantiles']
+            if call_args['allow_relative_error'] is False and len(quantiles) > 0 and \
+                    all([quantile in prefetched_quantiles for quantile in quantiles]):
+                return [prefetched_quantiles[quantile] for quantile in quantiles]
+            raise KeyError(func)
+
+        if func == 'get_column_unique_count':
+            # An exact count also answers a request for an approximate one
+            if 'unique_count' in column_statistics:
+                return column_statistics['unique_count']
+            if call_args['approximate'] and 'approximate_unique_count' in column_statistics:
+                return column_statistics['approximate_unique_count']
+            raise KeyError(func)
+
+        # Any non-default argument (such as parse_strings_as_datetimes) asks for something else
+        if not any([value for arg, value in call_args.items() if arg not in ('self', 'column')]):
+            for statistic, statistic_getter in self.column_statistic_getters.items():
+                if statistic_getter == func and statistic in column_statistics:
+                    return column_statistics[statistic]
+        raise KeyError(func)
+
+    def get_cache_statistics(self):
+        """Get statistics about the values cached by the getters of the dataset.
+
+        Returns:
+            dict: the hits, misses and compute time (in seconds) of the getters, in total and under "metrics" for \
+            each getter, with the number of cached values and the memory they use; plus, under "metric_cache", the \
+            statistics of the persistent metric cache if there is one
+        """
+        if self._in_memory_metric_cache is not None:
+            cache_statistics = self._in_memory_metric_cache.get_cache_statistics()
+        else:
+            cache_statistics = {}
+        if self._metric_cache is not None:
+            cache_statistics["metric_cache"] = self._metric_cache.get_cache_statistics()
+        return cache_statistics
+
+    def invalidate_cache(self, column=None):
+        """Forget the cached and prefetched values of the getters for the column, or for all columns, so that they are
+        computed again from the data. The persistent metric cache is not affected, as it is keyed on the content of
+        the data.
+
+        Args:
+            column (str): the name of the column, or None to forget every value, including table-level ones such as \
+            the row count
+        """
+        if self._in_memory_metric_cache is not None:
+            self._in_memory_metric_cache.invalidate(column)
+        if column is None:
+            self._prefetched_column_statistics.clear()
+        else:
+            self._prefetched_column_statistics.pop(column, None)
+
+    def prefetch_column_statistics(self, columns, statistics, quantiles=None):
+        """Gather statistics for many columns in as few passes over the data as the backend allows.
+
+        Once prefetched, a statistic is returned by the corresponding getter (see column_statistic_getters), including
+        when an expectation calls it, instead of being computed again. Since that makes the same assumption as caching,
+        that the data will not change, statistics are only kept when caching is enabled.
+
+        Statistics that the backend cannot gather in bulk, or that do not apply to a column (such as the mean of a
+        string column), are left out; the getters compute those as usual when they are called.
+
+        Args:
+            columns (list): the names of the columns
+            statistics (list): names of statistics in column_statistic_getters, or "quantiles"
+            quantiles (tuple of float): the quantiles to gather when statistics includes "quantiles"
+
+        Returns:
+            dict: for each column, a dict of the statistics that were gathered; "quantiles" maps each quantile to \
+            its value
+        """
+        for statistic in statistics:
+            if statistic != 'quantiles' and statistic not in self.column_statistic_getters:
+                raise ValueError("Unrecognized column statistic: {}".format(statistic))
+        if 'quantiles' in statistics and not quantiles:
+            raise ValueError("quantiles must be provided to prefetch the quantiles statistic")
+
+        column_statistics = self._get_column_statistics_in_bulk(
+            list(columns), list(statistics), tuple(quantiles) if quantiles else ()
+        )
+
+        if self.caching:
+            for column, values in column_statistics.items():
+                prefetched = self._prefetched_column_statistics.setdefault(column, {})
+                for statistic, value in values.items():
+                    if statistic == 'quantiles':
+                        prefetched.setdefault('quantiles', {}).update(value)
+                    else:
+                        prefetched[statistic] = value
+
+        return column_statistics
+
+    def _get_column_statistics_in_bulk(self, columns, statistics, quantiles):
+        """Backends override this to gather the statistics for prefetch_column_statistics, returning for each column
+        only those that they gathered. Values must be exactly what the corresponding getters would return."""
+        return {}
     
     @classmethod
     def from_dataset(cls, dataset=None):
@@ -237,12 +434,31 @@ class Dataset(MetaDataset):
         """Returns: any"""
         raise NotImplementedError
 
-    def get_column_unique_count(self, column):
-        """Returns: int"""
+    def get_column_unique_count(self, column, approximate=False):
+        """Get the number of distinct non-null values in a column.
+
+        Args:
+            column (string): name of column
+            approximate (boolean): if True, the backend may return an estimate, such as that of a HyperLogLog sketch \
+            or of the database's approximate distinct count, which is much cheaper for large columns with many \
+            distinct values
+
+        Returns:
+            int
+        """
         raise NotImplementedError
 
-    def get_column_modes(self, column):
-        """Returns: List[any], list of modes (ties OK)"""
+    def get_column_modes(self, column, approximate=False):
+        """Get the most common values of a column.
+
+        Args:
+            column (string): name of column
+            approximate (boolean): if True, the backend may return the values estimated to be the most common, such \
+            as by a count-min sketch, which bounds the memory used for columns with many distinct values
+
+        Returns:
+            List[any], list of modes (ties OK)
+        """
         raise NotImplementedError
 
     def get_column_median(self, column):
@@ -2758,6 +2974,7 @@ class Dataset(MetaDataset):
         self,
         column,
         min_value=None, max_value=None,
+        approximate=False,
         result_format=None, include_config=False, catch_exceptions=None,
         meta=None,
     ):
@@ -2774,6 +2991,12 @@ class Dataset(MetaDataset):
             max_value (int or None): \
                 The maximum number of unique values allowed.
 
+        Keyword Args:
+            approximate (boolean): \
+                If True, the number of unique values may be estimated, which is much faster on large columns with \
+                many unique values. See :func:`get_column_unique_count \
+                <great_expectations.dataset.dataset.Dataset.get_column_unique_count>`.
+
         Other Parameters:
             result_format (str or None): \
                 Which output mode to use: `BOOLEAN_ONLY`, `BASIC`, `COMPLETE`, or `SUMMARY`.
@@ -2811,7 +3034,7 @@ class Dataset(MetaDataset):
             <great_expectations.dataset.dataset.Dataset.expect_column_proportion_of_unique_values_to_be_between>`
 
         """
-        unique_value_count = self.get_column_unique_count(column)
+        unique_value_count = self.get_column_unique_count(column, approximate=approximate)
 
         if unique_value_count is None:
             return {
@@ -2848,6 +3071,7 @@ class Dataset(MetaDataset):
         column,
         min_value=0, max_value=1,
         strict_min=False, strict_max=False,  # tolerance=1e-9,
+        approximate=False,
         result_format=None, include_config=False, catch_exceptions=None,
         meta=None,
     ):
@@ -2872,6 +3096,12 @@ class Dataset(MetaDataset):
             strict_max (boolean):
                 If True, the maximum proportion of unique values must be strictly smaller than max_value, default=False
 
+        Keyword Args:
+            approximate (boolean): \
+                If True, the number of unique values may be estimated, which is much faster on large columns with \
+                many unique values. See :func:`get_column_unique_count \
+                <great_expectations.dataset.dataset.Dataset.get_column_unique_count>`.
+
         Other Parameters:
             result_format (str or None): \
                 Which output mode to use: `BOOLEAN_ONLY`, `BASIC`, `COMPLETE`, or `SUMMARY`. \
@@ -2913,11 +3143,14 @@ class Dataset(MetaDataset):
         # Tolerance docstring for later use:
         # tolerance (float):
         #     tolerance for strict_min, strict_max, default=1e-9
-        unique_value_count = self.get_column_unique_count(column)
+        unique_value_count = self.get_column_unique_count(column, approximate=approximate)
         total_value_count = self.get_column_nonnull_count(column)
 
         if total_value_count > 0:
             proportion_unique = float(unique_value_count) / total_value_count
+            if approximate:
+                # An estimate can exceed the number of values
+                proportion_unique = min(proportion_unique, 1.0)
         else:
             proportion_unique = None
 
@@ -2962,6 +3195,7 @@ class Dataset(MetaDataset):
         column,
         value_set,
         ties_okay=None,
+        approximate=False,
         result_format=None, include_config=False, catch_exceptions=None,
         meta=None,
     ):
@@ -2980,6 +3214,9 @@ class Dataset(MetaDataset):
             ties_okay (boolean or None): \
                 If True, then the expectation will still succeed if values outside the designated set are as common \
                 (but not more common) than designated values
+            approximate (boolean): \
+                If True, the most common values may be estimated. See :func:`get_column_modes \
+                <great_expectations.dataset.dataset.Dataset.get_column_modes>`.
 
         Other Parameters:
             result_format (str or None): \
@@ -3014,7 +3251,7 @@ class Dataset(MetaDataset):
             `observed_value` will contain a single copy of each most common value.
 
         """
-        mode_list = self.get_column_modes(column)
+        mode_list = self.get_column_modes(column, approximate=approximate)
         intersection_count = len(set(value_set).intersection(mode_list))
 
         if ties_okay:
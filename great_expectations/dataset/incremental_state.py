@@ -0,0 +1,153 @@
+import copy
+import errno
+import logging
+import os
+import pickle
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+
+logger = logging.getLogger(__name__)
+
+
+# How the fields of partial aggregates are merged; fields not listed here are added
+AGGREGATE_MERGE_OPERATIONS = {
+    "min": "min",
+    "max": "max",
+    "value_counts": "value_counts",
+    "distinct_sketch": "sketch",
+}
+
+
+def merge_aggregates(aggregate, other, max_distinct_values=None):
+    """Merge two partial aggregates of disjoint sets of rows, such as {"count": 3, "sum": 5.0, "min": 1}, into the
+    aggregate of all their rows.
+
+    Counts, sums and sums of squares are added, mins and maxes compared, ignoring None, and the value_counts
+    dictionaries added value by value. value_counts becomes None, meaning it is unknown, if either is unknown or the
+    merged dictionary has more than max_distinct_values values. Sketches, such as the HyperLogLog distinct_sketch, are
+    merged into a copy, and are unknown if either is.
+    """
+    if aggregate is None:
+        return dict(other)
+    merged = {}
+    for field in set(aggregate.keys()) | set(other.keys()):
+        value = aggregate.get(field)
+        other_value = other.get(field)
+        operation = AGGREGATE_MERGE_OPERATIONS.get(field, "add")
+        if operation == "value_counts":
+            if value is None or other_value is None:
+                merged[field] = None
+            else:
+                value_counts = dict(value)
+                for item, count in other_value.items():
+                    value_counts[item] = value_counts.get(item, 0) + count
+                if max_distinct_values is not None and len(value_counts) > max_distinct_values:
+                    value_counts = None
+                merged[field] = value_counts
+        elif operation == "sketch":
+            if value is None or other_value is None:
+                merged[field] = None
+            else:
+                merged[field] = copy.deepcopy(value).merge(other_value)
+        elif value is None:
+            merged[field] = other_value
+        elif other_value is None:
+            merged[field] = value
+        elif operation == "min":
+            merged[field] = min(value, other_value)
+        elif operation == "max":
+            merged[field] = max(value, other_value)
+        else:
+            merged[field] = value + other_value
+    return merged
+
+
+class IncrementalStateStore(object):
+    """Persists the partial aggregates that incremental validation computes over the rows of append-only tables, so
+    that the next run only reads the rows added since.
+
+    The aggregates of a data asset and expectation suite (the state key) are stored by metric, each with the
+    watermark, the highest value of the watermark column among the rows it aggregates.
+
+    Values are stored with pickle, so the database should only be shared by trusted users.
+
+    Args:
+        filepath (str): the path of the SQLite database, created if it does not exist
+        root_directory (str): the directory that a relative filepath is relative to
+    """
+
+    def __init__(self, filepath, root_directory=None):
+        if not os.path.isabs(filepath) and root_directory is not None:
+            filepath = os.path.join(root_directory, filepath)
+        directory = os.path.dirname(filepath)
+        if directory:
+            try:
+                os.makedirs(directory)
+            except OSError as e:
+                if e.errno != errno.EEXIST:
+                    raise
+        self.filepath = filepath
+        self._lock = threading.Lock()
+
+        with self._connect() as connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS incremental_state ("
+                "state_key TEXT NOT NULL, "
+                "metric_key TEXT NOT NULL, "
+                "watermark BLOB NOT NULL, "
+                "aggregate BLOB NOT NULL, "
+                "updated_at REAL NOT NULL, "
+                "PRIMARY KEY (state_key, metric_key))"
+            )
+
+    @contextmanager
+    def _connect(self):
+        # A connection per operation lets threads and processes share the database
+        connection = sqlite3.connect(self.filepath, timeout=30)
+        try:
+            with connection:
+                yield connection
+        finally:
+            connection.close()
+
+    def get_state(self, state_key):
+        """Get the stored aggregates of the state key.
+
+        Returns:
+            dict: the (watermark, aggregate) tuple of each metric key
+        """
+        with self._connect() as connection:
+            rows = connection.execute(
+                "SELECT metric_key, watermark, aggregate FROM incremental_state WHERE state_key = ?",
+                (state_key,)
+            ).fetchall()
+        return dict([
+            (metric_key, (pickle.loads(bytes(watermark)), pickle.loads(bytes(aggregate))))
+            for metric_key, watermark, aggregate in rows
+        ])
+
+    def set_state(self, state_key, state):
+        """Store aggregates of the state key, given as a dict of the (watermark, aggregate) tuple of each metric key,
+        replacing those previously stored for the same metric keys."""
+        now = time.time()
+        with self._lock, self._connect() as connection:
+            connection.executemany(
+                "INSERT OR REPLACE INTO incremental_state (state_key, metric_key, watermark, aggregate, updated_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                [
+                    (state_key, metric_key, sqlite3.Binary(pickle.dumps(watermark, protocol=2)),
+                     sqlite3.Binary(pickle.dumps(aggregate, protocol=2)), now)
+                    for metric_key, (watermark, aggregate) in state.items()
+                ]
+            )
+
+    def invalidate(self, state_key=None):
+        """Remove the aggregates stored for the state key, or all the aggregates, so that the next incremental
+        validation scans the full table again."""
+        with self._connect() as connection:
+            if state_key is None:
+                connection.execute("DELETE FROM incremental_state")
+            else:
+                connection.execute("DELETE FROM incremental_state WHERE state_key = ?", (state_key,))
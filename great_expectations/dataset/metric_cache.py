@@ -0,0 +1,343 @@
+import errno
+import logging
+import os
+import pickle
+import sqlite3
+import sys
+import threading
+import time
+from collections import namedtuple, OrderedDict
+from contextlib import contextmanager
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "maxsize", "currsize"])
+
+
+def estimate_memory_usage(value):
+    """Estimate the number of bytes of memory used by a metric value."""
+    if isinstance(value, pd.Series):
+        return int(value.memory_usage(deep=True))
+    elif isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(deep=True).sum())
+    elif isinstance(value, np.ndarray):
+        return int(value.nbytes)
+    elif isinstance(value, (list, tuple, set)):
+        return sys.getsizeof(value) + sum([sys.getsizeof(item) for item in value])
+    elif isinstance(value, dict):
+        return sys.getsizeof(value) + sum([sys.getsizeof(k) + sys.getsizeof(v) for k, v in value.items()])
+    return sys.getsizeof(value)
+
+
+class InMemoryMetricCache(object):
+    """Keeps the values computed by the metric getters of a dataset in memory, evicting the least recently used values
+    when they would use more than max_memory bytes.
+
+    Keys are (getter name, args, kwargs) tuples, as built by build_key. The cache also counts, for each getter, the
+    calls it answered (hits), the calls it did not (misses), and the time spent computing the values of the misses,
+    which shows which metrics dominate a validation.
+
+    Args:
+        max_memory (int): the most bytes of memory, as estimated by estimate_memory_usage, used by the cached values; \
+        None for no limit. A single value larger than that is not cached.
+    """
+
+    def __init__(self, max_memory=None):
+        self.max_memory = max_memory
+        self.memory = 0
+        self._values = OrderedDict()
+        self._metric_statistics = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def build_key(func, args, kwargs):
+        """Build the key of a call of the getter func, or None if its arguments cannot be hashed."""
+        key = (func, tuple(args), tuple(sorted(kwargs.items())))
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
+    def _get_metric_statistics(self, func):
+        return self._metric_statistics.setdefault(func, {"hits": 0, "misses": 0, "compute_time": 0.0})
+
+    def record_hit(self, func):
+        """Count a call of the getter func answered without computing its value, such as by prefetched statistics."""
+        with self._lock:
+            self._get_metric_statistics(func)["hits"] += 1
+
+    def record_miss(self, func, compute_time=0.0):
+        """Count a call of the getter func whose value was computed in compute_time seconds."""
+        with self._lock:
+            metric_statistics = self._get_metric_statistics(func)
+            metric_statistics["misses"] += 1
+            metric_statistics["compute_time"] += compute_time
+
+    def get(self, key):
+        """Get the cached value for the key.
+
+        Raises:
+            KeyError: if no value is cached for the key
+        """
+        with self._lock:
+            if key is not None and key in self._values:
+                self._values[key] = self._values.pop(key)  # now the most recently used
+                self._get_metric_statistics(key[0])["hits"] += 1
+                return self._values[key][0]
+            raise KeyError(key)
+
+    def set(self, key, value, compute_time=0.0):
+        """Cache the value computed in compute_time seconds for the key, which counts as a miss of its getter."""
+        self.record_miss(key[0], compute_time)
+        with self._lock:
+            size = estimate_memory_usage(value)
+            if self.max_memory is not None and size > self.max_memory:
+                return
+            if key in self._values:
+                self.memory -= self._values.pop(key)[1]
+            self._values[key] = (value, size)
+            self.memory += size
+            while self.max_memory is not None and self.memory > self.max_memory:
+                _, (_, evicted_size) = self._values.popitem(last=False)
+                self.memory -= evicted_size
+
+    def invalidate(self, column=None):
+        """Remove the cached values of the metrics of the column, given as the first argument or the column keyword
+        argument of their getter, or all the cached values if column is None."""
+        with self._lock:
+            if column is None:
+                self._values.clear()
+                self.memory = 0
+                return
+            for key in list(self._values.keys()):
+                func, args, kwargs = key
+                if (len(args) > 0 and args[0] == column) or dict(kwargs).get("column") == column:
+                    self.memory -= self._values.pop(key)[1]
+
+    def cache_info(self, func):
+        """Returns: CacheInfo, the statistics of the getter func in the form of functools.lru_cache's cache_info"""
+        with self._lock:
+            metric_statistics = self._get_metric_statistics(func)
+            return CacheInfo(
+                hits=metric_statistics["hits"],
+                misses=metric_statistics["misses"],
+                maxsize=None,
+                currsize=len([key for key in self._values if key[0] == func])
+            )
+
+    def get_cache_statistics(self):
+        """Returns: dict with the total hits, misses and compute time (in seconds), the number of cached values and the
+        memory they use, and under "metrics" the hits, misses and compute time of each getter"""
+        with self._lock:
+            metrics = dict([(func, dict(metric_statistics))
+                            for func, metric_statistics in self._metric_statistics.items()])
+            return {
+                "hits": sum([metric_statistics["hits"] for metric_statistics in metrics.values()]),
+                "misses": sum([metric_statistics["misses"] for metric_statistics in metrics.values()]),
+                "compute_time": sum([metric_statistics["compute_time"] for metric_statistics in metrics.values()]),
+                "entries": len(self._values),
+                "memory": self.memory,
+                "max_memory": self.max_memory,
+                "metrics": metrics,
+            }
+
+
+class SqliteMetricCache(object):
+    """Persists the values computed by the metric getters of datasets in a SQLite database, so that they are reused
+    across processes and runs instead of being computed again.
+
+    Values are keyed on the fingerprint of the content of a batch together with the getter and its arguments, so
+    re-validating an unchanged batch, or validating a second expectation suite against it, reuses the metrics computed
+    before. Datasets only use the cache when their batch_id includes a "fingerprint" of their content, as those of
+    PandasDatasource do: for file and S3 batches of any size, from the identity of the file or object and the options
+    it is read with, and for in-memory dataframes and unseeded samples below its HASH_THRESHOLD, from their rows.
+
+    Reads only look values up: the times at which values were read are written in batches of access_batch_size, and
+    before evicting. Values are evicted once the values this instance has stored, added to those stored when it was
+    created, could exceed max_size; values stored by other processes meanwhile are counted at the next eviction. Values
+    older than max_age are never returned, and are removed when they are read and by evict.
+
+    Values are stored with pickle, so the database should only be shared by trusted users.
+
+    Args:
+        filepath (str): the path of the SQLite database, created if it does not exist
+        root_directory (str): the directory that a relative filepath is relative to
+        max_size (int): if set, the least recently used values are evicted to keep the values below this many bytes
+        max_age (float): if set, values are evicted this many seconds after they were stored
+        access_batch_size (int): the number of read times to keep before writing them to the database
+    """
+
+    def __init__(self, filepath, root_directory=None, max_size=None, max_age=None, access_batch_size=100):
+        if not os.path.isabs(filepath) and root_directory is not None:
+            filepath = os.path.join(root_directory, filepath)
+        directory = os.path.dirname(filepath)
+        if directory:
+            try:
+                os.makedirs(directory)
+            except OSError as e:
+                if e.errno != errno.EEXIST:
+                    raise
+        self.filepath = filepath
+        self.max_size = max_size
+        self.max_age = max_age
+        self.access_batch_size = access_batch_size
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._connection_lock = threading.RLock()
+        self._connection = None
+        self._connection_pid = None
+        # (fingerprint, metric_key) -> the last time the value was read, not yet written to the database
+        self._accessed_at = {}
+        # An upper bound of the total size of the stored values, which is exact after each eviction
+        self._size = 0
+
+        with self._connect() as connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS metrics ("
+                "fingerprint TEXT NOT NULL, "
+                "metric_key TEXT NOT NULL, "
+                "value BLOB NOT NULL, "
+                "size INTEGER NOT NULL, "
+                "created_at REAL NOT NULL, "
+                "accessed_at REAL NOT NULL, "
+                "PRIMARY KEY (fingerprint, metric_key))"
+            )
+            self._size = connection.execute("SELECT COALESCE(SUM(size), 0) FROM metrics").fetchone()[0]
+
+    @contextmanager
+    def _connect(self):
+        # The threads of a process share one connection, one at a time; a forked process opens its own
+        with self._connection_lock:
+            if self._connection is None or self._connection_pid != os.getpid():
+                self._connection = sqlite3.connect(self.filepath, timeout=30, check_same_thread=False)
+                self._connection_pid = os.getpid()
+            with self._connection:
+                yield self._connection
+
+    def close(self):
+        """Write the pending read times and close the connection to the database."""
+        with self._connection_lock:
+            if self._connection is not None and self._connection_pid == os.getpid():
+                self._write_accessed_at()
+                self._connection.close()
+            self._connection = None
+
+    def _count(self, hit):
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def _write_accessed_at(self):
+        with self._lock:
+            accessed_at = self._accessed_at
+            self._accessed_at = {}
+        if accessed_at:
+            with self._connect() as connection:
+                connection.executemany(
+                    "UPDATE metrics SET accessed_at = ? WHERE fingerprint = ? AND metric_key = ? AND accessed_at < ?",
+                    [(at, fingerprint, metric_key, at) for (fingerprint, metric_key), at in accessed_at.items()]
+                )
+
+    def get(self, fingerprint, metric_key):
+        """Get the value stored for the metric of the batch with the given fingerprint.
+
+        Raises:
+            KeyError: if no value is stored, or it is older than max_age
+        """
+        now = time.time()
+        with self._connect() as connection:
+            row = connection.execute(
+                "SELECT value, created_at FROM metrics WHERE fingerprint = ? AND metric_key = ?",
+                (fingerprint, metric_key)
+            ).fetchone()
+            if row is not None and self.max_age is not None and row[1] < now - self.max_age:
+                connection.execute("DELETE FROM metrics WHERE fingerprint = ? AND metric_key = ?",
+                                   (fingerprint, metric_key))
+                row = None
+
+        if row is None:
+            self._count(hit=False)
+            raise KeyError((fingerprint, metric_key))
+        self._count(hit=True)
+        with self._lock:
+            self._accessed_at[(fingerprint, metric_key)] = now
+            write_accessed_at = len(self._accessed_at) >= self.access_batch_size
+        if write_accessed_at:
+            self._write_accessed_at()
+        return pickle.loads(bytes(row[0]))
+
+    def set(self, fingerprint, metric_key, value):
+        """Store the value of the metric of the batch with the given fingerprint, evicting values as needed.
+
+        Values that cannot be pickled are not stored."""
+        try:
+            serialized_value = pickle.dumps(value, protocol=2)
+        except (pickle.PicklingError, TypeError, AttributeError) as err:
+            logger.debug("Unable to store metric {} in the metric cache: {}".format(metric_key, str(err)))
+            return
+
+        now = time.time()
+        with self._connect() as connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO metrics (fingerprint, metric_key, value, size, created_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (fingerprint, metric_key, sqlite3.Binary(serialized_value), len(serialized_value), now, now)
+            )
+        with self._lock:
+            self._size += len(serialized_value)
+            evict = self.max_size is not None and self._size > self.max_size
+        if evict:
+            self.evict()
+
+    def evict(self):
+        """Remove the values older than max_age, then the least recently used values above max_size."""
+        self._write_accessed_at()
+        with self._connect() as connection:
+            if self.max_age is not None:
+                connection.execute("DELETE FROM metrics WHERE created_at < ?", (time.time() - self.max_age,))
+
+            total_size = connection.execute("SELECT COALESCE(SUM(size), 0) FROM metrics").fetchone()[0]
+            if self.max_size is not None and total_size > self.max_size:
+                evicted_keys = []
+                for fingerprint, metric_key, size in connection.execute(
+                        "SELECT fingerprint, metric_key, size FROM metrics ORDER BY accessed_at, created_at"):
+                    if total_size <= self.max_size:
+                        break
+                    evicted_keys.append((fingerprint, metric_key))
+                    total_size -= size
+                connection.executemany("DELETE FROM metrics WHERE fingerprint = ? AND metric_key = ?",
+                                       evicted_keys)
+        with self._lock:
+            self._size = total_size
+
+    def invalidate(self, fingerprint=None):
+        """Remove the values stored for the batch with the given fingerprint, or all the values."""
+        with self._connect() as connection:
+            if fingerprint is None:
+                connection.execute("DELETE FROM metrics")
+            else:
+                connection.execute("DELETE FROM metrics WHERE fingerprint = ?", (fingerprint,))
+            size = connection.execute("SELECT COALESCE(SUM(size), 0) FROM metrics").fetchone()[0]
+        with self._lock:
+            self._size = size
+
+    def get_cache_statistics(self):
+        """Returns: dict with the hits and misses of this instance, and the number and total size of stored values"""
+        with self._connect() as connection:
+            entries, size = connection.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM metrics").fetchone()
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "entries": entries,
+            "size": size,
+            "max_size": self.max_size,
+            "max_age": self.max_age,
+        }
@@ -15,7 +15,8 @@ from six import PY2, PY3, integer_types, string_types
 
 from great_expectations.data_asset import DataAsset
 from .dataset import Dataset
-from great_expectations.data_asset.util import DocInherit, parse_result_format
+from great_expectations.data_asset.util import DocInherit, MultiRegexMatcher, parse_result_format
+from great_expectations.dataset.sketches import CountMinSketch, HyperLogLog
 from great_expectations.dataset.util import \
     is_valid_partition_object, is_valid_categorical_partition_object, is_valid_continuous_partition_object, \
     _scipy_distribution_positional_args_from_dict, validate_distribution_parameters
@@ -295,11 +296,17 @@ class PandasDataset(MetaPandasDataset, pd.DataFrame):
         '_expectation_suite',
         '_config',
         'caching',
+        '_prefetched_column_statistics',
+        '_metric_cache',
+        '_in_memory_metric_cache',
         'default_expectation_args',
         'discard_subset_failing_expectations'
     ]
     _internal_names_set = set(_internal_names)
 
+    # The rows counted at a time by get_column_modes with approximate=True
+    approximate_modes_block_size = 100000
+
     # We may want to expand or alter support for subclassing dataframes in the future:
     # See http://pandas.pydata.org/pandas-docs/stable/extending.html#extending-subclassing-pandas
 
@@ -375,10 +382,18 @@ class PandasDataset(MetaPandasDataset, pd.DataFrame):
         counts.index.name = "value"
         return counts
 
-    def get_column_unique_count(self, column):
+    def get_column_unique_count(self, column, approximate=False):
+        if approximate:
+            return HyperLogLog().update(self[column]).count()
         return self.get_column_value_counts(column).shape[0]
 
-    def get_column_modes(self, column):
+    def get_column_modes(self, column, approximate=False):
+        if approximate:
+            # Counting a block of rows at a time bounds the memory used to the size of the sketch and of a block
+            sketch = CountMinSketch()
+            for start in range(0, len(self), self.approximate_modes_block_size):
+                sketch.update(self[column].iloc[start:start + self.approximate_modes_block_size])
+            return sketch.modes()
         return list(self[column].mode().values)
 
     def get_column_median(self, column):
@@ -396,6 +411,29 @@ class PandasDataset(MetaPandasDataset, pd.DataFrame):
         hist, bin_edges = np.histogram(self[column], bins, density=False)
         return list(hist)
 
+    def _get_column_statistics_in_bulk(self, columns, statistics, quantiles):
+        # Counts are computed across all the columns at once; the other statistics are left to the getters, since
+        # computing them column by column in memory costs the same
+        column_statistics = dict([(column, {}) for column in columns])
+        if "nonnull_count" in statistics:
+            for column, nonnull_count in self[columns].notnull().sum().items():
+                column_statistics[column]["nonnull_count"] = int(nonnull_count)
+        if "unique_count" in statistics:
+            try:
+                unique_counts = self[columns].nunique()
+            except TypeError:
+                # Unhashable values, such as lists
+                unique_counts = {}
+            for column, unique_count in unique_counts.items():
+                column_statistics[column]["unique_count"] = int(unique_count)
+        elif "approximate_unique_count" in statistics:
+            for column in columns:
+                try:
+                    column_statistics[column]["approximate_unique_count"] = HyperLogLog().update(self[column]).count()
+                except TypeError:
+                    pass
+        return column_statistics
+
     def get_column_count_in_range(self, column, min_val=None, max_val=None, strict_min=False, strict_max=True):
         # TODO this logic could probably go in the non-underscore version if we want to cache
         if min_val is None and max_val is None:
@@ -1069,17 +1107,15 @@ class PandasDataset(MetaPandasDataset, pd.DataFrame):
                                                  mostly=None,
                                                  result_format=None, include_config=False, catch_exceptions=None, meta=None):
 
-        regex_matches = []
-        for regex in regex_list:
-            regex_matches.append(column.astype(str).str.contains(regex))
-        regex_match_df = pd.concat(regex_matches, axis=1, ignore_index=True)
+        if match_on not in ["any", "all"]:
+            raise ValueError("match_on must be either 'any' or 'all'")
 
+        matcher = MultiRegexMatcher(regex_list)
+        values = column.astype(str)
         if match_on == "any":
-            return regex_match_df.any(axis='columns')
-        elif match_on == "all":
-            return regex_match_df.all(axis='columns')
+            return pd.Series(matcher.search_any_values(values), index=column.index)
         else:
-            raise ValueError("match_on must be either 'any' or 'all'")
+            return pd.Series(matcher.search_all_values(values), index=column.index)
 
 
     @DocInherit
@@ -1087,12 +1123,8 @@ class PandasDataset(MetaPandasDataset, pd.DataFrame):
     def expect_column_values_to_not_match_regex_list(self, column, regex_list,
                                                      mostly=None,
                                                      result_format=None, include_config=False, catch_exceptions=None, meta=None):
-        regex_matches = []
-        for regex in regex_list:
-            regex_matches.append(column.astype(str).str.contains(regex))
-        regex_match_df = pd.concat(regex_matches, axis=1, ignore_index=True)
-
-        return ~regex_match_df.any(axis='columns')
+        matcher = MultiRegexMatcher(regex_list)
+        return pd.Series(~matcher.search_any_values(column.astype(str)), index=column.index)
 
     @DocInherit
     @MetaPandasDataset.column_map_expectation
@@ -0,0 +1,126 @@
+import logging
+import threading
+import time
+import weakref
+
+logger = logging.getLogger(__name__)
+
+try:
+    import sqlalchemy as sa
+except ImportError:
+    sa = None
+    logger.debug("Unable to import sqlalchemy.")
+
+
+class ReflectionCache(object):
+    """Caches what SqlAlchemy reflection tells about the schemas, tables, views and columns of a database, so that
+    datasets and generators using the same engine do not query the database catalog again for ttl seconds.
+
+    Use get_reflection_cache to get the cache shared by everything using an engine. Reflected values are returned as
+    copies, so callers can modify them.
+
+    Args:
+        bind: the SqlAlchemy engine or connection to reflect
+        ttl (float): the number of seconds reflected values are reused; 0 not to reuse them
+    """
+
+    default_ttl = 300
+
+    def __init__(self, bind, ttl=None):
+        # The cache is kept with the engine, so it must not keep the engine alive
+        self._bind_ref = weakref.ref(bind)
+        self.ttl = ttl if ttl is not None else self.default_ttl
+        self.hits = 0
+        self.misses = 0
+        self.reflection_time = 0.0
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def _reflect(self, method, *args):
+        key = (method,) + args
+        with self._lock:
+            if key in self._values:
+                reflected_at, value = self._values[key]
+                if time.time() - reflected_at < self.ttl:
+                    self.hits += 1
+                    return value
+
+        start_time = time.time()
+        # A new inspector each time, since an inspector keeps everything it reflects forever
+        inspector = sa.inspect(self._bind_ref())
+        if method == "default_schema_name":
+            value = inspector.default_schema_name
+        else:
+            value = getattr(inspector, method)(*args)
+        reflection_time = time.time() - start_time
+        logger.debug("Reflected %s%s in %.3fs" % (method, repr(args), reflection_time))
+
+        with self._lock:
+            self.misses += 1
+            self.reflection_time += reflection_time
+            self._values[key] = (time.time(), value)
+        return value
+
+    @property
+    def default_schema_name(self):
+        return self._reflect("default_schema_name")
+
+    def get_schema_names(self):
+        return list(self._reflect("get_schema_names"))
+
+    def get_table_names(self, schema=None):
+        return list(self._reflect("get_table_names", schema))
+
+    def get_view_names(self, schema=None):
+        return list(self._reflect("get_view_names", schema))
+
+    def get_columns(self, table_name, schema=None):
+        return [dict(column) for column in self._reflect("get_columns", table_name, schema)]
+
+    def invalidate(self, table_name=None, schema=None):
+        """Forget the reflected columns of a table, together with the names of the tables and views of its schema,
+        or, if table_name is None, everything reflected. If schema is None, the table is forgotten in every schema,
+        since the default schema can be referred to both by name and as None."""
+        with self._lock:
+            if table_name is None:
+                self._values.clear()
+                return
+            for key in list(self._values.keys()):
+                if schema is not None and key[-1] != schema:
+                    continue
+                if (key[0] == "get_columns" and key[1] == table_name) or \
+                        key[0] in ["get_table_names", "get_view_names"]:
+                    del self._values[key]
+
+    def get_reflection_statistics(self):
+        """Returns: dict with the hits and misses of the cache, the time spent reflecting (in seconds) and the number
+        of reflected values"""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "reflection_time": self.reflection_time,
+                "entries": len(self._values),
+                "ttl": self.ttl,
+            }
+
+
+_reflection_caches = weakref.WeakKeyDictionary()
+_reflection_caches_lock = threading.Lock()
+
+
+def get_reflection_cache(bind, ttl=None):
+    """Get the ReflectionCache shared by everything using an engine or connection, creating it if needed.
+
+    Args:
+        bind: the SqlAlchemy engine or connection
+        ttl (float): if given, the number of seconds the cache reuses reflected values from now on
+    """
+    with _reflection_caches_lock:
+        reflection_cache = _reflection_caches.get(bind)
+        if reflection_cache is None:
+            reflection_cache = ReflectionCache(bind)
+            _reflection_caches[bind] = reflection_cache
+        if ttl is not None:
+            reflection_cache.ttl = ttl
+        return reflection_cache
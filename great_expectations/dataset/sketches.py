@@ -0,0 +1,200 @@
+# Mergeable sketches for approximate column statistics
+
+from __future__ import division
+
+import numpy as np
+import pandas as pd
+
+
+def hash_values(values):
+    """Hash values to 64-bit unsigned integers.
+
+    Args:
+        values: a list-like of hashable values
+
+    Returns:
+        np.ndarray of np.uint64
+    """
+    series = pd.Series(values)
+    if series.dtype == object:
+        # Values hash the same whether or not they come from a column of a more specific dtype
+        series = series.infer_objects()
+    return pd.util.hash_pandas_object(series, index=False).values
+
+
+def drop_nulls(values):
+    """Drop the null values of a list-like, as a pd.Series.
+
+    Nulls are dropped before the dtype of values given as a list or object array is inferred, so that the remaining
+    values, such as the integers of [1, 2, None], have the same dtype, and hash the same, as they would without the
+    nulls.
+    """
+    if isinstance(values, (pd.Series, np.ndarray)) and values.dtype != object:
+        return pd.Series(values).dropna()
+    values = pd.Series(values, dtype=object)
+    return values[~pd.isnull(values)].infer_objects()
+
+
+def _bit_length(values):
+    """The number of bits needed to represent each of an array of np.uint64 values below 2 ** 64 - 2 ** 11."""
+    # float64 represents integers below 2 ** 53 exactly, so the low bits are shifted away before taking the exponent
+    high = values >> np.uint64(11)
+    _, exponents = np.frexp(np.where(high > 0, high, values).astype(np.float64))
+    return np.where(high > 0, exponents + 11, exponents)
+
+
+class HyperLogLog(object):
+    """A HyperLogLog sketch estimating the number of distinct values it has been updated with.
+
+    The sketch uses 2 ** precision bytes regardless of the number of values, and the standard error of its estimate is
+    about 1.04 / sqrt(2 ** precision), or 0.8% for the default precision. Sketches with the same precision can be
+    merged, for example to count the distinct values of a column across batches without reading them again.
+
+    Null values are ignored, as they are by get_column_unique_count.
+    """
+
+    def __init__(self, precision=14):
+        if not 4 <= precision <= 18:
+            raise ValueError("precision must be between 4 and 18")
+        self.precision = precision
+        self.registers = np.zeros(2 ** precision, dtype=np.uint8)
+
+    def update(self, values):
+        """Add values to the sketch.
+
+        Returns:
+            the sketch
+        """
+        values = drop_nulls(values)
+        if len(values) == 0:
+            return self
+
+        hashes = hash_values(values)
+        # The first bits of a hash choose a register, which keeps the largest position of the first set bit among the
+        # remaining bits
+        remaining_bits = 64 - self.precision
+        indexes = (hashes >> np.uint64(remaining_bits)).astype(np.int64)
+        remainders = hashes & np.uint64((1 << remaining_bits) - 1)
+        ranks = remaining_bits - _bit_length(remainders) + 1
+
+        maxima = pd.Series(ranks).groupby(indexes).max()
+        self.registers[maxima.index.values] = np.maximum(
+            self.registers[maxima.index.values],
+            maxima.values.astype(np.uint8)
+        )
+        return self
+
+    def merge(self, other):
+        """Add the values of another sketch with the same precision to this sketch.
+
+        Returns:
+            the sketch
+        """
+        if not isinstance(other, HyperLogLog) or other.precision != self.precision:
+            raise ValueError("Only HyperLogLog sketches with the same precision can be merged")
+        np.maximum(self.registers, other.registers, out=self.registers)
+        return self
+
+    def count(self):
+        """Returns: int, the estimated number of distinct values"""
+        m = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        estimate = alpha * m * m / np.sum(np.exp2(-self.registers.astype(np.float64)))
+
+        empty_registers = np.count_nonzero(self.registers == 0)
+        if estimate <= 2.5 * m and empty_registers > 0:
+            # Linear counting is more accurate for small cardinalities
+            estimate = m * np.log(m / empty_registers)
+
+        return int(round(estimate))
+
+
+class CountMinSketch(object):
+    """A count-min sketch estimating how often values occur, which also keeps track of the values most likely to be
+    the most frequent ones (the "heavy hitters").
+
+    The counts use depth * width integers regardless of the number of distinct values. An estimated count is never
+    below the true count, and exceeds it by at most 2 * n / width with probability at least 1 - 0.5 ** depth, for n
+    values in total. The sketch keeps the `capacity` values with the highest estimated counts, so values whose true
+    count is far below the most frequent ones may be missing from most_common.
+
+    Sketches with the same width and depth can be merged. Null values are ignored, as they are by get_column_modes.
+    """
+
+    def __init__(self, width=2048, depth=5, capacity=100):
+        if width < 1 or depth < 1 or capacity < 1:
+            raise ValueError("width, depth and capacity must be positive")
+        self.width = width
+        self.depth = depth
+        self.capacity = capacity
+        self.table = np.zeros((depth, width), dtype=np.int64)
+        self.total = 0
+        self._candidates = []
+
+    def _indexes(self, values):
+        # The rows use independent hash functions, derived from the two halves of a single hash of each value
+        hashes = hash_values(values)
+        low = hashes & np.uint64(0xffffffff)
+        high = hashes >> np.uint64(32)
+        return [((low + np.uint64(row) * high) % np.uint64(self.width)).astype(np.int64)
+                for row in range(self.depth)]
+
+    def update(self, values):
+        """Add values to the sketch.
+
+        Returns:
+            the sketch
+        """
+        values = drop_nulls(values)
+        if len(values) == 0:
+            return self
+
+        for row, indexes in enumerate(self._indexes(values)):
+            self.table[row] += np.bincount(indexes, minlength=self.width)
+        self.total += len(values)
+
+        self._update_candidates(list(pd.unique(values)))
+        return self
+
+    def merge(self, other):
+        """Add the values of another sketch with the same width and depth to this sketch.
+
+        Returns:
+            the sketch
+        """
+        if not isinstance(other, CountMinSketch) or other.width != self.width or other.depth != self.depth:
+            raise ValueError("Only CountMinSketch sketches with the same width and depth can be merged")
+        self.table += other.table
+        self.total += other.total
+        self._update_candidates(other._candidates)
+        return self
+
+    def _update_candidates(self, values):
+        candidates = pd.unique(pd.Series(self._candidates + list(values), dtype=object))
+        if len(candidates) > self.capacity:
+            estimates = self.estimate(candidates)
+            # A stable sort keeps earlier candidates on ties
+            order = np.argsort(-estimates, kind="mergesort")[:self.capacity]
+            candidates = candidates[np.sort(order)]
+        self._candidates = list(candidates)
+
+    def estimate(self, values):
+        """Returns: np.ndarray of int, the estimated number of times each of the values occurred"""
+        if len(values) == 0:
+            return np.array([], dtype=np.int64)
+        return np.min([self.table[row][indexes] for row, indexes in enumerate(self._indexes(values))], axis=0)
+
+    def most_common(self, n=None):
+        """Returns: list of (value, estimated count) for the n values estimated to be the most frequent, in order"""
+        if len(self._candidates) == 0:
+            return []
+        estimates = self.estimate(self._candidates)
+        order = np.argsort(-estimates, kind="mergesort")[:n]
+        return [(self._candidates[i], int(estimates[i])) for i in order]
+
+    def modes(self):
+        """Returns: list of the values estimated to be the most frequent (ties OK)"""
+        most_common = self.most_common()
+        if len(most_common) == 0:
+            return []
+        return [value for value, count in most_common if count == most_common[0][1]]
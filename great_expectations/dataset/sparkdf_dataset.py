@@ -27,7 +27,11 @@ try:
         when,
         year,
         count,
-        countDistinct
+        countDistinct,
+        approx_count_distinct,
+        avg,
+        min as min_,
+        max as max_
     )
     import pyspark.sql.types as sparktypes
     from pyspark.ml.feature import Bucketizer
@@ -36,6 +40,24 @@ except ImportError as e:
     logger.debug(str(e))
     logger.debug("Unable to load spark context; install optional spark dependency for support.")
 
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = None
+    logger.debug("Unable to import pyarrow; Spark data will be brought to the driver row by row.")
+
+# The Spark configuration enabling Arrow in toPandas, in Spark 3 and in Spark 2.3 and 2.4. Spark falls back to
+# converting rows one by one for column types that Arrow does not support.
+ARROW_CONFIGURATION = {
+    "spark.sql.execution.arrow.pyspark.enabled": "true",
+    "spark.sql.execution.arrow.pyspark.fallback.enabled": "true",
+}
+SPARK_2_ARROW_CONFIGURATION = {
+    "spark.sql.execution.arrow.enabled": "true",
+    "spark.sql.execution.arrow.fallback.enabled": "true",
+}
+ARROW_BATCH_SIZE_CONFIGURATION = "spark.sql.execution.arrow.maxRecordsPerBatch"
+
 
 class MetaSparkDFDataset(Dataset):
     """MetaSparkDFDataset is a thin layer between Dataset and SparkDFDataset.
@@ -117,11 +139,14 @@ class MetaSparkDFDataset(Dataset):
                 unexpected_df = success_df.filter('__success = False')
                 if unexpected_count_limit:
                     unexpected_df = unexpected_df.limit(unexpected_count_limit)
-                maybe_limited_unexpected_list = [
-                    row[column]
-                    for row
-                    in unexpected_df.collect()
-                ]
+                    maybe_limited_unexpected_list = [
+                        row[column]
+                        for row
+                        in unexpected_df.collect()
+                    ]
+                else:
+                    # Every unexpected value is brought to the driver
+                    maybe_limited_unexpected_list = self._collect_column_values(unexpected_df, column)
 
                 if "output_strftime_format" in kwargs:
                     output_strftime_format = kwargs["output_strftime_format"]
@@ -183,6 +208,15 @@ class SparkDFDataset(MetaSparkDFDataset):
     """
     This class holds an attribute `spark_df` which is a spark.sql.DataFrame.
     """
+
+    # The maximum relative standard deviation of the counts of get_column_unique_count with approximate=True
+    approximate_count_distinct_rsd = 0.01
+    # Whether to bring data to the driver in Arrow record batches, when pyarrow is available. Arrow is enabled in the
+    # configuration of the Spark session when the dataset is created, unless it was configured there already.
+    use_arrow = True
+    # The maximum number of rows of each Arrow record batch
+    arrow_batch_size = 10000
+
     @classmethod
     def from_dataset(cls, dataset=None):
         if isinstance(dataset, SparkDFDataset):
@@ -193,12 +227,52 @@ class SparkDFDataset(MetaSparkDFDataset):
     def __init__(self, spark_df, *args, **kwargs):
         # Creation of the Spark DataFrame is done outside this class
         self.spark_df = spark_df
+        use_arrow = kwargs.pop("use_arrow", None)
+        if use_arrow is not None:
+            self.use_arrow = use_arrow
+        arrow_batch_size = kwargs.pop("arrow_batch_size", None)
+        if arrow_batch_size is not None:
+            self.arrow_batch_size = arrow_batch_size
+        if self.use_arrow and pyarrow is not None:
+            self._enable_arrow(spark_df.sql_ctx.sparkSession, set_batch_size=arrow_batch_size is not None)
         super(SparkDFDataset, self).__init__(*args, **kwargs)
 
+    def _enable_arrow(self, spark_session, set_batch_size=False):
+        """Enable Arrow in toPandas for the Spark session, with record batches of at most arrow_batch_size rows.
+
+        The configuration is set once, when the dataset is created, rather than around each transfer, since it is
+        shared by every thread using the session. Settings already made in the session, such as Arrow disabled by the
+        user, are left unchanged, except for the batch size when set_batch_size is set.
+        """
+        if spark_session.version.startswith("2."):
+            configuration = dict(SPARK_2_ARROW_CONFIGURATION)
+        else:
+            configuration = dict(ARROW_CONFIGURATION)
+        configuration[ARROW_BATCH_SIZE_CONFIGURATION] = str(self.arrow_batch_size)
+        for key, value in configuration.items():
+            if spark_session.conf.get(key, None) is None or (set_batch_size and key == ARROW_BATCH_SIZE_CONFIGURATION):
+                spark_session.conf.set(key, value)
+
+    def _to_pandas(self, spark_df):
+        """Bring a Spark DataFrame to the driver as a pandas DataFrame.
+
+        When use_arrow is set and pyarrow is available, toPandas transfers the data in Arrow record batches if Arrow
+        is enabled in the Spark session, as the dataset does when it is created. Otherwise the rows are converted one
+        by one, whatever the configuration of the session.
+        """
+        if self.use_arrow and pyarrow is not None:
+            return spark_df.toPandas()
+        return pd.DataFrame.from_records(spark_df.collect(), columns=spark_df.columns)
+
+    def _collect_column_values(self, spark_df, column):
+        """Returns: the list of the values of a column of a Spark DataFrame, as python values, with None for nulls"""
+        values = self._to_pandas(spark_df.select(column))[column].astype(object)
+        return values.where(values.notnull(), None).tolist()
+
     def head(self, n=5):
         """Returns a *PandasDataset* with the first *n* rows of the given Dataset"""
         return PandasDataset(
-            self.spark_df.limit(n).toPandas(),
+            self._to_pandas(self.spark_df.limit(n)),
             expectation_suite=self.get_expectation_suite(
                 discard_failed_expectations=False,
                 discard_result_format_kwargs=False,
@@ -221,28 +295,52 @@ class SparkDFDataset(MetaSparkDFDataset):
 
     def get_column_mean(self, column):
         # TODO need to apply this logic to other such methods?
-        types = dict(self.spark_df.dtypes)
-        if types[column] not in ('int', 'float', 'double', 'bigint'):
+        if column not in self._get_numeric_columns():
             raise TypeError('Expected numeric column type for function mean()')
         result = self.spark_df.select(column).groupBy().mean().collect()[0]
         return result[0] if len(result) > 0 else None
 
+    def _get_numeric_columns(self):
+        """Returns: the names of the columns of a numeric type, including smallint, tinyint and decimal columns"""
+        return [field.name for field in self.spark_df.schema.fields
+                if isinstance(field.dataType, sparktypes.NumericType)]
+
     def get_column_sum(self, column):
         return self.spark_df.select(column).groupBy().sum().collect()[0][0]
 
-    # TODO: consider getting all basic statistics in one go:
-    def _describe_column(self, column):
-        # temp_column = self.spark_df.select(column).where(col(column).isNotNull())
-        # return self.spark_df.select(
-        #     [
-        #         count(temp_column),
-        #         mean(temp_column),
-        #         stddev(temp_column),
-        #         min(temp_column),
-        #         max(temp_column)
-        #     ]
-        # )
-        pass
+    def _get_column_statistics_in_bulk(self, columns, statistics, quantiles):
+        # All the statistics are computed in a single aggregation. Quantiles are left to get_column_quantiles, since
+        # approxQuantile over several columns handles nulls differently across Spark versions.
+        numeric_columns = self._get_numeric_columns()
+
+        aggregates = []
+        for column in columns:
+            if 'nonnull_count' in statistics:
+                aggregates.append((column, 'nonnull_count', count(col(column))))
+            if 'unique_count' in statistics:
+                aggregates.append((column, 'unique_count', countDistinct(col(column))))
+            elif 'approximate_unique_count' in statistics:
+                aggregates.append((column, 'approximate_unique_count',
+                                   approx_count_distinct(col(column), rsd=self.approximate_count_distinct_rsd)))
+            if 'min' in statistics:
+                aggregates.append((column, 'min', min_(col(column))))
+            if 'max' in statistics:
+                aggregates.append((column, 'max', max_(col(column))))
+            if 'mean' in statistics and column in numeric_columns:
+                aggregates.append((column, 'mean', avg(col(column))))
+            if 'stdev' in statistics and column in numeric_columns:
+                aggregates.append((column, 'stdev', stddev_samp(col(column))))
+
+        column_statistics = dict([(column, {}) for column in columns])
+        if len(aggregates) == 0:
+            return column_statistics
+
+        row = self.spark_df.agg(*[
+            aggregate.alias("statistic_" + str(i)) for i, (_, _, aggregate) in enumerate(aggregates)
+        ]).collect()[0]
+        for (column, statistic, _), value in zip(aggregates, row):
+            column_statistics[column][statistic] = value
+        return column_statistics
 
     def get_column_max(self, column, parse_strings_as_datetimes=False):
         temp_column = self.spark_df.select(column).where(col(column).isNotNull())
@@ -262,7 +360,13 @@ class SparkDFDataset(MetaSparkDFDataset):
             return None
         return result[0][0]
 
-    def get_column_value_counts(self, column, sort="value", collate=None):
+    def get_column_value_counts(self, column, sort="value", collate=None, top_k=None):
+        """Get a series containing the frequency counts of unique values from the named column.
+
+        With top_k, only the top_k most frequent values are brought to the driver, ties broken by value, which
+        Spark finds without collecting every distinct value. See
+        :func:`Dataset.get_column_value_counts <great_expectations.dataset.dataset.Dataset.get_column_value_counts>`
+        """
         if sort not in ["value", "count", "none"]:
             raise ValueError(
                 "sort must be either 'value', 'count', or 'none'"
@@ -275,28 +379,44 @@ class SparkDFDataset(MetaSparkDFDataset):
             .where(col(column).isNotNull())\
             .groupBy(column)\
             .count()
+        if top_k is not None:
+            value_counts = value_counts.orderBy(desc("count"), col(column)).limit(top_k)
         if sort == "value":
             value_counts = value_counts.orderBy(column)
         elif sort == "count":
-            value_counts = value_counts.orderBy(desc("count"))
-        value_counts = value_counts.collect()
-        series = pd.Series(
-            [row['count'] for row in value_counts],
+            value_counts = value_counts.orderBy(desc("count"), col(column))
+        return self._build_value_counts_series(self._to_pandas(value_counts), column)
+
+    @staticmethod
+    def _build_value_counts_series(value_counts, column):
+        return pd.Series(
+            value_counts["count"].astype(object).tolist(),
             index=pd.Index(
-                data=[row[column] for row in value_counts],
+                data=value_counts[column].astype(object).tolist(),
                 name="value"
             ),
             name="count"
         )
-        return series
 
-    def get_column_unique_count(self, column):
+    def get_column_unique_count(self, column, approximate=False):
+        if approximate:
+            return self.spark_df.agg(
+                approx_count_distinct(column, rsd=self.approximate_count_distinct_rsd)
+            ).collect()[0][0]
         return self.spark_df.agg(countDistinct(column)).collect()[0][0]
 
-    def get_column_modes(self, column):
-        """leverages computation done in _get_column_value_counts"""
-        s = self.get_column_value_counts(column)
-        return list(s[s == s.max()].index)
+    def get_column_modes(self, column, approximate=False):
+        """The cluster aggregates the value counts and only the most frequent values are brought to the driver, so
+        the modes are always exact"""
+        value_counts = self.spark_df.select(column)\
+            .where(col(column).isNotNull())\
+            .groupBy(column)\
+            .count()
+        max_count = value_counts.agg(max_("count")).collect()[0][0]
+        if max_count is None:
+            return []
+        modes = value_counts.where(col("count") == max_count).orderBy(column)
+        return self._collect_column_values(modes, column)
 
     def get_column_median(self, column):
         # We will get the two middle values by choosing an epsilon to add
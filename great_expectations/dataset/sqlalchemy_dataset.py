@@ -2,9 +2,11 @@ from __future__ import division
 from six import PY3, string_types
 
 import uuid
+import weakref
 from functools import wraps
 import inspect
 import logging
+import math
 import warnings
 from datetime import datetime
 from importlib import import_module
@@ -15,9 +17,13 @@ import numpy as np
 from dateutil.parser import parse
 
 from .dataset import Dataset
+from .incremental_state import merge_aggregates
 from .pandas_dataset import PandasDataset
+from .reflection_cache import get_reflection_cache
+from .sketches import HyperLogLog
 from great_expectations.data_asset import DataAsset
-from great_expectations.data_asset.util import DocInherit, parse_result_format
+from great_expectations.data_asset.util import DocInherit, parse_result_format, \
+    recursively_convert_to_json_serializable
 
 logger = logging.getLogger(__name__)
 
@@ -111,12 +117,12 @@ class MetaSqlAlchemyDataset(Dataset):
             else:
                 ignore_values_condition = sa.literal(False)
 
-            count_query = sa.select([
-                sa.func.count().label('element_count'),
-                sa.func.sum(
+            count_expressions = {
+                'element_count': sa.func.count(),
+                'null_count': sa.func.sum(
                     sa.case([(ignore_values_condition, 1)], else_=0)
-                ).label('null_count'),
-                sa.func.sum(
+                ),
+                'unexpected_count': sa.func.sum(
                     sa.case([
                         (
                             sa.and_(
@@ -126,10 +132,22 @@ class MetaSqlAlchemyDataset(Dataset):
                             1
                         )
                     ], else_=0)
-                ).label('unexpected_count')
-            ]).select_from(self._table)
+                )
+            }
+
+            if self._watermark_column is not None and \
+                    func.__name__ not in self.non_incremental_map_expectations:
+                # The counts of the rows below the watermark are merged with those of the rows added since
+                metric_key = "{}({}, {})".format(func.__name__, repr(column),
+                                                 repr((args, sorted(kwargs.items()))))
+                count_results = dict(self._get_incremental_aggregate(metric_key, count_expressions))
+            else:
+                self._note_full_scan(func.__name__, column)
+                count_query = sa.select([
+                    expression.label(name) for name, expression in count_expressions.items()
+                ]).select_from(self._scan_table)
 
-            count_results = dict(self.engine.execute(count_query).fetchone())
+                count_results = dict(self.connection.execute(count_query).fetchone())
 
             # Handle case of empty table gracefully:
             if "element_count" not in count_results or count_results["element_count"] is None:
@@ -139,29 +157,28 @@ class MetaSqlAlchemyDataset(Dataset):
             if "unexpected_count" not in count_results or count_results["unexpected_count"] is None:
                 count_results["unexpected_count"] = 0
 
-            # Retrieve unexpected values
-            unexpected_query_results = self.engine.execute(
-                sa.select([sa.column(column)]).select_from(self._table).where(
-                    sa.and_(sa.not_(expected_condition),
-                            sa.not_(ignore_values_condition)
-                            )
-                ).limit(unexpected_count_limit)
-            )
-
             nonnull_count = count_results['element_count'] - \
                 count_results['null_count']
 
-            if "output_strftime_format" in kwargs:
-                output_strftime_format = kwargs["output_strftime_format"]
+            unexpected_condition = sa.and_(sa.not_(expected_condition), sa.not_(ignore_values_condition))
+            output_strftime_format = kwargs.get("output_strftime_format")
+
+            # Retrieve unexpected values
+            if result_format['result_format'] == 'BOOLEAN_ONLY' or count_results['unexpected_count'] == 0:
                 maybe_limited_unexpected_list = []
-                for x in unexpected_query_results.fetchall():
-                    if isinstance(x[column], string_types):
-                        col = parse(x[column])
-                    else:
-                        col = x[column]
-                    maybe_limited_unexpected_list.append(datetime.strftime(col, output_strftime_format))
             else:
-                maybe_limited_unexpected_list = [x[column] for x in unexpected_query_results.fetchall()]
+                if unexpected_count_limit is None:
+                    # All the unexpected values can only be found by reading the full table
+                    self._note_full_scan(func.__name__, column)
+                maybe_limited_unexpected_list = self._get_unexpected_values(
+                    column, unexpected_condition, unexpected_count_limit, output_strftime_format)
+
+            unexpected_counts = None
+            if self.aggregate_unexpected_values and result_format['result_format'] in ['SUMMARY', 'COMPLETE'] \
+                    and result_format['partial_unexpected_count'] > 0 and count_results['unexpected_count'] > 0:
+                self._note_full_scan(func.__name__, column)
+                unexpected_counts = self._get_unexpected_value_counts(
+                    column, unexpected_condition, result_format['partial_unexpected_count'], output_strftime_format)
 
             success_count = nonnull_count - count_results['unexpected_count']
             success, percent_success = self._calc_map_expectation_success(
@@ -175,6 +192,7 @@ class MetaSqlAlchemyDataset(Dataset):
                 count_results['unexpected_count'],
                 maybe_limited_unexpected_list,
                 None,
+                unexpected_counts=unexpected_counts,
             )
 
             if func.__name__ in ['expect_column_values_to_not_be_null', 'expect_column_values_to_be_null']:
@@ -198,17 +216,55 @@ class MetaSqlAlchemyDataset(Dataset):
 
 class SqlAlchemyDataset(MetaSqlAlchemyDataset):
 
+    # The most aggregate expressions selected in one query when gathering column statistics in bulk
+    column_statistics_batch_size = 500
+    # Whether column map expectations count the partial_unexpected_counts of SUMMARY and COMPLETE results with a
+    # GROUP BY in the database, over all the unexpected values, rather than counting the partial_unexpected_list
+    aggregate_unexpected_values = False
+    # The number of rows fetched at a time when streaming the unexpected_list of COMPLETE results
+    unexpected_fetch_size = 10000
+    # Column map expectations whose condition on a row depends on the other rows, so that their unexpected counts
+    # cannot be merged across incremental validations
+    non_incremental_map_expectations = ['expect_column_values_to_be_unique']
+    # The most distinct values of a column whose counts incremental validation keeps, beyond which the distinct
+    # values are computed from the full table and unique value counts estimated from a HyperLogLog sketch
+    incremental_max_distinct_values = 1000
+
     @classmethod
     def from_dataset(cls, dataset=None):
         if isinstance(dataset, SqlAlchemyDataset):
+            if dataset._custom_sql is not None:
+                # A temporary table only exists on the connection of the dataset that created it, so the new dataset
+                # runs the query again
+                return cls(custom_sql=dataset._custom_sql, engine=dataset.engine, materialize=dataset._materialize)
             return cls(table_name=str(dataset._table.name), engine=dataset.engine)
         else:
             raise ValueError("from_dataset requires a SqlAlchemy dataset")
 
     def __init__(self, table_name=None, engine=None, connection_string=None,
-                 custom_sql=None, schema=None, *args, **kwargs):
+                 custom_sql=None, schema=None, materialize=True, aggregate_unexpected_values=None,
+                 watermark_column=None, incremental_state_store=None, incremental_state_key=None, *args, **kwargs):
+        """
+        Args:
+            table_name: the table to validate, or the name of the temporary table created from custom_sql
+            engine: a SqlAlchemy engine
+            connection_string: a SqlAlchemy connection string, used to create an engine if none is given
+            custom_sql: a query whose results are validated instead of a table, as a string or a SqlAlchemy
+                selectable
+            schema: the schema of the table
+            materialize: if True (the default), the results of custom_sql are stored once in a temporary table that
+                every metric query reads; if False, custom_sql is used as a subquery by every metric query, which
+                runs it again each time but avoids writing its results
+            aggregate_unexpected_values: if given, overrides the aggregate_unexpected_values class attribute
+            watermark_column: for incremental validation of an append-only table, a non-null column whose value
+                increases with every row added, such as an auto-incremented id or an insertion timestamp
+            incremental_state_store: the IncrementalStateStore keeping the partial aggregates of incremental
+                validation between runs
+            incremental_state_key: the key of the aggregates in the store, by default "<data asset name>/<expectation
+                suite name>"
+        """
 
-        if custom_sql and not table_name:
+        if custom_sql is not None and not table_name:
             # dashes are special characters in most databases so use underscores
             table_name = "ge_tmp_" + str(uuid.uuid4()).replace("-", "_")
             generated_table_name = table_name
@@ -218,7 +274,20 @@ class SqlAlchemyDataset(MetaSqlAlchemyDataset):
         if table_name is None:
             raise ValueError("No table_name provided.")
 
-        self._table = sa.Table(table_name, sa.MetaData(), schema=schema)
+        self._custom_sql = custom_sql
+        self._materialize = materialize
+        if aggregate_unexpected_values is not None:
+            self.aggregate_unexpected_values = aggregate_unexpected_values
+        # The table whose columns a query selects, whose column types can then be reflected
+        selected_table = None
+        if custom_sql is not None and not materialize:
+            if isinstance(custom_sql, string_types):
+                custom_sql = sa.text(custom_sql).columns()
+            else:
+                selected_table = self._get_selected_table(custom_sql)
+            self._table = custom_sql.alias(table_name)
+        else:
+            self._table = sa.Table(table_name, sa.MetaData(), schema=schema)
 
         if engine is None and connection_string is None:
             raise ValueError("Engine or connection_string must be provided.")
@@ -232,6 +301,19 @@ class SqlAlchemyDataset(MetaSqlAlchemyDataset):
                 # Currently we do no error handling if the engine doesn't work out of the box.
                 raise err
 
+        # A temporary table is only visible from the connection that created it, so a dataset materializing
+        # custom_sql pins one connection for all its queries until close is called; other datasets run each query on
+        # a connection checked out of the engine's pool for that query only
+        self._pinned_connection = None
+        if custom_sql is not None and materialize:
+            self._pinned_connection = self.engine.connect()
+            if hasattr(weakref, "finalize"):
+                # Return the connection to the pool if the dataset is garbage collected without being closed
+                weakref.finalize(self, self._pinned_connection.close)
+            self.connection = self._pinned_connection
+        else:
+            self.connection = self.engine
+
         # Get the dialect **for purposes of identifying types**
         if self.engine.dialect.name.lower() in ["postgresql", "mysql", "sqlite", "oracle", "mssql", "oracle"]:
             # These are the officially included and supported dialects by sqlalchemy
@@ -254,34 +336,305 @@ class SqlAlchemyDataset(MetaSqlAlchemyDataset):
             if generated_table_name is not None and self.engine.dialect.dataset_id is None:
                 raise ValueError("No BigQuery dataset specified. Use biquery_temp_table batch_kwarg or a specify a default dataset in engine url")
 
-        if custom_sql:
-            self.create_temporary_table(table_name, custom_sql)
+        if custom_sql is not None and materialize:
+            if not isinstance(custom_sql, string_types):
+                custom_sql = str(custom_sql.compile(self.engine, compile_kwargs={"literal_binds": True}))
+            try:
+                self.create_temporary_table(table_name, custom_sql)
+            except Exception:
+                self.close()
+                raise
 
             if generated_table_name is not None and self.engine.dialect.name.lower() == "bigquery":
                 logger.warning("Created permanent table {table_name}".format(
                     table_name=table_name))
 
-        try:
-            insp = reflection.Inspector.from_engine(self.engine)
-            self.columns = insp.get_columns(table_name, schema=schema)
-        except KeyError:
-            # we will get a KeyError for temporary tables, since
-            # reflection will not find the temporary schema
+        if custom_sql is not None and not materialize:
             self.columns = self.column_reflection_fallback()
+            if selected_table is not None:
+                # The query only filters, samples or limits the rows of a table, so its columns are those of the table
+                try:
+                    table_columns = dict([
+                        (column["name"], column) for column in
+                        get_reflection_cache(self.engine).get_columns(selected_table.name, schema=selected_table.schema)
+                    ])
+                    self.columns = [table_columns.get(column["name"], column) for column in self.columns]
+                except (KeyError, sa.exc.SQLAlchemyError):
+                    logger.debug("Unable to reflect the columns of table {}".format(selected_table.name),
+                                 exc_info=True)
+        else:
+            try:
+                if custom_sql is not None:
+                    # The temporary table is only visible from the connection of the dataset
+                    insp = reflection.Inspector.from_engine(self.connection)
+                    self.columns = insp.get_columns(table_name, schema=schema)
+                else:
+                    self.columns = get_reflection_cache(self.engine).get_columns(table_name, schema=schema)
+            except KeyError:
+                # we will get a KeyError for temporary tables, since
+                # reflection will not find the temporary schema
+                self.columns = self.column_reflection_fallback()
+
+        self._watermark_column = watermark_column
+        self._incremental_state_store = incremental_state_store
+        self._incremental_state_key = incremental_state_key
+        # The aggregates loaded from the store, and those computed since, as (watermark, aggregate) tuples by metric
+        self._incremental_state = None
+        self._pending_incremental_state = {}
+        # The (getter or expectation, column) pairs computed from the full table despite incremental validation
+        self._full_scan_metrics = set()
+        self._incremental_full_scans = []
+        # The (getter, column) pairs estimated from a sketch rather than counted exactly
+        self._approximate_metrics = set()
+        self._incremental_approximations = []
+        # The rows that queries other than those of incremental aggregates read
+        self._scan_table = self._table
+        if watermark_column is not None:
+            # Rows added from now on are left to the next validation
+            self._high_watermark = self.connection.execute(
+                sa.select([sa.func.max(sa.column(watermark_column))]).select_from(self._table)
+            ).scalar()
+            if self._high_watermark is not None:
+                # Metrics computed from the full table describe the same rows as the merged aggregates
+                self._scan_table = sa.select([sa.text("*")]).select_from(self._table).where(
+                    sa.column(watermark_column) <= self._high_watermark
+                ).alias("watermarked_" + str(self._table.name))
 
         # Only call super once connection is established and table_name and columns known to allow autoinspection
         super(SqlAlchemyDataset, self).__init__(*args, **kwargs)
 
+    def _format_unexpected_value(self, value, output_strftime_format=None):
+        if output_strftime_format is None:
+            return value
+        if isinstance(value, string_types):
+            value = parse(value)
+        return datetime.strftime(value, output_strftime_format)
+
+    def _get_unexpected_values(self, column, unexpected_condition, limit=None, output_strftime_format=None):
+        """Get the values of the column that meet the unexpected_condition, up to limit of them.
+
+        Without a limit, the rows are streamed from a server-side cursor where the database supports it, and fetched
+        unexpected_fetch_size rows at a time, so that the driver never holds all of them at once."""
+        unexpected_query = sa.select([sa.column(column)]).select_from(self._scan_table).where(unexpected_condition)
+        if limit is not None:
+            unexpected_query_results = self.connection.execute(unexpected_query.limit(limit))
+            return [self._format_unexpected_value(row[0], output_strftime_format)
+                    for row in unexpected_query_results.fetchall()]
+
+        unexpected_values = []
+        unexpected_query_results = self.connection.execution_options(stream_results=True).execute(unexpected_query)
+        try:
+            while True:
+                rows = unexpected_query_results.fetchmany(self.unexpected_fetch_size)
+                if not rows:
+                    break
+                unexpected_values.extend(
+                    [self._format_unexpected_value(row[0], output_strftime_format) for row in rows])
+        finally:
+            unexpected_query_results.close()
+        return unexpected_values
+
+    def _get_unexpected_value_counts(self, column, unexpected_condition, limit, output_strftime_format=None):
+        """Count the values of the column that meet the unexpected_condition in the database.
+
+        Returns:
+            a list of the (value, count) tuples of the limit most common unexpected values, by decreasing count
+        """
+        value_count = sa.func.count().label("unexpected_value_count")
+        unexpected_counts_query = sa.select([sa.column(column), value_count]).select_from(self._scan_table).where(
+            unexpected_condition
+        ).group_by(sa.column(column)).order_by(value_count.desc(), sa.column(column)).limit(limit)
+        return [(self._format_unexpected_value(row[0], output_strftime_format), row[1])
+                for row in self.connection.execute(unexpected_counts_query).fetchall()]
+
+    def _get_incremental_state_key(self):
+        if self._incremental_state_key is not None:
+            return self._incremental_state_key
+        return "{}/{}".format(self._expectation_suite.get("data_asset_name"),
+                              self._expectation_suite.get("expectation_suite_name"))
+
+    def _get_incremental_aggregate(self, metric_key, aggregate_expressions, value_counts_column=None):
+        """Get an aggregate over the rows up to the high watermark of the dataset, merging the aggregate stored for the
+        rows below the watermark of the previous validation with the aggregate of the rows added since.
+
+        Args:
+            metric_key: the key of the aggregate in the incremental state
+            aggregate_expressions: dict of the SqlAlchemy expressions computing each field of the aggregate, which
+                must be mergeable by merge_aggregates
+            value_counts_column: if given, the aggregate also includes the "value_counts" of this column, or None if
+                it has more than incremental_max_distinct_values distinct values, and a HyperLogLog "distinct_sketch"
+                of its distinct values
+
+        Returns:
+            dict: the value of each field of the aggregate
+        """
+        if metric_key in self._pending_incremental_state:
+            return self._pending_incremental_state[metric_key][1]
+        if self._incremental_state is None:
+            if self._incremental_state_store is not None:
+                self._incremental_state = self._incremental_state_store.get_state(self._get_incremental_state_key())
+            else:
+                self._incremental_state = {}
+
+        watermark, aggregate = self._incremental_state.get(metric_key, (None, None))
+        if value_counts_column is not None and aggregate is not None and aggregate.get("distinct_sketch") is None:
+            # Aggregates stored before distinct sketches were kept cannot be brought up to date
+            watermark, aggregate = None, None
+        if watermark is not None and (self._high_watermark is None or watermark > self._high_watermark):
+            logger.warning("The high watermark of {} is below the watermark of its previous validation; the table "
+                           "may have been rewritten, so it is validated in full.".format(self._table.name))
+            watermark, aggregate = None, None
+
+        if aggregate is None or watermark != self._high_watermark:
+            watermark_column = sa.column(self._watermark_column)
+            conditions = [watermark_column <= self._high_watermark]
+            if watermark is not None:
+                conditions.append(watermark_column > watermark)
+
+            new_aggregate = {}
+            if aggregate_expressions:
+                new_aggregate = dict(self.connection.execute(
+                    sa.select([expression.label(name) for name, expression in aggregate_expressions.items()])
+                    .select_from(self._table).where(sa.and_(*conditions))
+                ).fetchone())
+            if value_counts_column is not None:
+                # Every distinct value of the new rows goes into the sketch, but only up to
+                # incremental_max_distinct_values of them are counted
+                value_counts = {}
+                distinct_sketch = HyperLogLog()
+                result = self.connection.execute(
+                    sa.select([sa.column(value_counts_column), sa.func.count()]).select_from(self._table)
+                    .where(sa.and_(sa.column(value_counts_column) != None, *conditions))
+                    .group_by(sa.column(value_counts_column))
+                )
+                while True:
+                    rows = result.fetchmany(self.incremental_max_distinct_values + 1)
+                    if not rows:
+                        break
+                    distinct_sketch.update([row[0] for row in rows])
+                    if value_counts is not None:
+                        value_counts.update((row[0], row[1]) for row in rows)
+                        if len(value_counts) > self.incremental_max_distinct_values:
+                            value_counts = None
+                new_aggregate["value_counts"] = value_counts
+                new_aggregate["distinct_sketch"] = distinct_sketch
+            aggregate = merge_aggregates(aggregate, new_aggregate,
+                                         max_distinct_values=self.incremental_max_distinct_values)
+
+        self._pending_incremental_state[metric_key] = (self._high_watermark, aggregate)
+        return aggregate
+
+    def _get_incremental_value_counts(self, column):
+        """The counts of the distinct non-null values of the column, or None if it has too many to keep them."""
+        return self._get_incremental_distinct_values(column)["value_counts"]
+
+    def _get_incremental_distinct_values(self, column):
+        return self._get_incremental_aggregate("get_column_value_counts({})".format(repr(column)), {},
+                                               value_counts_column=column)
+
+    def _get_incremental_moments(self, column):
+        return self._get_incremental_aggregate("moments({})".format(repr(column)), {
+            "nonnull_count": sa.func.count(sa.column(column)),
+            "sum": sa.func.sum(sa.column(column)),
+            "sum_of_squares": sa.func.sum(sa.column(column) * sa.column(column)),
+        })
+
+    def _note_full_scan(self, func, column=None):
+        """Note that a metric of the column was computed from the full table despite incremental validation."""
+        if self._watermark_column is not None:
+            self._full_scan_metrics.add((func, column))
+            self._incremental_full_scans.append((func, column))
+
+    def _note_approximation(self, func, column=None):
+        """Note that a metric of the column was estimated from a sketch of the incremental state."""
+        self._approximate_metrics.add((func, column))
+        self._incremental_approximations.append((func, column))
+
+    def _get_metric(self, func, getter, args, kwargs):
+        value = super(SqlAlchemyDataset, self)._get_metric(func, getter, args, kwargs)
+        if self._watermark_column is not None:
+            # A cached value computed from the full table still makes the expectation using it a full scan
+            column = args[0] if len(args) > 0 else kwargs.get("column")
+            if (func, column) in self._full_scan_metrics:
+                self._incremental_full_scans.append((func, column))
+            if (func, column) in self._approximate_metrics:
+                self._incremental_approximations.append((func, column))
+        return value
+
+    def _validate_single_expectation(self, expectation, result_format, runtime_evaluation_parameters,
+                                     catch_exceptions):
+        self._incremental_full_scans = []
+        self._incremental_approximations = []
+        expectation, result = super(SqlAlchemyDataset, self)._validate_single_expectation(
+            expectation, result_format, runtime_evaluation_parameters, catch_exceptions)
+        if self._watermark_column is not None:
+            result["incremental"] = {
+                "full_scan": len(self._incremental_full_scans) > 0,
+                "full_scan_metrics": sorted(set(["{}({})".format(func, column if column is not None else "")
+                                                 for func, column in self._incremental_full_scans])),
+                "approximate": len(self._incremental_approximations) > 0,
+                "approximate_metrics": sorted(set(["{}({})".format(func, column if column is not None else "")
+                                                   for func, column in self._incremental_approximations])),
+            }
+        return expectation, result
+
+    def validate(self, *args, **kwargs):
+        """Validate the dataset as DataAsset.validate does. With a watermark_column, the results of incremental
+        validation are marked with whether they needed a full scan of the table, and the aggregates computed are
+        stored for the next validation once it completes."""
+        validation_results = super(SqlAlchemyDataset, self).validate(*args, **kwargs)
+        if self._watermark_column is not None:
+            validation_results["meta"]["incremental"] = {
+                "watermark_column": self._watermark_column,
+                "watermark": recursively_convert_to_json_serializable(self._high_watermark),
+                "full_scan_expectations": sorted(set([
+                    result["expectation_config"]["expectation_type"] for result in validation_results["results"]
+                    if result.get("incremental", {}).get("full_scan")
+                ])),
+                "approximate_expectations": sorted(set([
+                    result["expectation_config"]["expectation_type"] for result in validation_results["results"]
+                    if result.get("incremental", {}).get("approximate")
+                ])),
+            }
+            self.commit_incremental_state()
+        return validation_results
+
+    def commit_incremental_state(self):
+        """Store the aggregates computed over the rows up to the high watermark of the dataset, so that the next
+        incremental validation only reads the rows added since. validate calls this once it completes."""
+        if self._incremental_state_store is not None and self._pending_incremental_state:
+            self._incremental_state_store.set_state(self._get_incremental_state_key(),
+                                                    self._pending_incremental_state)
+        if self._incremental_state is not None:
+            self._incremental_state.update(self._pending_incremental_state)
+        self._pending_incremental_state = {}
+
+    def close(self):
+        """Return the connection pinned by a dataset materializing custom_sql to the pool of its engine; the dataset
+        cannot be used afterwards. Other datasets hold no connection, so closing them has no effect. Datasets are
+        also context managers that close on exit."""
+        if self._pinned_connection is not None:
+            self._pinned_connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
     def head(self, n=5):
         """Returns a *PandasDataset* with the first *n* rows of the given Dataset"""
 
         try:
-            df = next(pd.read_sql_table(
-                table_name=self._table.name,
-                schema=self._table.schema,
-                con=self.engine,
-                chunksize=n
-            ))
+            if self._custom_sql is not None and not self._materialize:
+                df = pd.read_sql(sa.select([sa.text("*")]).select_from(self._table).limit(n), con=self.connection)
+            else:
+                df = next(pd.read_sql_table(
+                    table_name=self._table.name,
+                    schema=self._table.schema,
+                    con=self.connection,
+                    chunksize=n
+                ))
         except (ValueError, NotImplementedError):
             # it looks like MetaData that is used by pd.read_sql_table
             # cannot work on a temp table.
@@ -295,7 +648,7 @@ class SqlAlchemyDataset(MetaSqlAlchemyDataset):
                 head_sql_str += self._table.name
             head_sql_str += " limit {0:d}".format(n)
 
-            df = pd.read_sql(head_sql_str, con=self.engine)
+            df = pd.read_sql(head_sql_str, con=self.connection)
 
         return PandasDataset(
             df,
@@ -308,9 +661,11 @@ class SqlAlchemyDataset(MetaSqlAlchemyDataset):
         )
 
     def get_row_count(self):
+        if self._watermark_column is not None:
+            return self._get_incremental_aggregate("get_row_count()", {"row_count": sa.func.count()})["row_count"]
         count_query = sa.select([sa.func.count()]).select_from(
-            self._table)
-        return self.engine.execute(count_query).scalar()
+            self._scan_table)
+        return self.connection.execute(count_query).scalar()
 
     def get_column_count(self):
         return len(self.columns)
@@ -319,6 +674,8 @@ class SqlAlchemyDataset(MetaSqlAlchemyDataset):
         return [col['name'] for col in self.columns]
 
     def get_column_nonnull_count(self, column):
+        if self._watermark_column is not None:
+            return self._get_incremental_moments(column)["nonnull_count"]
         ignore_values = [None]
         count_query = sa.select([
             sa.func.count().label('element_count'),
@@ -329,32 +686,42 @@ class SqlAlchemyDataset(MetaSqlAlchemyDataset):
                     # But we only consider this if None is actually in the list of ignore values
                     sa.column(column).is_(None) if None in ignore_values else False), 1)], else_=0)
             ).label('null_count'),
-        ]).select_from(self._table)
-        count_results = dict(self.engine.execute(count_query).fetchone())
+        ]).select_from(self._scan_table)
+        count_results = dict(self.connection.execute(count_query).fetchone())
         element_count = count_results['element_count']
         null_count = count_results['null_count'] or 0
         return element_count - null_count
 
     def get_column_sum(self, column):
-        return self.engine.execute(
+        if self._watermark_column is not None:
+            return self._get_incremental_moments(column)["sum"]
+        return self.connection.execute(
             sa.select([sa.func.sum(sa.column(column))]).select_from(
-                self._table)
+                self._scan_table)
         ).scalar()
 
     def get_column_max(self, column, parse_strings_as_datetimes=False):
         if parse_strings_as_datetimes:
             raise NotImplementedError
-        return self.engine.execute(
+        if self._watermark_column is not None:
+            return self._get_incremental_aggregate("get_column_max({})".format(repr(column)), {
+                "max": sa.func.max(sa.column(column))
+            })["max"]
+        return self.connection.execute(
             sa.select([sa.func.max(sa.column(column))]).select_from(
-                self._table)
+                self._scan_table)
         ).scalar()
 
     def get_column_min(self, column, parse_strings_as_datetimes=False):
         if parse_strings_as_datetimes:
             raise NotImplementedError
-        return self.engine.execute(
+        if self._watermark_column is not None:
+            return self._get_incremental_aggregate("get_column_min({})".format(repr(column)), {
+                "min": sa.func.min(sa.column(column))
+            })["min"]
+        return self.connection.execute(
             sa.select([sa.func.min(sa.column(column))]).select_from(
-                self._table)
+                self._scan_table)
         ).scalar()
 
     def get_column_value_counts(self, column, sort="value", collate=None):
@@ -363,6 +730,22 @@ class SqlAlchemyDataset(MetaSqlAlchemyDataset):
                 "sort must be either 'value', 'count', or 'none'"
             )
 
+        if self._watermark_column is not None:
+            value_counts = self._get_incremental_value_counts(column) if collate is None else None
+            if value_counts is not None:
+                if sort == "value":
+                    items = sorted(value_counts.items())
+                elif sort == "count":
+                    items = sorted(value_counts.items(), key=lambda item: -item[1])
+                else:
+                    items = list(value_counts.items())
+                return pd.Series(
+                    [item[1] for item in items],
+                    index=pd.Index(data=[item[0] for item in items], name="value"),
+                    name="count"
+                )
+            self._note_full_scan("get_column_value_counts", column)
+
         query = sa.select([
                 sa.column(column).label("value"),
                 sa.func.count(sa.column(column)).label("count"),
@@ -379,7 +762,7 @@ class SqlAlchemyDataset(MetaSqlAlchemyDataset):
                 query = query.order_by(sa.column(column))
         elif sort == "count":
             query = query.order_by(sa.column("count").desc())
-        results = self.engine.execute(query.select_from(self._table)).fetchall()
+        results = self.connection.execute(query.select_from(self._scan_table)).fetchall()
         series = pd.Series(
             [row[1] for row in results],
             index=pd.Index(
@@ -391,23 +774,52 @@ class SqlAlchemyDataset(MetaSqlAlchemyDataset):
         return series
 
     def get_column_mean(self, column):
-        return self.engine.execute(
+        if self._watermark_column is not None:
+            moments = self._get_incremental_moments(column)
+            if not moments["nonnull_count"]:
+                return None
+            return moments["sum"] / moments["nonnull_count"]
+        return self.connection.execute(
             sa.select([sa.func.avg(sa.column(column))]).select_from(
-                self._table)
+                self._scan_table)
         ).scalar()
 
-    def get_column_unique_count(self, column):
-        return self.engine.execute(
-            sa.select([sa.func.count(sa.func.distinct(sa.column(column)))]).select_from(
-                self._table)
+    def get_column_unique_count(self, column, approximate=False):
+        if self._watermark_column is not None:
+            # Beyond incremental_max_distinct_values distinct values, the count is estimated from their sketch
+            distinct_values = self._get_incremental_distinct_values(column)
+            if distinct_values["value_counts"] is not None:
+                return len(distinct_values["value_counts"])
+            self._note_approximation("get_column_unique_count", column)
+            return distinct_values["distinct_sketch"].count()
+        return self.connection.execute(
+            sa.select([self._get_unique_count_expression(column, approximate=approximate)]).select_from(
+                self._scan_table)
         ).scalar()
 
+    def _get_unique_count_expression(self, column, approximate=False):
+        """The aggregate counting the distinct values of the column, which is the database's approximate distinct
+        count when approximate is True and the database has one."""
+        if approximate:
+            dialect_name = self.engine.dialect.name.lower()
+            server_version_info = getattr(self.engine.dialect, "server_version_info", None) or ()
+            # SQL Server added APPROX_COUNT_DISTINCT in SQL Server 2019
+            if dialect_name in ["bigquery", "snowflake", "oracle"] or \
+                    (dialect_name == "mssql" and tuple(server_version_info) >= (15,)):
+                return sa.func.approx_count_distinct(sa.column(column))
+            elif dialect_name == "redshift":
+                return sa.literal_column(
+                    "APPROXIMATE COUNT(DISTINCT {})".format(self.engine.dialect.identifier_preparer.quote(column))
+                )
+        return sa.func.count(sa.func.distinct(sa.column(column)))
+
     def get_column_median(self, column):
+        self._note_full_scan("get_column_median", column)
         nonnull_count = self.get_column_nonnull_count(column)
-        element_values = self.engine.execute(
+        element_values = self.connection.execute(
             sa.select([sa.column(column)]).order_by(sa.column(column)).where(
                 sa.column(column) != None
-            ).offset(max(nonnull_count // 2 - 1, 0)).limit(2).select_from(self._table)
+            ).offset(max(nonnull_count // 2 - 1, 0)).limit(2).select_from(self._scan_table)
         )
 
         column_values = list(element_values.fetchall())
@@ -426,6 +838,7 @@ class SqlAlchemyDataset(MetaSqlAlchemyDataset):
         return column_median
 
     def get_column_quantiles(self, column, quantiles, allow_relative_error=False):
+        self._note_full_scan("get_column_quantiles", column)
         selects = [sa.func.percentile_disc(quantile).within_group(
             sa.column(column).asc()) for quantile in quantiles]
         try:
@@ -441,13 +854,20 @@ class SqlAlchemyDataset(MetaSqlAlchemyDataset):
                                      "set allow_relative_error to True to allow approximate quantiles.")
         except (AttributeError, TypeError):
             pass
-        quantiles = self.engine.execute(sa.select(selects).select_from(self._table)).fetchone()
+        quantiles = self.connection.execute(sa.select(selects).select_from(self._scan_table)).fetchone()
         return list(quantiles)
 
     def get_column_stdev(self, column):
-        res = self.engine.execute(sa.select([
+        if self._watermark_column is not None:
+            moments = self._get_incremental_moments(column)
+            nonnull_count = moments["nonnull_count"]
+            if nonnull_count is None or nonnull_count < 2:
+                return float("nan")
+            variance = (moments["sum_of_squares"] - moments["sum"] ** 2 / nonnull_count) / (nonnull_count - 1)
+            return math.sqrt(max(variance, 0))
+        res = self.connection.execute(sa.select([
                 sa.func.stddev_samp(sa.column(column))
-            ]).select_from(self._table).where(sa.column(column) != None)).fetchone()
+            ]).select_from(self._scan_table).where(sa.column(column) != None)).fetchone()
         return float(res[0])
 
     def get_column_hist(self, column, bins):
@@ -457,6 +877,7 @@ class SqlAlchemyDataset(MetaSqlAlchemyDataset):
             column: the name of the column for which to get the histogram
             bins: tuple of bin edges for which to get histogram values; *must* be tuple to support caching
         """
+        self._note_full_scan("get_column_hist", column)
         case_conditions = []
         idx = 0
         bins = list(bins)
@@ -518,9 +939,9 @@ class SqlAlchemyDataset(MetaSqlAlchemyDataset):
         .where(
             sa.column(column) != None,
         )\
-        .select_from(self._table)
+        .select_from(self._scan_table)
 
-        hist = list(self.engine.execute(query).fetchone())
+        hist = list(self.connection.execute(query).fetchone())
         return hist
 
     def get_column_count_in_range(self, column, min_val=None, max_val=None, strict_min=False, strict_max=True):
@@ -528,6 +949,7 @@ class SqlAlchemyDataset(MetaSqlAlchemyDataset):
             raise ValueError('Must specify either min or max value')
         if min_val is not None and max_val is not None and min_val > max_val:
             raise ValueError('Min value must be <= to max value')
+        self._note_full_scan("get_column_count_in_range", column)
 
         min_condition = None
         max_condition = None
@@ -558,9 +980,85 @@ class SqlAlchemyDataset(MetaSqlAlchemyDataset):
                         condition
                     )
                 ) \
-                .select_from(self._table)
-
-        return self.engine.execute(query).scalar()
+                .select_from(self._scan_table)
+
+        return self.connection.execute(query).scalar()
+
+    def _get_column_statistics_in_bulk(self, columns, statistics, quantiles):
+        column_types = dict([(col['name'], col.get('type')) for col in self.columns])
+        numeric_columns = [column for column in columns
+                           if isinstance(column_types.get(column), (sa.types.Integer, sa.types.Numeric))]
+        ordered_columns = [column for column in columns
+                           if isinstance(column_types.get(column), (sa.types.Integer, sa.types.Numeric,
+                                                                    sa.types.Date, sa.types.DateTime))]
+
+        aggregates = []
+        for column in columns:
+            if 'nonnull_count' in statistics:
+                aggregates.append((column, 'nonnull_count', sa.func.count(sa.column(column))))
+            if 'unique_count' in statistics:
+                aggregates.append((column, 'unique_count', self._get_unique_count_expression(column)))
+            elif 'approximate_unique_count' in statistics:
+                aggregates.append((column, 'approximate_unique_count',
+                                   self._get_unique_count_expression(column, approximate=True)))
+            if 'min' in statistics and column in ordered_columns:
+                aggregates.append((column, 'min', sa.func.min(sa.column(column))))
+            if 'max' in statistics and column in ordered_columns:
+                aggregates.append((column, 'max', sa.func.max(sa.column(column))))
+            if 'mean' in statistics and column in numeric_columns:
+                aggregates.append((column, 'mean', sa.func.avg(sa.column(column))))
+
+        # Not every database supports stddev_samp and percentile_disc, so they are gathered separately, letting
+        # the statistics above be gathered regardless
+        stdev_aggregates = []
+        if 'stdev' in statistics:
+            stdev_aggregates = [(column, 'stdev', sa.func.stddev_samp(sa.column(column)))
+                                for column in numeric_columns]
+
+        quantile_aggregates = []
+        try:
+            is_redshift = isinstance(self.engine.dialect, sqlalchemy_redshift.dialect.RedshiftDialect)
+        except (AttributeError, TypeError):
+            is_redshift = False
+        # Redshift only supports approximate quantiles, which get_column_quantiles does not return by default
+        if 'quantiles' in statistics and not is_redshift:
+            for column in numeric_columns:
+                for quantile in quantiles:
+                    quantile_aggregates.append((
+                        column,
+                        quantile,
+                        sa.func.percentile_disc(quantile).within_group(sa.column(column).asc())
+                    ))
+
+        column_statistics = dict([(column, {}) for column in columns])
+        for column, statistic, value in self._select_column_aggregates(aggregates):
+            column_statistics[column][statistic] = value
+        for column, statistic, value in self._select_column_aggregates(stdev_aggregates):
+            # get_column_stdev fails rather than return None
+            if value is not None:
+                column_statistics[column][statistic] = float(value)
+        for column, quantile, value in self._select_column_aggregates(quantile_aggregates):
+            column_statistics[column].setdefault('quantiles', {})[quantile] = value
+
+        return column_statistics
+
+    def _select_column_aggregates(self, aggregates):
+        """Select a list of (column, statistic, aggregate expression) from the table, in as few queries as the limit
+        on the number of expressions per query allows, returning a list of (column, statistic, value). If the
+        database rejects any of the queries, no values are returned."""
+        results = []
+        try:
+            for start in range(0, len(aggregates), self.column_statistics_batch_size):
+                batch = aggregates[start:start + self.column_statistics_batch_size]
+                query = sa.select([
+                    expression.label("statistic_" + str(i)) for i, (_, _, expression) in enumerate(batch)
+                ]).select_from(self._scan_table)
+                row = self.connection.execute(query).fetchone()
+                results.extend([(column, statistic, value) for (column, statistic, _), value in zip(batch, row)])
+        except sa.exc.SQLAlchemyError as err:
+            logger.debug("Unable to gather column statistics in bulk: {}".format(str(err)))
+            return []
+        return results
 
     def create_temporary_table(self, table_name, custom_sql):
         """
@@ -580,12 +1078,28 @@ class SqlAlchemyDataset(MetaSqlAlchemyDataset):
         else:
             stmt = "CREATE TEMPORARY TABLE \"{table_name}\" AS {custom_sql}".format(
                 table_name=table_name, custom_sql=custom_sql)
-        self.engine.execute(stmt)
+        self.connection.execute(stmt)
+
+    @staticmethod
+    def _get_selected_table(query):
+        """Returns: the table whose every column the query selects, such as "SELECT * FROM table WHERE ..." or
+        "SELECT * FROM table TABLESAMPLE ...", or None if the query selects anything else"""
+        if not isinstance(query, sa.sql.expression.Select) or len(query.froms) != 1:
+            return None
+        table = query.froms[0]
+        if isinstance(table, sa.sql.expression.TableSample):
+            table = table.element
+        if not isinstance(table, sa.Table):
+            return None
+        for column in query.inner_columns:
+            if not (isinstance(column, sa.sql.elements.TextClause) and column.text.strip() == "*"):
+                return None
+        return table
 
     def column_reflection_fallback(self):
         """If we can't reflect the table, use a query to at least get column names."""
         sql = sa.select([sa.text("*")]).select_from(self._table).limit(1)
-        col_names = self.engine.execute(sql).keys()
+        col_names = self.connection.execute(sql).keys()
         col_dict = [{'name': col_name} for col_name in col_names]
         return col_dict
 
@@ -885,7 +1399,7 @@ class SqlAlchemyDataset(MetaSqlAlchemyDataset):
                                           result_format=None, include_config=False, catch_exceptions=None, meta=None):
         # Duplicates are found by filtering a group by query
         dup_query = sa.select([sa.column(column)]).\
-            select_from(self._table).\
+            select_from(self._scan_table).\
             group_by(sa.column(column)).\
             having(sa.func.count(sa.column(column)) > 1)
 
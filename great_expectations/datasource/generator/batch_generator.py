@@ -121,6 +121,19 @@ class BatchGenerator(object):
             self.reset_iterator(generator_asset, **kwargs)
             return self._data_asset_iterators[generator_asset][0]
 
+    def iterate_batch_kwargs(self, generator_asset, **kwargs):
+        """Iterate once over all the batch_kwargs of a generator_asset, with a new iterator that does not affect the
+        one used by yield_batch_kwargs.
+
+        Args:
+            generator_asset: the generator_asset whose batch_kwargs to iterate over
+            **kwargs: additional kwargs to supplement the batch_kwargs
+
+        Returns:
+            an iterator of BatchKwargs
+        """
+        return self._get_iterator(generator_asset, **kwargs)
+
     def build_batch_kwargs_from_partition_id(self, generator_asset, partition_id=None, batch_kwargs=None, **kwargs):
         """
         Build batch kwargs for the named generator_asset based on partition_id and optionally existing batch_kwargs.
@@ -0,0 +1,254 @@
+import fnmatch
+import glob
+import json
+import logging
+import os
+import threading
+import time
+from multiprocessing.pool import ThreadPool
+
+logger = logging.getLogger(__name__)
+
+try:
+    from os import scandir
+except ImportError:
+    scandir = None
+    logger.debug("os.scandir is not available; directories will be listed with os.listdir.")
+
+
+class DirectoryListingCache(object):
+    """Caches the listings of directories, so that generators can discover files again without listing every
+    directory again, which is slow for directories with many files, particularly on network filesystems.
+
+    A listing is reused as long as the modification time of its directory, which changes when a file is added to or
+    removed from it, is unchanged; checking that takes a single stat of the directory. A listing taken during the
+    same second as the last modification of its directory is not reused, since a later change in that second could go
+    unnoticed on filesystems with coarse modification times.
+
+    Use get_directory_listing_cache to get the cache shared by all generators.
+    """
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        # The (mtime, [(name, is_dir)]) of each directory
+        self._listings = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _scan(directory):
+        if scandir is not None:
+            iterator = scandir(directory)
+            try:
+                return [(entry.name, entry.is_dir()) for entry in iterator]
+            finally:
+                # scandir iterators only became context managers in python 3.6
+                if hasattr(iterator, "close"):
+                    iterator.close()
+        return [(name, os.path.isdir(os.path.join(directory, name))) for name in os.listdir(directory)]
+
+    def list_directory(self, directory):
+        """List a directory.
+
+        Returns:
+            list: the (name, is_dir) tuple of each entry of the directory, or an empty list if it does not exist
+        """
+        return self._list_directory(directory)[1]
+
+    def _list_directory(self, directory):
+        """Returns: the modification time of the directory, or None if the listing cannot be trusted to be current
+        later on, and its entries"""
+        try:
+            mtime = os.stat(directory).st_mtime
+        except OSError:
+            return None, []
+        with self._lock:
+            listing = self._listings.get(directory)
+            if listing is not None and listing[0] == mtime:
+                self.hits += 1
+                return mtime, listing[1]
+
+        listed_at = time.time()
+        try:
+            entries = self._scan(directory)
+        except OSError:
+            return None, []
+        with self._lock:
+            self.misses += 1
+            if listed_at - mtime < 1:
+                return None, entries
+            self._listings[directory] = (mtime, entries)
+        return mtime, entries
+
+    def glob(self, pathname, max_workers=1):
+        """Find the paths matching pathname as glob.glob does, listing the directories of each level of the pattern
+        with up to max_workers threads.
+
+        Returns:
+            tuple: the sorted list of matching paths, and a dict of the modification times of the directories that \
+            were listed to find them, None for those whose listing may not be current for long
+        """
+        directory = pathname
+        patterns = []
+        while glob.has_magic(directory):
+            directory, pattern = os.path.split(directory)
+            patterns.insert(0, pattern)
+        if not patterns:
+            return ([pathname] if os.path.lexists(pathname) else []), {}
+
+        directories = [directory]
+        directory_mtimes = {}
+        pool = None
+        try:
+            for level, pattern in enumerate(patterns):
+                if pool is None and max_workers > 1 and len(directories) > 1:
+                    pool = ThreadPool(max_workers)
+                if pool is not None:
+                    listings = pool.map(self._list_directory, directories)
+                else:
+                    listings = [self._list_directory(directory) for directory in directories]
+                last_level = level == len(patterns) - 1
+                matches = []
+                for directory, (mtime, entries) in zip(directories, listings):
+                    directory_mtimes[directory] = mtime
+                    names = [name for name, is_dir in entries if last_level or is_dir]
+                    if not pattern.startswith("."):
+                        # Like glob, only match hidden files explicitly
+                        names = [name for name in names if not name.startswith(".")]
+                    matches.extend([os.path.join(directory, name) for name in fnmatch.filter(names, pattern)])
+                directories = matches
+        finally:
+            if pool is not None:
+                pool.close()
+        return sorted(directories), directory_mtimes
+
+    def get_directory_mtimes(self, directories, max_workers=1):
+        """Returns: dict of the modification time of each directory, or None for those that do not exist"""
+        def get_mtime(directory):
+            try:
+                return os.stat(directory).st_mtime
+            except OSError:
+                return None
+
+        if max_workers > 1 and len(directories) > 1:
+            pool = ThreadPool(max_workers)
+            try:
+                mtimes = pool.map(get_mtime, directories)
+            finally:
+                pool.close()
+        else:
+            mtimes = [get_mtime(directory) for directory in directories]
+        return dict(zip(directories, mtimes))
+
+    def invalidate(self, directory=None):
+        """Forget the listing of the directory, or of every directory."""
+        with self._lock:
+            if directory is None:
+                self._listings.clear()
+            else:
+                self._listings.pop(directory, None)
+
+    def get_listing_statistics(self):
+        """Returns: dict with the hits and misses of the cache and the number of listed directories it keeps"""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "entries": len(self._listings),
+            }
+
+
+_directory_listing_cache = DirectoryListingCache()
+
+
+def get_directory_listing_cache():
+    """Get the DirectoryListingCache shared by all generators."""
+    return _directory_listing_cache
+
+
+class PartitionIndex(object):
+    """Persists, in a JSON file, the partitions that a generator found for its assets, so that a new process can use
+    them without listing their directories again.
+
+    The partitions of an asset are keyed by its glob and partition regex, and are reused as long as none of the
+    directories listed to find them has been modified since.
+
+    The loaded index is kept in memory, and read again only once the modification time of the file changes. As with
+    DirectoryListingCache, an index read during the same second as the last modification of its file is not kept.
+
+    Args:
+        filepath (str): the path of the JSON file, created if it does not exist
+    """
+
+    def __init__(self, filepath):
+        self.filepath = filepath
+        self._lock = threading.Lock()
+        # The (mtime, index) of the last read of the file that can be trusted to be current later on
+        self._loaded = None
+
+    def _load(self):
+        """Returns: the index, read from the file only if it was modified since it was last read. Call with the lock
+        held."""
+        try:
+            mtime = os.stat(self.filepath).st_mtime
+        except OSError:
+            self._loaded = None
+            return {}
+        if self._loaded is not None and self._loaded[0] == mtime:
+            return self._loaded[1]
+
+        loaded_at = time.time()
+        try:
+            with open(self.filepath, "r") as infile:
+                index = json.load(infile)
+        except (IOError, OSError, ValueError):
+            self._loaded = None
+            return {}
+        self._remember(mtime, index, loaded_at)
+        return index
+
+    def _remember(self, mtime, index, loaded_at):
+        if loaded_at - mtime < 1:
+            self._loaded = None
+        else:
+            self._loaded = (mtime, index)
+
+    @staticmethod
+    def build_key(glob_pattern, partition_regex=None, match_group_id=None):
+        return json.dumps([glob_pattern, partition_regex, match_group_id])
+
+    def get_partitions(self, key, listing_cache, max_workers=1):
+        """Get the partitions stored for the key, if their directories have not been modified since.
+
+        Returns:
+            list: the [partition_id, path] pairs of the partitions, or None if they must be found again
+        """
+        with self._lock:
+            entry = self._load().get(key)
+        if entry is None:
+            return None
+        directory_mtimes = listing_cache.get_directory_mtimes(list(entry["directories"].keys()),
+                                                              max_workers=max_workers)
+        if None in entry["directories"].values() or directory_mtimes != entry["directories"]:
+            return None
+        # The index is kept in memory, so callers must not be able to modify it
+        return [list(partition) for partition in entry["partitions"]]
+
+    def set_partitions(self, key, partitions, directory_mtimes):
+        """Store the [partition_id, path] pairs found for the key by listing directories with the given
+        modification times."""
+        with self._lock:
+            index = dict(self._load())
+            index[key] = {
+                "directories": directory_mtimes,
+                "partitions": [list(partition) for partition in partitions],
+            }
+            directory = os.path.dirname(self.filepath)
+            if directory and not os.path.isdir(directory):
+                os.makedirs(directory)
+            temporary_filepath = self.filepath + ".tmp"
+            with open(temporary_filepath, "w") as outfile:
+                json.dump(index, outfile)
+            # Readers in other processes never see a partially written index
+            getattr(os, "replace", os.rename)(temporary_filepath, self.filepath)
+            self._remember(os.stat(self.filepath).st_mtime, index, time.time())
@@ -1,5 +1,4 @@
 import os
-import glob
 import re
 import datetime
 import logging
@@ -8,6 +7,7 @@ import warnings
 from six import string_types
 
 from great_expectations.datasource.generator.batch_generator import BatchGenerator
+from great_expectations.datasource.generator.file_listing import get_directory_listing_cache, PartitionIndex
 from great_expectations.datasource.types import PathBatchKwargs
 from great_expectations.exceptions import BatchKwargsError
 
@@ -46,6 +46,12 @@ class GlobReaderGenerator(BatchGenerator):
                   glob: wifi*.log
                   partition_regex: wifi-((0[1-9]|1[012])-(0[1-9]|[12][0-9]|3[01])-20\d\d).*\.log
                   reader_method: csv
+
+    Directory listings are cached, and reused until their directory is modified, so discovering the same files again
+    does not list their directories again. The directories of each level of a glob are listed with up to max_workers
+    threads. With a partition_index, such as uncommitted/partition_index.json (relative to the root directory of the
+    data context), the partitions found for each asset are also persisted, so that new processes can use them without
+    listing any directory while none of the directories they were found in has changed.
     """
 
     def __init__(self, name="default",
@@ -53,7 +59,9 @@ class GlobReaderGenerator(BatchGenerator):
                  base_directory="/data",
                  reader_options=None,
                  asset_globs=None,
-                 reader_method=None):
+                 reader_method=None,
+                 max_workers=8,
+                 partition_index=None):
         logger.debug("Constructing GlobReaderGenerator {!r}".format(name))
         super(GlobReaderGenerator, self).__init__(name, datasource=datasource)
         if reader_options is None:
@@ -73,6 +81,9 @@ class GlobReaderGenerator(BatchGenerator):
         self._reader_options = reader_options
         self._asset_globs = asset_globs
         self._reader_method = reader_method
+        self._max_workers = max_workers
+        self._partition_index_filepath = partition_index
+        self._partition_index = None
 
     @property
     def reader_options(self):
@@ -95,6 +106,15 @@ class GlobReaderGenerator(BatchGenerator):
         else:
             return os.path.join(self._datasource.get_data_context().root_directory, self._base_directory)
 
+    @property
+    def partition_index(self):
+        if self._partition_index is None and self._partition_index_filepath is not None:
+            filepath = self._partition_index_filepath
+            if not os.path.isabs(filepath) and self._datasource.get_data_context() is not None:
+                filepath = os.path.join(self._datasource.get_data_context().root_directory, filepath)
+            self._partition_index = PartitionIndex(filepath)
+        return self._partition_index
+
     def get_available_data_asset_names(self):
         known_assets = []
         if not os.path.isdir(self.base_directory):
@@ -107,19 +127,17 @@ class GlobReaderGenerator(BatchGenerator):
         return known_assets
 
     def get_available_partition_ids(self, generator_asset):
-        glob_config = self._get_generator_asset_config(generator_asset)
-        batch_paths = self._get_generator_asset_paths(generator_asset)
         partition_ids = [
-            self._partitioner(path, glob_config) for path in batch_paths
-            if self._partitioner(path, glob_config) is not None
+            partition_id for partition_id, path in self._get_generator_asset_partitions(generator_asset)
+            if partition_id is not None
         ]
         return partition_ids
 
     def build_batch_kwargs_from_partition_id(self, generator_asset, partition_id=None, reader_options=None, limit=None):
         """Build batch kwargs from a partition id."""
         glob_config = self._get_generator_asset_config(generator_asset)
-        batch_paths = self._get_generator_asset_paths(generator_asset)
-        path = [path for path in batch_paths if self._partitioner(path, glob_config) == partition_id]
+        path = [path for path_partition_id, path in self._get_generator_asset_partitions(generator_asset)
+                if path_partition_id == partition_id]
         if len(path) != 1:
             raise BatchKwargsError("Unable to identify partition %s for asset %s" % (partition_id, generator_asset),
                                    {
@@ -140,8 +158,40 @@ class GlobReaderGenerator(BatchGenerator):
         Returns:
             paths (list)
         """
+        if self.partition_index is not None:
+            return [path for partition_id, path in self._get_generator_asset_partitions(generator_asset)]
+        glob_config = self._get_generator_asset_config(generator_asset)
+        paths, _ = get_directory_listing_cache().glob(os.path.join(self.base_directory, glob_config["glob"]),
+                                                      max_workers=self._max_workers)
+        return paths
+
+    def _get_generator_asset_partitions(self, generator_asset):
+        """
+        Returns the partition_id and path of each file of the given generator_asset, from the partition index when
+        its directories have not been modified since the partitions were stored
+
+        Args:
+            generator_asset:
+
+        Returns:
+            partitions (list): [partition_id, path] pairs
+        """
         glob_config = self._get_generator_asset_config(generator_asset)
-        return glob.glob(os.path.join(self.base_directory, glob_config["glob"]))
+        pathname = os.path.join(self.base_directory, glob_config["glob"])
+        partition_index = self.partition_index
+        if partition_index is not None:
+            index_key = PartitionIndex.build_key(pathname, glob_config.get("partition_regex"),
+                                                 glob_config.get("match_group_id"))
+            partitions = partition_index.get_partitions(index_key, get_directory_listing_cache(),
+                                                        max_workers=self._max_workers)
+            if partitions is not None:
+                return partitions
+
+        paths, directory_mtimes = get_directory_listing_cache().glob(pathname, max_workers=self._max_workers)
+        partitions = [[self._partitioner(path, glob_config), path] for path in paths]
+        if partition_index is not None:
+            partition_index.set_partitions(index_key, partitions, directory_mtimes)
+        return partitions
 
     def _get_generator_asset_config(self, generator_asset):
         if generator_asset not in self._asset_globs:
@@ -161,7 +211,7 @@ class GlobReaderGenerator(BatchGenerator):
 
     def _get_iterator(self, generator_asset, reader_options=None, limit=None):
         glob_config = self._get_generator_asset_config(generator_asset)
-        paths = glob.glob(os.path.join(self.base_directory, glob_config["glob"]))
+        paths = self._get_generator_asset_paths(generator_asset)
         return self._build_batch_kwargs_path_iter(paths, glob_config, reader_options=reader_options, limit=limit)
 
     def _build_batch_kwargs_path_iter(self, path_list, glob_config, reader_options=None, limit=None):
@@ -1,6 +1,9 @@
 import re
 import datetime
+import json
 import logging
+import os
+import threading
 
 try:
     import boto3
@@ -47,6 +50,20 @@ class S3Generator(BatchGenerator):
                     regex_filter: access_logs/2019.*\.csv.gz
                     sep: "~"
                     max_keys: 100
+                  daily_events:
+                    prefix: events/
+                    regex_filter: events/\d{4}-\d{2}-\d{2}/.*\.csv
+                    partition_regex: events/(\d{4}-\d{2}-\d{2})/.*\.csv
+                partition_manifest: uncommitted/s3_partition_manifest.json
+
+    The keys found while listing an asset are indexed by their partition_id, so build_batch_kwargs_from_partition_id
+    finds known partitions without listing the bucket again. When the partition_regex begins with a literal prefix
+    followed by the partition id (as for daily_events above), or an asset sets a partition_prefix such as
+    "events/{partition_id}/", only the keys under the partition's own prefix are listed to look it up. Otherwise the
+    index is refreshed by listing only the keys after the last one indexed (with StartAfter), as keys are listed in
+    lexicographic order, before falling back to listing the whole asset. get_available_partition_ids always lists the
+    whole asset. With a partition_manifest (relative to the root directory of the data context), the index is
+    persisted, so that other processes only list the keys added since to look up a partition.
     """
 
     # FIXME add tests for new partitioner functionality
@@ -59,7 +76,8 @@ class S3Generator(BatchGenerator):
                  delimiter="/",
                  reader_method=None,
                  boto3_options=None,
-                 max_keys=1000):
+                 max_keys=1000,
+                 partition_manifest=None):
         """Initialize a new S3Generator
 
         Args:
@@ -72,6 +90,7 @@ class S3Generator(BatchGenerator):
             reader_method: the reader_method to include in generated batch_kwargs
             boto3_options: dictionary of key-value pairs to use when creating boto3 client or resource objects
             max_keys: the maximum number of keys to fetch in a single list_objects request to s3
+            partition_manifest: the path of a JSON file in which to persist the partition index of the assets
         """
         super(S3Generator, self).__init__(name, datasource=datasource)
         if reader_options is None:
@@ -94,6 +113,10 @@ class S3Generator(BatchGenerator):
             boto3_options = {}
         self._max_keys = max_keys
         self._iterators = {}
+        self._partition_manifest = partition_manifest
+        # For each asset, the key of each partition_id and the last key listed
+        self._partition_indexes = {}
+        self._partition_index_lock = threading.Lock()
         try:
             self._s3 = boto3.client('s3', **boto3_options)
         except TypeError:
@@ -114,7 +137,11 @@ class S3Generator(BatchGenerator):
     def get_available_data_asset_names(self):
         return self._assets.keys()
 
-    def _get_iterator(self, generator_asset, reader_options=None, limit=None):
+    def iterate_batch_kwargs(self, generator_asset, reader_options=None, limit=None):
+        # A new listing, whose continuation token is not shared with the iterator of yield_batch_kwargs
+        return self._get_iterator(generator_asset, reader_options=reader_options, limit=limit, iterator_dict={})
+
+    def _get_iterator(self, generator_asset, reader_options=None, limit=None, iterator_dict=None):
         logger.debug("Beginning S3Generator _get_iterator for generator_asset: %s" % generator_asset)
 
         if generator_asset not in self._assets:
@@ -125,14 +152,17 @@ class S3Generator(BatchGenerator):
             }
             raise BatchKwargsError("Unknown asset_name %s" % generator_asset, batch_kwargs)
 
-        if generator_asset not in self._iterators:
-            self._iterators[generator_asset] = {}
+        if iterator_dict is None:
+            if generator_asset not in self._iterators:
+                self._iterators[generator_asset] = {}
+            iterator_dict = self._iterators[generator_asset]
 
         asset_config = self._assets[generator_asset]
 
         return self._build_asset_iterator(
+            generator_asset=generator_asset,
             asset_config=asset_config,
-            iterator_dict=self._iterators[generator_asset],
+            iterator_dict=iterator_dict,
             reader_options=reader_options,
             limit=limit
         )
@@ -148,17 +178,9 @@ class S3Generator(BatchGenerator):
             raise GreatExpectationsError(
                 "No asset config found for asset %s" % generator_asset
             )
-        if generator_asset not in self._iterators:
-            self._iterators[generator_asset] = {}
-
-        iterator_dict = self._iterators[generator_asset]
-        batch_kwargs = None
-        for key in self._get_asset_options(generator_asset, iterator_dict):
-            if self._partitioner(key=key, asset_config=asset_config) == partition_id:
-                batch_kwargs = self._build_batch_kwargs(key=key, asset_config=asset_config,
-                                                        reader_options=reader_options, limit=limit)
 
-        if batch_kwargs is None:
+        key = self._get_partition_key(generator_asset, partition_id)
+        if key is None:
             raise BatchKwargsError(
                 "Unable to identify partition %s for asset %s" % (partition_id, generator_asset),
                {
@@ -167,7 +189,176 @@ class S3Generator(BatchGenerator):
                 }
             )
 
-        return batch_kwargs
+        return self._build_batch_kwargs(key=key, asset_config=asset_config, reader_options=reader_options,
+                                        limit=limit)
+
+    @property
+    def partition_manifest_filepath(self):
+        filepath = self._partition_manifest
+        if filepath is not None and not os.path.isabs(filepath) and self._datasource is not None and \
+                self._datasource.get_data_context() is not None:
+            filepath = os.path.join(self._datasource.get_data_context().root_directory, filepath)
+        return filepath
+
+    def _get_manifest_key(self, asset_config):
+        return json.dumps([
+            self.bucket,
+            asset_config.get("prefix", ""),
+            asset_config.get("delimiter", self._delimiter),
+            asset_config.get("regex_filter", ".*"),
+            asset_config.get("directory_assets", False),
+            asset_config.get("partition_regex"),
+            asset_config.get("match_group_id", 1),
+        ])
+
+    def _load_partition_manifest(self):
+        try:
+            with open(self.partition_manifest_filepath, "r") as infile:
+                return json.load(infile)
+        except (IOError, OSError, ValueError):
+            return {}
+
+    def _save_partition_index(self, generator_asset):
+        if self._partition_manifest is None:
+            return
+        filepath = self.partition_manifest_filepath
+        manifest = self._load_partition_manifest()
+        manifest[self._get_manifest_key(self._assets[generator_asset])] = self._partition_indexes[generator_asset]
+        directory = os.path.dirname(filepath)
+        if directory and not os.path.isdir(directory):
+            os.makedirs(directory)
+        temporary_filepath = filepath + ".tmp"
+        with open(temporary_filepath, "w") as outfile:
+            json.dump(manifest, outfile)
+        # Readers in other processes never see a partially written manifest
+        getattr(os, "replace", os.rename)(temporary_filepath, filepath)
+
+    def _get_partition_index(self, generator_asset):
+        """Returns: dict with the key of each known partition_id of the asset under "partitions", and the last key
+        listed under "last_key", loaded from the partition manifest if there is one"""
+        if generator_asset not in self._partition_indexes:
+            partition_index = None
+            if self._partition_manifest is not None:
+                partition_index = self._load_partition_manifest().get(
+                    self._get_manifest_key(self._assets[generator_asset]))
+            if partition_index is None:
+                partition_index = {"partitions": {}, "last_key": None}
+            self._partition_indexes[generator_asset] = partition_index
+        return self._partition_indexes[generator_asset]
+
+    def refresh_partition_index(self, generator_asset, full=False):
+        """Index the keys of an asset added since it was last listed, which are the keys after the last one listed
+        when new keys sort last, as with date-partitioned layouts; or, if full is True, list and index all its keys.
+
+        Returns:
+            dict: the key of each partition_id of the asset
+        """
+        asset_config = self._assets[generator_asset]
+        with self._partition_index_lock:
+            partition_index = self._get_partition_index(generator_asset)
+            listing = {"last_key": partition_index["last_key"]}
+            if full:
+                partition_index["partitions"] = {}
+                listing["last_key"] = None
+            for key in self._list_asset_keys(asset_config, start_after=listing["last_key"], listing=listing):
+                partition_index["partitions"][self._partitioner(key=key, asset_config=asset_config)] = key
+            partition_index["last_key"] = listing["last_key"]
+            self._save_partition_index(generator_asset)
+            return partition_index["partitions"]
+
+    def _get_partition_key(self, generator_asset, partition_id):
+        """Find the key of a partition: from the partition index; else by listing only the keys under the prefix of
+        the partition, when it can be derived; else by refreshing the partition index.
+
+        Returns:
+            str: the key, or None if no key of the asset has the partition_id
+        """
+        asset_config = self._assets[generator_asset]
+        with self._partition_index_lock:
+            partition_index = self._get_partition_index(generator_asset)
+            if partition_id in partition_index["partitions"]:
+                return partition_index["partitions"][partition_id]
+
+        partition_prefix = self._get_partition_prefix(asset_config, partition_id)
+        if partition_prefix is not None:
+            partition_key = None
+            for key in self._list_asset_keys(asset_config, prefix=partition_prefix):
+                if self._partitioner(key=key, asset_config=asset_config) == partition_id:
+                    partition_key = key
+            if partition_key is not None:
+                with self._partition_index_lock:
+                    partition_index["partitions"][partition_id] = partition_key
+                    self._save_partition_index(generator_asset)
+            return partition_key
+
+        partitions = self.refresh_partition_index(generator_asset)
+        if partition_id not in partitions:
+            # Keys added before the last key listed are only found by listing the asset again
+            partitions = self.refresh_partition_index(generator_asset, full=True)
+        return partitions.get(partition_id)
+
+    def _get_partition_prefix(self, asset_config, partition_id):
+        """The narrowest prefix of the keys of the asset with the partition_id, or None if it cannot be derived."""
+        if asset_config.get("partition_prefix") is not None:
+            partition_prefix = asset_config["partition_prefix"].format(partition_id=partition_id)
+        elif "partition_regex" in asset_config and asset_config.get("match_group_id", 1) == 1:
+            partition_prefix = derive_partition_prefix(asset_config["partition_regex"], partition_id)
+        else:
+            partition_prefix = None
+        if partition_prefix is None:
+            return None
+
+        # The partition's keys must also be keys of the asset
+        asset_prefix = asset_config.get("prefix", "")
+        if partition_prefix.startswith(asset_prefix):
+            return partition_prefix
+        elif asset_prefix.startswith(partition_prefix):
+            return asset_prefix
+        return None
+
+    def _list_asset_keys(self, asset_config, prefix=None, start_after=None, listing=None):
+        """List the keys of an asset that match its regex_filter, fetching every page of results.
+
+        Args:
+            asset_config: the configuration of the asset
+            prefix: if given, list only the keys under this prefix instead of that of the asset
+            start_after: if given, list only the keys after this one
+            listing: if given, a dict whose "last_key" is set to the last key listed, matching or not
+        """
+        query_options = {
+            "Bucket": self.bucket,
+            "Delimiter": asset_config.get("delimiter", self._delimiter),
+            "Prefix": prefix if prefix is not None else asset_config.get("prefix", ""),
+            "MaxKeys": asset_config.get("max_keys", self._max_keys)
+        }
+        if start_after is not None:
+            query_options["StartAfter"] = start_after
+        directory_assets = asset_config.get("directory_assets", False)
+        regex_filter = asset_config.get("regex_filter", ".*")
+
+        while True:
+            logger.debug("Fetching objects from S3 with query options: %s" % str(query_options))
+            asset_options = self._s3.list_objects_v2(**query_options)
+            contents = asset_options.get("Contents", [])
+            common_prefixes = asset_options.get("CommonPrefixes", [])
+            if listing is not None:
+                listed_keys = [item["Key"] for item in contents] + [item["Prefix"] for item in common_prefixes]
+                if listing.get("last_key") is not None:
+                    listed_keys.append(listing["last_key"])
+                if len(listed_keys) > 0:
+                    listing["last_key"] = max(listed_keys)
+
+            if directory_assets:
+                keys = [item["Prefix"] for item in common_prefixes]
+            else:
+                keys = [item["Key"] for item in contents if item["Size"] > 0]
+            for key in keys:
+                if re.match(regex_filter, key) is not None:
+                    yield key
+
+            if not asset_options.get("IsTruncated"):
+                break
+            query_options["ContinuationToken"] = asset_options["NextContinuationToken"]
 
     def _build_batch_kwargs(self, key, asset_config=None, reader_options=None, limit=None):
         batch_kwargs = {"s3": "s3a://" + self.bucket + "/" + key, 'reader_options': self.reader_options}
@@ -241,8 +432,12 @@ class S3Generator(BatchGenerator):
             # Make sure we clear the token once we've gotten fully through
             del iterator_dict["continuation_token"]
 
-    def _build_asset_iterator(self, asset_config, iterator_dict, reader_options=None, limit=None):
+    def _build_asset_iterator(self, generator_asset, asset_config, iterator_dict, reader_options=None, limit=None):
         for key in self._get_asset_options(asset_config, iterator_dict):
+            # Index the keys as they are listed, so that they can be looked up by partition_id later on
+            with self._partition_index_lock:
+                self._get_partition_index(generator_asset)["partitions"][
+                    self._partitioner(key=key, asset_config=asset_config)] = key
             yield self._build_batch_kwargs(
                 key,
                 asset_config,
@@ -251,14 +446,10 @@ class S3Generator(BatchGenerator):
             )
 
     def get_available_partition_ids(self, generator_asset):
-        if generator_asset not in self._iterators:
-            self._iterators[generator_asset] = {}
-        iterator_dict = self._iterators[generator_asset]
-        asset_config = self._assets[generator_asset]
-        available_ids = [
-            self._partitioner(key=key, asset_config=asset_config)
-            for key in self._get_asset_options(generator_asset, iterator_dict)
-        ]
+        # Keys added anywhere in the asset, not only after the last key indexed, must be found
+        partitions = self.refresh_partition_index(generator_asset, full=True)
+        # In the order of their keys, as listed by S3
+        available_ids = [partition_id for partition_id, key in sorted(partitions.items(), key=lambda item: item[1])]
         return available_ids
 
     def _partitioner(self, key, asset_config):
@@ -284,3 +475,53 @@ class S3Generator(BatchGenerator):
                 key = key[len(prefix):]
             return key
 
+
+def derive_partition_prefix(partition_regex, partition_id):
+    """Derive the prefix shared by the keys whose partition_id, the first group of partition_regex, is partition_id.
+
+    That is possible when the regex begins with literal characters followed by the group, as with
+    "events/(\\d{4}-\\d{2}-\\d{2})/.*\\.csv", whose keys for the partition_id "2019-01-02" all begin with
+    "events/2019-01-02".
+
+    Returns:
+        str: the prefix, or None if it cannot be derived from the regex
+    """
+    # An alternative outside of any group could match keys without the literal prefix
+    depth = 0
+    escaped = False
+    for char in partition_regex:
+        if escaped:
+            escaped = False
+        elif char == "\\":
+            escaped = True
+        elif char == "(":
+            depth += 1
+        elif char == ")":
+            depth -= 1
+        elif char == "|" and depth == 0:
+            return None
+
+    literal = ""
+    position = 1 if partition_regex.startswith("^") else 0
+    while position < len(partition_regex):
+        char = partition_regex[position]
+        if char == "\\" and position + 1 < len(partition_regex) and \
+                not partition_regex[position + 1].isalnum():
+            char = partition_regex[position + 1]
+            next_position = position + 2
+        elif char in ".^$*+?{}[]|()\\":
+            break
+        else:
+            next_position = position + 1
+        if next_position < len(partition_regex) and partition_regex[next_position] in "*?{":
+            # The character is optional or repeated
+            break
+        literal += char
+        position = next_position
+
+    # The first group must be capturing, and begin right after the literal prefix
+    if not partition_regex[position:].startswith("(") or partition_regex[position:].startswith("(?:") or \
+            (partition_regex[position:].startswith("(?") and not partition_regex[position:].startswith("(?P<")):
+        return None
+    return literal + partition_id
+
@@ -1,7 +1,9 @@
 import os
 import logging
+from multiprocessing.pool import ThreadPool
 
 from great_expectations.datasource.generator.batch_generator import BatchGenerator
+from great_expectations.datasource.generator.file_listing import get_directory_listing_cache
 from great_expectations.datasource.types import PathBatchKwargs
 from great_expectations.exceptions import BatchKwargsError
 
@@ -22,6 +24,9 @@ class SubdirReaderGenerator(BatchGenerator):
 
     SubdirReaderGenerator can also include configured reader_options which will be added to batch_kwargs generated
     by this generator.
+
+    Directory listings are cached, and reused until their directory is modified. The subdirectories of base_directory
+    are listed with up to max_workers threads.
     """
 
     _default_reader_options = {}
@@ -31,7 +36,8 @@ class SubdirReaderGenerator(BatchGenerator):
                  base_directory="/data",
                  reader_options=None,
                  known_extensions=None,
-                 reader_method=None):
+                 reader_method=None,
+                 max_workers=8):
         super(SubdirReaderGenerator, self).__init__(name, datasource=datasource)
         if reader_options is None:
             reader_options = self._default_reader_options
@@ -43,6 +49,7 @@ class SubdirReaderGenerator(BatchGenerator):
         self._reader_options = reader_options
         self._reader_method = reader_method
         self._base_directory = base_directory
+        self._max_workers = max_workers
 
     @property
     def reader_options(self):
@@ -106,22 +113,36 @@ class SubdirReaderGenerator(BatchGenerator):
         return self._build_batch_kwargs_from_path(path, reader_options=reader_options, limit=limit,
                                                   partition_id=partition_id)
 
-    def _get_valid_file_options(self, base_directory=None):
+    def _get_valid_file_options(self, base_directory=None, parallel=True):
         valid_options = []
         if base_directory is None:
             base_directory = self.base_directory
-        file_options = os.listdir(base_directory)
-        for file_option in file_options:
+        file_options = get_directory_listing_cache().list_directory(base_directory)
+
+        # Make sure there's at least one valid file inside each subdir, looking into several subdirs at once
+        def has_valid_file_options(subdir):
+            return len(self._get_valid_file_options(base_directory=os.path.join(base_directory, subdir),
+                                                    parallel=False)) > 0
+
+        subdirs = [file_option for file_option, is_dir in file_options if is_dir]
+        if parallel and self._max_workers > 1 and len(subdirs) > 1:
+            pool = ThreadPool(self._max_workers)
+            try:
+                valid_subdirs = dict(zip(subdirs, pool.map(has_valid_file_options, subdirs)))
+            finally:
+                pool.close()
+        else:
+            valid_subdirs = dict([(subdir, has_valid_file_options(subdir)) for subdir in subdirs])
+
+        for file_option, is_dir in file_options:
+            if is_dir:
+                if valid_subdirs[file_option] and file_option not in valid_options:
+                    valid_options.append(file_option)
+                continue
             for extension in self.known_extensions:
                 if (file_option.endswith(extension) and not file_option.startswith(".") and
                         file_option[:-len(extension)] not in valid_options):
                     valid_options.append(file_option[:-len(extension)])
-                elif os.path.isdir(os.path.join(self.base_directory, file_option)):
-                    # Make sure there's at least one valid file inside the subdir
-                    subdir_options = self._get_valid_file_options(base_directory=os.path.join(base_directory,
-                                                                                              file_option))
-                    if len(subdir_options) > 0 and file_option not in valid_options:
-                        valid_options.append(file_option)
         return valid_options
 
     def _get_iterator(self, generator_asset, reader_options=None, limit=None):
@@ -129,9 +150,10 @@ class SubdirReaderGenerator(BatchGenerator):
         # If the generator_asset is a file, then return the path.
         # Otherwise, use files in a subdir as batches
         if os.path.isdir(os.path.join(self.base_directory, generator_asset)):
-            subdir_options = os.listdir(os.path.join(self.base_directory, generator_asset))
+            subdir_options = get_directory_listing_cache().list_directory(
+                os.path.join(self.base_directory, generator_asset))
             batches = []
-            for file_option in subdir_options:
+            for file_option, _ in subdir_options:
                 for extension in self.known_extensions:
                     if file_option.endswith(extension) and not file_option.startswith("."):
                         batches.append(os.path.join(self.base_directory, generator_asset, file_option))
@@ -6,6 +6,7 @@ from marshmallow import Schema, fields, post_load, ValidationError
 from .batch_generator import BatchGenerator
 from great_expectations.exceptions import BatchKwargsError, GreatExpectationsError
 from great_expectations.datasource.types import SqlAlchemyDatasourceTableBatchKwargs
+from great_expectations.dataset.reflection_cache import get_reflection_cache
 
 
 logger = logging.getLogger(__name__)
@@ -24,6 +25,7 @@ except ImportError:
 class AssetConfigurationSchema(Schema):
     table = fields.Str()
     schema = fields.Str()
+    partition_column = fields.Str()
 
     @post_load(pass_many=False)
     def make_asset_configuration(self, data):
@@ -31,9 +33,10 @@ class AssetConfigurationSchema(Schema):
 
 
 class AssetConfiguration(object):
-    def __init__(self, table, schema=None):
+    def __init__(self, table, schema=None, partition_column=None):
         self.__table = table
         self.__schema = schema
+        self.__partition_column = partition_column
 
     @property
     def table(self):
@@ -43,6 +46,10 @@ class AssetConfiguration(object):
     def schema(self):
         return self.__schema
 
+    @property
+    def partition_column(self):
+        return self.__partition_column
+
 
 assetConfigurationSchema = AssetConfigurationSchema()
 
@@ -68,6 +75,17 @@ class TableGenerator(BatchGenerator):
     In that case, the asset my_datasource/my_generator/my_asset will refer to a table called my_table in a schema
     defined in batch_kwargs.
 
+    An asset can also define a partition_column, in which case the batch for a partition_id holds the rows whose
+    partition_column equals the partition_id. The datasource filters the table with a WHERE clause in every query of
+    the batch, so that validating one partition of a large table only reads that partition::
+
+        my_generator:
+          class_name: TableGenerator
+          assets:
+            events:
+              table: events
+              partition_column: event_date
+
     """
 
     def __init__(self, name="default", datasource=None, assets=None):
@@ -86,13 +104,17 @@ class TableGenerator(BatchGenerator):
         if datasource is not None:
             self.engine = datasource.engine
             try:
-                self.inspector = sqlalchemy.inspect(self.engine)
+                # Reflection is cached for the engine, shared with the datasets and other generators using it
+                self.inspector = get_reflection_cache(self.engine)
+                # Reflecting the default schema checks that the database can be reached
+                self.inspector.default_schema_name
 
             except sqlalchemy.exc.OperationalError:
                 logger.warning("Unable to create inspector from engine in generator '%s'" % name)
                 self.inspector = None
 
-    def _get_iterator(self, generator_asset, query_params=None, limit=None, offset=None, partition_id=None):
+    def _get_iterator(self, generator_asset, query_params=None, limit=None, offset=None, partition_id=None,
+                      sampling=None):
         batch_kwargs = None
         # First, we check if we have a configured asset
         if generator_asset in self._assets:
@@ -135,7 +157,13 @@ class TableGenerator(BatchGenerator):
                 batch_kwargs = SqlAlchemyDatasourceTableBatchKwargs(table=table_name, schema=schema_name)
 
         if batch_kwargs is not None:
-            if partition_id is not None:
+            partition_column = None
+            if generator_asset in self._assets:
+                partition_column = self._assets[generator_asset].partition_column
+            if partition_id is not None and partition_column is not None:
+                batch_kwargs['partition_id'] = partition_id
+                batch_kwargs['where'] = {partition_column: partition_id}
+            elif partition_id is not None:
                 logger.warning("table_generator cannot identify partitions; provided partition id will be recorded "
                                "only")
                 batch_kwargs['partition_id'] = partition_id
@@ -143,6 +171,8 @@ class TableGenerator(BatchGenerator):
                 batch_kwargs['limit'] = limit
             if offset is not None:
                 batch_kwargs['offset'] = offset
+            if sampling is not None:
+                batch_kwargs['sampling'] = sampling
             return iter([batch_kwargs])
 
         # Otherwise, we return None
@@ -188,12 +218,12 @@ class TableGenerator(BatchGenerator):
         return defined_assets + tables
 
     def build_batch_kwargs_from_partition_id(self, generator_asset, partition_id=None, limit=None, offset=None,
-                                             query_params=None):
+                                             query_params=None, sampling=None):
         if query_params is None:
             query_params = {}
 
         return next(self._get_iterator(generator_asset, query_params=query_params, limit=limit,
-                                       offset=offset, partition_id=partition_id))
+                                       offset=offset, partition_id=partition_id, sampling=sampling))
 
     def get_available_partition_ids(self, generator_asset):
         raise BatchKwargsError("TableGenerator cannot identify partitions, however any existing table may"
@@ -1,11 +1,14 @@
+import os
+import io
+import codecs
+import json
+import struct
 import time
 import hashlib
 import logging
-
-try:
-    from io import StringIO
-except ImportError:
-    from StringIO import StringIO
+import random
+import threading
+from collections import OrderedDict
 
 from six import PY2
 
@@ -20,13 +23,28 @@ from great_expectations.datasource.types import (
     BatchId
 )
 from great_expectations.dataset.pandas_dataset import PandasDataset
+from great_expectations.data_asset.util import get_expectation_suite_columns
+from great_expectations.data_context.util import instantiate_class_from_config
 from great_expectations.types import ClassConfig
 from great_expectations.exceptions import BatchKwargsError
-from .util import S3Url
+from .util import S3Url, get_sampling_options
+from .s3_reader import DEFAULT_MAX_WORKERS, DEFAULT_RANGE_SIZE, S3ObjectCache, download_s3_object, open_s3_stream
 
 logger = logging.getLogger(__name__)
 
+try:
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
+    logger.debug("Unable to import pyarrow.")
+
 HASH_THRESHOLD = 1e9
+# The number of rows hashed at a time when fingerprinting the rows of a batch
+HASH_CHUNK_ROWS = 1000000
+# The number of bytes read from each end of a file to fingerprint its content
+PARTIAL_HASH_BYTES = 65536
+# The number of files whose fingerprints a datasource remembers
+FINGERPRINT_CACHE_SIZE = 1024
 
 
 class PandasDatasource(Datasource):
@@ -91,6 +109,32 @@ class PandasDatasource(Datasource):
 
     def __init__(self, name="pandas", data_context=None, data_asset_type=None, generators=None,
                  boto3_options=None, **kwargs):
+        """
+        Build a new PandasDatasource.
+
+        Args:
+            name: the name for the datasource
+            data_context: data context to which to connect
+            data_asset_type (ClassConfig): the type of DataAsset to produce
+            generators: generators to add to the datasource
+            boto3_options: Optional dictionary with key-value pairs to pass to boto3 during instantiation.
+            metric_cache: Optional configuration of a persistent metric cache, such as
+                {"class_name": "SqliteMetricCache", "filepath": "uncommitted/metric_cache.db"}, in which the batches
+                of the datasource store the metrics they compute. A relative filepath is relative to the root
+                directory of the data context.
+            row_fingerprint: if True, also fingerprint the rows of every batch, however large, adding the result to
+                the batch_id as "row_fingerprint" before the batch is returned
+            prune_columns: if True, read from CSV and parquet files only the columns referenced by the expectation
+                suite of the batch; batch_kwargs can override this with a "prune_columns" key
+            strings_to_categorical: if True, read the string columns of parquet files as categoricals; batch_kwargs
+                can override this with a "strings_to_categorical" key
+            s3_cache_directory: if given, a directory in which to keep the S3 objects that the datasource downloads,
+                by ETag, so that loading an unchanged object again reads it from disk. A relative directory is
+                relative to the root directory of the data context.
+            s3_range_size: the number of bytes of S3 objects downloaded by each request when downloading them in
+                ranges, as parquet objects and objects kept in the s3_cache_directory are
+            s3_max_workers: the maximum number of concurrent requests when downloading S3 objects in ranges
+        """
         configuration_with_defaults = PandasDatasource.build_configuration(data_asset_type, generators,
                                                                            boto3_options, **kwargs)
         data_asset_type = configuration_with_defaults.pop("data_asset_type")
@@ -102,6 +146,32 @@ class PandasDatasource(Datasource):
                                                **configuration_with_defaults)
         self._build_generators()
         self._boto3_options = configuration_with_defaults.get("boto3_options", {})
+        self._row_fingerprint = configuration_with_defaults.get("row_fingerprint", False)
+        self._prune_columns = configuration_with_defaults.get("prune_columns", False)
+        self._strings_to_categorical = configuration_with_defaults.get("strings_to_categorical", False)
+        # Fingerprints of files by their identity (path, size and modification time), so that loading an unchanged
+        # file again does not read it to fingerprint it
+        self._fingerprint_cache = OrderedDict()
+        self._fingerprint_cache_lock = threading.Lock()
+        self._s3_range_size = configuration_with_defaults.get("s3_range_size", DEFAULT_RANGE_SIZE)
+        self._s3_max_workers = configuration_with_defaults.get("s3_max_workers", DEFAULT_MAX_WORKERS)
+        self._s3_object_cache = None
+        if configuration_with_defaults.get("s3_cache_directory") is not None:
+            self._s3_object_cache = S3ObjectCache(
+                configuration_with_defaults["s3_cache_directory"],
+                root_directory=data_context.root_directory if data_context is not None else None
+            )
+        self._metric_cache = None
+        if configuration_with_defaults.get("metric_cache") is not None:
+            self._metric_cache = instantiate_class_from_config(
+                config=configuration_with_defaults["metric_cache"],
+                runtime_config={
+                    "root_directory": data_context.root_directory if data_context is not None else None
+                },
+                config_defaults={
+                    "module_name": "great_expectations.dataset.metric_cache"
+                }
+            )
 
     def _get_generator_class_from_type(self, type_):
         if type_ == "subdir_reader":
@@ -156,14 +226,52 @@ class PandasDatasource(Datasource):
         if "limit" in batch_kwargs:
             reader_options['nrows'] = batch_kwargs['limit']
 
+        sampling = get_sampling_options(batch_kwargs)
+        # Set once the reader has already sampled the rows
+        sampled = False
+        # Identifies the content of the data asset before it is read, when the datasource can tell it cheaply
+        file_identity = None
+        file_fingerprint = None
+        # Set to the columns read when only those referenced by the expectation suite are read
+        pruned_columns = None
+        strings_to_categorical = False
+
         if "path" in batch_kwargs:
             path = batch_kwargs['path']
             reader_method = batch_kwargs.get("reader_method")
             reader_fn, reader_fn_options = self._get_reader_fn(reader_method, path, reader_options)
-            try:
-                df = getattr(pd, reader_fn)(path, **reader_fn_options)
-            except AttributeError:
-                raise BatchKwargsError("Unsupported reader: %s" % reader_method.name, batch_kwargs)
+            file_identity, file_fingerprint = self._get_file_fingerprint(path, reader_fn)
+
+            if batch_kwargs.get("prune_columns", self._prune_columns):
+                pruned_columns = self._get_pruned_columns(path, reader_fn, reader_fn_options, expectation_suite)
+                if pruned_columns is not None:
+                    logger.debug("Reading columns %s from %s" % (pruned_columns, path))
+                    if reader_fn == "read_csv":
+                        reader_fn_options = dict(reader_fn_options or {}, usecols=pruned_columns)
+                    else:
+                        reader_fn_options = dict(reader_fn_options or {}, columns=pruned_columns)
+            strings_to_categorical = batch_kwargs.get("strings_to_categorical", self._strings_to_categorical)
+
+            df = None
+            if sampling is not None and reader_fn == "read_parquet":
+                df = self._read_parquet_row_group_sample(path, sampling, reader_fn_options)
+                sampled = df is not None
+            elif sampling is not None and reader_fn == "read_csv" and self._can_skip_csv_rows(reader_fn_options):
+                fraction, seed = sampling
+                random_generator = random.Random(seed)
+                # Leave the header row in place; skipping rows as they are parsed avoids loading the whole file
+                reader_fn_options = dict(reader_fn_options,
+                                         skiprows=lambda row: row > 0 and random_generator.random() >= fraction)
+                sampled = True
+
+            if df is None and reader_fn == "read_parquet":
+                df = self._read_parquet_with_arrow(path, reader_fn_options, strings_to_categorical)
+
+            if df is None:
+                try:
+                    df = getattr(pd, reader_fn)(path, **reader_fn_options)
+                except AttributeError:
+                    raise BatchKwargsError("Unsupported reader: %s" % reader_method.name, batch_kwargs)
 
         elif "s3" in batch_kwargs:
             try:
@@ -174,19 +282,33 @@ class PandasDatasource(Datasource):
             raw_url = batch_kwargs["s3"]
             reader_method = batch_kwargs.get("reader_method")
             url = S3Url(raw_url)
-            logger.debug("Fetching s3 object. Bucket: %s Key: %s" % (url.bucket, url.key))
-            s3_object = s3.get_object(Bucket=url.bucket, Key=url.key)
             reader_fn, reader_fn_options = self._get_reader_fn(reader_method, url.key, reader_options)
+            if self._s3_object_cache is not None or reader_fn == "read_parquet":
+                # Objects downloaded in ranges are fetched once their size and ETag are known
+                s3_object = s3.head_object(Bucket=url.bucket, Key=url.key)
+            else:
+                logger.debug("Fetching s3 object. Bucket: %s Key: %s" % (url.bucket, url.key))
+                s3_object = s3.get_object(Bucket=url.bucket, Key=url.key)
+            if s3_object.get("ETag"):
+                # The ETag changes whenever the object does
+                file_identity = ("s3", url.bucket, url.key, s3_object["ETag"])
+                file_fingerprint = hashlib.md5(json.dumps(file_identity).encode("utf-8")).hexdigest()
 
-            try:
-                df = getattr(pd, reader_fn)(
-                    StringIO(s3_object["Body"].read().decode(s3_object.get("ContentEncoding", "utf-8"))),
-                    **reader_fn_options
-                )
-            except AttributeError:
-                raise BatchKwargsError("Unsupported reader: %s" % reader_method.name, batch_kwargs)
-            except IOError:
-                raise
+            if not hasattr(pd, str(reader_fn)):
+                raise BatchKwargsError("Unsupported reader: %s" % reader_method, batch_kwargs)
+            if self._s3_object_cache is not None and s3_object.get("ETag"):
+                local_path = self._s3_object_cache.get_object(s3, url.bucket, url.key, s3_object,
+                                                              range_size=self._s3_range_size,
+                                                              max_workers=self._s3_max_workers)
+                df = self._read_s3_object_file(local_path, s3_object, reader_fn, reader_fn_options)
+            elif reader_fn == "read_parquet":
+                buffer = download_s3_object(s3, url.bucket, url.key, s3_object, range_size=self._s3_range_size,
+                                            max_workers=self._s3_max_workers)
+                df = self._read_parquet_buffer(buffer, reader_fn_options)
+            else:
+                if "Body" not in s3_object:
+                    s3_object = s3.get_object(Bucket=url.bucket, Key=url.key)
+                df = self._read_s3_object_stream(s3_object, url.key, reader_fn, reader_fn_options)
 
         elif "dataset" in batch_kwargs and isinstance(batch_kwargs["dataset"], (pd.DataFrame, pd.Series)):
             df = batch_kwargs.get("dataset")
@@ -200,13 +322,280 @@ class PandasDatasource(Datasource):
             raise BatchKwargsError("Invalid batch_kwargs: path, s3, or df is required for a PandasDatasource",
                                    batch_kwargs)
 
-        if df.memory_usage().sum() < HASH_THRESHOLD:
-            batch_id["fingerprint"] = hashlib.md5(pd.util.hash_pandas_object(df, index=True).values).hexdigest()
+        if sampling is not None and not sampled:
+            fraction, seed = sampling
+            df = df.sample(frac=fraction, random_state=seed).sort_index()
+
+        # The same options read the same rows from the same file, unless they sample them without a seed
+        if file_fingerprint is not None and (sampling is None or sampling[1] is not None):
+            batch_options = {
+                "reader_method": batch_kwargs.get("reader_method"),
+                "reader_options": reader_options,
+                "limit": batch_kwargs.get("limit"),
+                "sampling": batch_kwargs.get("sampling"),
+                "columns": sorted(pruned_columns) if pruned_columns is not None else None,
+                "strings_to_categorical": strings_to_categorical,
+            }
+            batch_id["fingerprint"] = hashlib.md5(
+                (file_fingerprint + json.dumps(batch_options, sort_keys=True, default=str)).encode("utf-8")
+            ).hexdigest()
+        else:
+            file_identity = None
+            if df.memory_usage().sum() < HASH_THRESHOLD:
+                batch_id["fingerprint"] = self._hash_rows(df)
+
+        if self._row_fingerprint:
+            self._add_row_fingerprint(df, batch_id, file_identity)
+
+        data_asset_kwargs = {}
+        if self._metric_cache is not None:
+            data_asset_kwargs["metric_cache"] = self._metric_cache
         return data_asset_type(df,
                                expectation_suite=expectation_suite,
                                data_context=self._data_context,
                                batch_kwargs=batch_kwargs,
-                               batch_id=batch_id)
+                               batch_id=batch_id,
+                               **data_asset_kwargs)
+
+    @staticmethod
+    def _get_s3_object_encoding(s3_object, reader_options):
+        """Returns: a (compression, encoding) tuple for reading an S3 object: "gzip" if its Content-Encoding is
+        gzip, and the encoding given by the reader options, or else by its Content-Encoding if that names a text
+        encoding"""
+        content_encoding = s3_object.get("ContentEncoding")
+        if content_encoding == "gzip":
+            return "gzip", reader_options.get("encoding")
+        if reader_options.get("encoding") is None and content_encoding:
+            try:
+                codecs.lookup(content_encoding)
+                return None, content_encoding
+            except LookupError:
+                pass
+        return None, reader_options.get("encoding")
+
+    def _read_s3_object_stream(self, s3_object, key, reader_fn, reader_options):
+        """Read an S3 object with a pandas reader as it is streamed, decompressing gzip objects on the fly, so that the
+        object is never held in memory besides the dataframe read from it. A limit stops the download once enough
+        rows are read."""
+        reader_options = dict(reader_options or {})
+        compression, encoding = self._get_s3_object_encoding(s3_object, reader_options)
+        # pandas only infers the compression of paths, so it is inferred here from the key
+        reader_compression = reader_options.pop("compression", "infer")
+        if reader_compression == "gzip" or (reader_compression == "infer" and key.endswith(".gz")):
+            compression = "gzip"
+
+        if reader_fn in ["read_excel", "read_pickle"]:
+            # These readers need to seek, so the object is read into a binary buffer, without decoding it
+            with open_s3_stream(s3_object["Body"], compression=compression) as stream:
+                return getattr(pd, reader_fn)(io.BytesIO(stream.read()), **reader_options)
+
+        if reader_fn == "read_csv" and reader_options.get("engine") != "python":
+            # The C parser decodes binary streams itself
+            if encoding is not None:
+                reader_options["encoding"] = encoding
+            stream = open_s3_stream(s3_object["Body"], compression=compression)
+        else:
+            reader_options.pop("encoding", None)
+            stream = open_s3_stream(s3_object["Body"], compression=compression, encoding=encoding or "utf-8")
+        with stream:
+            return getattr(pd, reader_fn)(stream, **reader_options)
+
+    def _read_s3_object_file(self, path, s3_object, reader_fn, reader_options):
+        """Read the local copy of an S3 object kept by the S3 object cache."""
+        reader_options = dict(reader_options or {})
+        compression, encoding = self._get_s3_object_encoding(s3_object, reader_options)
+        if compression is not None:
+            reader_options["compression"] = compression
+        if encoding is not None and reader_fn in ["read_csv", "read_json"]:
+            reader_options["encoding"] = encoding
+        if reader_fn == "read_parquet":
+            df = self._read_parquet_with_arrow(path, reader_options)
+            if df is not None:
+                return df
+        return getattr(pd, reader_fn)(path, **reader_options)
+
+    @staticmethod
+    def _read_parquet_buffer(buffer, reader_options):
+        """Read a parquet file downloaded into a buffer, with pyarrow reading the buffer in place when it is
+        available."""
+        reader_options = reader_options or {}
+        if pyarrow is not None and all([option == "columns" for option in reader_options]):
+            return pyarrow.parquet.read_table(
+                pyarrow.BufferReader(pyarrow.py_buffer(buffer)),
+                columns=reader_options.get("columns"),
+                use_pandas_metadata=True
+            ).to_pandas()
+        return pd.read_parquet(io.BytesIO(buffer), **reader_options)
+
+    def _get_file_fingerprint(self, path, reader_fn):
+        """Fingerprint the content of a file from its path, size and modification time, and a hash of the bytes at
+        its start and end, without reading the rest of it. For parquet files, the hash covers the whole footer,
+        which includes the statistics of every row group.
+
+        Fingerprints are cached by file identity, so fingerprinting an unchanged file again does not read it.
+
+        Returns:
+            a (file identity, fingerprint) tuple, or (None, None) if the file cannot be fingerprinted
+        """
+        try:
+            path = os.path.abspath(path)
+            stat = os.stat(path)
+        except (OSError, TypeError):
+            return None, None
+        file_identity = (path, stat.st_size, stat.st_mtime, reader_fn)
+
+        with self._fingerprint_cache_lock:
+            fingerprints = self._fingerprint_cache.get(file_identity)
+            if fingerprints is not None:
+                self._fingerprint_cache[file_identity] = self._fingerprint_cache.pop(file_identity)
+                return file_identity, fingerprints["file"]
+
+        file_hash = hashlib.md5(json.dumps(file_identity).encode("utf-8"))
+        try:
+            with open(path, "rb") as f:
+                file_hash.update(f.read(PARTIAL_HASH_BYTES))
+                tail_length = PARTIAL_HASH_BYTES
+                if reader_fn == "read_parquet" and stat.st_size >= 12:
+                    # A parquet file ends with its footer, the length of the footer and the magic bytes
+                    f.seek(-8, os.SEEK_END)
+                    footer_length, magic = struct.unpack("<i4s", f.read(8))
+                    if magic == b"PAR1":
+                        tail_length = max(tail_length, footer_length + 8)
+                f.seek(max(stat.st_size - tail_length, 0))
+                file_hash.update(f.read())
+        except (IOError, OSError) as e:
+            logger.debug("Unable to fingerprint file %s: %s" % (path, str(e)))
+            return None, None
+
+        fingerprint = file_hash.hexdigest()
+        with self._fingerprint_cache_lock:
+            self._fingerprint_cache[file_identity] = {"file": fingerprint, "rows": {}}
+            while len(self._fingerprint_cache) > FINGERPRINT_CACHE_SIZE:
+                self._fingerprint_cache.popitem(last=False)
+        return file_identity, fingerprint
+
+    @staticmethod
+    def _hash_rows(df):
+        """Fingerprint the rows of a dataframe, hashing HASH_CHUNK_ROWS rows at a time to bound the memory used."""
+        rows_hash = hashlib.md5()
+        for start in range(0, len(df), HASH_CHUNK_ROWS):
+            rows_hash.update(pd.util.hash_pandas_object(df.iloc[start:start + HASH_CHUNK_ROWS], index=True).values)
+        return rows_hash.hexdigest()
+
+    def _add_row_fingerprint(self, df, batch_id, file_identity=None):
+        """Add the fingerprint of the rows of df to the batch_id as "row_fingerprint", from the fingerprint cache if
+        the batch comes from a file whose rows were already fingerprinted."""
+        # Different options read different rows from the same file, so row fingerprints are kept by batch fingerprint
+        row_fingerprints = None
+        if file_identity is not None:
+            with self._fingerprint_cache_lock:
+                row_fingerprints = self._fingerprint_cache.get(file_identity, {}).get("rows")
+        if row_fingerprints is not None:
+            row_fingerprint = row_fingerprints.get(batch_id["fingerprint"])
+            if row_fingerprint is not None:
+                batch_id["row_fingerprint"] = row_fingerprint
+                return
+
+        row_fingerprint = self._hash_rows(df)
+        if row_fingerprints is not None:
+            with self._fingerprint_cache_lock:
+                row_fingerprints[batch_id["fingerprint"]] = row_fingerprint
+        batch_id["row_fingerprint"] = row_fingerprint
+
+    @staticmethod
+    def _get_pruned_columns(path, reader_fn, reader_options, expectation_suite):
+        """Find the columns of a CSV or parquet file that the expectation suite references, so that only those are
+        read.
+
+        Returns:
+            list: the names of the columns, or None if all the columns must be read, for example because the suite
+            has expectations about the columns of the whole table, or the reader options already select columns
+        """
+        columns = get_expectation_suite_columns(expectation_suite)
+        if columns is None:
+            return None
+        reader_options = reader_options or {}
+
+        if reader_fn == "read_csv":
+            if reader_options.get("usecols") is not None or reader_options.get("index_col") not in [None, False] \
+                    or reader_options.get("header", "infer") not in ["infer", 0]:
+                return None
+            file_columns = pd.read_csv(path, **dict(reader_options, nrows=0)).columns
+        elif reader_fn == "read_parquet":
+            if pyarrow is None or reader_options.get("columns") is not None:
+                return None
+            # The schema is read from the footer
+            file_columns = pyarrow.parquet.read_schema(path).names
+        else:
+            return None
+
+        # Referenced columns missing from the file cannot be requested
+        pruned_columns = [column for column in file_columns if column in columns]
+        if len(pruned_columns) == 0:
+            return None
+        return pruned_columns
+
+    @staticmethod
+    def _read_parquet_with_arrow(path, reader_options, strings_to_categorical=False):
+        """Read a parquet file with pyarrow, memory mapping it rather than copying it into a buffer first, and
+        optionally reading its string columns as dictionaries, which pandas represents as categoricals.
+
+        Returns:
+            pandas DataFrame, or None if pyarrow is not available or the reader options are not ones that this reader
+            supports; the caller then uses pandas.read_parquet
+        """
+        if pyarrow is None or any([option != "columns" for option in (reader_options or {})]):
+            return None
+
+        columns = reader_options.get("columns") if reader_options else None
+        read_dictionary = None
+        if strings_to_categorical:
+            schema = pyarrow.parquet.read_schema(path, memory_map=True)
+            read_dictionary = [field.name for field in schema
+                               if pyarrow.types.is_string(field.type) and (columns is None or field.name in columns)]
+        return pyarrow.parquet.read_table(
+            path,
+            columns=columns,
+            memory_map=True,
+            use_pandas_metadata=True,
+            read_dictionary=read_dictionary or None
+        ).to_pandas()
+
+    @staticmethod
+    def _can_skip_csv_rows(reader_options):
+        """Whether CSV rows can be sampled by skipping them as they are read, which requires the header to be the
+        first row and no other rows to be skipped."""
+        if reader_options is None:
+            return False
+        return "skiprows" not in reader_options and "names" not in reader_options and \
+            reader_options.get("header", "infer") in ["infer", 0]
+
+    @staticmethod
+    def _read_parquet_row_group_sample(path, sampling, reader_options):
+        """Read a random sample of the row groups of a parquet file, amounting to about fraction of its row groups,
+        without reading the others.
+
+        Returns:
+            the sampled rows as a pandas DataFrame, or None if the sample cannot be taken by row groups, for example
+            when the file has too few of them; the caller then samples rows from the whole file
+        """
+        if pyarrow is None or any([option != "columns" for option in (reader_options or {})]):
+            return None
+
+        fraction, seed = sampling
+        parquet_file = pyarrow.parquet.ParquetFile(path, memory_map=True)
+        num_row_groups = parquet_file.num_row_groups
+        sample_size = int(round(fraction * num_row_groups))
+        if sample_size < 1 or (sample_size >= num_row_groups and fraction < 1):
+            return None
+
+        row_groups = sorted(random.Random(seed).sample(range(num_row_groups), sample_size))
+        logger.debug("Sampling row groups %s of %d from %s" % (row_groups, num_row_groups, path))
+        return parquet_file.read_row_groups(
+            row_groups,
+            columns=reader_options.get("columns") if reader_options else None,
+            use_pandas_metadata=True
+        ).to_pandas()
 
     def _get_reader_fn(self, reader_method, path, reader_options):
         if reader_method is None:
@@ -228,7 +617,7 @@ class PandasDatasource(Datasource):
         elif reader_method == ReaderMethods.JSON:
             return "read_json", reader_options
         elif reader_method == ReaderMethods.CSV_GZ:
-            return "read_csv", reader_options.update({"compression": "gzip"})
+            return "read_csv", dict(reader_options, compression="gzip")
         elif reader_method == ReaderMethods.pickle:
             return "read_pickle", reader_options
 
@@ -0,0 +1,201 @@
+import errno
+import gzip
+import hashlib
+import io
+import logging
+import os
+import shutil
+import threading
+import uuid
+from multiprocessing.pool import ThreadPool
+
+logger = logging.getLogger(__name__)
+
+# The size of the byte ranges in which objects are downloaded in parallel
+DEFAULT_RANGE_SIZE = 8 * 1024 * 1024
+DEFAULT_MAX_WORKERS = 8
+
+
+class S3StreamReader(io.RawIOBase):
+    """Adapts the streaming body of an S3 object to a raw binary stream, so that it can be buffered, decompressed
+    and decoded as it is read, without holding the whole object in memory."""
+
+    def __init__(self, body):
+        super(S3StreamReader, self).__init__()
+        self._body = body
+
+    def readable(self):
+        return True
+
+    def readinto(self, b):
+        data = self._body.read(len(b))
+        b[:len(data)] = data
+        return len(data)
+
+    def close(self):
+        if not self.closed:
+            self._body.close()
+        super(S3StreamReader, self).close()
+
+
+def open_s3_stream(body, compression=None, encoding=None):
+    """Open the streaming body of an S3 object as a file object.
+
+    Args:
+        body: the "Body" of a get_object response
+        compression: "gzip" to decompress the object as it is read
+        encoding: if given, the file object is a text stream decoding the object with this encoding; otherwise it
+            is a binary stream
+
+    Returns:
+        a file object reading the object as it is streamed from S3
+    """
+    stream = io.BufferedReader(S3StreamReader(body))
+    if compression == "gzip":
+        stream = gzip.GzipFile(fileobj=stream, mode="rb")
+    if encoding is not None:
+        stream = io.TextIOWrapper(stream, encoding=encoding)
+    return stream
+
+
+def get_byte_ranges(size, range_size):
+    """Returns: list of the inclusive (first, last) byte offsets of the ranges of range_size bytes covering size
+    bytes"""
+    return [(start, min(start + range_size, size) - 1) for start in range(0, size, range_size)]
+
+
+def download_s3_object(s3, bucket, key, s3_object, fileobj=None, range_size=DEFAULT_RANGE_SIZE,
+                       max_workers=DEFAULT_MAX_WORKERS):
+    """Download an object in ranges of range_size bytes with up to max_workers concurrent requests.
+
+    Every range is requested with the ETag of the object, so that the download fails rather than mixing the bytes
+    of different versions if the object is replaced meanwhile.
+
+    Args:
+        s3: a boto3 S3 client
+        bucket: the bucket of the object
+        key: the key of the object
+        s3_object: the head_object response for the object, which gives its size and ETag
+        fileobj: if given, a seekable binary file into which to write the object
+        range_size: the number of bytes downloaded by each request
+        max_workers: the maximum number of concurrent requests
+
+    Returns:
+        bytearray: the content of the object, or None if it was written into fileobj
+    """
+    size = s3_object["ContentLength"]
+    etag = s3_object.get("ETag")
+    ranges = get_byte_ranges(size, range_size)
+    logger.debug("Downloading s3 object in %d ranges. Bucket: %s Key: %s" % (len(ranges), bucket, key))
+    buffer = bytearray(size) if fileobj is None else None
+    view = memoryview(buffer) if buffer is not None else None
+    write_lock = threading.Lock()
+
+    def download_range(byte_range):
+        first, last = byte_range
+        options = {"Bucket": bucket, "Key": key, "Range": "bytes=%d-%d" % (first, last)}
+        if etag:
+            options["IfMatch"] = etag
+        data = s3.get_object(**options)["Body"].read()
+        if len(data) != last - first + 1:
+            raise IOError("Incomplete range %d-%d of s3 object %s/%s" % (first, last, bucket, key))
+        if view is not None:
+            view[first:last + 1] = data
+        else:
+            with write_lock:
+                fileobj.seek(first)
+                fileobj.write(data)
+
+    if max_workers > 1 and len(ranges) > 1:
+        pool = ThreadPool(min(max_workers, len(ranges)))
+        try:
+            pool.map(download_range, ranges)
+        finally:
+            pool.close()
+    else:
+        for byte_range in ranges:
+            download_range(byte_range)
+    return buffer
+
+
+class S3ObjectCache(object):
+    """Keeps downloaded S3 objects on the local disk, so that loading an unchanged object again reads it from disk.
+
+    Objects are stored by bucket, key and ETag, which changes whenever the object does, and the file of an object is
+    removed when a newer version of it is downloaded. Files are named after the last part of their key, so readers
+    can still tell their type from their extension.
+
+    Args:
+        directory (str): the directory in which to keep the objects, created if it does not exist
+        root_directory (str): the directory that a relative directory is relative to
+    """
+
+    def __init__(self, directory, root_directory=None):
+        if not os.path.isabs(directory) and root_directory is not None:
+            directory = os.path.join(root_directory, directory)
+        self.directory = directory
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def _get_object_directory(self, bucket, key):
+        return os.path.join(self.directory, hashlib.md5(("%s/%s" % (bucket, key)).encode("utf-8")).hexdigest())
+
+    def get_object_path(self, bucket, key, etag):
+        """Returns: the path at which the version of the object with the given ETag is kept"""
+        return os.path.join(self._get_object_directory(bucket, key), etag.strip('"'),
+                            key.rstrip("/").split("/")[-1] or "object")
+
+    def get_object(self, s3, bucket, key, s3_object, range_size=DEFAULT_RANGE_SIZE, max_workers=DEFAULT_MAX_WORKERS):
+        """Get the local path of an object, downloading it unless the version with its current ETag is kept already.
+
+        Args:
+            s3: a boto3 S3 client
+            bucket: the bucket of the object
+            key: the key of the object
+            s3_object: the head_object response for the object
+            range_size: the number of bytes downloaded by each request
+            max_workers: the maximum number of concurrent requests
+
+        Returns:
+            str: the path of the local copy of the object
+        """
+        path = self.get_object_path(bucket, key, s3_object["ETag"])
+        if os.path.isfile(path):
+            with self._lock:
+                self.hits += 1
+            return path
+
+        directory = os.path.dirname(path)
+        try:
+            os.makedirs(directory)
+        except OSError as e:
+            if e.errno != errno.EEXIST:
+                raise
+        # Concurrent downloads of the same object each write their own file, then replace the cached one
+        temporary_path = os.path.join(directory, ".%s.tmp" % uuid.uuid4().hex)
+        try:
+            with open(temporary_path, "wb") as fileobj:
+                download_s3_object(s3, bucket, key, s3_object, fileobj=fileobj, range_size=range_size,
+                                   max_workers=max_workers)
+            getattr(os, "replace", os.rename)(temporary_path, path)
+        finally:
+            if os.path.exists(temporary_path):
+                os.remove(temporary_path)
+        with self._lock:
+            self.misses += 1
+
+        # Older versions of the object will not be read again
+        object_directory = os.path.dirname(directory)
+        for version in os.listdir(object_directory):
+            if version != os.path.basename(directory):
+                shutil.rmtree(os.path.join(object_directory, version), ignore_errors=True)
+        return path
+
+    def get_cache_statistics(self):
+        """Returns: dict with the hits and misses of the cache"""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+            }
@@ -5,6 +5,7 @@ from great_expectations.datasource.types import BatchId
 from ..exceptions import BatchKwargsError
 
 from .datasource import Datasource, ReaderMethods
+from .util import get_sampling_options
 from great_expectations.datasource.generator.subdir_reader_generator import SubdirReaderGenerator
 from great_expectations.datasource.generator.databricks_generator import DatabricksTableGenerator
 from great_expectations.datasource.generator.in_memory_generator import InMemoryGenerator
@@ -208,6 +209,11 @@ class SparkDFDatasource(Datasource):
         else:
             raise BatchKwargsError("Unrecognized batch_kwargs for spark_source", batch_kwargs)
 
+        sampling = get_sampling_options(batch_kwargs)
+        if sampling is not None:
+            fraction, seed = sampling
+            df = df.sample(withReplacement=False, fraction=fraction, seed=seed)
+
         if "limit" in batch_kwargs:
             df = df.limit(batch_kwargs['limit'])
 
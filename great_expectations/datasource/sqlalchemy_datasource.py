@@ -1,14 +1,19 @@
 import logging
+import math
+import operator
 import time
 from string import Template
 
+from great_expectations.data_context.util import instantiate_class_from_config
 from great_expectations.dataset.sqlalchemy_dataset import SqlAlchemyDataset
+from great_expectations.dataset.reflection_cache import get_reflection_cache
 from great_expectations.datasource import Datasource
 from great_expectations.datasource.types import BatchId
-from great_expectations.exceptions import DatasourceInitializationError
+from great_expectations.exceptions import DatasourceInitializationError, BatchKwargsError
 from great_expectations.types import ClassConfig
 
 from .generator.query_generator import QueryGenerator
+from .util import get_sampling_options
 
 logger = logging.getLogger(__name__)
 
@@ -20,6 +25,17 @@ except ImportError:
     create_engine = None
     logger.debug("Unable to import sqlalchemy.")
 
+# The comparison operators of "where" batch_kwargs
+WHERE_OPERATORS = {
+    "==": operator.eq,
+    "!=": operator.ne,
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+    "in": lambda column, values: column.in_(list(values)),
+}
+
 
 class SqlAlchemyDatasource(Datasource):
     """
@@ -28,7 +44,13 @@ class SqlAlchemyDatasource(Datasource):
         to that table
       - if the batch_kwargs include a query key, the datasource will create a temporary table using that
         that query. The query can be parameterized according to the standard python Template engine, which
-        uses $parameter, with additional kwargs passed to the get_batch method.
+        uses $parameter, with additional kwargs passed to the get_batch method. With "materialize": False in the
+        batch_kwargs, the query is instead used as a subquery by every query of the dataset
+      - if the batch_kwargs for a table include sampling, the dataset will be connected to a random sample of the
+        table: TABLESAMPLE BERNOULLI on PostgreSQL, and ORDER BY random() with a LIMIT elsewhere
+      - if the batch_kwargs for a table include a watermark_column, the dataset validates the table incrementally,
+        reading only the rows added since its previous validation and merging their aggregates with those kept in
+        the incremental_state_store of the datasource
     """
 
     @classmethod
@@ -96,6 +118,9 @@ class SqlAlchemyDatasource(Datasource):
             self._datasource_config.update({"credentials": credentials})
         else:
             credentials = {}
+        # The remaining kwargs are passed to create_engine
+        reflection_cache_ttl = kwargs.pop("reflection_cache_ttl", None)
+        incremental_state_store = kwargs.pop("incremental_state_store", None)
 
         try:
             # if an engine was provided, use that
@@ -127,8 +152,35 @@ class SqlAlchemyDatasource(Datasource):
         except (sqlalchemy.exc.OperationalError, sqlalchemy.exc.DatabaseError) as sqlalchemy_error:
             raise DatasourceInitializationError(self._name, str(sqlalchemy_error))
 
+        # Shared with the datasets and generators using the engine
+        self._reflection_cache = get_reflection_cache(self.engine, ttl=reflection_cache_ttl)
+        self._incremental_state_store = None
+        if incremental_state_store is not None:
+            self._incremental_state_store = instantiate_class_from_config(
+                config=incremental_state_store,
+                runtime_config={
+                    "root_directory": data_context.root_directory if data_context is not None else None
+                },
+                config_defaults={
+                    "module_name": "great_expectations.dataset.incremental_state"
+                }
+            )
         self._build_generators()
 
+    def invalidate_reflection_cache(self, table_name=None, schema=None):
+        """Forget what was reflected about a table, for example after changing its columns, or about every table.
+
+        Args:
+            table_name: the name of the table, or None for every table
+            schema: the schema of the table
+        """
+        self._reflection_cache.invalidate(table_name, schema)
+
+    def get_reflection_statistics(self):
+        """Returns: dict with the hits and misses of the reflection cache of the engine, and the time spent reflecting
+        (in seconds)"""
+        return self._reflection_cache.get_reflection_statistics()
+
     def _get_sqlalchemy_connection_options(self, **kwargs):
         drivername = None
 
@@ -198,47 +250,74 @@ class SqlAlchemyDatasource(Datasource):
         if "table" in batch_kwargs:
             limit = batch_kwargs.get("limit")
             offset = batch_kwargs.get("offset")
-
-            if limit is not None or offset is not None:
-                logger.info("Generating query from table batch_kwargs based on limit and offset")
-                raw_query = (
-                    sqlalchemy.select([sqlalchemy.text("*")])
-                    .select_from(
-                        sqlalchemy.schema.Table(
-                            batch_kwargs["table"], sqlalchemy.MetaData(), schema=schema
-                        )
-                    )
-                    .offset(offset)
-                    .limit(limit)
-                )
-                query = str(raw_query.compile(self.engine, compile_kwargs={"literal_binds": True}))
-
-                return data_asset_type(
-                    custom_sql=query,
-                    engine=self.engine,
-                    data_context=self._data_context,
-                    expectation_suite=expectation_suite,
-                    batch_kwargs=batch_kwargs,
-                    batch_id=batch_id,
-                )
-
-            else:
+            sampling = get_sampling_options(batch_kwargs)
+            where = batch_kwargs.get("where")
+            watermark_column = batch_kwargs.get("watermark_column")
+
+            if sampling is None and limit is None and offset is None and where is None:
+                incremental_kwargs = {}
+                if watermark_column is not None:
+                    incremental_kwargs = {
+                        "watermark_column": watermark_column,
+                        "incremental_state_store": self._incremental_state_store,
+                    }
                 return data_asset_type(
                     table_name=batch_kwargs["table"],
                     engine=self.engine,
                     schema=schema,
+                    **incremental_kwargs,
                     data_context=self._data_context,
                     expectation_suite=expectation_suite,
                     batch_kwargs=batch_kwargs,
                     batch_id=batch_id,
                 )
 
+            if watermark_column is not None:
+                raise BatchKwargsError("watermark_column validates a full table incrementally, so it cannot be "
+                                       "combined with limit, offset, sampling or where", batch_kwargs)
+
+            table = sqlalchemy.schema.Table(batch_kwargs["table"], sqlalchemy.MetaData(), schema=schema)
+            predicates = self._get_where_predicates(where, batch_kwargs) if where is not None else []
+            if sampling is not None:
+                logger.info("Generating query from table batch_kwargs based on sampling")
+                raw_query, repeatable = self._get_sample_query(
+                    table,
+                    sampling,
+                    limit,
+                    offset,
+                    predicates=predicates,
+                    method=batch_kwargs["sampling"].get("method"),
+                    column=batch_kwargs["sampling"].get("column")
+                )
+            else:
+                logger.info("Generating query from table batch_kwargs based on where, limit and offset")
+                raw_query = self._select_rows(table, predicates).offset(offset).limit(limit)
+                # Without an order, a limit or offset may select different rows each time the query runs
+                repeatable = limit is None and offset is None
+
+            # A query that selects the same rows each time it runs can be used directly by every query of the dataset,
+            # so that the database only reads the rows it selects, instead of being materialized in a temporary table
+            return data_asset_type(
+                custom_sql=raw_query,
+                engine=self.engine,
+                materialize=batch_kwargs.get("materialize", not repeatable),
+                data_context=self._data_context,
+                expectation_suite=expectation_suite,
+                batch_kwargs=batch_kwargs,
+                batch_id=batch_id,
+            )
+
         elif "query" in batch_kwargs:
             if "limit" in batch_kwargs or "offset" in batch_kwargs:
                 logger.warning(
                     "Limit and offset parameters are ignored when using query-based batch_kwargs; consider "
                     "adding limit and offset directly to the generated query."
                 )
+            if "sampling" in batch_kwargs:
+                logger.warning(
+                    "Sampling parameters are ignored when using query-based batch_kwargs; consider "
+                    "adding sampling directly to the generated query."
+                )
 
             if "bigquery_temp_table" in batch_kwargs:
                 table_name = batch_kwargs.get("bigquery_temp_table")
@@ -251,6 +330,7 @@ class SqlAlchemyDatasource(Datasource):
                 custom_sql=query,
                 engine=self.engine,
                 table_name=table_name,
+                materialize=batch_kwargs.get("materialize", True),
                 data_context=self._data_context,
                 expectation_suite=expectation_suite,
                 batch_kwargs=batch_kwargs,
@@ -261,3 +341,118 @@ class SqlAlchemyDatasource(Datasource):
             raise ValueError(
                 "Invalid batch_kwargs: exactly one of 'table' or 'query' must be specified"
             )
+
+    @staticmethod
+    def _get_where_predicates(where, batch_kwargs):
+        """Build the predicates selecting the rows of a table for the "where" batch_kwargs, a dictionary mapping
+        columns to a value, a list of values, or a dictionary of comparison operators (==, !=, <, <=, >, >=, in)
+        to values. All the predicates must hold."""
+        if not isinstance(where, dict):
+            raise BatchKwargsError("where batch_kwargs must be a dictionary mapping columns to values", batch_kwargs)
+
+        predicates = []
+        for column, condition in sorted(where.items()):
+            if not isinstance(condition, dict):
+                condition = {"in" if isinstance(condition, (list, tuple)) else "==": condition}
+            for where_operator, value in sorted(condition.items()):
+                if where_operator not in WHERE_OPERATORS:
+                    raise BatchKwargsError("Unrecognized where operator: %s" % where_operator, batch_kwargs)
+                predicates.append(WHERE_OPERATORS[where_operator](sqlalchemy.column(column), value))
+        return predicates
+
+    @staticmethod
+    def _select_rows(selectable, predicates):
+        """Build a query selecting the rows of selectable that satisfy all the predicates."""
+        query = sqlalchemy.select([sqlalchemy.text("*")]).select_from(selectable)
+        for predicate in predicates:
+            query = query.where(predicate)
+        return query
+
+    def _get_sample_query(self, table, sampling, limit=None, offset=None, predicates=None, method=None, column=None):
+        """Build a query selecting a random sample of about fraction of the rows of table that satisfy the predicates.
+
+        The method chooses how rows are sampled:
+
+        - "bernoulli" (the default on PostgreSQL) and "system" use TABLESAMPLE, on PostgreSQL and Snowflake; SYSTEM
+          samples whole blocks of rows, which reads less of the table but is less random
+        - "hash" keeps the rows whose hash of the given column falls in the first fraction of the possible hashes;
+          this selects the same rows every time, without a seed, and is supported by every database (on databases
+          without a hash function, the column must be an integer column)
+        - "random" (the default elsewhere) orders the rows randomly and keeps the expected number of sampled rows,
+          which takes an additional count query; only MySQL honors the seed there
+
+        Returns:
+            a (query, repeatable) tuple, where repeatable tells whether the query selects the same rows each time it
+            runs
+        """
+        fraction, seed = sampling
+        predicates = predicates or []
+        dialect_name = self.engine.dialect.name.lower()
+        if method is None:
+            method = "bernoulli" if dialect_name == "postgresql" else "random"
+
+        if method in ["bernoulli", "system"]:
+            if dialect_name not in ["postgresql", "snowflake"]:
+                raise BatchKwargsError("TABLESAMPLE sampling is not supported by %s" % dialect_name,
+                                       {"sampling": {"method": method}})
+            sampled_table = sqlalchemy.tablesample(
+                table,
+                getattr(sqlalchemy.func, method)(100.0 * fraction),
+                seed=sqlalchemy.literal(seed) if seed is not None else None
+            )
+            query = self._select_rows(sampled_table, predicates).offset(offset).limit(limit)
+            return query, seed is not None and limit is None and offset is None
+
+        elif method == "hash":
+            if column is None:
+                raise BatchKwargsError("hash sampling requires a column", {"sampling": {"method": method}})
+            query = self._select_rows(table, [self._get_hash_sample_predicate(column, fraction)] + predicates)\
+                .offset(offset).limit(limit)
+            return query, limit is None and offset is None
+
+        elif method != "random":
+            raise BatchKwargsError("Unrecognized sampling method: %s" % method, {"sampling": {"method": method}})
+
+        filtered_table = self._select_rows(table, predicates)
+        row_count = self.engine.execute(
+            sqlalchemy.select([sqlalchemy.func.count()]).select_from(filtered_table.alias())
+        ).scalar()
+        sample_size = int(math.ceil(fraction * row_count))
+        if limit is not None:
+            sample_size = min(sample_size, limit)
+
+        if dialect_name == "mysql":
+            random_order = sqlalchemy.func.rand(seed) if seed is not None else sqlalchemy.func.rand()
+        elif dialect_name == "mssql":
+            random_order = sqlalchemy.func.newid()
+        else:
+            random_order = sqlalchemy.func.random()
+
+        return filtered_table.order_by(random_order).offset(offset).limit(sample_size), False
+
+    def _get_hash_sample_predicate(self, column, fraction, buckets=10000):
+        """Build a predicate keeping the rows whose hash of column falls in the first fraction of buckets."""
+        dialect_name = self.engine.dialect.name.lower()
+        column = sqlalchemy.column(column)
+        if dialect_name == "postgresql":
+            hashed = sqlalchemy.func.hashtext(sqlalchemy.cast(column, sqlalchemy.Text))
+        elif dialect_name == "redshift":
+            hashed = sqlalchemy.func.fnv_hash(column)
+        elif dialect_name == "mysql":
+            hashed = sqlalchemy.func.crc32(column)
+        elif dialect_name == "snowflake":
+            hashed = sqlalchemy.func.hash(column)
+        elif dialect_name == "bigquery":
+            hashed = sqlalchemy.func.farm_fingerprint(sqlalchemy.cast(column, sqlalchemy.String))
+        elif dialect_name == "mssql":
+            hashed = sqlalchemy.func.checksum(column)
+        else:
+            # Knuth's multiplicative hash spreads consecutive integers across the buckets
+            hashed = column * 2654435761
+
+        if dialect_name == "bigquery":
+            bucket = sqlalchemy.func.mod(sqlalchemy.func.mod(hashed, buckets) + buckets, buckets)
+        else:
+            # Hashes can be negative
+            bucket = (hashed % buckets + buckets) % buckets
+        return bucket < int(round(fraction * buckets))
@@ -1,8 +1,39 @@
+from numbers import Number
+
 try:
     from urlparse import urlparse
 except ImportError:
     from urllib.parse import urlparse
 
+from six import integer_types
+
+from great_expectations.exceptions import BatchKwargsError
+
+
+def get_sampling_options(batch_kwargs):
+    """Read the "sampling" batch_kwargs, which ask a datasource to load a random sample of the data asset.
+
+    The sampling batch_kwargs are a dictionary with a "fraction" of the rows to sample, between 0 and 1, and an
+    optional integer "seed" that makes the sample repeatable where the backend supports seeding.
+
+    Returns:
+        a (fraction, seed) tuple, or None if the batch_kwargs do not ask for sampling
+    """
+    sampling = batch_kwargs.get("sampling")
+    if sampling is None:
+        return None
+
+    if not isinstance(sampling, dict) or "fraction" not in sampling:
+        raise BatchKwargsError("sampling batch_kwargs must be a dictionary with a fraction", batch_kwargs)
+    fraction = sampling["fraction"]
+    seed = sampling.get("seed")
+    if isinstance(fraction, bool) or not isinstance(fraction, Number) or not 0 < fraction <= 1:
+        raise BatchKwargsError("sampling fraction must be a number greater than 0 and at most 1", batch_kwargs)
+    if seed is not None and (isinstance(seed, bool) or not isinstance(seed, integer_types)):
+        raise BatchKwargsError("sampling seed must be an integer", batch_kwargs)
+    return fraction, seed
+
+
 # S3Url class courtesy: https://stackoverflow.com/questions/42641315/s3-urls-get-bucket-name-and-path
 class S3Url(object):
     """
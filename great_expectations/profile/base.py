@@ -43,6 +43,9 @@ class DatasetProfiler(DataAssetProfiler):
 
         if batch_kwargs is not None:
             expectation_suite["meta"][class_name]["batch_kwargs"] = batch_kwargs
+            if "sampling" in batch_kwargs:
+                # The suite was profiled from a sample rather than from the whole batch
+                expectation_suite["meta"][class_name]["sampling"] = batch_kwargs["sampling"]
 
         new_expectations = [cls.add_expectation_meta(
             exp) for exp in expectation_suite["expectations"]]
@@ -19,6 +19,10 @@ class BasicDatasetProfiler(DatasetProfiler):
     BOOLEAN_TYPE_NAMES = {"BOOLEAN", "BOOL", "bool", "BooleanType"}
     DATETIME_TYPE_NAMES = {"DATETIME", "DATE", "TIMESTAMP", "DateType", "TimestampType", "datetime64", "Timestamp"}
 
+    # Subclasses can set this to estimate the number of unique values of columns rather than count them exactly,
+    # which is much faster on large columns with many unique values
+    approximate_cardinality = False
+
     @classmethod
     def _get_column_type(cls, df, column):
         # list of types is used to support pandas and sqlalchemy
@@ -54,14 +58,25 @@ class BasicDatasetProfiler(DatasetProfiler):
         pct_unique = None
         df.set_config_value("interactive_evaluation", True)
 
+        # approximate is only passed when set, to leave the expectations of exact profiles unchanged
+        cardinality_kwargs = {"approximate": True} if cls.approximate_cardinality else {}
         try:
-            num_unique = df.expect_column_unique_value_count_to_be_between(column, None, None)[
+            num_unique = df.expect_column_unique_value_count_to_be_between(column, None, None, **cardinality_kwargs)[
                 'result']['observed_value']
             pct_unique = df.expect_column_proportion_of_unique_values_to_be_between(
-                column, None, None)['result']['observed_value']
+                column, None, None, **cardinality_kwargs)['result']['observed_value']
         except KeyError:  # if observed_value value is not set
             logger.error("Failed to get cardinality of column {0:s} - continuing...".format(column))
 
+        cardinality = cls._get_cardinality(num_unique, pct_unique)
+        # print('col: {0:s}, num_unique: {1:s}, pct_unique: {2:s}, card: {3:s}'.format(column, str(num_unique), str(pct_unique), cardinality))
+
+        df.set_config_value('interactive_evaluation', False)
+
+        return cardinality
+
+    @classmethod
+    def _get_cardinality(cls, num_unique, pct_unique):
         if num_unique is None or num_unique == 0 or pct_unique is None:
             cardinality = "none"
 
@@ -90,12 +105,38 @@ class BasicDatasetProfiler(DatasetProfiler):
 
             else:
                 cardinality = "many"
-        # print('col: {0:s}, num_unique: {1:s}, pct_unique: {2:s}, card: {3:s}'.format(column, str(num_unique), str(pct_unique), cardinality))
-
-        df.set_config_value('interactive_evaluation', False)
 
         return cardinality
 
+    @classmethod
+    def _prefetch_column_statistics(cls, df, columns):
+        """Gather the statistics that the expectations of the profile rely on in as few passes over the data as the
+        backend allows, so that neither the profiling nor the validation of the profile computes them one by one."""
+        unique_count_statistic = "approximate_unique_count" if cls.approximate_cardinality else "unique_count"
+        column_statistics = df.prefetch_column_statistics(
+            columns,
+            ["nonnull_count", unique_count_statistic, "min", "max", "mean", "stdev"]
+        )
+
+        # Quantiles, for expect_column_quantile_values_to_be_between and the partition of
+        # expect_column_kl_divergence_to_be_less_than, are only needed for columns with many distinct values
+        quantile_columns = []
+        for column in columns:
+            statistics = column_statistics.get(column, {})
+            num_unique = statistics.get(unique_count_statistic)
+            nonnull_count = statistics.get("nonnull_count")
+            if num_unique is None or not nonnull_count:
+                continue
+            if cls._get_cardinality(num_unique, float(num_unique) / nonnull_count) in ["many", "very many"]:
+                quantile_columns.append(column)
+
+        if len(quantile_columns) > 0:
+            df.prefetch_column_statistics(
+                quantile_columns,
+                ["quantiles"],
+                quantiles=(0.0, 0.05, 0.25, 0.5, 0.75, 0.95, 1.0)
+            )
+
     @classmethod
     def _profile(cls, dataset):
         df = dataset
@@ -112,6 +153,8 @@ class BasicDatasetProfiler(DatasetProfiler):
         for column in columns:
             meta_columns[column] = {"description": ""}
 
+        cls._prefetch_column_statistics(df, columns)
+
         number_of_columns = len(columns)
         for i, column in enumerate(columns):
             logger.info("            Preparing column {} of {}: {}".format(i+1, number_of_columns, column))
@@ -72,9 +72,22 @@ class MetricsStore(object):
                 MultiBatchNamespaceAwareExpectationDefinedValidationMetric
         """
 
+        return self.get_multi_batch_metrics_for_fingerprints(
+            [bk.batch_fingerprint.fingerprint for bk in batch_kwargs_list]
+        )
+
+    def get_multi_batch_metrics_for_fingerprints(self, batch_fingerprints):
+        """
+        Return a list of multi batch metrics for a list of batch fingerprints
+        :param batch_fingerprints: list of fingerprint strings
+        :return: dict of multi batch metrics (by mb metric key).
+                Values are MultiBatchNamespaceAwareValidationMetric or
+                MultiBatchNamespaceAwareExpectationDefinedValidationMetric
+        """
+
         dict_selected_batches = {}
         for batch_fingerprint, batch_metrics in self.dict_single_batch_metrics_by_multi_batch_key_by_batch.items():
-            if batch_fingerprint in [bk.batch_fingerprint.fingerprint for bk in batch_kwargs_list]:
+            if batch_fingerprint in batch_fingerprints:
                 dict_selected_batches[batch_fingerprint] = batch_metrics
 
         # let's compute the union of all metrics names that come from all the batches.
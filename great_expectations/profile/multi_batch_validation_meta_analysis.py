@@ -3,7 +3,11 @@ from collections import defaultdict
 import collections
 
 import warnings
-from great_expectations.datasource.types import BatchKwargs
+
+import pandas as pd
+
+from great_expectations.data_context.types import NormalizedDataAssetName
+from great_expectations.datasource.types import BatchKwargs, BatchFingerprint
 from great_expectations.profile.metrics_store import MetricsStore
 from great_expectations.profile.metrics_utils import (
 set_nested_value_in_dict,
@@ -31,6 +35,46 @@ class MultiBatchValidationMetaAnalysis(object):
 
     }
 
+    # NOTE: Eugene: 2019-09-04: Add more entries
+    # expectation type -> (result key -> metric name)
+    EXPECTATION_METRICS_LOOKUP_TABLE = {
+        # 'expect_column_distinct_values_to_be_in_set'
+        # 'expect_column_kl_divergence_to_be_less_than',
+        'expect_column_max_to_be_between': {
+            'observed_value': 'column_max'
+        },
+        'expect_column_mean_to_be_between': {
+            'observed_value': 'column_mean'
+        },
+        'expect_column_median_to_be_between': {
+            'observed_value': 'column_median'
+        },
+        'expect_column_min_to_be_between': {
+            'observed_value': 'column_min'
+        },
+        'expect_column_proportion_of_unique_values_to_be_between': {
+            'observed_value': 'column_proportion_of_unique_values'
+        },
+        # 'expect_column_quantile_values_to_be_between',
+        'expect_column_stdev_to_be_between': {
+            'observed_value': 'column_stdev'
+        },
+        'expect_column_unique_value_count_to_be_between': {
+            'observed_value': 'column_unique_count'
+        },
+        # 'expect_column_values_to_be_between',
+        # 'expect_column_values_to_be_in_set',
+        # 'expect_column_values_to_be_in_type_list',
+        'expect_column_values_to_be_unique': {
+
+        },
+        # 'expect_table_columns_to_match_ordered_list',
+        'expect_table_row_count_to_be_between': {
+            'observed_value': 'row_count'
+        }
+
+    }
+
     @classmethod
     def add_expectation_defined_metric_for_result_key(cls, d, result, data_asset_name, batch_kwargs, metrics_store, t=()):
         for key, value in d.items():
@@ -70,48 +114,9 @@ class MultiBatchValidationMetaAnalysis(object):
         :param batch_kwargs: BatchKwargs of the batch that was validated
         :param metrics_store
         """
-        # NOTE: Eugene: 2019-09-04: Add more entries
-        expectation_metrics = {
-            # 'expect_column_distinct_values_to_be_in_set'
-            # 'expect_column_kl_divergence_to_be_less_than',
-            'expect_column_max_to_be_between': {
-                'observed_value': 'column_max'
-            },
-            'expect_column_mean_to_be_between': {
-                'observed_value': 'column_mean'
-            },
-            'expect_column_median_to_be_between': {
-                'observed_value': 'column_median'
-            },
-            'expect_column_min_to_be_between': {
-                'observed_value': 'column_min'
-            },
-            'expect_column_proportion_of_unique_values_to_be_between': {
-                'observed_value': 'column_proportion_of_unique_values'
-            },
-            # 'expect_column_quantile_values_to_be_between',
-            'expect_column_stdev_to_be_between': {
-                'observed_value': 'column_stdev'
-            },
-            'expect_column_unique_value_count_to_be_between': {
-                'observed_value': 'column_unique_count'
-            },
-            # 'expect_column_values_to_be_between',
-            # 'expect_column_values_to_be_in_set',
-            # 'expect_column_values_to_be_in_type_list',
-            'expect_column_values_to_be_unique': {
-
-            },
-            # 'expect_table_columns_to_match_ordered_list',
-            'expect_table_row_count_to_be_between': {
-                'observed_value': 'row_count'
-            }
-
-        }
-
         metrics = []
         if result.get('result'):
-            entry = expectation_metrics.get(result['expectation_config']['expectation_type'])
+            entry = cls.EXPECTATION_METRICS_LOOKUP_TABLE.get(result['expectation_config']['expectation_type'])
             if entry:
                 for key in result['result'].keys():
                     metric_name = entry.get(key)
@@ -165,3 +170,56 @@ class MultiBatchValidationMetaAnalysis(object):
         mb_metrics = metrics_store.get_multi_batch_metrics(batch_kwargs_list)
 
         return mb_metrics
+
+    @classmethod
+    def get_metrics_from_validation_metrics_store(cls, validation_metrics_store, filters=None):
+        """
+        Get multi-batch metrics from the flattened metrics in a ParquetValidationMetricsStore, without reading
+        any validation result files.
+
+        Only scalar metrics are available this way: metrics that come from non-scalar result values (such as
+        quantile lists) are not captured by ParquetValidationMetricsStore.
+
+        :param validation_metrics_store: a ParquetValidationMetricsStore
+        :param filters: (column, operator, value) tuples passed to ParquetValidationMetricsStore.query, e.g.
+                [("generator_asset", "==", "titanic"), ("run_id", ">=", "20190901")]
+        :return: a dict: {multi-batch metric urn -> multi-batch metric}
+        """
+        metrics_df = validation_metrics_store.query(
+            filters=filters,
+            columns=[
+                "datasource", "generator", "generator_asset", "run_id", "batch_partition_id", "batch_fingerprint",
+                "expectation_type", "column", "observed_value", "unexpected_percent"
+            ]
+        )
+        metrics_df = metrics_df[metrics_df["batch_fingerprint"].notnull()].sort_values("run_id", kind="mergesort")
+
+        metrics_store = MetricsStore()
+        batch_fingerprints = []
+        for row in metrics_df.itertuples(index=False):
+            data_asset_name = NormalizedDataAssetName(row.datasource, row.generator, row.generator_asset)
+            batch_fingerprint = BatchFingerprint(partition_id=row.batch_partition_id, fingerprint=row.batch_fingerprint)
+            if batch_fingerprint.fingerprint not in batch_fingerprints:
+                batch_fingerprints.append(batch_fingerprint.fingerprint)
+            metric_kwargs = {"column": row.column} if row.column else {}
+
+            metric_name = cls.EXPECTATION_METRICS_LOOKUP_TABLE.get(row.expectation_type, {}).get('observed_value')
+            if metric_name and not pd.isnull(row.observed_value):
+                metrics_store.add_single_batch_metric(
+                    data_asset_name,
+                    batch_fingerprint,
+                    metric_name,
+                    metric_kwargs,
+                    row.observed_value)
+
+            if (row.expectation_type, ('unexpected_percent',)) in cls.EXPECTATION_DEFINED_METRICS_LOOKUP_TABLE \
+                    and not pd.isnull(row.unexpected_percent):
+                metrics_store.add_single_batch_expectation_defined_metric(
+                    data_asset_name,
+                    batch_fingerprint,
+                    row.expectation_type,
+                    ('unexpected_percent',),
+                    metric_kwargs,
+                    row.unexpected_percent)
+
+        return metrics_store.get_multi_batch_metrics_for_fingerprints(batch_fingerprints)
@@ -3,6 +3,7 @@ from .actions import (
     NamespacedValidationAction,
     NoOpAction,
     StoreAction,
+    StoreValidationMetricsAction,
     ExtractAndStoreEvaluationParamsAction,
     SlackNotificationAction,
     UpdateDataDocsAction
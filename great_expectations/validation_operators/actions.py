@@ -10,6 +10,8 @@ from great_expectations.data_context.util import (
 from ..data_context.types import (
     ValidationResultIdentifier
 )
+from ..data_context.store import ParquetValidationMetricsStore
+from ..exceptions import DataContextError
 
 from .util import send_slack_notification
 
@@ -23,6 +25,13 @@ class BasicValidationAction(object):
     def run(self, validation_result_suite):
         return NotImplementedError
 
+    def flush(self):
+        """
+        Called by the validation operator once, after the actions of all the batches in a run have been invoked.
+        Actions that defer work until the end of a run override this method to complete it.
+        """
+        pass
+
 class NamespacedValidationAction(BasicValidationAction):
     """
     This is the base class for all actions that act on validation results
@@ -165,6 +174,36 @@ class StoreAction(NamespacedValidationAction):
         self.target_store.set(validation_result_suite_identifier, validation_result_suite)
 
 
+class StoreValidationMetricsAction(StoreAction):
+    """
+    StoreValidationMetricsAction is a variant of StoreAction that appends the flattened per-expectation metrics
+    of a validation result to a ParquetValidationMetricsStore, so that metrics can be queried across runs without
+    parsing every stored validation result.
+
+    Example config:
+    {
+        "class_name": "StoreValidationMetricsAction",
+        "target_store_name": "validation_metrics_store"
+    }
+    """
+
+    def __init__(self,
+                 data_context,
+                 target_store_name,
+                 ):
+        """
+
+        :param data_context: data context
+        :param target_store_name: the name of the ParquetValidationMetricsStore in the data context which
+                should receive the metrics
+        """
+        super(StoreValidationMetricsAction, self).__init__(data_context, target_store_name=target_store_name)
+
+        if not isinstance(self.target_store, ParquetValidationMetricsStore):
+            raise DataContextError("StoreValidationMetricsAction requires a ParquetValidationMetricsStore, but store "
+                                   "{0} is a {1}".format(target_store_name, type(self.target_store).__name__))
+
+
 class ExtractAndStoreEvaluationParamsAction(NamespacedValidationAction):
     """
     ExtractAndStoreEvaluationParamsAction is a namespeace-aware validation action that
@@ -216,13 +255,28 @@ class UpdateDataDocsAction(NamespacedValidationAction):
     UpdateDataDocsAction is a namespace-aware validation action that
     notifies the site builders of all the data docs sites of the data context
     that a validation result should be added to the data docs.
+
+    By default, the data docs are built once per validation result. When coalesce_updates is true, the action
+    only records the identifier of each validation result, and the data docs are built once for all of them
+    when the validation operator flushes its actions at the end of the run. That way the static assets are
+    copied and the index page is rebuilt once per run rather than once per batch.
+
+    Example config:
+    {
+        "class_name": "UpdateDataDocsAction",
+        "coalesce_updates": true
+    }
     """
 
-    def __init__(self, data_context):
+    def __init__(self, data_context, coalesce_updates=False):
         """
         :param data_context: data context
+        :param coalesce_updates: boolean - if true, build the data docs once per operator run instead of once per
+            validation result
         """
         super(UpdateDataDocsAction, self).__init__(data_context)
+        self.coalesce_updates = coalesce_updates
+        self._pending_resource_identifiers = []
 
 
     def _run(self, validation_result_suite, validation_result_suite_identifier, data_asset):
@@ -236,6 +290,23 @@ class UpdateDataDocsAction(NamespacedValidationAction):
                 type(validation_result_suite_identifier)
             ))
 
+        if self.coalesce_updates:
+            self._pending_resource_identifiers.append(validation_result_suite_identifier)
+            return
+
         self.data_context.build_data_docs(
             resource_identifiers=[validation_result_suite_identifier]
         )
+
+    def flush(self):
+        if not self._pending_resource_identifiers:
+            return
+
+        resource_identifiers = self._pending_resource_identifiers
+        self._pending_resource_identifiers = []
+        logger.debug("UpdateDataDocsAction building data docs for {} validation results".format(
+            len(resource_identifiers)
+        ))
+        self.data_context.build_data_docs(
+            resource_identifiers=resource_identifiers
+        )
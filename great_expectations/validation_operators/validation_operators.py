@@ -1,8 +1,12 @@
 import datetime
 import logging
+from multiprocessing.pool import ThreadPool
+import threading
+import time
 logger = logging.getLogger(__name__)
 
 from six import string_types
+from six.moves import queue
 
 from great_expectations.data_context.util import (
     instantiate_class_from_config,
@@ -66,11 +70,26 @@ class ActionListValidationOperator(ValidationOperator):
                   renderer:
                     module_name: great_expectations.render.renderer.slack_renderer
                     class_name: SlackRenderer
+
+    By default, each batch is loaded, validated and passed through the actions before the next batch is loaded.
+    When max_workers is greater than 1, batches are loaded and validated in a pool of max_workers threads, while a
+    separate thread runs the actions on each validation result as it completes, so that slow actions do not hold up
+    the next validation. The actions of different batches never run concurrently with each other. At most
+    2 * max_workers batches are held in memory at a time.
+
+    The returned object has the same shape in both modes, with the details listed in the order of
+    assets_to_validate. Each entry in the details includes the seconds spent in each phase::
+
+        "timing": {"load_batch": 0.12, "validate": 1.5, "actions": 0.3}
     """
 
-    def __init__(self, data_context, action_list):
+    def __init__(self, data_context, action_list, max_workers=1):
         self.data_context = data_context
 
+        if not isinstance(max_workers, int) or max_workers < 1:
+            raise ValueError("max_workers must be a positive integer, not {!r}".format(max_workers))
+        self.max_workers = max_workers
+
         self.action_list = action_list
         self.actions = {}
         for action_config in action_list:
@@ -113,33 +132,146 @@ class ActionListValidationOperator(ValidationOperator):
 
         return batch
 
+    @staticmethod
+    def _close_batch_from_item(item, batch):
+        """Close a batch that _build_batch_from_item loaded for the item, releasing any database connection it holds.
+        A DataAsset passed to the operator belongs to the caller, and is left open."""
+        if not isinstance(item, DataAsset) and hasattr(batch, "close"):
+            batch.close()
+
     def run(self, assets_to_validate, run_id):
+        try:
+            if self.max_workers > 1:
+                batch_details = self._run_concurrently(assets_to_validate, run_id)
+            else:
+                batch_details = []
+                for item in assets_to_validate:
+                    batch, expectation_suite_identifier, batch_validation_result, timing = \
+                        self._build_and_validate_item(item, run_id)
+                    actions_start = time.time()
+                    try:
+                        batch_actions_results = self._run_actions(batch, expectation_suite_identifier, batch._expectation_suite, batch_validation_result, run_id)
+                    finally:
+                        self._close_batch_from_item(item, batch)
+                    timing["actions"] = time.time() - actions_start
+                    batch_details.append((expectation_suite_identifier, batch_validation_result, batch_actions_results, timing))
+        finally:
+            # Deferred work covers the batches whose actions ran, even if a later batch failed
+            self._flush_actions()
+
         result_object = {
             "success": None,
             "details": {}
         }
 
-        for item in assets_to_validate:
-            batch = self._build_batch_from_item(item)
+        for expectation_suite_identifier, batch_validation_result, batch_actions_results, timing in batch_details:
+            result_object["details"][expectation_suite_identifier] = {
+                "validation_result": batch_validation_result,
+                "actions_results": batch_actions_results,
+                "timing": timing,
+            }
+
+        result_object["success"] = all([val["validation_result"]["success"] for val in result_object["details"].values()])
+
+        return result_object
+
+    def _build_and_validate_item(self, item, run_id):
+        """Load the batch for one asset to validate and validate it against its expectation suite.
+
+        Returns:
+            a tuple of the batch, its expectation suite identifier, its validation result and a dictionary
+            with the seconds spent loading and validating the batch
+        """
+        load_start = time.time()
+        batch = self._build_batch_from_item(item)
+        validate_start = time.time()
+        try:
             expectation_suite_identifier = ExpectationSuiteIdentifier(
                 data_asset_name=DataAssetIdentifier(
                     *self.data_context.normalize_data_asset_name(batch._expectation_suite["data_asset_name"])
                 ),
                 expectation_suite_name=batch._expectation_suite.expectation_suite_name
             )
-            validation_result_id = ValidationResultIdentifier(
-                expectation_suite_identifier=expectation_suite_identifier,
-                run_id=run_id,
-            )
-            result_object["details"][expectation_suite_identifier] = {}
             batch_validation_result = batch.validate(run_id=run_id, result_format="SUMMARY")
-            result_object["details"][expectation_suite_identifier]["validation_result"] = batch_validation_result
-            batch_actions_results = self._run_actions(batch, expectation_suite_identifier, batch._expectation_suite, batch_validation_result, run_id)
-            result_object["details"][expectation_suite_identifier]["actions_results"] = batch_actions_results
+        except Exception:
+            self._close_batch_from_item(item, batch)
+            raise
+        timing = {
+            "load_batch": validate_start - load_start,
+            "validate": time.time() - validate_start,
+        }
+        return batch, expectation_suite_identifier, batch_validation_result, timing
 
-        result_object["success"] = all([val["validation_result"]["success"] for val in result_object["details"].values()])
+    def _run_concurrently(self, assets_to_validate, run_id):
+        """Validate batches in a pool of max_workers threads, running actions on a separate thread.
 
-        return result_object
+        Returns:
+            a list with one (expectation_suite_identifier, validation_result, actions_results, timing) tuple per
+            asset to validate, in the order of assets_to_validate
+        """
+        batch_details = {}
+        errors = []
+        # Bounds the number of batches that have been submitted but whose actions have not yet finished
+        batches_in_flight = threading.BoundedSemaphore(2 * self.max_workers)
+        action_queue = queue.Queue()
+
+        def build_and_validate(index, item):
+            try:
+                action_queue.put((index, item, self._build_and_validate_item(item, run_id)))
+            except Exception as e:
+                logger.exception("Error validating asset number {}".format(index))
+                errors.append((index, e))
+                batches_in_flight.release()
+
+        def run_queued_actions():
+            while True:
+                queued = action_queue.get()
+                if queued is None:
+                    return
+                index, item, (batch, expectation_suite_identifier, batch_validation_result, timing) = queued
+                try:
+                    if not errors:
+                        actions_start = time.time()
+                        batch_actions_results = self._run_actions(batch, expectation_suite_identifier, batch._expectation_suite, batch_validation_result, run_id)
+                        timing["actions"] = time.time() - actions_start
+                        batch_details[index] = (expectation_suite_identifier, batch_validation_result,
+                                                batch_actions_results, timing)
+                except Exception as e:
+                    errors.append((index, e))
+                finally:
+                    # Drop the batch as soon as its actions are done, rather than when the next one is queued
+                    try:
+                        self._close_batch_from_item(item, batch)
+                    except Exception as e:
+                        logger.exception("Error closing the batch of asset number {}".format(index))
+                        errors.append((index, e))
+                    finally:
+                        queued = item = batch = None
+                        batches_in_flight.release()
+
+        action_thread = threading.Thread(target=run_queued_actions)
+        action_thread.daemon = True
+        action_thread.start()
+
+        pool = ThreadPool(self.max_workers)
+        try:
+            for index, item in enumerate(assets_to_validate):
+                batches_in_flight.acquire()
+                if errors:
+                    batches_in_flight.release()
+                    break
+                pool.apply_async(build_and_validate, (index, item))
+        finally:
+            pool.close()
+            pool.join()
+            action_queue.put(None)
+            action_thread.join()
+
+        if errors:
+            # Raise the error of the earliest asset, so that the same failure is reported on every run
+            raise sorted(errors, key=lambda error: error[0])[0][1]
+
+        return [batch_details[index] for index in sorted(batch_details.keys())]
 
     def _run_actions(self, batch, expectation_suite_identifier, expectation_suite, batch_validation_result, run_id):
         """
@@ -200,6 +332,18 @@ class ActionListValidationOperator(ValidationOperator):
         # NOTE: Eugene: 2019-09-24: Need to define this result object. Discussion required!
         return result_object
 
+    def _flush_actions(self):
+        """
+        Runs the flush method of every action in the action list, once all the batches of an operator run have been
+        processed. Actions use it to finish work that they defer until the end of the run, such as
+        UpdateDataDocsAction building the data docs once for all the validation results of the run.
+        """
+        for action in self.action_list:
+            logger.debug("Flushing validation action with name {}".format(action["name"]))
+            flush = getattr(self.actions[action["name"]], "flush", None)
+            if flush is not None:
+                flush()
+
 
 class WarningAndFailureExpectationSuitesValidationOperator(ActionListValidationOperator):
     """WarningAndFailureExpectationSuitesValidationOperator is a validation operator
@@ -403,95 +547,99 @@ class WarningAndFailureExpectationSuitesValidationOperator(ActionListValidationO
 
         for item in assets_to_validate:
             batch = self._build_batch_from_item(item)
-
-            # TODO : We should be using typed batch
-            data_asset_identifier = DataAssetIdentifier(
-                *self.data_context.normalize_data_asset_name(
-                    batch._expectation_suite["data_asset_name"]
+            try:
+                # TODO : We should be using typed batch
+                data_asset_identifier = DataAssetIdentifier(
+                    *self.data_context.normalize_data_asset_name(
+                        batch._expectation_suite["data_asset_name"]
+                    )
                 )
-            )
-            run_id = run_id
+                run_id = run_id
 
-            assert not data_asset_identifier is None
-            assert not run_id is None
+                assert not data_asset_identifier is None
+                assert not run_id is None
 
-            return_obj["data_asset_identifiers"].append(data_asset_identifier)
+                return_obj["data_asset_identifiers"].append(data_asset_identifier)
 
-            # NOTE : Abe 2019/09/12 : Perhaps this could be generalized to a loop.
-            # I'm NOT doing that, because lots of user research suggests that these 3 specific behaviors
-            # (failure, warning, quarantine) will cover most of the common use cases for
-            # post-validation data treatment.
-
-            failure_expectation_suite_identifier = ExpectationSuiteIdentifier(
-                data_asset_name=data_asset_identifier,
-                expectation_suite_name=self.expectation_suite_name_prefix + self.expectation_suite_name_suffixes[0]
-            )
-
-            failure_validation_result_id = ValidationResultIdentifier(
-                expectation_suite_identifier=failure_expectation_suite_identifier,
-                run_id=run_id,
-            )
+                # NOTE : Abe 2019/09/12 : Perhaps this could be generalized to a loop.
+                # I'm NOT doing that, because lots of user research suggests that these 3 specific behaviors
+                # (failure, warning, quarantine) will cover most of the common use cases for
+                # post-validation data treatment.
 
-            failure_expectation_suite = None
-            try:
-                failure_expectation_suite = self.data_context.stores[self.data_context.expectations_store_name].get(
-                    failure_expectation_suite_identifier
+                failure_expectation_suite_identifier = ExpectationSuiteIdentifier(
+                    data_asset_name=data_asset_identifier,
+                    expectation_suite_name=self.expectation_suite_name_prefix + self.expectation_suite_name_suffixes[0]
                 )
 
-            # NOTE : Abe 2019/09/17 : I'm concerned that this may be too permissive, since
-            # it will catch any error in the Store, not just KeyErrors. In the longer term, a better
-            # solution will be to have the Stores catch other known errors and raise KeyErrors,
-            # so that methods like this can catch and handle a single error type.
-            except Exception as e:
-                logger.debug("Failure expectation suite not found: {}".format(failure_expectation_suite_identifier))
-
-            if failure_expectation_suite:
-                return_obj["failure"][failure_validation_result_id] = {}
-                failure_validation_result = batch.validate(failure_expectation_suite, result_format="SUMMARY")
-                return_obj["failure"][failure_validation_result_id]["validation_result"] = failure_validation_result
-                failure_actions_results = self._run_actions(
-                    batch,
-                    failure_expectation_suite_identifier,
-                    failure_expectation_suite,
-                    failure_validation_result,
-                    run_id
+                failure_validation_result_id = ValidationResultIdentifier(
+                    expectation_suite_identifier=failure_expectation_suite_identifier,
+                    run_id=run_id,
                 )
-                return_obj["failure"][failure_validation_result_id]["actions_results"] = failure_actions_results
-
-                if not failure_validation_result["success"] and self.stop_on_first_error:
-                    break
-
-
-            warning_expectation_suite_identifier = ExpectationSuiteIdentifier(
-                data_asset_name=data_asset_identifier,
-                expectation_suite_name=self.expectation_suite_name_prefix + self.expectation_suite_name_suffixes[1]
-            )
 
-            warning_validation_result_id = ValidationResultIdentifier(
-                expectation_suite_identifier=warning_expectation_suite_identifier,
-                run_id=run_id,
-            )
-
-            warning_expectation_suite = None
-            try:
-                warning_expectation_suite = self.data_context.stores[self.data_context.expectations_store_name].get(
-                    warning_expectation_suite_identifier
+                failure_expectation_suite = None
+                try:
+                    failure_expectation_suite = self.data_context.stores[self.data_context.expectations_store_name].get(
+                        failure_expectation_suite_identifier
+                    )
+
+                # NOTE : Abe 2019/09/17 : I'm concerned that this may be too permissive, since
+                # it will catch any error in the Store, not just KeyErrors. In the longer term, a better
+                # solution will be to have the Stores catch other known errors and raise KeyErrors,
+                # so that methods like this can catch and handle a single error type.
+                except Exception as e:
+                    logger.debug("Failure expectation suite not found: {}".format(failure_expectation_suite_identifier))
+
+                if failure_expectation_suite:
+                    return_obj["failure"][failure_validation_result_id] = {}
+                    failure_validation_result = batch.validate(failure_expectation_suite, result_format="SUMMARY")
+                    return_obj["failure"][failure_validation_result_id]["validation_result"] = failure_validation_result
+                    failure_actions_results = self._run_actions(
+                        batch,
+                        failure_expectation_suite_identifier,
+                        failure_expectation_suite,
+                        failure_validation_result,
+                        run_id
+                    )
+                    return_obj["failure"][failure_validation_result_id]["actions_results"] = failure_actions_results
+
+                    if not failure_validation_result["success"] and self.stop_on_first_error:
+                        break
+
+
+                warning_expectation_suite_identifier = ExpectationSuiteIdentifier(
+                    data_asset_name=data_asset_identifier,
+                    expectation_suite_name=self.expectation_suite_name_prefix + self.expectation_suite_name_suffixes[1]
                 )
-            except Exception as e:
-                logger.debug("Warning expectation suite not found: {}".format(warning_expectation_suite_identifier))
-
-            if warning_expectation_suite:
-                return_obj["warning"][warning_validation_result_id] = {}
-                warning_validation_result = batch.validate(warning_expectation_suite, result_format="SUMMARY")
-                return_obj["warning"][warning_validation_result_id]["validation_result"] = warning_validation_result
-                warning_actions_results = self._run_actions(
-                    batch,
-                    warning_expectation_suite_identifier,
-                    warning_expectation_suite,
-                    warning_validation_result,
-                    run_id
+
+                warning_validation_result_id = ValidationResultIdentifier(
+                    expectation_suite_identifier=warning_expectation_suite_identifier,
+                    run_id=run_id,
                 )
-                return_obj["warning"][warning_validation_result_id]["actions_results"] = warning_actions_results
+
+                warning_expectation_suite = None
+                try:
+                    warning_expectation_suite = self.data_context.stores[self.data_context.expectations_store_name].get(
+                        warning_expectation_suite_identifier
+                    )
+                except Exception as e:
+                    logger.debug("Warning expectation suite not found: {}".format(warning_expectation_suite_identifier))
+
+                if warning_expectation_suite:
+                    return_obj["warning"][warning_validation_result_id] = {}
+                    warning_validation_result = batch.validate(warning_expectation_suite, result_format="SUMMARY")
+                    return_obj["warning"][warning_validation_result_id]["validation_result"] = warning_validation_result
+                    warning_actions_results = self._run_actions(
+                        batch,
+                        warning_expectation_suite_identifier,
+                        warning_expectation_suite,
+                        warning_validation_result,
+                        run_id
+                    )
+                    return_obj["warning"][warning_validation_result_id]["actions_results"] = warning_actions_results
+            finally:
+                self._close_batch_from_item(item, batch)
+
+        self._flush_actions()
 
         return_obj["success"] = all([val["validation_result"]["success"] for val in return_obj["failure"].values()])
 
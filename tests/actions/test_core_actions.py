@@ -7,7 +7,9 @@ except ImportError:
 from great_expectations.validation_operators import (
     BasicValidationAction,
     SlackNotificationAction,
-    StoreAction
+    StoreAction,
+    StoreValidationMetricsAction,
+    UpdateDataDocsAction,
 )
 # from great_expectations.actions.types import (
 #     ActionInternalConfig,
@@ -17,7 +19,9 @@ from great_expectations.validation_operators import (
 from great_expectations.data_context.store import (
     # NamespacedInMemoryStore
     ValidationsStore,
+    ParquetValidationMetricsStore,
 )
+from great_expectations.exceptions import DataContextError
 from great_expectations.data_context.types.resource_identifiers import (
     ValidationResultIdentifier,
     ExpectationSuiteIdentifier,
@@ -84,6 +88,92 @@ def test_StoreAction():
     )) == {}
 
 
+
+def test_StoreValidationMetricsAction(tmp_path_factory):
+    path = str(tmp_path_factory.mktemp('test_StoreValidationMetricsAction__dir'))
+
+    class Object(object):
+        pass
+
+    data_context = Object()
+    data_context.stores = {
+        "validation_metrics_store": ParquetValidationMetricsStore(base_directory="metrics", root_directory=path),
+        "fake_in_memory_store": ValidationsStore(
+            root_directory=None,
+            store_backend={
+                "class_name": "InMemoryStoreBackend",
+            }
+        )
+    }
+
+    with pytest.raises(DataContextError):
+        StoreValidationMetricsAction(
+            data_context=data_context,
+            target_store_name="fake_in_memory_store",
+        )
+
+    action = StoreValidationMetricsAction(
+        data_context=data_context,
+        target_store_name="validation_metrics_store",
+    )
+
+    vr_id = "ValidationResultIdentifier.my_db.default_generator.my_table.default_expectations.prod_20190801"
+    action.run(
+        validation_result_suite_identifier=ValidationResultIdentifier(from_string=vr_id),
+        validation_result_suite={
+            "results": [{
+                "success": True,
+                "expectation_config": {
+                    "expectation_type": "expect_column_values_to_not_be_null",
+                    "kwargs": {"column": "a"}
+                },
+                "result": {"unexpected_percent": 0.0}
+            }]
+        },
+        data_asset=None
+    )
+
+    metrics = data_context.stores["validation_metrics_store"].query()
+    assert metrics[["generator_asset", "run_id", "column", "unexpected_percent", "success"]].to_dict("records") == [{
+        "generator_asset": "my_table",
+        "run_id": "prod_20190801",
+        "column": "a",
+        "unexpected_percent": 0.0,
+        "success": True
+    }]
+
+def test_UpdateDataDocsAction_coalesce_updates():
+    data_context = mock.Mock()
+    validation_result_suite_ids = [
+        ValidationResultIdentifier(from_string="ValidationResultIdentifier.a.b.c.warning.prod-" + str(i))
+        for i in range(3)
+    ]
+
+    action = UpdateDataDocsAction(data_context=data_context)
+    action.run(
+        validation_result_suite_identifier=validation_result_suite_ids[0],
+        validation_result_suite={},
+        data_asset=None
+    )
+    data_context.build_data_docs.assert_called_once_with(resource_identifiers=[validation_result_suite_ids[0]])
+
+    data_context = mock.Mock()
+    action = UpdateDataDocsAction(data_context=data_context, coalesce_updates=True)
+    for validation_result_suite_id in validation_result_suite_ids:
+        action.run(
+            validation_result_suite_identifier=validation_result_suite_id,
+            validation_result_suite={},
+            data_asset=None
+        )
+    assert data_context.build_data_docs.call_count == 0
+
+    action.flush()
+    data_context.build_data_docs.assert_called_once_with(resource_identifiers=validation_result_suite_ids)
+
+    # Nothing is pending after a flush
+    action.flush()
+    assert data_context.build_data_docs.call_count == 1
+
 def test_SlackNotificationAction(data_context):
 
     renderer = {
@@ -5,10 +5,16 @@ import shutil
 
 import pandas as pd
 
+try:
+    from unittest import mock
+except ImportError:
+    import mock
+
 from great_expectations.data_context import (
     ConfigOnlyDataContext,
     DataContext,
 )
+from great_expectations.dataset import SqlAlchemyDataset
 from great_expectations.data_context.types import (
 #     DataContextConfig,
     DataAssetIdentifier,
@@ -126,6 +132,131 @@ def test_ActionListValidationOperator(basic_data_context_config_for_validation_o
     assert data_context.stores["validation_result_store"].get(validation_result_store_keys[0])["success"] is True
 
 
+def test_ActionListValidationOperator_with_max_workers(basic_data_context_config_for_validation_operator,
+                                                       tmp_path_factory, filesystem_csv_4):
+    project_path = str(tmp_path_factory.mktemp('great_expectations'))
+    basic_data_context_config_for_validation_operator["validation_operators"]["store_val_res_and_extract_eval_params"][
+        "max_workers"] = 3
+
+    data_context = ConfigOnlyDataContext(
+        basic_data_context_config_for_validation_operator,
+        project_path,
+    )
+    data_context.add_datasource("my_datasource",
+                                class_name="PandasDatasource",
+                                base_directory=str(filesystem_csv_4))
+
+    data_context.create_expectation_suite("my_datasource/default/f1", "foo")
+    df = data_context.get_batch("my_datasource/default/f1", "foo",
+                                batch_kwargs=data_context.yield_batch_kwargs("my_datasource/default/f1"))
+    df.expect_column_values_to_be_between(column="x", min_value=1, max_value=9)
+    expectation_suite = df.get_expectation_suite(discard_failed_expectations=False)
+    suite_names = ["suite_{}".format(i) for i in range(6)]
+    for suite_name in suite_names:
+        data_context.save_expectation_suite(expectation_suite, data_asset_name="my_datasource/default/f1",
+                                            expectation_suite_name=suite_name)
+
+    validator_batch_kwargs = data_context.yield_batch_kwargs("my_datasource/default/f1")
+    operator_result = data_context.run_validation_operator(
+        assets_to_validate=[("my_datasource/default/f1", suite_name, validator_batch_kwargs)
+                            for suite_name in suite_names],
+        run_id="test-100",
+        validation_operator_name="store_val_res_and_extract_eval_params",
+    )
+
+    assert operator_result["success"]
+    # Details are listed in the order of assets_to_validate, regardless of the order the validations finished in
+    assert [identifier.expectation_suite_name for identifier in operator_result["details"].keys()] == suite_names
+    for details in operator_result["details"].values():
+        assert set(details["actions_results"].keys()) == \
+            {"store_validation_result", "extract_and_store_eval_parameters"}
+        assert set(details["timing"].keys()) == {"load_batch", "validate", "actions"}
+    assert len(data_context.stores["validation_result_store"].list_keys()) == 6
+
+    # An error loading any batch is raised from run
+    with pytest.raises(IOError):
+        data_context.run_validation_operator(
+            assets_to_validate=[("my_datasource/default/f1", "suite_0", validator_batch_kwargs),
+                                ("my_datasource/default/f1", "suite_1", {"path": "/not/a/real/file.csv"})],
+            run_id="test-101",
+            validation_operator_name="store_val_res_and_extract_eval_params",
+        )
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_ActionListValidationOperator_closes_the_batches_it_loads(basic_data_context_config_for_validation_operator,
+                                                                  tmp_path_factory, max_workers, sa):
+    project_path = str(tmp_path_factory.mktemp('great_expectations'))
+    basic_data_context_config_for_validation_operator["validation_operators"]["store_val_res_and_extract_eval_params"][
+        "max_workers"] = max_workers
+    data_context = ConfigOnlyDataContext(
+        basic_data_context_config_for_validation_operator,
+        project_path,
+    )
+    # Each batch of a query holds a connection of the pool until it is closed
+    data_context.add_datasource("my_db", class_name="SqlAlchemyDatasource",
+                                connection_string="sqlite:///" + os.path.join(project_path, "test.db"),
+                                connect_args={"check_same_thread": False}, poolclass=sa.pool.QueuePool,
+                                pool_size=1, max_overflow=0, pool_timeout=10)
+    engine = data_context.datasources["my_db"].engine
+    pd.DataFrame({"x": [1, 2, 3]}).to_sql(name="test_table", con=engine, index=False)
+    data_context.create_expectation_suite("my_db/default/test", "foo")
+
+    batch_kwargs = {"query": "SELECT x FROM test_table WHERE x > 1"}
+    with mock.patch.object(SqlAlchemyDataset, "close", autospec=True, side_effect=SqlAlchemyDataset.close) as close:
+        operator_result = data_context.run_validation_operator(
+            assets_to_validate=[("my_db/default/test", "foo", batch_kwargs) for _ in range(3)],
+            run_id="test-100",
+            validation_operator_name="store_val_res_and_extract_eval_params",
+        )
+        assert close.call_count == 3
+    assert operator_result["success"]
+    assert engine.pool.checkedout() == 0
+
+    # A batch passed to the operator is left open for the caller
+    batch = data_context.get_batch("my_db/default/test", "foo", batch_kwargs=batch_kwargs)
+    data_context.run_validation_operator(
+        assets_to_validate=[batch],
+        run_id="test-101",
+        validation_operator_name="store_val_res_and_extract_eval_params",
+    )
+    assert batch.get_row_count() == 2
+    batch.close()
+    assert engine.pool.checkedout() == 0
+
+
+def test_ActionListValidationOperator_reports_errors_closing_batches(basic_data_context_config_for_validation_operator,
+                                                                     tmp_path_factory, sa):
+    project_path = str(tmp_path_factory.mktemp('great_expectations'))
+    basic_data_context_config_for_validation_operator["validation_operators"]["store_val_res_and_extract_eval_params"][
+        "max_workers"] = 2
+    data_context = ConfigOnlyDataContext(
+        basic_data_context_config_for_validation_operator,
+        project_path,
+    )
+    data_context.add_datasource("my_db", class_name="SqlAlchemyDatasource",
+                                connection_string="sqlite:///" + os.path.join(project_path, "test.db"),
+                                connect_args={"check_same_thread": False})
+    engine = data_context.datasources["my_db"].engine
+    pd.DataFrame({"x": [1, 2, 3]}).to_sql(name="test_table", con=engine, index=False)
+    data_context.create_expectation_suite("my_db/default/test", "foo")
+
+    # More assets than batches in flight: a failing close must not stop the operator from loading the others
+    batch_kwargs = {"query": "SELECT x FROM test_table WHERE x > 1"}
+    with mock.patch.object(SqlAlchemyDataset, "close", autospec=True, side_effect=IOError("close failed")):
+        with pytest.raises(IOError):
+            data_context.run_validation_operator(
+                assets_to_validate=[("my_db/default/test", "foo", batch_kwargs) for _ in range(6)],
+                run_id="test-100",
+                validation_operator_name="store_val_res_and_extract_eval_params",
+            )
+
+
+def test_ActionListValidationOperator_rejects_invalid_max_workers():
+    from great_expectations.validation_operators import ActionListValidationOperator
+    with pytest.raises(ValueError):
+        ActionListValidationOperator(data_context=None, action_list=[], max_workers=0)
+
 def test_WarningAndFailureExpectationSuitesValidationOperator_with_file_structure(tmp_path_factory):
     base_path = str(tmp_path_factory.mktemp('test_DefaultDataContextAwareValidationOperator_with_file_structure__dir'))
     project_path = os.path.join( base_path, "project")
@@ -30,9 +30,24 @@ def pytest_configure(config):
     config.addinivalue_line(
         "markers", "rendered_output: produces rendered output that should be manually reviewed."
     )
+    config.addinivalue_line(
+        "markers", "benchmark: mark test as a benchmark, which only runs with --benchmark."
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--benchmark"):
+        return
+    skip_benchmark = pytest.mark.skip(reason="benchmarks only run with --benchmark")
+    for item in items:
+        if "benchmark" in item.keywords:
+            item.add_marker(skip_benchmark)
 
 
 def pytest_addoption(parser):
+    parser.addoption(
+        "--benchmark", action="store_true", help="If set, run the benchmarks, which are skipped by default"
+    )
     parser.addoption(
         "--no-spark", action='store_true', help="If set, suppress tests against the spark test suite"
     )
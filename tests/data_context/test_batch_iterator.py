@@ -0,0 +1,110 @@
+import threading
+import time
+
+import pandas as pd
+import pytest
+
+from great_expectations.data_context.batch_iterator import PrefetchingBatchIterator
+
+
+class BatchLoader(object):
+    """Loads dataframes of the requested number of rows, keeping track of the batches loaded but not yet consumed."""
+
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.loaded = []
+        self.consumed = 0
+        self.max_outstanding = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, batch_kwargs):
+        time.sleep(self.delay)
+        if batch_kwargs.get("fail"):
+            raise ValueError("Unable to load batch")
+        with self._lock:
+            self.loaded.append(batch_kwargs["id"])
+            self.max_outstanding = max(self.max_outstanding, len(self.loaded) - self.consumed)
+        return pd.DataFrame({"id": [batch_kwargs["id"]] * batch_kwargs.get("rows", 1)})
+
+    def consume(self, batch):
+        with self._lock:
+            self.consumed += 1
+        return batch["id"][0]
+
+
+def test_prefetching_batch_iterator_order_and_prefetch_bound():
+    loader = BatchLoader(delay=0.01)
+    batches = PrefetchingBatchIterator(loader, [{"id": i} for i in range(10)], prefetch=3)
+    ids = []
+    for batch in batches:
+        time.sleep(0.02)
+        ids.append(loader.consume(batch))
+    assert ids == list(range(10))
+    # The batch being validated and the batches loaded ahead of it
+    assert loader.max_outstanding <= 4
+
+    statistics = batches.get_statistics()
+    assert statistics["batches"] == 10
+    # Batches load while the previous one is validated
+    assert statistics["prefetched_batches"] >= 5
+    assert statistics["stall_time"] < statistics["load_time"]
+    assert statistics["loaded_bytes"] > 0
+
+
+def test_prefetching_batch_iterator_max_bytes():
+    loader = BatchLoader()
+    batch_kwargs = [{"id": i, "rows": 10000} for i in range(6)]
+    batches = PrefetchingBatchIterator(loader, batch_kwargs, prefetch=5, max_bytes=1)
+    ids = []
+    for batch in batches:
+        # Let any batch scheduled ahead finish loading
+        time.sleep(0.05)
+        ids.append(loader.consume(batch))
+    assert ids == list(range(6))
+    # Only one batch is loaded ahead once it exceeds the budget
+    assert loader.max_outstanding <= 2
+
+
+def test_prefetching_batch_iterator_load_errors():
+    loader = BatchLoader()
+    batches = PrefetchingBatchIterator(loader, [{"id": 0}, {"id": 1, "fail": True}, {"id": 2}])
+    assert loader.consume(next(batches)) == 0
+    with pytest.raises(ValueError):
+        next(batches)
+    batches.close()
+    with pytest.raises(StopIteration):
+        next(batches)
+
+
+class ClosableBatch(object):
+    def __init__(self, batch_id):
+        self.id = batch_id
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+def test_prefetching_batch_iterator_closes_batches_loaded_ahead():
+    loaded = []
+
+    def load_batch(batch_kwargs):
+        time.sleep(batch_kwargs["delay"])
+        batch = ClosableBatch(batch_kwargs["id"])
+        loaded.append(batch)
+        return batch
+
+    batch_kwargs = [{"id": 0, "delay": 0}, {"id": 1, "delay": 0}, {"id": 2, "delay": 0.2}]
+    batches = PrefetchingBatchIterator(load_batch, batch_kwargs, prefetch=2)
+    first = next(batches)
+    # The second batch is loaded ahead, and the third is still loading
+    time.sleep(0.05)
+    batches.close()
+    assert [batch.id for batch in loaded] == [0, 1]
+    assert not first.closed
+    assert loaded[1].closed
+
+    # The batch that was still loading is closed once it has loaded
+    time.sleep(0.3)
+    assert [batch.id for batch in loaded] == [0, 1, 2]
+    assert loaded[2].closed
@@ -647,6 +647,7 @@ data_docs/
                     Titanic/
                         BasicDatasetProfiler.html
         static/
+            static_assets_digest.txt
             fonts/
                 HKGrotesk/
                     HKGrotesk-Bold.otf
@@ -1194,6 +1195,24 @@ def test_build_batch_kwargs(titanic_multibatch_data_context):
     assert batch_kwargs["partition_id"] == "Titanic_1911"
 
 
+def test_iterate_batches(titanic_multibatch_data_context):
+    context = titanic_multibatch_data_context
+    context.create_expectation_suite("titanic", "default")
+
+    batches = context.iterate_batches("titanic", "default")
+    paths = [batch.batch_kwargs["path"] for batch in batches]
+    assert sorted([os.path.basename(path) for path in paths]) == ["Titanic_1911.csv", "Titanic_1912.csv"]
+    assert batches.get_statistics()["batches"] == 2
+    # The iterator used by yield_batch_kwargs is unaffected
+    assert context.yield_batch_kwargs("titanic")["path"] == paths[0]
+
+    with context.iterate_batches("titanic", "default", partition_ids=["Titanic_1912"], prefetch=1) as batches:
+        batch = next(batches)
+        assert batch.batch_kwargs["partition_id"] == "Titanic_1912"
+        assert batch.get_expectation_suite_name() == "default"
+        assert len(list(batches)) == 0
+
+
 def test_existing_local_data_docs_urls_returns_nothing_on_empty_project(tmp_path_factory):
     empty_directory = str(tmp_path_factory.mktemp("hey_there"))
     DataContext.create(empty_directory)
@@ -0,0 +1,123 @@
+import time
+
+try:
+    from unittest import mock
+except ImportError:
+    import mock
+
+import pandas as pd
+import pytest
+
+from great_expectations.dataset import PandasDataset
+from great_expectations.dataset.metric_cache import SqliteMetricCache
+
+
+def test_SqliteMetricCache_get_and_set(tmp_path_factory):
+    path = str(tmp_path_factory.mktemp('test_SqliteMetricCache_get_and_set__dir'))
+    metric_cache = SqliteMetricCache("metric_cache/metrics.db", root_directory=path)
+
+    with pytest.raises(KeyError):
+        metric_cache.get("abc", "get_column_max")
+    metric_cache.set("abc", "get_column_max", 3)
+    metric_cache.set("abc", "get_column_value_counts", pd.Series([1, 2], index=["a", "b"]))
+    metric_cache.set("abc", "get_column_min", None)
+    assert metric_cache.get("abc", "get_column_max") == 3
+    assert metric_cache.get("abc", "get_column_value_counts").to_dict() == {"a": 1, "b": 2}
+    assert metric_cache.get("abc", "get_column_min") is None
+
+    # Values persist across instances
+    other_metric_cache = SqliteMetricCache("metric_cache/metrics.db", root_directory=path)
+    assert other_metric_cache.get("abc", "get_column_max") == 3
+
+    statistics = metric_cache.get_cache_statistics()
+    assert statistics["hits"] == 3
+    assert statistics["misses"] == 1
+    assert statistics["entries"] == 3
+
+    metric_cache.set("def", "get_column_max", 4)
+    metric_cache.invalidate("abc")
+    assert metric_cache.get_cache_statistics()["entries"] == 1
+    metric_cache.invalidate()
+    assert metric_cache.get_cache_statistics()["entries"] == 0
+
+
+def test_SqliteMetricCache_eviction(tmp_path_factory):
+    path = str(tmp_path_factory.mktemp('test_SqliteMetricCache_eviction__dir'))
+    metric_cache = SqliteMetricCache("metrics.db", root_directory=path, max_size=2500)
+
+    for i in range(3):
+        metric_cache.set("abc", "metric_" + str(i), "x" * 1000)
+        time.sleep(0.01)
+    # The least recently used value is evicted to stay below max_size
+    with pytest.raises(KeyError):
+        metric_cache.get("abc", "metric_0")
+    assert metric_cache.get_cache_statistics()["size"] <= 2500
+
+    metric_cache.get("abc", "metric_1")
+    time.sleep(0.01)
+    metric_cache.set("abc", "metric_3", "x" * 1000)
+    assert metric_cache.get("abc", "metric_1") == "x" * 1000
+    with pytest.raises(KeyError):
+        metric_cache.get("abc", "metric_2")
+
+    metric_cache = SqliteMetricCache("metrics.db", root_directory=path, max_age=0.05)
+    metric_cache.set("abc", "metric_4", 4)
+    assert metric_cache.get("abc", "metric_4") == 4
+    time.sleep(0.1)
+    with pytest.raises(KeyError):
+        metric_cache.get("abc", "metric_4")
+    metric_cache.evict()
+    assert metric_cache.get_cache_statistics()["entries"] == 0
+
+
+def test_SqliteMetricCache_batches_access_times_and_evicts_only_above_max_size(tmp_path_factory):
+    path = str(tmp_path_factory.mktemp('test_SqliteMetricCache_batches_access_times__dir'))
+    metric_cache = SqliteMetricCache("metrics.db", root_directory=path, max_size=2500, access_batch_size=2)
+
+    def get_accessed_at(metric_key):
+        with metric_cache._connect() as connection:
+            return connection.execute("SELECT accessed_at FROM metrics WHERE metric_key = ?",
+                                      (metric_key,)).fetchone()[0]
+
+    with mock.patch.object(metric_cache, "evict", wraps=metric_cache.evict) as evict:
+        metric_cache.set("abc", "metric_0", "x" * 1000)
+        metric_cache.set("abc", "metric_1", "x" * 1000)
+        assert evict.call_count == 0
+
+        stored_at = get_accessed_at("metric_0")
+        time.sleep(0.01)
+        metric_cache.get("abc", "metric_0")
+        assert get_accessed_at("metric_0") == stored_at
+        metric_cache.get("abc", "metric_1")
+        assert get_accessed_at("metric_0") > stored_at
+
+        metric_cache.set("abc", "metric_2", "x" * 1000)
+        assert evict.call_count == 1
+    # metric_0 is the least recently used value
+    with pytest.raises(KeyError):
+        metric_cache.get("abc", "metric_0")
+    metric_cache.close()
+
+
+def test_Dataset_metric_cache(tmp_path_factory):
+    path = str(tmp_path_factory.mktemp('test_Dataset_metric_cache__dir'))
+    metric_cache = SqliteMetricCache("metrics.db", root_directory=path)
+
+    dataset = PandasDataset({"x": [1, 2, 3]}, batch_id={"fingerprint": "abc"}, metric_cache=metric_cache)
+    assert dataset.get_column_max("x") == 3
+    assert dataset.expect_column_max_to_be_between("x", 3, 3)["success"]
+    statistics = metric_cache.get_cache_statistics()
+    assert statistics["hits"] == 0
+
+    # A new dataset with the same fingerprint reuses the metrics, even when the in-memory cache is off
+    dataset = PandasDataset({"x": [1, 2, 3]}, batch_id={"fingerprint": "abc"}, metric_cache=metric_cache,
+                            caching=False)
+    assert dataset.get_column_max("x") == 3
+    assert dataset.expect_column_max_to_be_between("x", 3, 3)["success"]
+    assert metric_cache.get_cache_statistics()["misses"] == statistics["misses"]
+    assert metric_cache.get_cache_statistics()["hits"] == statistics["misses"]
+
+    # Without a fingerprint, the cache is not used
+    dataset = PandasDataset({"x": [1, 2, 3]}, metric_cache=metric_cache)
+    dataset.get_column_min("x")
+    assert metric_cache.get_cache_statistics()["entries"] == statistics["entries"]
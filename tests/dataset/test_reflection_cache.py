@@ -0,0 +1,46 @@
+import pandas as pd
+import pytest
+
+from great_expectations.dataset import SqlAlchemyDataset
+from great_expectations.dataset.reflection_cache import get_reflection_cache
+
+
+@pytest.fixture
+def sqlite_engine(sa):
+    engine = sa.create_engine("sqlite://")
+    pd.DataFrame({"a": [1, 2, 3], "b": ["x", "y", "z"]}).to_sql(name="test_table", con=engine, index=False)
+    return engine
+
+
+def test_reflection_cache_is_shared_by_datasets(sqlite_engine):
+    reflection_cache = get_reflection_cache(sqlite_engine)
+    assert get_reflection_cache(sqlite_engine) is reflection_cache
+
+    dataset = SqlAlchemyDataset("test_table", engine=sqlite_engine)
+    assert [column["name"] for column in dataset.columns] == ["a", "b"]
+    other_dataset = SqlAlchemyDataset("test_table", engine=sqlite_engine)
+    assert [column["name"] for column in other_dataset.columns] == ["a", "b"]
+
+    statistics = reflection_cache.get_reflection_statistics()
+    assert statistics["misses"] == 1
+    assert statistics["hits"] == 1
+    assert statistics["reflection_time"] > 0
+
+    # Datasets get copies of the reflected columns
+    dataset.columns[0]["name"] = "c"
+    assert reflection_cache.get_columns("test_table")[0]["name"] == "a"
+
+
+def test_reflection_cache_ttl_and_invalidation(sqlite_engine):
+    reflection_cache = get_reflection_cache(sqlite_engine)
+    assert reflection_cache.get_table_names() == ["test_table"]
+
+    pd.DataFrame({"c": [1]}).to_sql(name="other_table", con=sqlite_engine, index=False)
+    assert reflection_cache.get_table_names() == ["test_table"]
+    reflection_cache.invalidate("other_table")
+    assert reflection_cache.get_table_names() == ["other_table", "test_table"]
+
+    pd.DataFrame({"c": [1]}).to_sql(name="test_table", con=sqlite_engine, index=False, if_exists="replace")
+    get_reflection_cache(sqlite_engine, ttl=0)
+    assert [column["name"] for column in reflection_cache.get_columns("test_table")] == ["c"]
+    assert reflection_cache.get_reflection_statistics()["ttl"] == 0
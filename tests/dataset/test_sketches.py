@@ -0,0 +1,60 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from great_expectations.dataset.sketches import CountMinSketch, HyperLogLog
+
+
+@pytest.mark.parametrize("n", [0, 1, 100, 10000, 200000])
+def test_HyperLogLog_count(n):
+    values = np.random.RandomState(n).randint(0, 2 ** 40, n)
+    exact = len(np.unique(values))
+    sketch = HyperLogLog().update(values)
+    assert sketch.count() == pytest.approx(exact, rel=0.03)
+    # Duplicates and nulls do not change the estimate
+    assert sketch.update(pd.Series(values[:n // 2]).append(pd.Series([None]))).count() == sketch.count()
+
+
+def test_HyperLogLog_merge():
+    first = HyperLogLog().update(range(0, 60000))
+    second = HyperLogLog().update(range(30000, 90000))
+    assert first.merge(second).count() == pytest.approx(90000, rel=0.03)
+    assert HyperLogLog().update(["a", "b", "a", None]).count() == 2
+
+    # The same values hash the same whether or not their batch has nulls
+    assert HyperLogLog().update([1, 2, 3]).merge(HyperLogLog().update([1, 2, 3, None])).count() == 3
+    assert HyperLogLog().update(pd.Series([1, 2])).merge(
+        HyperLogLog().update(np.array([2, 3, None], dtype=object))).count() == 3
+
+    with pytest.raises(ValueError):
+        first.merge(HyperLogLog(precision=12))
+    with pytest.raises(ValueError):
+        HyperLogLog(precision=2)
+
+
+def test_CountMinSketch_most_common():
+    values = pd.Series(np.random.RandomState(0).zipf(1.3, 100000))
+    sketch = CountMinSketch(capacity=20)
+    for start in range(0, len(values), 10000):
+        sketch.update(values.iloc[start:start + 10000])
+
+    value_counts = values.value_counts()
+    most_common = sketch.most_common(5)
+    assert [value for value, count in most_common] == list(value_counts.index[:5])
+    for value, count in most_common:
+        # Estimates never fall below the true count
+        assert value_counts[value] <= count <= value_counts[value] + 2 * len(values) / sketch.width
+    assert sketch.modes() == [value_counts.index[0]]
+    assert sketch.total == len(values)
+
+
+def test_CountMinSketch_merge():
+    first = CountMinSketch().update(["a", "b", "b", None])
+    second = CountMinSketch().update(["c", "c", "a", "c"])
+    assert first.merge(second).most_common() == [("c", 3), ("a", 2), ("b", 2)]
+    assert first.modes() == ["c"]
+    assert CountMinSketch().modes() == []
+    assert CountMinSketch().update([1, 2, 2]).merge(CountMinSketch().update([2, None])).most_common(1) == [(2, 3)]
+
+    with pytest.raises(ValueError):
+        first.merge(CountMinSketch(width=1024))
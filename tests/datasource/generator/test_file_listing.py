@@ -0,0 +1,121 @@
+import glob
+import json
+import os
+import time
+
+try:
+    from unittest import mock
+except ImportError:
+    import mock
+
+from great_expectations.datasource.generator import GlobReaderGenerator
+from great_expectations.datasource.generator.file_listing import DirectoryListingCache, PartitionIndex
+
+
+def touch(path, mtime=None):
+    directory = os.path.dirname(path)
+    if not os.path.isdir(directory):
+        os.makedirs(directory)
+    with open(path, "w") as outfile:
+        outfile.write("a,b\n1,2\n")
+    if mtime is not None:
+        os.utime(path, (mtime, mtime))
+
+
+def age_directories(base_directory, seconds=60):
+    """Move the modification times of the directories back, as if they had been written a while ago."""
+    mtime = time.time() - seconds
+    for directory, _, _ in os.walk(base_directory):
+        os.utime(directory, (mtime, mtime))
+
+
+def test_directory_listing_cache_glob_matches_glob(tmp_path_factory):
+    base_directory = str(tmp_path_factory.mktemp("test_directory_listing_cache_glob_matches_glob"))
+    for path in ["2019/01/a.csv", "2019/01/b.txt", "2019/02/c.csv", "2019/02/.hidden.csv", "2020/01/d.csv",
+                 "top.csv"]:
+        touch(os.path.join(base_directory, path))
+    age_directories(base_directory)
+
+    listing_cache = DirectoryListingCache()
+    for pattern in ["*", "*.csv", "*/*/*.csv", "2019/*/*", "20*/0[12]/*.csv", "2019/01/a.csv", "missing/*"]:
+        pathname = os.path.join(base_directory, pattern)
+        assert listing_cache.glob(pathname, max_workers=4)[0] == sorted(glob.glob(pathname))
+
+
+def test_directory_listing_cache_reuses_listings_until_modified(tmp_path_factory):
+    base_directory = str(tmp_path_factory.mktemp("test_directory_listing_cache_reuses_listings"))
+    touch(os.path.join(base_directory, "a.csv"))
+    listing_cache = DirectoryListingCache()
+
+    # The directory was just modified, so its listing could still change within the same second
+    assert listing_cache.list_directory(base_directory) == [("a.csv", False)]
+    assert listing_cache.get_listing_statistics()["entries"] == 0
+
+    age_directories(base_directory)
+    listing_cache.list_directory(base_directory)
+    assert listing_cache.list_directory(base_directory) == [("a.csv", False)]
+    assert listing_cache.get_listing_statistics() == {"hits": 1, "misses": 2, "entries": 1}
+
+    touch(os.path.join(base_directory, "b.csv"))
+    assert sorted(listing_cache.list_directory(base_directory)) == [("a.csv", False), ("b.csv", False)]
+
+
+def test_glob_reader_generator_partition_index(tmp_path_factory):
+    base_directory = str(tmp_path_factory.mktemp("test_glob_reader_generator_partition_index"))
+    for day in ["20190101", "20190102"]:
+        touch(os.path.join(base_directory, "logs", day + "_log.csv"))
+    age_directories(base_directory)
+    index_path = os.path.join(base_directory, "index", "partition_index.json")
+
+    def get_generator():
+        return GlobReaderGenerator("test_generator", base_directory=base_directory, partition_index=index_path,
+                                   asset_globs={
+                                       "logs": {
+                                           "glob": "logs/*.csv",
+                                           "partition_regex": r".*/(\d{8})_log\.csv",
+                                       }
+                                   })
+
+    assert get_generator().get_available_partition_ids("logs") == ["20190101", "20190102"]
+    assert os.path.isfile(index_path)
+
+    # A new generator, such as one in another process, uses the index without listing the directories
+    with mock.patch.object(DirectoryListingCache, "_list_directory") as list_directory:
+        generator = get_generator()
+        assert generator.get_available_partition_ids("logs") == ["20190101", "20190102"]
+        assert generator.build_batch_kwargs_from_partition_id("logs", "20190102")["path"] == \
+            os.path.join(base_directory, "logs", "20190102_log.csv")
+        assert not list_directory.called
+
+    touch(os.path.join(base_directory, "logs", "20190103_log.csv"))
+    assert get_generator().get_available_partition_ids("logs") == ["20190101", "20190102", "20190103"]
+
+
+def test_partition_index_reads_its_file_again_only_once_modified(tmp_path_factory):
+    base_directory = str(tmp_path_factory.mktemp("test_partition_index_reads_its_file_again"))
+    touch(os.path.join(base_directory, "logs", "a.csv"))
+    age_directories(base_directory)
+    listing_cache = DirectoryListingCache()
+    paths, directory_mtimes = listing_cache.glob(os.path.join(base_directory, "logs", "*.csv"))
+    index_path = os.path.join(base_directory, "partition_index.json")
+    PartitionIndex(index_path).set_partitions("logs", [["a", paths[0]]], directory_mtimes)
+    mtime = time.time() - 60
+    os.utime(index_path, (mtime, mtime))
+
+    partition_index = PartitionIndex(index_path)
+    with mock.patch("json.load", wraps=json.load) as load:
+        assert partition_index.get_partitions("logs", listing_cache) == [["a", paths[0]]]
+        partitions = partition_index.get_partitions("logs", listing_cache)
+        assert load.call_count == 1
+
+        # Changes made by callers do not reach the index kept in memory
+        partitions.append(["b", "b.csv"])
+        assert partition_index.get_partitions("logs", listing_cache) == [["a", paths[0]]]
+
+        # Another process replaced the file
+        PartitionIndex(index_path).set_partitions("other", [], {})
+        os.utime(index_path, (mtime + 1, mtime + 1))
+        load.reset_mock()
+        assert partition_index.get_partitions("logs", listing_cache) == [["a", paths[0]]]
+        assert partition_index.get_partitions("other", listing_cache) == []
+        assert load.call_count == 1
@@ -25,7 +25,7 @@ def mocked_glob_kwargs():
     }
     glob_generator = GlobReaderGenerator("test_generator", asset_globs=test_asset_globs)
 
-    with mock.patch("glob.glob") as mock_glob:
+    with mock.patch("great_expectations.datasource.generator.file_listing.DirectoryListingCache.glob") as mock_glob:
         mock_glob_match = [
             "20190101__my_data.csv",
             "20190102__my_data.csv",
@@ -33,7 +33,7 @@ def mocked_glob_kwargs():
             "20190104__my_data.csv",
             "20190105__my_data.csv"
         ]
-        mock_glob.return_value = mock_glob_match
+        mock_glob.return_value = (mock_glob_match, {})
         kwargs = [kwargs for kwargs in glob_generator.get_iterator("test_asset")]
     return kwargs
 
@@ -90,7 +90,7 @@ def test_glob_reader_generator_partitioning():
         }
                                          )
 
-    with mock.patch("glob.glob") as mock_glob, mock.patch("os.path.isdir") as is_dir:
+    with mock.patch("great_expectations.datasource.generator.file_listing.DirectoryListingCache.glob") as mock_glob, mock.patch("os.path.isdir") as is_dir:
         mock_glob_match = [
             "/data/project/asset1/20190101__my_data.csv",
             "/data/project/asset1/20190102__my_data.csv",
@@ -106,13 +106,13 @@ def test_glob_reader_generator_partitioning():
             "/data/project/no_partition_asset1/this_is_another_batch_of_data.csv",
             "/data/project/my_data.csv"
         ]
-        mock_glob.return_value = mock_glob_match
+        mock_glob.return_value = (mock_glob_match, {})
         is_dir.return_value = True
         names = glob_generator.get_available_data_asset_names()
         # Use set in test to avoid order issues
         assert set(names) == {"asset1", "asset2", "asset3", "no_partition_asset1", "no_partition_asset2"}
 
-    with mock.patch("glob.glob") as mock_glob, mock.patch("os.path.isdir") as is_dir:
+    with mock.patch("great_expectations.datasource.generator.file_listing.DirectoryListingCache.glob") as mock_glob, mock.patch("os.path.isdir") as is_dir:
         mock_glob_match = [
                 "/data/project/asset1/20190101__my_data.csv",
                 "/data/project/asset1/20190102__my_data.csv",
@@ -120,7 +120,7 @@ def test_glob_reader_generator_partitioning():
                 "/data/project/asset1/20190104__my_data.csv",
                 "/data/project/asset1/20190105__my_data.csv"
             ]
-        mock_glob.return_value = mock_glob_match
+        mock_glob.return_value = (mock_glob_match, {})
         is_dir.return_value = True
         partitions = glob_generator.get_available_partition_ids("asset1")
         # Use set in test to avoid order issues
@@ -140,12 +140,12 @@ def test_glob_reader_generator_partitioning():
         assert batch_kwargs["reader_method"] == "csv"
         assert len(batch_kwargs) == 4
 
-    with mock.patch("glob.glob") as mock_glob, mock.patch("os.path.isdir") as is_dir:
+    with mock.patch("great_expectations.datasource.generator.file_listing.DirectoryListingCache.glob") as mock_glob, mock.patch("os.path.isdir") as is_dir:
         mock_glob_match = [
             "/data/project/no_partition_asset1/this_is_a_batch_of_data.csv",
             "/data/project/no_partition_asset1/this_is_another_batch_of_data.csv"
             ]
-        mock_glob.return_value = mock_glob_match
+        mock_glob.return_value = (mock_glob_match, {})
         is_dir.return_value = True
         partitions = glob_generator.get_available_partition_ids("no_partition_asset1")
         # Use set in test to avoid order issues
@@ -193,9 +193,9 @@ def test_glob_reader_generator_partitioning():
         assert batch_kwargs["limit"] == 10
         assert len(batch_kwargs) == 5
 
-    with mock.patch("glob.glob") as mock_glob, mock.patch("os.path.isdir") as is_dir:
+    with mock.patch("great_expectations.datasource.generator.file_listing.DirectoryListingCache.glob") as mock_glob, mock.patch("os.path.isdir") as is_dir:
         mock_glob_match = ["/data/project/asset3/mydata.parquet"]    
-        mock_glob.return_value = mock_glob_match
+        mock_glob.return_value = (mock_glob_match, {})
         is_dir.return_value = True
         batch_kwargs = glob_generator.yield_batch_kwargs("asset3")
         assert batch_kwargs["reader_method"] == "parquet"
@@ -212,7 +212,7 @@ def test_glob_reader_generator_customize_partitioning():
 
     glob_generator = DateutilPartitioningGlobReaderGenerator("test_generator")  # default asset blob is ok
 
-    with mock.patch("glob.glob") as mock_glob:
+    with mock.patch("great_expectations.datasource.generator.file_listing.DirectoryListingCache.glob") as mock_glob:
         mock_glob_match = [
             "20190101__my_data.csv",
             "20190102__my_data.csv",
@@ -220,7 +220,7 @@ def test_glob_reader_generator_customize_partitioning():
             "20190104__my_data.csv",
             "20190105__my_data.csv"
         ]
-        mock_glob.return_value = mock_glob_match
+        mock_glob.return_value = (mock_glob_match, {})
         default_asset_kwargs = [kwargs for kwargs in glob_generator.get_iterator("default")]
 
     partitions = set([kwargs["partition_id"] for kwargs in default_asset_kwargs])
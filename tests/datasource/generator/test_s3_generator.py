@@ -1,11 +1,16 @@
 import pytest
 from moto import mock_s3
 
+try:
+    from unittest import mock
+except ImportError:
+    import mock
+
 import logging
 import pandas as pd
 import boto3
 
-from great_expectations.datasource.generator.s3_generator import S3Generator
+from great_expectations.datasource.generator.s3_generator import S3Generator, derive_partition_prefix
 from great_expectations.exceptions import BatchKwargsError
 
 
@@ -140,3 +145,110 @@ def test_s3_generator_limit(s3_generator):
 def test_s3_generator_reader_method_configuration(s3_generator):
     batch_kwargs_list = [kwargs for kwargs in s3_generator.get_iterator("delta_files", limit=10)]
     assert batch_kwargs_list[0]["reader_method"] == "delta"
+
+
+def test_s3_generator_iterate_batch_kwargs_starts_a_new_listing(s3_generator):
+    keys = ["s3a://test_bucket/other/for/you.csv", "s3a://test_bucket/other/is/you.csv",
+            "s3a://test_bucket/other/to/you.csv"]
+    assert [s3_generator.yield_batch_kwargs("other_empty_delimiter")["s3"] for _ in range(2)] == keys[:2]
+
+    # The listing continued by yield_batch_kwargs is not the one iterate_batch_kwargs starts
+    assert [batch_kwargs["s3"] for batch_kwargs in s3_generator.iterate_batch_kwargs("other_empty_delimiter")] == \
+        keys
+    assert s3_generator.yield_batch_kwargs("other_empty_delimiter")["s3"] == keys[2]
+
+
+@pytest.fixture
+def partitioned_s3_bucket(mock_s3_bucket):
+    bucket = 'test_partitioned_bucket'
+    client = boto3.client('s3', region_name='us-east-1')
+    client.create_bucket(Bucket=bucket)
+    for key in ["events/2019-01-01/part-0.csv", "events/2019-01-02/part-0.csv", "logs/a/20190101.csv",
+                "logs/b/20190102.csv"]:
+        client.put_object(Bucket=bucket, Body=b"c1\n1\n", Key=key)
+    yield bucket
+    for item in client.list_objects_v2(Bucket=bucket)["Contents"]:
+        client.delete_object(Bucket=bucket, Key=item["Key"])
+    client.delete_bucket(Bucket=bucket)
+
+
+def get_partitioned_s3_generator(bucket, partition_manifest=None):
+    return S3Generator("my_partitioned_generator",
+                       datasource=None,
+                       bucket=bucket,
+                       partition_manifest=partition_manifest,
+                       assets={
+                           "events": {
+                               "prefix": "events/",
+                               "delimiter": "",
+                               "partition_regex": r"events/(\d{4}-\d{2}-\d{2})/.*\.csv"
+                           },
+                           "logs": {
+                               "prefix": "logs/",
+                               "delimiter": "",
+                               "partition_regex": r".*/(\d{8})\.csv"
+                           }
+                       })
+
+
+def test_derive_partition_prefix():
+    assert derive_partition_prefix(r"events/(\d{4}-\d{2}-\d{2})/.*\.csv", "2019-01-02") == "events/2019-01-02"
+    assert derive_partition_prefix(r"^data/v1\.2/(?P<day>\d+)\.csv", "5") == "data/v1.2/5"
+    # The partition id does not follow a literal prefix
+    assert derive_partition_prefix(r".*/(\d{8})\.csv", "20190101") is None
+    assert derive_partition_prefix(r"data/\d(\d)", "1") is None
+    assert derive_partition_prefix(r"data/x?(\d)", "1") is None
+    assert derive_partition_prefix(r"data/(?:x)(\d)", "1") is None
+    assert derive_partition_prefix(r"a/(\d)|b/(\d)", "1") is None
+
+
+def test_s3_generator_partition_lookup_lists_partition_prefix(partitioned_s3_bucket):
+    generator = get_partitioned_s3_generator(partitioned_s3_bucket)
+    with mock.patch.object(generator._s3, "list_objects_v2", wraps=generator._s3.list_objects_v2) as list_objects:
+        batch_kwargs = generator.build_batch_kwargs_from_partition_id("events", "2019-01-02")
+        assert batch_kwargs["s3"] == "s3a://test_partitioned_bucket/events/2019-01-02/part-0.csv"
+        assert [call[1]["Prefix"] for call in list_objects.call_args_list] == ["events/2019-01-02"]
+
+        # The partition is now indexed
+        generator.build_batch_kwargs_from_partition_id("events", "2019-01-02")
+        assert list_objects.call_count == 1
+
+    with pytest.raises(BatchKwargsError):
+        generator.build_batch_kwargs_from_partition_id("events", "2019-01-03")
+
+
+def test_s3_generator_partition_manifest_delta_refresh(partitioned_s3_bucket, tmp_path_factory):
+    manifest_path = str(tmp_path_factory.mktemp("test_s3_generator_partition_manifest").joinpath("manifest.json"))
+    generator = get_partitioned_s3_generator(partitioned_s3_bucket, partition_manifest=manifest_path)
+    assert generator.get_available_partition_ids("logs") == ["20190101", "20190102"]
+
+    # A new generator, such as one in another process, finds known partitions without listing the bucket
+    generator = get_partitioned_s3_generator(partitioned_s3_bucket, partition_manifest=manifest_path)
+    with mock.patch.object(generator._s3, "list_objects_v2", wraps=generator._s3.list_objects_v2) as list_objects:
+        assert generator.build_batch_kwargs_from_partition_id("logs", "20190102")["s3"] == \
+            "s3a://test_partitioned_bucket/logs/b/20190102.csv"
+        assert not list_objects.called
+
+        # Only the keys after the last indexed one are listed to find a new partition
+        generator._s3.put_object(Bucket=partitioned_s3_bucket, Body=b"c1\n1\n", Key="logs/c/20190103.csv")
+        assert generator.build_batch_kwargs_from_partition_id("logs", "20190103")["s3"] == \
+            "s3a://test_partitioned_bucket/logs/c/20190103.csv"
+        assert [call[1]["StartAfter"] for call in list_objects.call_args_list] == ["logs/b/20190102.csv"]
+
+    # A key sorting before the last indexed one is found by listing the whole asset again
+    generator._s3.put_object(Bucket=partitioned_s3_bucket, Body=b"c1\n1\n", Key="logs/a/20181231.csv")
+    assert generator.build_batch_kwargs_from_partition_id("logs", "20181231")["s3"] == \
+        "s3a://test_partitioned_bucket/logs/a/20181231.csv"
+    assert get_partitioned_s3_generator(partitioned_s3_bucket, partition_manifest=manifest_path)\
+        .get_available_partition_ids("logs") == ["20181231", "20190101", "20190102", "20190103"]
+
+
+def test_s3_generator_available_partition_ids_lists_whole_asset(partitioned_s3_bucket):
+    generator = get_partitioned_s3_generator(partitioned_s3_bucket)
+    assert generator.get_available_partition_ids("logs") == ["20190101", "20190102"]
+
+    # A key sorting before the last one listed is still found by a reused generator
+    generator._s3.put_object(Bucket=partitioned_s3_bucket, Body=b"c1\n1\n", Key="logs/a/20181230.csv")
+    with mock.patch.object(generator._s3, "list_objects_v2", wraps=generator._s3.list_objects_v2) as list_objects:
+        assert generator.get_available_partition_ids("logs") == ["20181230", "20190101", "20190102"]
+        assert ["StartAfter" in call[1] for call in list_objects.call_args_list] == [False]
@@ -2,22 +2,38 @@
 
 import pytest
 
+import gzip
+import io
+import math
 import os
+import time
 from ruamel.yaml import YAML
 
 import pandas as pd
 from six import PY3
 import shutil
 
+try:
+    from unittest import mock
+except ImportError:
+    import mock
+
+try:
+    import botocore.client
+except ImportError:
+    botocore = None
+
 
 from great_expectations.exceptions import BatchKwargsError
 from great_expectations.datasource import PandasDatasource
 from great_expectations.datasource.types.batch_kwargs import (
     PathBatchKwargs,
+    S3BatchKwargs,
     BatchId,
     BatchFingerprint
 )
 from great_expectations.dataset import PandasDataset
+from great_expectations.data_asset.util import get_empty_expectation_suite
 
 yaml = YAML(typ='safe')
 
@@ -232,3 +248,258 @@ def test_read_limit(test_folder_connection_path):
     assert isinstance(dataset.batch_kwargs, PathBatchKwargs)
     assert isinstance(dataset.batch_id, BatchId)
     assert isinstance(dataset.batch_fingerprint, BatchFingerprint)
+
+
+def test_read_sample(tmp_path_factory):
+    path = str(tmp_path_factory.mktemp("test_read_sample"))
+    df = pd.DataFrame({"col_1": range(1000), "col_2": ["a", "b"] * 500})
+    df.to_csv(os.path.join(path, "test.csv"), index=False)
+    datasource = PandasDatasource('PandasCSV', base_directory=path)
+
+    def get_sample(file_name, **sampling):
+        return datasource.get_data_asset(
+            file_name.split(".")[0],
+            generator_name="default",
+            batch_kwargs=PathBatchKwargs({"path": os.path.join(path, file_name), "sampling": sampling})
+        )
+
+    sample = get_sample("test.csv", fraction=0.1, seed=42)
+    assert 50 < len(sample) < 150
+    assert list(sample.columns) == ["col_1", "col_2"]
+    # Rows keep their order, and the same seed takes the same sample
+    assert sample["col_1"].is_monotonic_increasing
+    assert sample["col_1"].tolist() == get_sample("test.csv", fraction=0.1, seed=42)["col_1"].tolist()
+    assert sample["col_1"].tolist() != get_sample("test.csv", fraction=0.1, seed=43)["col_1"].tolist()
+    assert sample.batch_kwargs["sampling"] == {"fraction": 0.1, "seed": 42}
+    assert len(get_sample("test.csv", fraction=1)) == 1000
+
+    with pytest.raises(BatchKwargsError):
+        get_sample("test.csv", fraction=2)
+    with pytest.raises(BatchKwargsError):
+        get_sample("test.csv", fraction=0.1, seed="42")
+
+
+def test_read_parquet_sample_by_row_groups(tmp_path_factory):
+    pyarrow_parquet = pytest.importorskip("pyarrow.parquet")
+    import pyarrow
+    path = str(tmp_path_factory.mktemp("test_read_parquet_sample"))
+    df = pd.DataFrame({"col_1": range(1000)})
+    pyarrow_parquet.write_table(pyarrow.Table.from_pandas(df, preserve_index=False),
+                                os.path.join(path, "test.parquet"), row_group_size=100)
+    datasource = PandasDatasource('PandasParquet', base_directory=path)
+
+    sample = datasource.get_data_asset("test", generator_name="default", batch_kwargs=PathBatchKwargs({
+        "path": os.path.join(path, "test.parquet"),
+        "sampling": {"fraction": 0.2, "seed": 1}
+    }))
+    # Two whole row groups of 100 rows
+    assert len(sample) == 200
+    assert set(sample["col_1"] // 100) == set([value // 100 for value in sample["col_1"][::100]])
+    assert len(set(sample["col_1"] // 100)) == 2
+
+    # A fraction too small to sample a single row group samples rows
+    sample = datasource.get_data_asset("test", generator_name="default", batch_kwargs=PathBatchKwargs({
+        "path": os.path.join(path, "test.parquet"),
+        "sampling": {"fraction": 0.01, "seed": 1}
+    }))
+    assert len(sample) == 10
+
+
+def test_pandas_datasource_metric_cache(test_folder_connection_path, tmp_path_factory):
+    metric_cache_path = os.path.join(str(tmp_path_factory.mktemp("test_pandas_datasource_metric_cache")),
+                                     "metrics.db")
+    datasource = PandasDatasource('PandasCSV', base_directory=test_folder_connection_path, metric_cache={
+        "class_name": "SqliteMetricCache",
+        "filepath": metric_cache_path,
+    })
+    assert os.path.isfile(metric_cache_path)
+
+    dataset = datasource.get_data_asset("test", generator_name="default")
+    assert dataset.expect_column_mean_to_be_between("col_1", 3, 3)["success"]
+    statistics = dataset._metric_cache.get_cache_statistics()
+    assert statistics["entries"] > 0 and statistics["hits"] == 0
+
+    # Validating the unchanged file again, from another batch, reuses the metrics
+    dataset = datasource.get_data_asset("test", generator_name="default")
+    assert dataset.expect_column_mean_to_be_between("col_1", 3, 3)["success"]
+    assert dataset._metric_cache.get_cache_statistics()["hits"] == statistics["misses"]
+
+
+def test_pandas_datasource_file_fingerprint(tmp_path_factory):
+    path = str(tmp_path_factory.mktemp("test_pandas_datasource_file_fingerprint"))
+    file_path = os.path.join(path, "test.csv")
+    pd.DataFrame({"col_1": range(10)}).to_csv(file_path, index=False)
+    datasource = PandasDatasource('PandasCSV', base_directory=path)
+
+    def get_batch(**batch_kwargs):
+        batch_kwargs.update({"path": file_path})
+        return datasource.get_data_asset("test", generator_name="default", batch_kwargs=PathBatchKwargs(batch_kwargs))
+
+    fingerprint = get_batch().batch_id["fingerprint"]
+    assert get_batch().batch_id["fingerprint"] == fingerprint
+    assert len(datasource._fingerprint_cache) == 1
+    # Different options read different rows
+    assert get_batch(limit=5).batch_id["fingerprint"] != fingerprint
+    assert get_batch(sampling={"fraction": 0.5, "seed": 1}).batch_id["fingerprint"] != fingerprint
+    # Unseeded samples fall back to hashing the rows
+    sample = get_batch(sampling={"fraction": 0.5})
+    assert sample.batch_id["fingerprint"] == PandasDatasource._hash_rows(sample)
+
+    # Changing the file changes its identity and fingerprint
+    pd.DataFrame({"col_1": range(20)}).to_csv(file_path, index=False)
+    os.utime(file_path, (0, 0))
+    assert get_batch().batch_id["fingerprint"] != fingerprint
+    assert len(datasource._fingerprint_cache) == 2
+
+
+def test_pandas_datasource_row_fingerprint(test_folder_connection_path):
+    datasource = PandasDatasource('PandasCSV', base_directory=test_folder_connection_path, row_fingerprint=True)
+    dataset = datasource.get_data_asset("test", generator_name="default")
+    assert dataset.batch_id["row_fingerprint"] == PandasDatasource._hash_rows(dataset)
+
+    # Loading the unchanged file again reuses the row fingerprint
+    with mock.patch.object(PandasDatasource, "_hash_rows") as hash_rows:
+        dataset = datasource.get_data_asset("test", generator_name="default")
+        assert hash_rows.call_count == 0
+    assert dataset.batch_id["row_fingerprint"] == PandasDatasource._hash_rows(dataset)
+
+
+def test_pandas_datasource_prune_columns(tmp_path_factory):
+    path = str(tmp_path_factory.mktemp("test_pandas_datasource_prune_columns"))
+    df = pd.DataFrame({"a": [1, 2, 3], "b": ["x", "y", "x"], "c": [1.0, 2.0, 3.0], "d": ["p", "q", "r"]})
+    df.to_csv(os.path.join(path, "test.csv"), index=False)
+    expectation_suite = get_empty_expectation_suite("test")
+    expectation_suite["expectations"] = [
+        {"expectation_type": "expect_column_values_to_not_be_null", "kwargs": {"column": "a"}},
+        {"expectation_type": "expect_column_values_to_be_in_set", "kwargs": {"column": "b", "value_set": ["x", "y"]}},
+        {"expectation_type": "expect_column_to_exist", "kwargs": {"column": "missing"}},
+    ]
+    datasource = PandasDatasource('PandasCSV', base_directory=path, prune_columns=True)
+
+    dataset = datasource.get_data_asset("test", generator_name="default", expectation_suite=expectation_suite)
+    assert list(dataset.columns) == ["a", "b"]
+    assert len(dataset) == 3
+    assert dataset.validate()["statistics"]["successful_expectations"] == 2
+    fingerprint = dataset.batch_id["fingerprint"]
+
+    # batch_kwargs can turn pruning off
+    batch_kwargs = datasource.get_generator("default").yield_batch_kwargs("test")
+    batch_kwargs["prune_columns"] = False
+    dataset = datasource.get_data_asset("test", expectation_suite=expectation_suite, batch_kwargs=batch_kwargs)
+    assert list(dataset.columns) == ["a", "b", "c", "d"]
+    assert dataset.batch_id["fingerprint"] != fingerprint
+
+    # Expectations about all the columns of the table need every column
+    expectation_suite["expectations"].append({
+        "expectation_type": "expect_table_column_count_to_equal",
+        "kwargs": {"value": 4}
+    })
+    dataset = datasource.get_data_asset("test", generator_name="default", expectation_suite=expectation_suite)
+    assert list(dataset.columns) == ["a", "b", "c", "d"]
+
+
+def test_pandas_datasource_prune_parquet_columns(tmp_path_factory):
+    pytest.importorskip("pyarrow")
+    path = str(tmp_path_factory.mktemp("test_pandas_datasource_prune_parquet_columns"))
+    df = pd.DataFrame({"a": [1, 2, 3], "b": ["x", "y", "x"], "c": [1.0, 2.0, 3.0], "d": ["p", "q", "r"]})
+    df.to_parquet(os.path.join(path, "test.parquet"))
+    expectation_suite = get_empty_expectation_suite("test")
+    expectation_suite["expectations"] = [
+        {"expectation_type": "expect_column_pair_values_to_be_equal", "kwargs": {"column_A": "a", "column_B": "d"}},
+    ]
+    datasource = PandasDatasource('PandasParquet', base_directory=path, prune_columns=True)
+
+    batch_kwargs = PathBatchKwargs({"path": os.path.join(path, "test.parquet")})
+    dataset = datasource.get_data_asset("test", expectation_suite=expectation_suite, batch_kwargs=batch_kwargs)
+    assert list(dataset.columns) == ["a", "d"]
+    assert dataset["d"].dtype == object
+    fingerprint = dataset.batch_id["fingerprint"]
+
+    batch_kwargs["strings_to_categorical"] = True
+    dataset = datasource.get_data_asset("test", expectation_suite=expectation_suite, batch_kwargs=batch_kwargs)
+    assert list(dataset.columns) == ["a", "d"]
+    assert str(dataset["d"].dtype) == "category"
+    assert dataset["d"].tolist() == ["p", "q", "r"]
+    # Categoricals can have different metrics, such as value counts of unobserved categories
+    assert dataset.batch_id["fingerprint"] != fingerprint
+
+
+@pytest.fixture
+def s3_bucket():
+    moto = pytest.importorskip("moto")
+    boto3 = pytest.importorskip("boto3")
+    with moto.mock_s3():
+        client = boto3.client("s3", region_name="us-east-1")
+        client.create_bucket(Bucket="test_pandas_bucket")
+        yield client
+
+
+def gzip_compress(data):
+    buffer = io.BytesIO()
+    with gzip.GzipFile(fileobj=buffer, mode="wb") as outfile:
+        outfile.write(data)
+    return buffer.getvalue()
+
+
+def get_s3_batch(datasource, s3_url, **batch_kwargs):
+    batch_kwargs.update({"s3": s3_url})
+    return datasource.get_data_asset("test", batch_kwargs=S3BatchKwargs(batch_kwargs))
+
+
+def test_pandas_datasource_s3_streaming_reads(s3_bucket):
+    df = pd.DataFrame({"col_1": range(10), "col_2": [u"é", "b"] * 5})
+    csv = df.to_csv(index=False).encode("utf-8")
+    s3_bucket.put_object(Bucket="test_pandas_bucket", Key="test.csv", Body=csv)
+    s3_bucket.put_object(Bucket="test_pandas_bucket", Key="test.csv.gz", Body=gzip_compress(csv))
+    s3_bucket.put_object(Bucket="test_pandas_bucket", Key="encoded/test.csv", Body=gzip_compress(csv),
+                         ContentEncoding="gzip")
+    datasource = PandasDatasource("PandasS3", boto3_options={"region_name": "us-east-1"})
+
+    for key in ["test.csv", "test.csv.gz", "encoded/test.csv"]:
+        batch = get_s3_batch(datasource, "s3a://test_pandas_bucket/" + key)
+        assert df.equals(batch)
+    # The python parser, used to sniff the separator, reads a text stream
+    batch = get_s3_batch(datasource, "s3a://test_pandas_bucket/test.csv.gz",
+                         reader_options={"sep": None, "engine": "python"})
+    assert df.equals(batch)
+    assert len(get_s3_batch(datasource, "s3a://test_pandas_bucket/test.csv", limit=3)) == 3
+
+
+def test_pandas_datasource_s3_parquet_ranged_download(s3_bucket, tmp_path_factory):
+    pytest.importorskip("pyarrow")
+    path = os.path.join(str(tmp_path_factory.mktemp("test_pandas_datasource_s3_parquet")), "test.parquet")
+    df = pd.DataFrame({"col_1": range(1000), "col_2": ["a", "b"] * 500})
+    df.to_parquet(path)
+    with open(path, "rb") as infile:
+        s3_bucket.put_object(Bucket="test_pandas_bucket", Key="test.parquet", Body=infile.read())
+    datasource = PandasDatasource("PandasS3", boto3_options={"region_name": "us-east-1"}, s3_range_size=1024,
+                                  s3_max_workers=4)
+
+    with mock.patch("botocore.client.BaseClient._make_api_call", autospec=True,
+                    side_effect=botocore.client.BaseClient._make_api_call) as make_api_call:
+        batch = get_s3_batch(datasource, "s3a://test_pandas_bucket/test.parquet")
+    assert df.equals(batch)
+    ranges = [call[0][2]["Range"] for call in make_api_call.call_args_list if call[0][1] == "GetObject"]
+    assert len(ranges) == int(math.ceil(os.path.getsize(path) / 1024.))
+    assert ranges[0] == "bytes=0-1023"
+
+
+def test_pandas_datasource_s3_cache_directory(s3_bucket, tmp_path_factory):
+    cache_directory = str(tmp_path_factory.mktemp("test_pandas_datasource_s3_cache_directory"))
+    s3_bucket.put_object(Bucket="test_pandas_bucket", Key="data/test.csv", Body=b"col_1\n1\n2\n")
+    datasource = PandasDatasource("PandasS3", boto3_options={"region_name": "us-east-1"},
+                                  s3_cache_directory=cache_directory)
+
+    assert get_s3_batch(datasource, "s3a://test_pandas_bucket/data/test.csv")["col_1"].tolist() == [1, 2]
+    fingerprint = get_s3_batch(datasource, "s3a://test_pandas_bucket/data/test.csv").batch_id["fingerprint"]
+    assert datasource._s3_object_cache.get_cache_statistics() == {"hits": 1, "misses": 1}
+
+    # A new version of the object has a new ETag, so it is downloaded again and replaces the old one
+    s3_bucket.put_object(Bucket="test_pandas_bucket", Key="data/test.csv", Body=b"col_1\n3\n")
+    batch = get_s3_batch(datasource, "s3a://test_pandas_bucket/data/test.csv")
+    assert batch["col_1"].tolist() == [3]
+    assert batch.batch_id["fingerprint"] != fingerprint
+    assert datasource._s3_object_cache.get_cache_statistics() == {"hits": 1, "misses": 2}
+    object_directories = os.listdir(cache_directory)
+    assert len(object_directories) == 1
+    assert len(os.listdir(os.path.join(cache_directory, object_directories[0]))) == 1
@@ -7,6 +7,7 @@ import pandas as pd
 
 from great_expectations.dataset import SqlAlchemyDataset
 from great_expectations.datasource import SqlAlchemyDatasource
+from great_expectations.exceptions import BatchKwargsError
 
 yaml = YAML(typ='safe')
 
@@ -166,3 +167,151 @@ def test_sqlalchemy_source_limit(sqlitedb_engine):
     assert limited_dataset._table.name.startswith("ge_tmp_")  # we have generated a temporary table
     assert len(limited_dataset.head(10)) == 1  # and it is only one row long
     assert limited_dataset.head(10)['col_1'][0] == 3  # offset should have been applied
+
+
+def test_sqlalchemy_source_sampling(sqlitedb_engine):
+    df = pd.DataFrame({'col_1': range(100)})
+    df.to_sql('table_to_sample', con=sqlitedb_engine, index=False)
+    datasource = SqlAlchemyDatasource('SqlAlchemy', engine=sqlitedb_engine)
+
+    sampled_dataset = datasource.get_data_asset("table_to_sample", "default", sampling={"fraction": 0.25})
+    assert isinstance(sampled_dataset, SqlAlchemyDataset)
+    assert sampled_dataset._table.name.startswith("ge_tmp_")
+    assert sampled_dataset.get_row_count() == 25
+    assert len(set(sampled_dataset.head(25)['col_1'])) == 25
+
+    sampled_dataset = datasource.get_data_asset("table_to_sample", "default", sampling={"fraction": 0.25}, limit=10)
+    assert sampled_dataset.get_row_count() == 10
+
+
+def test_sqlalchemy_source_where(sqlitedb_engine):
+    df = pd.DataFrame({
+        'day': ['2020-01-01'] * 3 + ['2020-01-02'] * 2,
+        'col_1': [1, 2, 3, 4, 5]
+    })
+    df.to_sql('table_to_filter', con=sqlitedb_engine, index=False)
+    datasource = SqlAlchemyDatasource('SqlAlchemy', engine=sqlitedb_engine)
+
+    def get_batch(**batch_kwargs):
+        batch_kwargs["table"] = "table_to_filter"
+        return datasource.get_data_asset("table_to_filter", batch_kwargs=batch_kwargs)
+
+    dataset = get_batch(where={"day": "2020-01-02"})
+    # The filter is part of every query of the dataset rather than materialized in a temporary table
+    assert "WHERE day = " in str(dataset._table.compile(sqlitedb_engine))
+    assert not dataset._materialize
+    assert dataset.get_row_count() == 2
+    assert dataset.expect_column_values_to_be_between("col_1", 4, 5)["success"]
+    # The column types are reflected from the table
+    assert dataset.expect_column_values_to_be_of_type("day", "TEXT")["success"]
+    assert dataset.expect_column_values_to_be_of_type("col_1", "INTEGER")["result"]["observed_value"] == "BIGINT"
+
+    assert get_batch(where={"day": "2020-01-01", "col_1": {">": 1, "<=": 3}}).get_row_count() == 2
+    assert get_batch(where={"col_1": [1, 5]}).get_row_count() == 2
+    assert get_batch(where={"col_1": {"in": [1, 5], "!=": 5}}).get_row_count() == 1
+    # A limit without an order is materialized, so that every query sees the same rows
+    assert get_batch(where={"day": "2020-01-01"}, limit=2)._materialize
+    assert get_batch(where={"day": "2020-01-01"}, materialize=True)._materialize
+
+    with pytest.raises(BatchKwargsError):
+        get_batch(where={"col_1": {"like": 1}})
+    with pytest.raises(BatchKwargsError):
+        get_batch(where=["col_1"])
+
+
+def test_sqlalchemy_source_hash_sampling(sqlitedb_engine):
+    df = pd.DataFrame({'col_1': range(1000)})
+    df.to_sql('table_to_sample', con=sqlitedb_engine, index=False)
+    datasource = SqlAlchemyDatasource('SqlAlchemy', engine=sqlitedb_engine)
+
+    def get_sample(**sampling):
+        return datasource.get_data_asset("table_to_sample", batch_kwargs={
+            "table": "table_to_sample",
+            "sampling": sampling
+        })
+
+    sample = get_sample(fraction=0.1, method="hash", column="col_1")
+    assert not sample._materialize
+    assert sample.expect_column_values_to_be_of_type("col_1", "INTEGER")["result"]["observed_value"] == "BIGINT"
+    assert 50 < sample.get_row_count() < 150
+    # The same rows are sampled every time
+    assert sample.get_column_sum("col_1") == get_sample(fraction=0.1, method="hash", column="col_1")\
+        .get_column_sum("col_1")
+
+    with pytest.raises(BatchKwargsError):
+        get_sample(fraction=0.1, method="hash")
+    with pytest.raises(BatchKwargsError):
+        get_sample(fraction=0.1, method="bernoulli")
+    with pytest.raises(BatchKwargsError):
+        get_sample(fraction=0.1, method="unknown")
+
+
+def test_sqlalchemy_source_partition_column(sqlitedb_engine):
+    df = pd.DataFrame({
+        'day': ['2020-01-01'] * 3 + ['2020-01-02'] * 2,
+        'col_1': [1, 2, 3, 4, 5]
+    })
+    df.to_sql('events', con=sqlitedb_engine, index=False)
+    datasource = SqlAlchemyDatasource('SqlAlchemy', engine=sqlitedb_engine, generators={
+        "default": {
+            "class_name": "TableGenerator",
+            "assets": {
+                "events": {
+                    "table": "events",
+                    "partition_column": "day"
+                }
+            }
+        }
+    })
+
+    batch_kwargs = datasource.build_batch_kwargs("events", partition_id="2020-01-02")
+    assert batch_kwargs["where"] == {"day": "2020-01-02"}
+    dataset = datasource.get_data_asset("events", batch_kwargs=batch_kwargs)
+    assert dataset.get_row_count() == 2
+
+
+def test_sqlalchemy_source_incremental_validation(sqlitedb_engine, tmp_path_factory):
+    df = pd.DataFrame({'id': [1, 2, 3], 'col_1': [1, 2, 3]})
+    df.to_sql('table_to_validate_incrementally', con=sqlitedb_engine, index=False)
+    state_path = str(tmp_path_factory.mktemp("test_sqlalchemy_source_incremental_validation").joinpath("state.db"))
+    datasource = SqlAlchemyDatasource('SqlAlchemy', engine=sqlitedb_engine, incremental_state_store={
+        "class_name": "IncrementalStateStore",
+        "filepath": state_path
+    })
+    batch_kwargs = {"table": "table_to_validate_incrementally", "watermark_column": "id"}
+
+    dataset = datasource.get_data_asset("table_to_validate_incrementally", batch_kwargs=batch_kwargs)
+    dataset.expect_column_sum_to_be_between("col_1", 0, 100)
+    expectation_suite = dataset.get_expectation_suite()
+    assert dataset.validate(expectation_suite)["meta"]["incremental"]["watermark"] == 3
+
+    pd.DataFrame({'id': [4], 'col_1': [4]}).to_sql('table_to_validate_incrementally', con=sqlitedb_engine,
+                                                   index=False, if_exists="append")
+    dataset = datasource.get_data_asset("table_to_validate_incrementally", batch_kwargs=batch_kwargs)
+    results = dataset.validate(expectation_suite)
+    assert results["meta"]["incremental"]["watermark"] == 4
+    assert results["results"][0]["result"]["observed_value"] == 10
+
+    with pytest.raises(BatchKwargsError):
+        datasource.get_data_asset("table_to_validate_incrementally", batch_kwargs={
+            "table": "table_to_validate_incrementally", "watermark_column": "id", "limit": 2
+        })
+
+
+def test_sqlalchemy_datasource_reflection_cache(sqlitedb_engine):
+    pd.DataFrame({"col_1": [1, 2, 3]}).to_sql(name="table_1", con=sqlitedb_engine, index=False)
+    datasource = SqlAlchemyDatasource('SqlAlchemy', engine=sqlitedb_engine, reflection_cache_ttl=600)
+    generator = datasource.get_generator()
+    assert generator.inspector.get_reflection_statistics()["ttl"] == 600
+
+    for _ in range(3):
+        batch_kwargs = generator.yield_batch_kwargs("table_1")
+        datasource.get_data_asset("table_1", batch_kwargs=batch_kwargs)
+    statistics = datasource.get_reflection_statistics()
+    # The default schema, tables, views and columns were each reflected once
+    assert statistics["misses"] == 4
+    assert statistics["hits"] > 0
+
+    datasource.invalidate_reflection_cache("table_1")
+    datasource.get_data_asset("table_1", batch_kwargs=generator.yield_batch_kwargs("table_1"))
+    assert datasource.get_reflection_statistics()["misses"] == 7
@@ -4,6 +4,12 @@ from great_expectations.profile.basic_dataset_profiler import BasicDatasetProfil
 
 from great_expectations.profile.multi_batch_validation_meta_analysis import MultiBatchValidationMetaAnalysis
 from great_expectations.datasource.types import BatchKwargs
+from great_expectations.data_context.store import ParquetValidationMetricsStore
+from great_expectations.data_context.types import (
+    DataAssetIdentifier,
+    ExpectationSuiteIdentifier,
+    ValidationResultIdentifier,
+)
 from great_expectations.data_context.types.metrics import (
     NamespaceAwareValidationMetric,
     MultiBatchNamespaceAwareValidationMetric,
@@ -53,4 +59,55 @@ def test_get_metrics_basic(titanic_multibatch_data_context):
 
     # verify the expectation types for MultiBatchNamespaceAwareExpectationDefinedValidationMetric
     assert set([m.expectation_type for m in mb_metrics.values() if
-         isinstance(m, MultiBatchNamespaceAwareExpectationDefinedValidationMetric)]) == set(['expect_column_values_to_not_be_null', 'expect_column_quantile_values_to_be_between'])
\ No newline at end of file
+         isinstance(m, MultiBatchNamespaceAwareExpectationDefinedValidationMetric)]) == set(['expect_column_values_to_not_be_null', 'expect_column_quantile_values_to_be_between'])
+
+def test_get_metrics_from_validation_metrics_store(titanic_multibatch_data_context, tmp_path_factory):
+    """
+    Metrics loaded from a ParquetValidationMetricsStore should match the scalar metrics that
+    MultiBatchValidationMetaAnalysis.get_metrics extracts from the same validation results.
+    """
+    context = titanic_multibatch_data_context
+    my_ds = context.get_datasource("mydatasource")
+    generator = my_ds.get_generator("mygenerator")
+    all_batch_kwargs = sorted([x for x in generator.get_iterator('titanic')], key=lambda x: x['path'])
+
+    metrics_store = ParquetValidationMetricsStore(
+        base_directory=str(tmp_path_factory.mktemp("validation_metrics"))
+    )
+
+    batch_profiling_results = []
+    for i, batch_kwargs_set in enumerate(all_batch_kwargs):
+        context.create_expectation_suite("titanic", "foo", overwrite_existing=True)
+        batch = context.get_batch('titanic', "foo", batch_kwargs=batch_kwargs_set)
+        run_id = "profiling_{}".format(i)
+        expectation_suite, validation_result = BasicDatasetProfiler.profile(batch, run_id=run_id)
+        batch_profiling_results.append(validation_result)
+        metrics_store.set(
+            ValidationResultIdentifier(
+                expectation_suite_identifier=ExpectationSuiteIdentifier(
+                    data_asset_name=DataAssetIdentifier(*context.normalize_data_asset_name("titanic")),
+                    expectation_suite_name="foo",
+                ),
+                run_id=run_id,
+            ),
+            validation_result
+        )
+
+    mb_metrics = MultiBatchValidationMetaAnalysis.get_metrics(batch_profiling_results, context)
+    stored_mb_metrics = MultiBatchValidationMetaAnalysis.get_metrics_from_validation_metrics_store(
+        metrics_store,
+        filters=[("generator_asset", "==", "titanic")]
+    )
+
+    # quantile metrics are not scalar, so they are not captured in the store
+    expected_keys = set([key for key, m in mb_metrics.items() if not (
+        isinstance(m, MultiBatchNamespaceAwareExpectationDefinedValidationMetric) and
+        m.expectation_type == 'expect_column_quantile_values_to_be_between')])
+    assert set(stored_mb_metrics.keys()) == expected_keys
+    for key in expected_keys:
+        assert stored_mb_metrics[key].batch_metric_values == pytest.approx(mb_metrics[key].batch_metric_values)
+
+    assert MultiBatchValidationMetaAnalysis.get_metrics_from_validation_metrics_store(
+        metrics_store,
+        filters=[("generator_asset", "==", "not_titanic")]
+    ) == {}
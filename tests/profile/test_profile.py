@@ -1,8 +1,11 @@
 import pytest
 
 import json
+import os
 from collections import OrderedDict
 
+import pandas as pd
+
 from great_expectations.profile.base import DatasetProfiler
 from great_expectations.profile.basic_dataset_profiler import BasicDatasetProfiler
 from great_expectations.profile.columns_exist import ColumnsExistProfiler
@@ -220,6 +223,58 @@ def test_context_profiler(empty_data_context, filesystem_csv_2):
     assert len(profiled_expectations["expectations"]) > 0
 
 
+def test_context_profiler_with_sampling_and_max_workers(empty_data_context, tmp_path_factory):
+    base_dir = str(tmp_path_factory.mktemp('test_context_profiler_with_sampling'))
+    for name in ["f1", "f2", "f3"]:
+        pd.DataFrame({"x": range(1000), "y": ["a", "b"] * 500}).to_csv(os.path.join(base_dir, name + ".csv"),
+                                                                     index=None)
+    empty_data_context.add_datasource("my_datasource",
+                                      module_name="great_expectations.datasource",
+                                      class_name="PandasDatasource",
+                                      base_directory=base_dir)
+
+    with pytest.raises(ValueError):
+        empty_data_context.profile_datasource("my_datasource", max_workers=0)
+
+    profiling_results = empty_data_context.profile_datasource("my_datasource", sample_fraction=0.1, sample_seed=42,
+                                                              max_workers=2)
+    assert profiling_results["success"]
+    assert [suite["data_asset_name"] for suite, evrs in profiling_results["results"]] == [
+        "my_datasource/default/f1", "my_datasource/default/f2", "my_datasource/default/f3"
+    ]
+
+    profiled_expectations = empty_data_context.get_expectation_suite("f2", "BasicDatasetProfiler")
+    assert profiled_expectations["meta"]["BasicDatasetProfiler"]["sampling"] == {"fraction": 0.1, "seed": 42}
+    row_count_expectation = [exp for exp in profiled_expectations["expectations"]
+                             if exp["expectation_type"] == "expect_table_row_count_to_be_between"]
+    assert len(row_count_expectation) == 1
+    evrs = profiling_results["results"][1][1]
+    row_count_result = [evr for evr in evrs["results"]
+                        if evr["expectation_config"]["expectation_type"] == "expect_table_row_count_to_be_between"]
+    assert 50 < row_count_result[0]["result"]["observed_value"] < 150
+
+
+def test_context_profiler_closes_batches_that_fail_to_profile(empty_data_context, tmp_path_factory, sa, monkeypatch):
+    from great_expectations.dataset import SqlAlchemyDataset
+    path = str(tmp_path_factory.mktemp('test_context_profiler_closes_batches'))
+    empty_data_context.add_datasource("my_db", class_name="SqlAlchemyDatasource",
+                                      connection_string="sqlite:///" + os.path.join(path, "test.db"))
+    pd.DataFrame({"x": [1, 2, 3]}).to_sql(name="test_table", con=empty_data_context.datasources["my_db"].engine,
+                                          index=False)
+
+    def profile(*args, **kwargs):
+        raise IOError("profiling failed")
+
+    monkeypatch.setattr(BasicDatasetProfiler, "profile", profile)
+    closed_batches = []
+    close = SqlAlchemyDataset.close
+    monkeypatch.setattr(SqlAlchemyDataset, "close", lambda self: closed_batches.append(self) or close(self))
+
+    profiling_results = empty_data_context.profile_datasource("my_db")
+    assert profiling_results["results"] == []
+    assert len(closed_batches) == 1
+
+
 # noinspection PyPep8Naming
 def test_BasicDatasetProfiler_on_titanic():
     """
@@ -266,3 +321,63 @@ def test_BasicDatasetProfiler_on_titanic():
     # DISABLE TEST IN PY2 BECAUSE OF ORDER ISSUE AND NEAR-EOL
     if not PY2:
         assertDeepAlmostEqual(expected_evrs, evrs)
+
+
+# noinspection PyPep8Naming
+def test_BasicDatasetProfiler_prefetches_column_statistics_in_bulk(monkeypatch):
+    """Profiling with the column statistics gathered in bulk issues fewer queries, and produces the same suite and
+    validation results, than computing them one expectation at a time."""
+    sa = pytest.importorskip("sqlalchemy")
+    from great_expectations.dataset import SqlAlchemyDataset
+
+    engine = sa.create_engine("sqlite://")
+    pd.read_csv("./tests/test_sets/Titanic.csv").to_sql(name="titanic", con=engine, index=False)
+
+    def profile():
+        dataset = SqlAlchemyDataset("titanic", engine=engine)
+        queries = []
+
+        def record_query(conn, cursor, statement, parameters, context, executemany):
+            queries.append(statement)
+
+        sa.event.listen(engine, "before_cursor_execute", record_query)
+        try:
+            suite, evrs = BasicDatasetProfiler.profile(dataset, run_id="test")
+        finally:
+            sa.event.remove(engine, "before_cursor_execute", record_query)
+        return suite, evrs, queries
+
+    suite, evrs, queries = profile()
+    monkeypatch.setattr(BasicDatasetProfiler, "_prefetch_column_statistics", classmethod(lambda cls, df, columns: None))
+    expected_suite, expected_evrs, expected_queries = profile()
+
+    for profiled_suite in [suite, expected_suite]:
+        profiled_suite["meta"].pop("BasicDatasetProfiler")
+    assert suite == expected_suite
+    evrs.pop("meta")
+    expected_evrs.pop("meta")
+    assert evrs == expected_evrs
+    assert len(queries) < len(expected_queries)
+
+
+# noinspection PyPep8Naming
+def test_BasicDatasetProfiler_with_approximate_cardinality():
+    class ApproximateBasicDatasetProfiler(BasicDatasetProfiler):
+        approximate_cardinality = True
+
+    df = ge.read_csv("./tests/test_sets/Titanic.csv")
+    suite, evrs = df.profile(ApproximateBasicDatasetProfiler)
+    expected_suite, expected_evrs = ge.read_csv("./tests/test_sets/Titanic.csv").profile(BasicDatasetProfiler)
+
+    def cardinality_expectations(expectation_suite):
+        return [exp for exp in expectation_suite["expectations"] if exp["expectation_type"] in [
+            "expect_column_unique_value_count_to_be_between",
+            "expect_column_proportion_of_unique_values_to_be_between"
+        ]]
+
+    assert len(cardinality_expectations(suite)) == len(cardinality_expectations(expected_suite)) > 0
+    assert all([exp["kwargs"]["approximate"] for exp in cardinality_expectations(suite)])
+    assert all(["approximate" not in exp["kwargs"] for exp in cardinality_expectations(expected_suite)])
+    # The estimates are close enough to profile the same expectations
+    assert [exp["expectation_type"] for exp in suite["expectations"]] == \
+        [exp["expectation_type"] for exp in expected_suite["expectations"]]
@@ -0,0 +1,166 @@
+import pytest
+import pandas as pd
+
+from great_expectations.dataset import SqlAlchemyDataset
+from great_expectations.dataset.incremental_state import IncrementalStateStore, merge_aggregates
+from great_expectations.dataset.sketches import HyperLogLog
+
+
+@pytest.fixture
+def events_engine(sa):
+    engine = sa.create_engine("sqlite://")
+    pd.DataFrame({
+        "id": [1, 2, 3, 4],
+        "amount": [10.0, 20.0, 30.0, None],
+        "category": ["a", "b", "a", "c"],
+    }).to_sql("events", con=engine, index=False)
+    return engine
+
+
+def append_events(engine, df):
+    df.to_sql("events", con=engine, index=False, if_exists="append")
+
+
+def get_incremental_dataset(engine, store):
+    return SqlAlchemyDataset("events", engine=engine, watermark_column="id", incremental_state_store=store,
+                             incremental_state_key="events/default")
+
+
+def build_suite(dataset):
+    dataset.expect_table_row_count_to_be_between(1, 100)
+    dataset.expect_column_values_to_be_in_set("category", ["a", "b", "c"])
+    dataset.expect_column_mean_to_be_between("amount", 0, 100)
+    dataset.expect_column_sum_to_be_between("amount", 0, 1000)
+    dataset.expect_column_max_to_be_between("amount", 0, 100)
+    dataset.expect_column_unique_value_count_to_be_between("category", 1, 10)
+    dataset.expect_column_median_to_be_between("amount", 0, 100)
+    return dataset.get_expectation_suite()
+
+
+def get_observed_values(validation_results):
+    return [result["result"].get("observed_value", result["result"].get("unexpected_count"))
+            for result in validation_results["results"]]
+
+
+def test_merge_aggregates():
+    assert merge_aggregates(None, {"count": 1}) == {"count": 1}
+    assert merge_aggregates(
+        {"count": 2, "sum": None, "min": 3, "max": 5, "value_counts": {"a": 1, "b": 1}},
+        {"count": 1, "sum": 4.0, "min": 1, "max": None, "value_counts": {"a": 2}}
+    ) == {"count": 3, "sum": 4.0, "min": 1, "max": 5, "value_counts": {"a": 3, "b": 1}}
+    assert merge_aggregates({"value_counts": {"a": 1}}, {"value_counts": {"b": 1}},
+                            max_distinct_values=1) == {"value_counts": None}
+
+    sketch = HyperLogLog().update(["a", "b"])
+    merged = merge_aggregates({"distinct_sketch": sketch}, {"distinct_sketch": HyperLogLog().update(["b", "c"])})
+    assert merged["distinct_sketch"].count() == 3
+    assert sketch.count() == 2
+    assert merge_aggregates({"distinct_sketch": sketch}, {"distinct_sketch": None}) == {"distinct_sketch": None}
+
+
+def test_incremental_validation_matches_full_validation(sa, events_engine, tmp_path_factory):
+    store = IncrementalStateStore(
+        str(tmp_path_factory.mktemp("test_incremental_validation").joinpath("state.db")))
+    expectation_suite = build_suite(SqlAlchemyDataset("events", engine=events_engine))
+
+    first_results = get_incremental_dataset(events_engine, store).validate(expectation_suite,
+                                                                          result_format="SUMMARY")
+    assert first_results["meta"]["incremental"]["watermark"] == 4
+    assert first_results["meta"]["incremental"]["full_scan_expectations"] == ["expect_column_median_to_be_between"]
+    assert [result["incremental"]["full_scan"] for result in first_results["results"]] == \
+        [False, False, False, False, False, False, True]
+    assert len(store.get_state("events/default")) > 0
+
+    append_events(events_engine, pd.DataFrame({
+        "id": [5, 6],
+        "amount": [50.0, 60.0],
+        "category": ["d", "a"],
+    }))
+
+    incremental_results = get_incremental_dataset(events_engine, store).validate(expectation_suite,
+                                                                                result_format="SUMMARY")
+    full_results = SqlAlchemyDataset("events", engine=events_engine).validate(expectation_suite,
+                                                                              result_format="SUMMARY")
+    assert incremental_results["meta"]["incremental"]["watermark"] == 6
+    assert get_observed_values(incremental_results)[:2] == get_observed_values(full_results)[:2] == [6, 1]
+    for incremental_value, full_value in zip(get_observed_values(incremental_results),
+                                             get_observed_values(full_results)):
+        assert incremental_value == pytest.approx(full_value)
+    assert incremental_results["results"][1]["result"]["partial_unexpected_list"] == ["d"]
+
+
+def test_incremental_validation_reads_only_new_rows(sa, events_engine, tmp_path_factory):
+    store = IncrementalStateStore(
+        str(tmp_path_factory.mktemp("test_incremental_validation").joinpath("state.db")))
+    dataset = get_incremental_dataset(events_engine, store)
+    assert dataset.get_row_count() == 4
+    assert dataset.get_column_sum("amount") == 60.0
+    assert dataset.get_column_stdev("amount") == pytest.approx(10.0)
+    dataset.commit_incremental_state()
+
+    # Rows below the watermark are not read again, so changing them goes unnoticed
+    events_engine.execute("UPDATE events SET amount = 1000 WHERE id = 1")
+    append_events(events_engine, pd.DataFrame({"id": [5], "amount": [5.0], "category": ["a"]}))
+    dataset = get_incremental_dataset(events_engine, store)
+    assert dataset.get_row_count() == 5
+    assert dataset.get_column_sum("amount") == 65.0
+
+    store.invalidate("events/default")
+    dataset = get_incremental_dataset(events_engine, store)
+    assert dataset.get_column_sum("amount") == 1055.0
+
+
+def test_incremental_value_counts_fall_back_to_full_scan(sa, events_engine):
+    dataset = SqlAlchemyDataset("events", engine=events_engine, watermark_column="id")
+    dataset.incremental_max_distinct_values = 2
+    assert dataset.get_column_unique_count("category") == 3
+    assert dataset._full_scan_metrics == set()
+    assert list(dataset.get_column_value_counts("category").items()) == [("a", 2), ("b", 1), ("c", 1)]
+    assert ("get_column_value_counts", "category") in dataset._full_scan_metrics
+
+    dataset = SqlAlchemyDataset("events", engine=events_engine, watermark_column="id")
+    assert list(dataset.get_column_value_counts("category").items()) == [("a", 2), ("b", 1), ("c", 1)]
+    assert dataset._full_scan_metrics == set()
+
+
+def test_incremental_unique_count_merges_distinct_sketches(sa, events_engine, tmp_path_factory):
+    store = IncrementalStateStore(
+        str(tmp_path_factory.mktemp("test_incremental_validation").joinpath("state.db")))
+    dataset = get_incremental_dataset(events_engine, store)
+    dataset.incremental_max_distinct_values = 2
+    assert dataset.get_column_unique_count("category") == 3
+    dataset.commit_incremental_state()
+
+    append_events(events_engine, pd.DataFrame({
+        "id": [5, 6, 7],
+        "amount": [50.0, 60.0, 70.0],
+        "category": ["d", "a", "e"],
+    }))
+    dataset = get_incremental_dataset(events_engine, store)
+    dataset.incremental_max_distinct_values = 2
+    assert dataset.get_column_unique_count("category") == 5
+    # The count is estimated from the merged sketches, which the result reports
+    dataset.expect_column_unique_value_count_to_be_between("category", 1, 10)
+    validation_results = dataset.validate(result_format="SUMMARY")
+    assert validation_results["meta"]["incremental"]["approximate_expectations"] == \
+        ["expect_column_unique_value_count_to_be_between"]
+    result = validation_results["results"][0]
+    assert result["result"]["observed_value"] == 5
+    assert result["incremental"]["approximate"]
+    assert result["incremental"]["approximate_metrics"] == ["get_column_unique_count(category)"]
+    assert not result["incremental"]["full_scan"]
+    assert dataset.get_column_value_counts("category") is not None
+    assert [(func, column) for func, column in dataset._full_scan_metrics] == \
+        [("get_column_value_counts", "category")]
+
+
+def test_incremental_full_scans_read_rows_up_to_the_high_watermark(sa, events_engine):
+    dataset = SqlAlchemyDataset("events", engine=events_engine, watermark_column="id")
+    append_events(events_engine, pd.DataFrame({"id": [5, 6], "amount": [50.0, 60.0], "category": ["z", "z"]}))
+
+    # Rows added after the dataset was created are left to the next validation, by full scans too
+    assert dataset.get_row_count() == 4
+    assert dataset.get_column_median("amount") == 20.0
+    assert dataset.get_column_max("amount") == 30.0
+    result = dataset.expect_column_values_to_be_unique("category", result_format="COMPLETE")
+    assert result["result"]["unexpected_list"] == ["a", "a"]
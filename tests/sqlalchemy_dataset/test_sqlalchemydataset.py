@@ -1,3 +1,5 @@
+import gc
+
 try:
     from unittest import mock
 except ImportError:
@@ -152,6 +154,76 @@ def test_sqlalchemydataset_with_custom_sql(sa):
     assert result['success'] == False
 
 
+def test_sqlalchemydataset_custom_sql_uses_one_connection(sa, tmp_path_factory):
+    # A file-based SQLite engine opens a new connection for each query, which cannot see temporary tables created
+    # on another connection
+    path = str(tmp_path_factory.mktemp("test_sqlalchemydataset_custom_sql_uses_one_connection"))
+    engine = sa.create_engine('sqlite:///' + path + '/test.db', poolclass=sa.pool.NullPool)
+    data = pd.DataFrame({"age": [16, 21, 38, 22, 10]})
+    data.to_sql(name='test_sql_data', con=engine, index=False)
+
+    dataset = SqlAlchemyDataset(engine=engine, custom_sql="SELECT age FROM test_sql_data WHERE age > 12")
+    assert dataset.get_row_count() == 4
+    assert dataset.expect_column_max_to_be_between("age", 38, 38)["success"]
+    assert len(dataset.head()) == 4
+    dataset.close()
+
+
+def test_sqlalchemydataset_only_pins_a_connection_for_a_temporary_table(sa, tmp_path_factory):
+    path = str(tmp_path_factory.mktemp("test_sqlalchemydataset_only_pins_a_connection_for_a_temporary_table"))
+    engine = sa.create_engine('sqlite:///' + path + '/test.db', poolclass=sa.pool.QueuePool, pool_size=2,
+                              max_overflow=0, pool_timeout=1)
+    data = pd.DataFrame({"age": [16, 21, 38, 22, 10]})
+    data.to_sql(name='test_sql_data', con=engine, index=False)
+
+    # Datasets of a table hold no connection, so there can be more of them than connections in the pool
+    datasets = [SqlAlchemyDataset("test_sql_data", engine=engine) for _ in range(3)]
+    assert [dataset.get_row_count() for dataset in datasets] == [5, 5, 5]
+    assert engine.pool.checkedout() == 0
+
+    with SqlAlchemyDataset(engine=engine, custom_sql="SELECT age FROM test_sql_data WHERE age > 12") as dataset:
+        assert engine.pool.checkedout() == 1
+        assert dataset.get_row_count() == 4
+    assert engine.pool.checkedout() == 0
+
+    # A dataset that is garbage collected without being closed releases its connection
+    dataset = SqlAlchemyDataset(engine=engine, custom_sql="SELECT age FROM test_sql_data WHERE age > 12")
+    assert engine.pool.checkedout() == 1
+    del dataset
+    gc.collect()
+    assert engine.pool.checkedout() == 0
+
+    # A dataset rebuilt from one with a temporary table creates its own
+    with SqlAlchemyDataset(engine=engine, custom_sql="SELECT age FROM test_sql_data WHERE age > 12") as dataset:
+        with SqlAlchemyDataset.from_dataset(dataset) as new_dataset:
+            assert new_dataset.get_row_count() == 4
+    assert engine.pool.checkedout() == 0
+
+
+def test_sqlalchemydataset_custom_sql_without_materialization(sa):
+    engine = sa.create_engine('sqlite://')
+    data = pd.DataFrame({
+        "name": ["Frank", "Steve", "Jane", "Frank", "Michael"],
+        "age": [16, 21, 38, 22, 10],
+    })
+    data.to_sql(name='test_sql_data', con=engine, index=False)
+
+    custom_sql = "SELECT name, age FROM test_sql_data WHERE age > 12"
+    dataset = SqlAlchemyDataset(engine=engine, custom_sql=custom_sql, materialize=False)
+    # No temporary table was created
+    assert sa.inspect(engine).get_temp_table_names() == []
+    assert [column["name"] for column in dataset.columns] == ["name", "age"]
+    assert dataset.get_row_count() == 4
+    assert dataset.expect_column_values_to_be_between("age", 13, 40)["success"]
+    assert dataset.expect_column_values_to_be_in_set("name", ["Frank", "Steve"])["result"]["partial_unexpected_list"] == \
+        ["Jane"]
+    assert dataset.head(2)["name"].tolist() == ["Frank", "Steve"]
+
+    # from_dataset keeps the query
+    dataset = SqlAlchemyDataset.from_dataset(dataset)
+    assert dataset.get_row_count() == 4
+
+
 def test_column_fallback(sa):
     engine = sa.create_engine('sqlite://')
 
@@ -219,3 +291,34 @@ def test_sqlalchemy_dataset_unexpected_count_calculations(sa, unexpected_count_d
 def test_result_format_warning(sa, unexpected_count_df):
     with pytest.warns(UserWarning, match=r'Setting result format to COMPLETE for a SqlAlchemyDataset can be dangerous'):
         unexpected_count_df.expect_column_values_to_be_in_set("a", value_set=[1], result_format={"result_format": "COMPLETE", "partial_unexpected_count": 2})
+
+
+def test_sqlalchemy_dataset_aggregate_unexpected_values(sa):
+    engine = sa.create_engine('sqlite://')
+    pd.DataFrame({"a": [1, 2, 3, 2, 3, 3, 4, 4, 4, 4, None]}).to_sql("test", con=engine, index=False)
+
+    dataset = SqlAlchemyDataset("test", engine=engine)
+    res = dataset.expect_column_values_to_be_in_set("a", value_set=[1], result_format={
+        "result_format": "SUMMARY", "partial_unexpected_count": 3})
+    # Only the first three unexpected values are counted
+    assert res["result"]["partial_unexpected_counts"] == [
+        {"value": 2.0, "count": 2}, {"value": 3.0, "count": 1}
+    ]
+
+    dataset = SqlAlchemyDataset("test", engine=engine, aggregate_unexpected_values=True)
+    res = dataset.expect_column_values_to_be_in_set("a", value_set=[1], result_format={
+        "result_format": "SUMMARY", "partial_unexpected_count": 2})
+    assert res["result"]["unexpected_count"] == 9
+    assert len(res["result"]["partial_unexpected_list"]) == 2
+    # All the unexpected values are counted, by the database
+    assert res["result"]["partial_unexpected_counts"] == [
+        {"value": 4.0, "count": 4}, {"value": 3.0, "count": 3}
+    ]
+
+
+def test_sqlalchemy_dataset_streams_complete_unexpected_list(sa, unexpected_count_df):
+    unexpected_count_df.unexpected_fetch_size = 2
+    with pytest.warns(UserWarning):
+        res = unexpected_count_df.expect_column_values_to_be_in_set("a", value_set=[1], result_format={
+            "result_format": "COMPLETE", "partial_unexpected_count": 2})
+    assert res["result"]["unexpected_list"] == [2] * 5
@@ -0,0 +1,123 @@
+import json
+import os
+
+import boto3
+from moto import mock_s3
+
+from great_expectations.data_context.store import (
+    ExpectationsStore,
+)
+from great_expectations.data_context.types import (
+    ExpectationSuiteIdentifier,
+)
+
+
+def test_ExpectationsStore_caches_suites_with_FixedLengthTupleFilesystemStoreBackend(tmp_path_factory):
+    path = str(tmp_path_factory.mktemp('test_ExpectationsStore_caches_suites__dir'))
+
+    my_store = ExpectationsStore(
+        store_backend={
+            "class_name": "FixedLengthTupleFilesystemStoreBackend",
+            "base_directory": "expectations/",
+        },
+        root_directory=path,
+    )
+
+    ns_1 = ExpectationSuiteIdentifier(from_string="ExpectationSuiteIdentifier.a.b.c.warning")
+    my_store.set(ns_1, {"expectations": [{"expectation_type": "expect_column_to_exist"}]})
+
+    assert my_store.get(ns_1) == {"expectations": [{"expectation_type": "expect_column_to_exist"}]}
+    assert my_store.get_cache_statistics()["misses"] == 1
+    suite = my_store.get(ns_1)
+    assert my_store.get(ns_1) == suite
+    assert my_store.get(ns_1) is not suite
+    assert my_store.get_cache_statistics() == {"hits": 3, "misses": 1, "size": 1, "max_size": 128}
+
+    # A change made behind the store's back is detected through the file's size and mtime
+    suite_filepath = os.path.join(path, "expectations", "a", "b", "c", "warning.json")
+    with open(suite_filepath, "w") as outfile:
+        json.dump({"expectations": []}, outfile)
+    assert my_store.get(ns_1) == {"expectations": []}
+    assert my_store.cache_misses == 2
+
+    # Writing through the store evicts the cached suite
+    my_store.set(ns_1, {"expectations": [], "meta": {}})
+    assert my_store.get(ns_1) == {"expectations": [], "meta": {}}
+    assert my_store.cache_misses == 3
+
+    assert my_store.has_key(ns_1)
+    assert not my_store.has_key(ExpectationSuiteIdentifier(from_string="ExpectationSuiteIdentifier.a.b.c.failure"))
+
+
+def test_ExpectationsStore_cache_evicts_least_recently_used_suite(tmp_path_factory):
+    path = str(tmp_path_factory.mktemp('test_ExpectationsStore_cache_evicts__dir'))
+
+    my_store = ExpectationsStore(
+        store_backend={
+            "class_name": "FixedLengthTupleFilesystemStoreBackend",
+            "base_directory": "expectations/",
+        },
+        root_directory=path,
+        cache_size=2,
+    )
+
+    keys = [ExpectationSuiteIdentifier(from_string="ExpectationSuiteIdentifier.a.b.c." + name)
+            for name in ["one", "two", "three"]]
+    for key in keys:
+        my_store.set(key, {"expectations": []})
+
+    my_store.get(keys[0])
+    my_store.get(keys[1])
+    my_store.get(keys[0])
+    my_store.get(keys[2])
+    assert list(my_store._suite_cache.keys()) == [keys[0], keys[2]]
+
+    my_store.clear_cache()
+    assert my_store.get_cache_statistics()["size"] == 0
+
+
+def test_ExpectationsStore_does_not_cache_with_InMemoryStoreBackend():
+    my_store = ExpectationsStore(
+        store_backend={
+            "class_name": "InMemoryStoreBackend",
+        },
+        root_directory=None,
+    )
+
+    ns_1 = ExpectationSuiteIdentifier(from_string="ExpectationSuiteIdentifier.a.b.c.warning")
+    my_store.set(ns_1, {"expectations": []})
+    assert my_store.get(ns_1) == {"expectations": []}
+    assert my_store.get(ns_1) is not my_store.get(ns_1)
+    assert my_store.get_cache_statistics()["size"] == 0
+
+
+@mock_s3
+def test_ExpectationsStore_caches_suites_with_FixedLengthTupleS3StoreBackend():
+    bucket = "test_expectations_store_bucket"
+    prefix = "test/prefix"
+
+    conn = boto3.resource('s3', region_name='us-east-1')
+    conn.create_bucket(Bucket=bucket)
+
+    my_store = ExpectationsStore(
+        store_backend={
+            "class_name": "FixedLengthTupleS3StoreBackend",
+            "bucket": bucket,
+            "prefix": prefix
+        },
+        root_directory=None
+    )
+
+    ns_1 = ExpectationSuiteIdentifier(from_string="ExpectationSuiteIdentifier.a.b.c.warning")
+    my_store.set(ns_1, {"expectations": []})
+    assert my_store.get(ns_1) == {"expectations": []}
+    first_suite = my_store.get(ns_1)
+    first_suite["expectations"].append({"expectation_type": "expect_column_to_exist"})
+    # Modifying a suite returned by the store leaves the cached suite unchanged
+    assert my_store.get(ns_1) == {"expectations": []}
+    assert my_store.cache_hits == 2
+
+    # Overwriting the object changes its ETag
+    boto3.client('s3').put_object(Bucket=bucket, Key="test/prefix/a/b/c/warning.json", Body=b'{"expectations": [1]}')
+    assert my_store.get(ns_1) == {"expectations": [1]}
+    assert my_store.cache_misses == 2
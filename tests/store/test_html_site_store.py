@@ -1,3 +1,5 @@
+import os
+
 import pytest
 
 from moto import mock_s3
@@ -153,3 +155,41 @@ def test_HtmlSiteStore_S3_backend():
     index_content = boto3.client('s3').get_object(Bucket=bucket, Key='test/prefix/index.html')["Body"]\
         .read().decode('utf-8')
     assert index_content == "index_html_string_content"
+
+
+def test_HtmlSiteStore_copy_static_assets_skips_unchanged_assets(tmp_path_factory):
+    path = str(tmp_path_factory.mktemp('test_HtmlSiteStore_copy_static_assets__dir'))
+
+    my_store = HtmlSiteStore(
+        root_directory=path,
+        store_backend={
+            "class_name": "FixedLengthTupleFilesystemStoreBackend",
+            "base_directory": "my_store"
+        }
+    )
+
+    assert my_store.copy_static_assets() is True
+    digest_filepath = os.path.join(path, "my_store", "static", "static_assets_digest.txt")
+    styles_filepath = os.path.join(path, "my_store", "static", "styles", "data_docs_default_styles.css")
+    assert os.path.isfile(digest_filepath)
+    assert os.path.isfile(styles_filepath)
+
+    # A second store writing to the same site finds the assets up to date
+    my_store = HtmlSiteStore(
+        root_directory=path,
+        store_backend={
+            "class_name": "FixedLengthTupleFilesystemStoreBackend",
+            "base_directory": "my_store"
+        }
+    )
+    os.remove(styles_filepath)
+    assert my_store.copy_static_assets() is False
+    assert not os.path.isfile(styles_filepath)
+
+    assert my_store.copy_static_assets(force=True) is True
+    assert os.path.isfile(styles_filepath)
+
+    # A site with a different digest, for example one built by another version, is copied again
+    with open(digest_filepath, "w") as outfile:
+        outfile.write("not_the_digest")
+    assert my_store.copy_static_assets() is True
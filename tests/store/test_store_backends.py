@@ -215,6 +215,12 @@ def test_FixedLengthTupleS3StoreBackend():
     assert set([s3_object_info['Key'] for s3_object_info in boto3.client('s3').list_objects(Bucket=bucket, Prefix=prefix)['Contents']])\
            == set(['this_is_a_test_prefix/my_file_AAA', 'this_is_a_test_prefix/my_file_BBB'])
 
+    # Compressed serialized values are stored unchanged, along with their content encoding
+    my_store.set(("CCC",), b"\x1f\x8b", content_encoding="gzip", content_type="application/json")
+    object = boto3.client('s3').get_object(Bucket=bucket, Key=prefix + "/my_file_CCC")
+    assert object["Body"].read() == b"\x1f\x8b"
+    assert object["ContentEncoding"] == "gzip"
+
 
 def test_FixedLengthTupleGCSStoreBackend():
 
@@ -274,6 +280,17 @@ def test_FixedLengthTupleGCSStoreBackend():
         mock_bucket.blob.assert_called_once_with("this_is_a_test_prefix/AAA")
         mock_blob.upload_from_string.assert_called_once_with(b"aaa", content_type="image/png")
 
+    with patch("google.cloud.storage.Client", autospec=True) as mock_gcs_client:
+        mock_client = mock_gcs_client.return_value
+        mock_bucket = mock_client.get_bucket.return_value
+        mock_blob = mock_bucket.blob.return_value
+
+        # Compressed serialized values are uploaded unchanged, along with their content encoding
+        my_store.set(("CCC",), b"\x1f\x8b", content_encoding="gzip", content_type="application/json")
+
+        mock_blob.upload_from_string.assert_called_once_with(b"\x1f\x8b", content_encoding="gzip",
+                                                             content_type="application/json")
+
     with patch("google.cloud.storage.Client", autospec=True) as mock_gcs_client:
 
         mock_client = mock_gcs_client.return_value
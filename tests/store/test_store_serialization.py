@@ -0,0 +1,181 @@
+import json
+import os
+import timeit
+
+import boto3
+import pytest
+from moto import mock_s3
+
+from great_expectations.data_context.store import (
+    ValidationsStore,
+)
+from great_expectations.data_context.store.store import (
+    deserialize_json_compatible,
+    GZIP_MAGIC_NUMBER,
+    ZSTD_MAGIC_NUMBER,
+)
+from great_expectations.data_context.types import (
+    ValidationResultIdentifier,
+)
+from great_expectations.util import file_relative_path
+
+PROFILING_RESULT_FIXTURE = file_relative_path(
+    __file__,
+    "../data_context/fixtures/post_init_project_v0.8.0_A/great_expectations/uncommitted/validations/profiling/"
+    "data__dir/default/bob-ross/BasicDatasetProfiler.json"
+)
+
+
+@pytest.fixture
+def profiling_validation_result():
+    with open(PROFILING_RESULT_FIXTURE, "r") as infile:
+        return json.load(infile)
+
+
+def _get_serialization_types():
+    serialization_types = ["json", "gzip_json"]
+    try:
+        import zstandard
+        serialization_types.append("zstd_json")
+    except ImportError:
+        pass
+    try:
+        import msgpack
+        serialization_types.append("msgpack")
+    except ImportError:
+        pass
+    return serialization_types
+
+
+@pytest.mark.parametrize("serialization_type", _get_serialization_types())
+def test_ValidationsStore_serialization_types_round_trip(tmp_path_factory, serialization_type,
+                                                        profiling_validation_result):
+    path = str(tmp_path_factory.mktemp('test_ValidationsStore_serialization_types__dir'))
+
+    my_store = ValidationsStore(
+        store_backend={
+            "class_name": "FixedLengthTupleFilesystemStoreBackend",
+            "base_directory": "validations/",
+        },
+        root_directory=path,
+        serialization_type=serialization_type,
+    )
+    ns_1 = ValidationResultIdentifier(from_string="ValidationResultIdentifier.a.b.c.quarantine.prod-100")
+    my_store.set(ns_1, profiling_validation_result)
+    assert my_store.get(ns_1) == profiling_validation_result
+
+    # A store configured for plain json can still read values written with any other serialization type
+    json_store = ValidationsStore(
+        store_backend={
+            "class_name": "FixedLengthTupleFilesystemStoreBackend",
+            "base_directory": "validations/",
+        },
+        root_directory=path,
+    )
+    assert json_store.get(ns_1) == profiling_validation_result
+
+
+def test_deserialize_json_compatible_detects_format():
+    assert deserialize_json_compatible('{"a": 1}') == {"a": 1}
+    assert deserialize_json_compatible(b'{"a": 1}') == {"a": 1}
+
+    from great_expectations.data_context.store.store import gzip_compress
+    compressed = gzip_compress(b'{"a": 1}')
+    assert compressed[:2] == GZIP_MAGIC_NUMBER
+    assert deserialize_json_compatible(compressed) == {"a": 1}
+    # Compression output is deterministic
+    assert gzip_compress(b'{"a": 1}') == compressed
+
+    zstandard = pytest.importorskip("zstandard")
+    compressed = zstandard.ZstdCompressor().compress(b'{"a": 1}')
+    assert compressed[:4] == ZSTD_MAGIC_NUMBER
+    assert deserialize_json_compatible(compressed) == {"a": 1}
+
+    msgpack = pytest.importorskip("msgpack")
+    assert deserialize_json_compatible(msgpack.packb({"a": [1, "b"]}, use_bin_type=True)) == {"a": [1, "b"]}
+
+
+@mock_s3
+def test_ValidationsStore_gzip_json_with_FixedLengthTupleS3StoreBackend():
+    bucket = "test_validation_store_bucket"
+    prefix = "test/prefix"
+
+    conn = boto3.resource('s3', region_name='us-east-1')
+    conn.create_bucket(Bucket=bucket)
+
+    my_store = ValidationsStore(
+        store_backend={
+            "class_name": "FixedLengthTupleS3StoreBackend",
+            "bucket": bucket,
+            "prefix": prefix
+        },
+        root_directory=None,
+        serialization_type="gzip_json",
+    )
+
+    ns_1 = ValidationResultIdentifier(from_string="ValidationResultIdentifier.a.b.c.quarantine.prod-100")
+    my_store.set(ns_1, {"A": "aaa"})
+    assert my_store.get(ns_1) == {"A": "aaa"}
+
+    s3_object = boto3.client('s3').get_object(Bucket=bucket, Key="test/prefix/prod-100/a/b/c/quarantine.json")
+    assert s3_object["ContentEncoding"] == "gzip"
+    assert s3_object["ContentType"] == "application/json"
+
+    # The content metadata follows a serialization_type passed to set
+    my_store.serialization_type = "json"
+    ns_2 = ValidationResultIdentifier(from_string="ValidationResultIdentifier.a.b.c.quarantine.prod-200")
+    my_store.set(ns_2, {"A": "aaa"}, serialization_type="gzip_json")
+    assert my_store.get(ns_2) == {"A": "aaa"}
+    s3_object = boto3.client('s3').get_object(Bucket=bucket, Key="test/prefix/prod-200/a/b/c/quarantine.json")
+    assert s3_object["ContentEncoding"] == "gzip"
+
+
+def test_compressed_serialization_types_are_smaller_than_json(tmp_path_factory, profiling_validation_result):
+    # Results of validating many batches repeat the same structure, which compresses well
+    validation_result = dict(profiling_validation_result)
+    validation_result["results"] = profiling_validation_result["results"] * 20
+
+    sizes = {}
+    for serialization_type in _get_serialization_types():
+        path = str(tmp_path_factory.mktemp('test_serialization_sizes__dir'))
+        my_store = ValidationsStore(
+            store_backend={
+                "class_name": "FixedLengthTupleFilesystemStoreBackend",
+                "base_directory": "validations/",
+            },
+            root_directory=path,
+            serialization_type=serialization_type,
+        )
+        ns_1 = ValidationResultIdentifier(from_string="ValidationResultIdentifier.a.b.c.quarantine.prod-100")
+        filepath = my_store.set(ns_1, validation_result)
+        sizes[serialization_type] = os.path.getsize(filepath)
+        assert my_store.get(ns_1) == validation_result
+
+    for serialization_type in ["gzip_json", "zstd_json"]:
+        if serialization_type in sizes:
+            assert sizes[serialization_type] * 10 < sizes["json"]
+    if "msgpack" in sizes:
+        assert sizes["msgpack"] < sizes["json"]
+
+
+@pytest.mark.benchmark
+def test_serialization_types_size_and_parse_time(tmp_path_factory, profiling_validation_result):
+    validation_result = dict(profiling_validation_result)
+    validation_result["results"] = profiling_validation_result["results"] * 20
+
+    for serialization_type in _get_serialization_types():
+        path = str(tmp_path_factory.mktemp('test_serialization_benchmark__dir'))
+        my_store = ValidationsStore(
+            store_backend={
+                "class_name": "FixedLengthTupleFilesystemStoreBackend",
+                "base_directory": "validations/",
+            },
+            root_directory=path,
+            serialization_type=serialization_type,
+        )
+        ns_1 = ValidationResultIdentifier(from_string="ValidationResultIdentifier.a.b.c.quarantine.prod-100")
+        filepath = my_store.set(ns_1, validation_result)
+        parse_time = min(timeit.repeat(lambda: my_store.get(ns_1), number=10, repeat=3)) / 10
+        print("{}: {} bytes, {:.2f} ms to read and parse".format(
+            serialization_type, os.path.getsize(filepath), parse_time * 1000))
+        assert my_store.get(ns_1) == validation_result
@@ -0,0 +1,121 @@
+import pytest
+
+import numpy as np
+
+try:
+    from unittest import mock
+except ImportError:
+    import mock
+
+from great_expectations.data_context.store import (
+    ParquetValidationMetricsStore,
+)
+from great_expectations.data_context.types import (
+    ValidationResultIdentifier,
+)
+
+
+def _make_validation_result(null_percent, row_count):
+    return {
+        "success": False,
+        "meta": {
+            "batch_kwargs": {"path": "/data/titanic.csv", "partition_id": "titanic"},
+        },
+        "results": [
+            {
+                "success": True,
+                "expectation_config": {
+                    "expectation_type": "expect_table_row_count_to_be_between",
+                    "kwargs": {"min_value": 0},
+                },
+                "result": {"observed_value": row_count},
+            },
+            {
+                "success": False,
+                "expectation_config": {
+                    "expectation_type": "expect_column_values_to_not_be_null",
+                    "kwargs": {"column": "Age"},
+                },
+                "result": {"unexpected_percent": null_percent, "element_count": row_count},
+            },
+            {
+                "success": True,
+                "expectation_config": {
+                    "expectation_type": "expect_column_quantile_values_to_be_between",
+                    "kwargs": {"column": "Age"},
+                },
+                "result": {"observed_value": {"quantiles": [0.5], "values": [30]}},
+            },
+        ]
+    }
+
+
+def test_ParquetValidationMetricsStore_flatten_validation_result():
+    vr_id = ValidationResultIdentifier(from_string="ValidationResultIdentifier.a.b.titanic.warning.20190901T000000Z")
+    df = ParquetValidationMetricsStore.flatten_validation_result(_make_validation_result(20.5, 1313), vr_id)
+
+    assert list(df.columns) == ParquetValidationMetricsStore.PARTITION_COLUMNS + \
+        ParquetValidationMetricsStore.METRIC_COLUMNS
+    assert df["expectation_type"].tolist() == [
+        "expect_table_row_count_to_be_between",
+        "expect_column_values_to_not_be_null",
+        "expect_column_quantile_values_to_be_between",
+    ]
+    assert df["column"].tolist() == [None, "Age", "Age"]
+    assert df["observed_value"].iloc[0] == 1313
+    # Non-scalar observed values are not captured
+    assert np.isnan(df["observed_value"].iloc[2])
+    assert df["unexpected_percent"].iloc[1] == 20.5
+    assert df["success"].tolist() == [True, False, True]
+    assert set(df["run_id"]) == {"20190901T000000Z"}
+    assert set(df["batch_partition_id"]) == {"titanic"}
+
+
+def test_ParquetValidationMetricsStore_set_and_query(tmp_path_factory):
+    pyarrow = pytest.importorskip("pyarrow")
+    pytest.importorskip("pyarrow.parquet")
+    path = str(tmp_path_factory.mktemp('test_ParquetValidationMetricsStore_set_and_query__dir'))
+    my_store = ParquetValidationMetricsStore(base_directory="validation_metrics", root_directory=path)
+
+    assert len(my_store.query()) == 0
+
+    for run_id, null_percent in [("20190901T000000Z", 10.0), ("20190902T000000Z", 20.0)]:
+        my_store.set(
+            ValidationResultIdentifier(from_string="ValidationResultIdentifier.a.b.titanic.warning." + run_id),
+            _make_validation_result(null_percent, 1313)
+        )
+    my_store.set(
+        ValidationResultIdentifier(from_string="ValidationResultIdentifier.a.b.passengers.warning.20190902T000000Z"),
+        _make_validation_result(50.0, 10)
+    )
+
+    assert len(my_store.query()) == 9
+
+    null_rates = my_store.query(
+        filters=[
+            ("generator_asset", "==", "titanic"),
+            ("expectation_type", "==", "expect_column_values_to_not_be_null"),
+            ("column", "==", "Age"),
+        ],
+        columns=["run_id", "unexpected_percent"],
+    ).sort_values("run_id")
+    assert list(null_rates.columns) == ["run_id", "unexpected_percent"]
+    assert null_rates["unexpected_percent"].tolist() == [10.0, 20.0]
+
+    # Only the files of the runs in the window are read
+    with mock.patch("pyarrow.parquet.read_table", wraps=pyarrow.parquet.read_table) as read_table:
+        recent = my_store.query(filters=[("run_id", ">=", "20190902T000000Z")])
+        assert read_table.call_count == 2
+    assert sorted(set(recent["generator_asset"])) == ["passengers", "titanic"]
+    assert len(recent) == 6
+
+    assert len(my_store.query(filters=[("generator_asset", "in", ["missing"])])) == 0
+
+    with pytest.raises(ValueError):
+        my_store.query(filters=[("not_a_column", "==", 1)])
+
+    with pytest.raises(ValueError):
+        my_store.query(filters=[("run_id", "like", "2019%")])
+
+    with pytest.raises(TypeError):
+        my_store.set("not_a_ValidationResultIdentifier", {})
@@ -1,13 +1,18 @@
 import decimal
 import json
 import datetime
+import re
+import timeit
 import numpy as np
+import pandas as pd
+import pytest
 import unittest
 from functools import wraps
 import sys
 import platform
 
 import great_expectations as ge
+from great_expectations.data_asset.util import MultiRegexMatcher, get_expectation_suite_columns
 
 
 class TestDataAssetUtilMethods(unittest.TestCase):
@@ -179,5 +184,93 @@ class TestDocumentation(unittest.TestCase):
         )
 
 
+def test_MultiRegexMatcher_matches_like_re_search():
+    values = ["abc", "ABC", "a1b2", "aa", "xyz\n", "", "123-456", "foo bar"]
+    regex_lists = [
+        ["^a", "b+c", r"\d{3}", "z$", "a*"],
+        # Not combinable: an inline flag, and a numbered backreference
+        ["(?i)abc", "x"],
+        [r"(a)\1", "b"],
+        # Not combinable: duplicate group names
+        ["(?P<x>a)", "(?P<x>b)"],
+    ]
+    for regex_list in regex_lists:
+        matcher = MultiRegexMatcher(regex_list)
+        expected = np.array([[re.search(regex, value) is not None for regex in regex_list] for value in values])
+        assert (matcher.search_any_values(values) == expected.any(axis=1)).all()
+        assert (matcher.search_all_values(values) == expected.all(axis=1)).all()
+
+    assert MultiRegexMatcher(regex_lists[0]).is_combined
+    assert not any([MultiRegexMatcher(regex_list).is_combined for regex_list in regex_lists[1:]])
+
+    with pytest.raises(re.error):
+        MultiRegexMatcher(["a", "["])
+    with pytest.raises(ValueError):
+        MultiRegexMatcher([])
+
+
+def test_MultiRegexMatcher_matches_like_str_contains_on_many_regexes():
+    regex_list = [r"^user_%d\b" % i for i in range(25)] + [r"error code %d$" % i for i in range(25)]
+    values = pd.Series(["user_%d logged in, error code %d" % (i % 60, i % 40) for i in range(2000)])
+    regex_match_df = pd.concat([values.str.contains(regex) for regex in regex_list], axis=1, ignore_index=True)
+
+    matcher = MultiRegexMatcher(regex_list)
+    assert matcher.is_combined
+    assert (matcher.search_any_values(values) == regex_match_df.any(axis='columns').values).all()
+    assert (matcher.search_all_values(values) == regex_match_df.all(axis='columns').values).all()
+    # Some values match none of the regexes, so the comparison is not trivial
+    assert 0 < regex_match_df.any(axis='columns').sum() < len(values)
+
+
+def test_get_expectation_suite_columns():
+    def suite(*expectations):
+        return {"expectations": [{"expectation_type": expectation_type, "kwargs": kwargs}
+                                 for expectation_type, kwargs in expectations]}
+
+    assert get_expectation_suite_columns(None) is None
+    assert get_expectation_suite_columns(suite(("expect_table_row_count_to_equal", {"value": 3}))) is None
+    assert get_expectation_suite_columns(suite(
+        ("expect_column_values_to_not_be_null", {"column": "a"}),
+        ("expect_column_pair_values_A_to_be_greater_than_B", {"column_A": "b", "column_B": "c"}),
+        ("expect_multicolumn_values_to_be_unique", {"column_list": ["c", "d"]}),
+        ("expect_column_to_exist", {"column": "e"}),
+    )) == {"a", "b", "c", "d", "e"}
+
+    # Expectations about the columns of the whole table, or about the position of a column, need every column
+    assert get_expectation_suite_columns(suite(
+        ("expect_column_values_to_not_be_null", {"column": "a"}),
+        ("expect_table_columns_to_match_ordered_list", {"column_list": ["a", "b"]}),
+    )) is None
+    assert get_expectation_suite_columns(suite(
+        ("expect_column_values_to_not_be_null", {"column": "a"}),
+        ("expect_column_to_exist", {"column": "c", "column_index": 2}),
+    )) is None
+    # An evaluation parameter could stand for any column
+    assert get_expectation_suite_columns(suite(
+        ("expect_column_values_to_not_be_null", {"column": {"$PARAMETER": "column_name"}}),
+    )) is None
+
+
 if __name__ == "__main__":
     unittest.main()
+
+
+@pytest.mark.benchmark
+def test_MultiRegexMatcher_benchmark_50_regexes():
+    regex_list = [r"^user_%d\b" % i for i in range(25)] + [r"error code %d$" % i for i in range(25)]
+    values = pd.Series(["user_%d logged in, error code %d" % (i % 60, i % 40) for i in range(20000)])
+    matcher = MultiRegexMatcher(regex_list)
+
+    def str_contains_any():
+        return pd.concat([values.str.contains(regex) for regex in regex_list], axis=1).any(axis="columns")
+
+    def str_contains_all():
+        return pd.concat([values.str.contains(regex) for regex in regex_list], axis=1).all(axis="columns")
+
+    for name, function in [("str.contains any", str_contains_any),
+                           ("search_any_values", lambda: matcher.search_any_values(values)),
+                           ("str.contains all", str_contains_all),
+                           ("search_all_values", lambda: matcher.search_all_values(values))]:
+        print("{}: {:.1f} ms".format(name, min(timeit.repeat(function, number=1, repeat=3)) * 1000))
+    assert (matcher.search_any_values(values) == str_contains_any().values).all()
+    assert (matcher.search_all_values(values) == str_contains_all().values).all()
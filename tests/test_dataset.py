@@ -1,3 +1,6 @@
+import weakref
+
+import pandas as pd
 import pytest
 
 from .test_utils import get_dataset
@@ -35,6 +38,57 @@ def test_caching(test_backend):
         dataset.get_column_max.cache_info()
 
 
+def test_cache_statistics_and_invalidation(test_backend):
+    dataset = get_dataset(test_backend, data, schemas=schemas.get(test_backend), caching=True)
+    dataset.get_column_max('a')
+    dataset.get_column_max('a')
+    dataset.get_column_max('c')
+    dataset.get_row_count()
+
+    cache_statistics = dataset.get_cache_statistics()
+    assert cache_statistics["metrics"]["get_column_max"]["hits"] == 1
+    assert cache_statistics["metrics"]["get_column_max"]["misses"] == 2
+    assert cache_statistics["metrics"]["get_column_max"]["compute_time"] >= 0
+    assert cache_statistics["entries"] == 3
+    assert cache_statistics["memory"] > 0
+
+    dataset.invalidate_cache('a')
+    assert dataset.get_cache_statistics()["entries"] == 2
+    dataset.get_column_max('a')
+    dataset.get_column_max('c')
+    assert dataset.get_column_max.cache_info().hits == 2
+    assert dataset.get_column_max.cache_info().misses == 3
+
+    dataset.invalidate_cache()
+    assert dataset.get_cache_statistics()["entries"] == 0
+
+
+def test_cache_max_memory():
+    dataset = PandasDataset({"a": list(range(1000)), "b": list(range(1000))}, cache_max_memory=20000)
+    dataset.get_column_value_counts('a')
+    assert dataset.get_cache_statistics()["entries"] == 1
+    dataset.get_column_value_counts('b')
+    # Both value counts do not fit, so the least recently used one was evicted
+    assert dataset.get_cache_statistics()["entries"] == 1
+    assert dataset.get_cache_statistics()["memory"] <= 20000
+    dataset.get_column_value_counts('a')
+    assert dataset.get_column_value_counts.cache_info().misses == 3
+
+    # A value larger than the cache is not cached
+    dataset = PandasDataset({"a": list(range(1000))}, cache_max_memory=100)
+    dataset.get_column_value_counts('a')
+    assert dataset.get_cache_statistics()["entries"] == 0
+
+
+def test_cached_getters_do_not_keep_dataset_alive():
+    dataset = PandasDataset({"a": [1, 2, 3]})
+    dataset.get_column_max('a')
+    dataset_ref = weakref.ref(dataset)
+    del dataset
+    # Without a reference cycle, the dataset is freed without waiting for the garbage collector
+    assert dataset_ref() is None
+
+
 def test_head(test_backend):
     dataset = get_dataset(test_backend, data, schemas=schemas.get(test_backend), caching=True)
     dataset.expect_column_mean_to_be_between("b", 5, 5)
@@ -54,3 +108,164 @@ def test_head(test_backend):
     assert isinstance(head, PandasDataset)
     assert len(head) == 1
     assert list(head.columns) == ["a"]
+
+
+def test_prefetch_column_statistics(test_backend):
+    dataset = get_dataset(test_backend, data, schemas=schemas.get(test_backend), caching=True)
+    reference_dataset = get_dataset(test_backend, data, schemas=schemas.get(test_backend), caching=False)
+
+    statistics = ["nonnull_count", "unique_count", "min", "max", "mean", "stdev"]
+    column_statistics = dataset.prefetch_column_statistics(["a", "b", "d"], statistics + ["quantiles"],
+                                                           quantiles=(0.0, 0.5, 1.0))
+    assert set(column_statistics.keys()) == {"a", "b", "d"}
+
+    # Whatever was gathered is exactly what the getters compute, and is returned by them from now on
+    for column, gathered in column_statistics.items():
+        for statistic, value in gathered.items():
+            if statistic == "quantiles":
+                assert reference_dataset.get_column_quantiles(column, tuple(value.keys())) == list(value.values())
+                assert dataset.get_column_quantiles(column, tuple(value.keys())) == list(value.values())
+            else:
+                getter = dataset.column_statistic_getters[statistic]
+                assert getattr(reference_dataset, getter)(column) == value
+                assert getattr(dataset, getter)(column) == value
+
+    assert dataset.get_column_nonnull_count("d") == 1
+    assert dataset.get_column_unique_count("b") == 1
+
+    with pytest.raises(ValueError):
+        dataset.prefetch_column_statistics(["a"], ["not_a_statistic"])
+    with pytest.raises(ValueError):
+        dataset.prefetch_column_statistics(["a"], ["quantiles"])
+
+    # Without caching, statistics are gathered but not kept
+    reference_dataset.prefetch_column_statistics(["a"], statistics)
+    assert reference_dataset._prefetched_column_statistics == {}
+
+
+def test_approximate_unique_count(test_backend):
+    cardinality_data = {"x": [i % 500 for i in range(1000)] + [None] * 100}
+    cardinality_schemas = {"SparkDFDataset": {"x": "int"}}
+    dataset = get_dataset(test_backend, cardinality_data, schemas=cardinality_schemas.get(test_backend), caching=True)
+
+    # Backends without an approximate distinct count count exactly
+    assert dataset.get_column_unique_count("x") == 500
+    assert dataset.get_column_unique_count("x", approximate=True) == pytest.approx(500, rel=0.05)
+
+    result = dataset.expect_column_unique_value_count_to_be_between("x", 450, 550, approximate=True)
+    assert result["success"]
+    assert result["result"]["observed_value"] == pytest.approx(500, rel=0.05)
+    result = dataset.expect_column_proportion_of_unique_values_to_be_between("x", 0.45, 0.55, approximate=True)
+    assert result["success"]
+
+    column_statistics = dataset.prefetch_column_statistics(["x"], ["approximate_unique_count"])
+    assert column_statistics["x"]["approximate_unique_count"] == pytest.approx(500, rel=0.05)
+    # The exact count is not answered with an estimate
+    assert dataset.get_column_unique_count("x") == 500
+
+    dataset = get_dataset(test_backend, cardinality_data, schemas=cardinality_schemas.get(test_backend), caching=True)
+    dataset.prefetch_column_statistics(["x"], ["unique_count"])
+    dataset._prefetched_column_statistics["x"]["unique_count"] = -1
+    # but a prefetched exact count answers requests for an estimate
+    assert dataset.get_column_unique_count("x", approximate=True) == -1
+
+
+def test_approximate_modes():
+    dataset = PandasDataset({"x": [1, 2, 2, 3, 3, 3, None] * 100})
+    dataset.approximate_modes_block_size = 70
+
+    assert dataset.get_column_modes("x", approximate=True) == [3]
+    assert dataset.expect_column_most_common_value_to_be_in_set("x", [3], approximate=True)["success"]
+
+    dataset = PandasDataset({"x": ["a", "b"] * 100})
+    assert sorted(dataset.get_column_modes("x", approximate=True)) == ["a", "b"]
+    assert dataset.expect_column_most_common_value_to_be_in_set("x", ["a"], ties_okay=True, approximate=True)["success"]
+
+
+def test_sparkdf_dataset_arrow_transfer_and_top_k_value_counts(spark_session):
+    pytest.importorskip("pyarrow")
+    from great_expectations.dataset import SparkDFDataset
+
+    spark_df = spark_session.createDataFrame(
+        pd.DataFrame({"x": [1, 2, 2, 3, 3, 3, 4, 4, 4] * 10, "y": ["a", "b", "c"] * 30})
+    )
+    spark_session.conf.unset("spark.sql.execution.arrow.maxRecordsPerBatch")
+    dataset = SparkDFDataset(spark_df, arrow_batch_size=7, caching=False)
+    # The Arrow configuration of the session is set once, when the dataset is created
+    assert spark_session.conf.get("spark.sql.execution.arrow.maxRecordsPerBatch", None) == "7"
+
+    head = dataset.head(4)
+    assert head["x"].tolist() == [1, 2, 2, 3]
+    assert spark_session.conf.get("spark.sql.execution.arrow.maxRecordsPerBatch", None) == "7"
+
+    value_counts = dataset.get_column_value_counts("x", sort="count", top_k=2)
+    assert list(value_counts.index) == [3, 4]
+    assert list(value_counts) == [30, 30]
+    assert list(dataset.get_column_value_counts("x").index) == [1, 2, 3, 4]
+    assert dataset.get_column_modes("x") == [3, 4]
+
+    # Values brought to the driver are the same with and without Arrow
+    row_dataset = SparkDFDataset(spark_df, use_arrow=False, caching=False)
+    assert row_dataset.get_column_value_counts("y").equals(dataset.get_column_value_counts("y"))
+    result = dataset.expect_column_values_to_be_in_set("x", [1, 2], result_format="COMPLETE")
+    assert result["result"]["unexpected_list"] == \
+        row_dataset.expect_column_values_to_be_in_set("x", [1, 2], result_format="COMPLETE")["result"][
+            "unexpected_list"]
+    assert all([type(value) == int for value in result["result"]["unexpected_list"]])
+
+
+def test_sparkdf_dataset_keeps_arrow_configuration_set_in_the_session(spark_session):
+    from great_expectations.dataset import SparkDFDataset
+    from great_expectations.dataset.sparkdf_dataset import (
+        ARROW_BATCH_SIZE_CONFIGURATION, ARROW_CONFIGURATION, SPARK_2_ARROW_CONFIGURATION
+    )
+
+    if spark_session.version.startswith("2."):
+        enabled_key, fallback_key = sorted(SPARK_2_ARROW_CONFIGURATION)
+    else:
+        enabled_key, fallback_key = sorted(ARROW_CONFIGURATION)
+    keys = [enabled_key, fallback_key, ARROW_BATCH_SIZE_CONFIGURATION]
+    for key in keys:
+        spark_session.conf.unset(key)
+    try:
+        spark_session.conf.set(enabled_key, "false")
+        spark_session.conf.set(ARROW_BATCH_SIZE_CONFIGURATION, "5")
+        dataset = SparkDFDataset(spark_session.createDataFrame(pd.DataFrame({"x": [1, 2, 3]})), use_arrow=False,
+                                 caching=False)
+        # Called directly, so that the test does not require pyarrow
+        dataset._enable_arrow(spark_session)
+        assert spark_session.conf.get(enabled_key, None) == "false"
+        assert spark_session.conf.get(fallback_key, None) == "true"
+        assert spark_session.conf.get(ARROW_BATCH_SIZE_CONFIGURATION, None) == "5"
+
+        # A batch size given to the dataset replaces that of the session
+        dataset.arrow_batch_size = 7
+        dataset._enable_arrow(spark_session, set_batch_size=True)
+        assert spark_session.conf.get(enabled_key, None) == "false"
+        assert spark_session.conf.get(ARROW_BATCH_SIZE_CONFIGURATION, None) == "7"
+    finally:
+        for key in keys:
+            spark_session.conf.unset(key)
+
+
+def test_sparkdf_dataset_prefetches_mean_and_stdev_of_every_numeric_type(spark_session):
+    from decimal import Decimal
+    import pyspark.sql.types as sparktypes
+    from great_expectations.dataset import SparkDFDataset
+
+    schema = sparktypes.StructType([
+        sparktypes.StructField("small", sparktypes.ShortType()),
+        sparktypes.StructField("tiny", sparktypes.ByteType()),
+        sparktypes.StructField("price", sparktypes.DecimalType(10, 2)),
+        sparktypes.StructField("name", sparktypes.StringType()),
+    ])
+    spark_df = spark_session.createDataFrame(
+        [(1, 2, Decimal("1.50"), "a"), (3, 4, Decimal("2.50"), "b")], schema=schema)
+    dataset = SparkDFDataset(spark_df)
+
+    column_statistics = dataset.prefetch_column_statistics(["small", "tiny", "price", "name"], ["mean", "stdev"])
+    for column in ["small", "tiny", "price"]:
+        assert set(column_statistics[column].keys()) == {"mean", "stdev"}
+        assert column_statistics[column]["mean"] == SparkDFDataset(spark_df).get_column_mean(column)
+    assert column_statistics["small"]["mean"] == 2
+    assert column_statistics["name"] == {}
@@ -1,8 +1,10 @@
 from __future__ import division
 
+import os
 import warnings
 import pytest
 import great_expectations as ge
+from great_expectations.data_asset import file_data_asset
 from .test_utils import assertDeepAlmostEqual
 
 
@@ -153,3 +155,162 @@ def test_file_format_map_output():
                                                                                           expected_count=3,
                                                                                           skip=1,
                                                                                           result_format="JOKE")
+
+
+@pytest.fixture
+def log_file(tmp_path_factory):
+    path = os.path.join(str(tmp_path_factory.mktemp("test_file_lines_map__dir")), "app.log")
+    with open(path, "w") as outfile:
+        outfile.write("timestamp level message\n")
+        for i in range(1000):
+            if i % 10 == 0:
+                outfile.write("\n")
+            elif i % 7 == 0:
+                outfile.write("{} ERROR request failed\n".format(i % 3))
+            else:
+                outfile.write("{} INFO request ok\n".format(i))
+    return path
+
+
+def test_file_lines_map_expectation_streams_blocks(log_file, monkeypatch):
+    expected = ge.data_asset.FileDataAsset(log_file).expect_file_line_regex_match_count_to_equal(
+        regex=r"INFO", expected_count=1, skip=1, result_format="SUMMARY")
+    assert expected["result"]["element_count"] == 1000
+    assert expected["result"]["missing_count"] == 100
+    assert expected["result"]["unexpected_count"] == 128
+    assert expected["result"]["partial_unexpected_list"][:2] == ["1 ERROR request failed\n",
+                                                                 "2 ERROR request failed\n"]
+    assert expected["result"]["partial_unexpected_index_list"][:2] == [6, 12]
+    assert expected["result"]["partial_unexpected_counts"] == [
+        {"value": "0 ERROR request failed\n", "count": 43},
+        {"value": "1 ERROR request failed\n", "count": 43},
+        {"value": "2 ERROR request failed\n", "count": 42},
+    ]
+
+    # Results do not depend on where the blocks of lines start and end
+    monkeypatch.setattr(file_data_asset, "FILE_LINES_BLOCK_SIZE", 100)
+    for result_format in ["BOOLEAN_ONLY", "BASIC", "SUMMARY", "COMPLETE"]:
+        file_dat = ge.data_asset.FileDataAsset(log_file)
+        result = file_dat.expect_file_line_regex_match_count_to_equal(
+            regex=r"INFO", expected_count=1, skip=1, result_format=result_format)
+        assert result["success"] is False
+        if result_format == "SUMMARY":
+            assert result == expected
+        if result_format == "COMPLETE":
+            assert len(result["result"]["unexpected_list"]) == 128
+            assert result["result"]["unexpected_index_list"][:2] == [6, 12]
+
+    # A skip greater than the number of lines in the file does not skip any line
+    result = ge.data_asset.FileDataAsset(log_file).expect_file_line_regex_match_count_to_equal(
+        regex=r"INFO", expected_count=1, skip=5000, result_format="BASIC")
+    assert result["result"]["element_count"] == 1001
+
+
+def test_FileDataAsset_validate_reads_file_once_for_file_lines_map_expectations(log_file, monkeypatch):
+    file_dat = ge.data_asset.FileDataAsset(log_file)
+    expectation_suite = file_dat.get_expectation_suite()
+    expectation_suite["expectations"] = [
+        {"expectation_type": "expect_file_line_regex_match_count_to_equal",
+         "kwargs": {"regex": "INFO", "expected_count": 1, "skip": 1}},
+        {"expectation_type": "expect_file_line_regex_match_count_to_be_between",
+         "kwargs": {"regex": "request", "expected_min_count": 1, "expected_max_count": 1,
+                    "result_format": "COMPLETE"}},
+        {"expectation_type": "expect_file_line_regex_match_count_to_equal",
+         "kwargs": {"regex": "ERROR", "expected_count": 0, "skip": 1, "mostly": 0.8}},
+        # An invalid expectation still fails on its own when it is validated
+        {"expectation_type": "expect_file_line_regex_match_count_to_equal",
+         "kwargs": {"regex": "[", "expected_count": 0}},
+    ]
+    expected_results = [
+        file_dat.validate(expectation_suite=dict(expectation_suite, expectations=[expectation]),
+                          result_format="SUMMARY")["results"][0]
+        for expectation in expectation_suite["expectations"]
+    ]
+
+    opened_paths = []
+    builtin_open = open
+
+    def counting_open(path, *args, **kwargs):
+        opened_paths.append(path)
+        return builtin_open(path, *args, **kwargs)
+
+    monkeypatch.setattr(file_data_asset, "open", counting_open, raising=False)
+    results = file_dat.validate(expectation_suite=expectation_suite, result_format="SUMMARY")["results"]
+    # One pass for the valid expectations, and one for the expectation that raises its exception
+    assert opened_paths == [log_file, log_file]
+
+    assert [result["success"] for result in results] == [False, False, True, False]
+    for result, expected_result in zip(results, expected_results):
+        assert result.get("result") == expected_result.get("result")
+    assert results[3]["exception_info"]["raised_exception"] is True
+
+
+def test_FileDataAsset_validate_reads_file_once_for_all_expectations(log_file, monkeypatch):
+    import hashlib
+    with open(log_file, "rb") as infile:
+        contents = infile.read()
+
+    file_dat = ge.data_asset.FileDataAsset(log_file)
+    expectation_suite = file_dat.get_expectation_suite()
+    expectation_suite["expectations"] = [
+        {"expectation_type": "expect_file_hash_to_equal",
+         "kwargs": {"value": hashlib.md5(contents).hexdigest()}},
+        {"expectation_type": "expect_file_hash_to_equal",
+         "kwargs": {"value": hashlib.sha256(contents).hexdigest(), "hash_alg": "sha256"}},
+        {"expectation_type": "expect_file_size_to_be_between",
+         "kwargs": {"minsize": 1}},
+        {"expectation_type": "expect_file_to_have_valid_table_header",
+         "kwargs": {"regex": " "}},
+        {"expectation_type": "expect_file_to_be_valid_json",
+         "kwargs": {}},
+        {"expectation_type": "expect_file_line_regex_match_count_to_equal",
+         "kwargs": {"regex": "INFO", "expected_count": 1, "skip": 1, "mostly": 0.8}},
+    ]
+    expected_results = [
+        file_dat.validate(expectation_suite=dict(expectation_suite, expectations=[expectation]))["results"][0]
+        for expectation in expectation_suite["expectations"]
+    ]
+
+    opened_paths = []
+    builtin_open = open
+
+    def counting_open(path, *args, **kwargs):
+        opened_paths.append(path)
+        return builtin_open(path, *args, **kwargs)
+
+    monkeypatch.setattr(file_data_asset, "open", counting_open, raising=False)
+    monkeypatch.setattr(file_data_asset, "FILE_LINES_BLOCK_SIZE", 1000)
+    results = file_dat.validate(expectation_suite=expectation_suite)["results"]
+    assert opened_paths == [log_file]
+
+    assert [result["success"] for result in results] == [True, True, True, True, False, True]
+    for result, expected_result in zip(results, expected_results):
+        assert result.get("result") == expected_result.get("result")
+
+
+def test_FileScan(log_file):
+    with open(log_file, "r") as infile:
+        lines = infile.readlines()
+
+    file_scan = file_data_asset.FileScan(log_file, first_line_count=2).run()
+    assert file_scan.first_lines == lines[:2]
+    # Reading stopped before the end of the file
+    assert file_scan.line_count is None
+
+    file_scan = file_data_asset.FileScan(log_file, hash_algs=["md5"], first_line_count=2, keep_text=True).run()
+    assert file_scan.first_lines == lines[:2]
+    assert file_scan.line_count == len(lines)
+    assert file_scan.text == "".join(lines)
+    assert file_scan.hexdigests == {"md5": file_data_asset.FileScan(log_file, hash_algs=["md5"]).run().hexdigests["md5"]}
+
+
+def test_FileScan_does_not_keep_text_of_large_files(log_file, monkeypatch):
+    monkeypatch.setattr(file_data_asset, "FILE_SCAN_MAX_TEXT_SIZE", os.path.getsize(log_file) - 1)
+    file_scan = file_data_asset.FileScan(log_file, first_line_count=1, keep_text=True).run()
+    assert file_scan.text is None
+    assert len(file_scan.first_lines) == 1
+
+    # The JSON expectation then reads the file itself
+    my_file = ge.data_asset.FileDataAsset(log_file)
+    my_file.expect_file_to_be_valid_json()
+    assert my_file.validate()["results"][0]["success"] is False